@@ -0,0 +1,102 @@
+"""
+N concurrent RPC reads (block number + USDC balance) from inside an asyncio service, against a
+local JSON-RPC stand-in with a fixed per-request latency:
+
+    before: the synchronous Web3 client called from a coroutine, blocking the event loop
+    to_thread: the synchronous client pushed to worker threads
+    after: AsyncOstium / AsyncBalance on AsyncWeb3
+
+Also reports the worst event-loop stall seen by a 1 ms ticker running alongside. With AsyncWeb3
+the remaining stall is web3's own request encoding for all the reads launched at once, not I/O.
+
+    python benchmarks/bench_async_ostium.py [n_calls] [latency_ms]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from web3 import AsyncWeb3, Web3  # noqa: E402
+
+from common import start_rpc_server  # noqa: E402
+from ostium_python_sdk.async_ostium import AsyncOstium  # noqa: E402
+from ostium_python_sdk.balance import AsyncBalance, Balance  # noqa: E402
+from ostium_python_sdk.ostium import Ostium  # noqa: E402
+
+ADDRESS = '0x0000000000000000000000000000000000000001'
+PRIVATE_KEY = '0x' + '11' * 32
+
+METHODS = {
+    'eth_chainId': lambda params: '0xa4b1',
+    'eth_call': lambda params: '0x' + f'{5 * 10**6:064x}',
+    'eth_getBalance': lambda params: hex(10**18),
+    'eth_getBlockByNumber': lambda params: {
+        'number': '0x10', 'hash': '0x' + 'bb' * 32, 'parentHash': '0x' + 'aa' * 32, 'timestamp': '0x1',
+        'gasLimit': '0x1c9c380', 'gasUsed': '0x0', 'transactions': [], 'miner': ADDRESS,
+        'difficulty': '0x0', 'extraData': '0x', 'logsBloom': '0x' + '00' * 256, 'nonce': '0x' + '00' * 8,
+        'sha3Uncles': '0x' + '00' * 32, 'size': '0x0', 'stateRoot': '0x' + '00' * 32,
+        'receiptsRoot': '0x' + '00' * 32, 'transactionsRoot': '0x' + '00' * 32, 'uncles': []},
+}
+
+
+async def run(label, n, coro_factory):
+    stalls = [0.0]
+
+    async def ticker():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls[0] = max(stalls[0], now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*[coro_factory() for _ in range(n)])
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.005)  # let the ticker see the last stall
+    task.cancel()
+    print(f"{label:<34} {elapsed * 1000:>9,.1f} ms for {n} reads  worst loop stall {stalls[0] * 1000:>8,.1f} ms")
+
+
+async def main(n, latency):
+    server, url = start_rpc_server(METHODS, latency=latency)
+    w3 = Web3(Web3.HTTPProvider(url))
+    ostium = Ostium(w3, ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY)
+    balance = Balance(w3, ADDRESS)
+    async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(url))
+    async_ostium = AsyncOstium(async_w3, ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY)
+    async_balance = AsyncBalance(async_w3, ADDRESS)
+
+    async def blocking():
+        ostium.get_block_number()
+        balance.get_usdc_balance(ADDRESS)
+
+    async def threaded():
+        await asyncio.gather(asyncio.to_thread(ostium.get_block_number),
+                             asyncio.to_thread(balance.get_usdc_balance, ADDRESS))
+
+    async def non_blocking():
+        await asyncio.gather(async_ostium.get_block_number(), async_balance.get_usdc_balance(ADDRESS))
+
+    try:
+        # warm up: connection pools, ABI parsing
+        await blocking()
+        await non_blocking()
+
+        await run("before: sync Web3 in a coroutine", n, blocking)
+        await run("to_thread: sync Web3 in threads", n, threaded)
+        await run("after: AsyncWeb3", n, non_blocking)
+    finally:
+        await async_w3.provider.disconnect()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main(n, latency_ms / 1000))
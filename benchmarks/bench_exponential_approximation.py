@@ -0,0 +1,61 @@
+"""
+exponentialApproximation() vs. its memoized / table-driven exponentialApproximationCached(),
+alone and inside formulae_wrapper.get_trade_metrics() over many trades.
+
+    python benchmarks/bench_exponential_approximation.py [n_trades]
+"""
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import make_open_trade, make_price_feeds, make_subgraph_pair  # noqa: E402
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics  # noqa: E402
+from ostium_python_sdk.scscript import funding  # noqa: E402
+
+N_PAIRS = 20
+reference = funding.exponentialApproximation
+cached = funding.exponentialApproximationCached
+
+
+def run_trade_metrics(trades, prices, blocks):
+    start = time.perf_counter()
+    for t, block in zip(trades, blocks):
+        get_trade_metrics(t, prices[(t['pair']['from'], t['pair']['to'])], block, 100, 25)
+    return time.perf_counter() - start
+
+
+def main(n_trades):
+    rng = random.Random(1)
+    values = [-Decimal(rng.randint(1, 10**16)) * rng.randint(1, 10**5) / Decimal(10**22) for _ in range(200)]
+    calls = [rng.choice(values) for _ in range(n_trades)]
+    for label, fn in (("before: exponentialApproximation()", reference),
+                      ("after: exponentialApproximationCached()", cached)):
+        start = time.perf_counter()
+        for value in calls:
+            fn(value)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<55} {n_trades / elapsed:>10,.0f} calls/s")
+
+    # every trade of a pair valued at the same few blocks, like a risk pass over many traders
+    pairs = [make_subgraph_pair(i) for i in range(N_PAIRS)]
+    for pair in pairs:
+        pair['springFactor'] = str(rng.randint(10**12, 10**15))
+    trades = [make_open_trade(pairs[i % N_PAIRS], index=i) for i in range(n_trades)]
+    blocks = [12000 + rng.randint(0, 3) * 100000 for _ in range(n_trades)]
+    prices = {(p['from'], p['to']): p for p in make_price_feeds(N_PAIRS)}
+
+    funding.exponentialApproximationCached = reference
+    before = run_trade_metrics(trades, prices, blocks)
+    funding.exponentialApproximationCached = cached
+    after = run_trade_metrics(trades, prices, blocks)
+    print(f"{'before: get_trade_metrics() x ' + format(n_trades, ','):<55} {before * 1000:>10,.1f} ms")
+    print(f"{'after: get_trade_metrics() x ' + format(n_trades, ','):<55} {after * 1000:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
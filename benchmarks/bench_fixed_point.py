@@ -0,0 +1,75 @@
+"""
+Contract-mirroring math: Decimal versions (scscript.funding / scscript.pairinfos) vs. the
+integer fixed-point engine (scscript.fixed_point), same inputs, calls per second.
+
+    python benchmarks/bench_fixed_point.py [n_calls]
+"""
+import os
+import sys
+import time
+from decimal import Decimal, ROUND_DOWN, localcontext
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ostium_python_sdk.scscript import fixed_point, funding, pairinfos  # noqa: E402
+
+P2, P6, P18 = Decimal(10**2), Decimal(10**6), Decimal(10**18)
+
+FUNDING_ARGS = dict(blockNumber=1200, lastUpdateBlock=200, valueLong=12722273808, valueShort=0,
+                    openInterestUsdcLong=1500000000000, openInterestUsdcShort=1000000000000,
+                    OiCap=1000000000000, maxFundingFeePerBlock=47564687975, lastFundingRate=129795925,
+                    hillInflectionPoint=160000000000000000, hillPosScale=118, hillNegScale=91,
+                    springFactor=86000000000000, sFactorUpScale=11000, sFactorDownScaleP=9000)
+FUNDING_PRECISIONS = dict(valueLong=P18, valueShort=P18, openInterestUsdcLong=P6, openInterestUsdcShort=P6,
+                          OiCap=P6, maxFundingFeePerBlock=P18, lastFundingRate=P18, hillInflectionPoint=P18,
+                          hillPosScale=P2, hillNegScale=P2, springFactor=P18, sFactorUpScale=P2,
+                          sFactorDownScaleP=P2)
+DECIMAL_FUNDING_ARGS = {name: Decimal(value) / FUNDING_PRECISIONS.get(name, 1) for name, value in FUNDING_ARGS.items()}
+
+LIQ_ARGS = (2500, 95 * 10**18, True, 1000 * 10**6, 1000, 1500000, 2500000, 10000)
+DECIMAL_LIQ_ARGS = (Decimal('25'), Decimal(95), True, Decimal(1000), Decimal(10), Decimal('1.5'),
+                    Decimal('2.5'), Decimal(100))
+
+FEE_ARGS = (10000 * 10**6, 1000, -4000 * 10**6, 2000, 30000, 70000)
+DECIMAL_FEE_ARGS = (Decimal(10000), Decimal(10), Decimal(-4000), Decimal(20), Decimal('0.03'), Decimal('0.07'))
+
+CASES = [
+    ("getPendingAccFundingFees",
+     lambda: funding.getPendingAccFundingFees(**DECIMAL_FUNDING_ARGS),
+     lambda: fixed_point.getPendingAccFundingFees(**FUNDING_ARGS)),
+    ("getTargetFundingRate",
+     lambda: funding.getTargetFundingRate(Decimal('0.333333'), Decimal('0.16'), Decimal('0.000000047564687975'),
+                                          Decimal('1.18'), Decimal('0.91')),
+     lambda: fixed_point.getTargetFundingRate(333333, 16 * 10**16, 47564687975, 118, 91)),
+    ("exponentialApproximation (|x| < 0.79)",
+     lambda: funding.exponentialApproximation(Decimal('-0.086')),
+     lambda: fixed_point.exponentialApproximation(-86 * 10**15)),
+    ("exponentialApproximation (|x| < 6.906)",
+     lambda: funding.exponentialApproximation(Decimal('-3.4567')),
+     lambda: fixed_point.exponentialApproximation(-34567 * 10**14)),
+    ("getTradeLiquidationPrice",
+     lambda: pairinfos.getTradeLiquidationPrice(*DECIMAL_LIQ_ARGS),
+     lambda: fixed_point.getTradeLiquidationPrice(*LIQ_ARGS)),
+    ("getOpeningFee",
+     lambda: pairinfos.getOpeningFee(*DECIMAL_FEE_ARGS),
+     lambda: fixed_point.getOpeningFee(*FEE_ARGS)),
+]
+
+
+def rate(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+def main(n):
+    print(f"{'':<40} {'Decimal':>14} {'int':>14} {'speedup':>8}")
+    with localcontext(prec=128, rounding=ROUND_DOWN):
+        for label, decimal_fn, int_fn in CASES:
+            decimal_rate, int_rate = rate(decimal_fn, n), rate(int_fn, n)
+            print(f"{label:<40} {decimal_rate:>10,.0f}/s {int_rate:>10,.0f}/s {int_rate / decimal_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
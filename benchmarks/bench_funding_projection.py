@@ -0,0 +1,45 @@
+"""
+Funding curve of one pair, every hour for the next 7 days (168 horizons): GetFundingRate() once
+per horizon vs. a single ProjectFundingRate() call.
+
+    python benchmarks/bench_funding_projection.py [n_pairs]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import make_subgraph_pair  # noqa: E402
+from ostium_python_sdk.formulae import GetFundingRate, ProjectFundingRate  # noqa: E402
+
+BLOCKS_PER_HOUR = 12000
+
+
+def main(n_pairs):
+    pair = make_subgraph_pair(0)
+    head = (pair['accFundingLong'], pair['accFundingShort'], pair['lastFundingRate'],
+            pair['maxFundingFeePerBlock'], pair['lastFundingBlock'])
+    tail = ('150000000000', '100000000000', pair['maxOI'], pair['hillInflectionPoint'], pair['hillPosScale'],
+            pair['hillNegScale'], pair['springFactor'], pair['sFactorUpScaleP'], pair['sFactorDownScaleP'])
+    blocks = [200 + h * BLOCKS_PER_HOUR for h in range(1, 24 * 7 + 1)]
+
+    start = time.perf_counter()
+    for _ in range(n_pairs):
+        for block in blocks:
+            GetFundingRate(*head, str(block), *tail)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n_pairs):
+        ProjectFundingRate(*head, blocks, *tail)
+    after = time.perf_counter() - start
+
+    print(f"{n_pairs} pairs x {len(blocks)} hourly horizons")
+    print(f"{'before: GetFundingRate() per horizon':<45} {before * 1000:>9,.1f} ms")
+    print(f"{'after: one ProjectFundingRate() per pair':<45} {after * 1000:>9,.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,145 @@
+"""
+Client-side cost of one Ostium write (delegated close_trade: build + sign + send + receipt
+decode) with the network taken out: web3 talks to an in-process provider answering from memory,
+so what is timed is the SDK / web3 / eth-account CPU work and the number of RPC calls made.
+
+    before: private key re-derived (from_key) for every transaction, chainId looked up by
+            build_transaction(), inner delegated calldata built with a full build_transaction(),
+            PriceRequested topic re-hashed for every receipt
+    after:  account, chain id and event topics cached on the Ostium instance, calldata
+            encoded locally
+
+The eth_chainId calls left in "after" are web3's own transaction validation, which the providers
+built by OstiumSDK answer from their request cache.
+
+Then prints the top functions of a cProfile run of the "after" loop.
+
+    python benchmarks/bench_ostium_tx_overhead.py [n_transactions]
+"""
+import cProfile
+import itertools
+import os
+import pstats
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_utils import keccak  # noqa: E402
+from web3 import Web3  # noqa: E402
+from web3.providers.base import BaseProvider  # noqa: E402
+
+from ostium_python_sdk.ostium import Ostium  # noqa: E402
+
+ADDRESS = '0x0000000000000000000000000000000000000001'
+TRADER = Web3.to_checksum_address('0x00000000000000000000000000000000000000aa')
+PRIVATE_KEY = '0x' + '11' * 32
+PRICE_REQUESTED_TOPIC = '0x' + keccak(text="PriceRequested(uint256,bytes32,uint256)").hex()
+
+BLOCK = {
+    'number': '0x10', 'hash': '0x' + 'bb' * 32, 'parentHash': '0x' + 'aa' * 32, 'baseFeePerGas': '0x989680',
+    'timestamp': '0x1', 'gasLimit': '0x1c9c380', 'gasUsed': '0x0', 'transactions': [], 'miner': ADDRESS,
+    'difficulty': '0x0', 'extraData': '0x', 'logsBloom': '0x' + '00' * 256, 'nonce': '0x' + '00' * 8,
+    'sha3Uncles': '0x' + '00' * 32, 'size': '0x0', 'stateRoot': '0x' + '00' * 32,
+    'receiptsRoot': '0x' + '00' * 32, 'transactionsRoot': '0x' + '00' * 32, 'uncles': [],
+    'mixHash': '0x' + '00' * 32}
+
+
+def make_receipt(tx_hash, order_id):
+    return {'transactionHash': tx_hash, 'status': '0x1', 'blockNumber': '0x10', 'blockHash': '0x' + 'bb' * 32,
+            'transactionIndex': '0x0', 'from': ADDRESS, 'to': ADDRESS, 'gasUsed': '0x5208',
+            'cumulativeGasUsed': '0x5208', 'effectiveGasPrice': '0x1', 'contractAddress': None,
+            'logsBloom': '0x' + '00' * 256, 'type': '0x2', 'logs': [{
+                'address': ADDRESS, 'topics': [PRICE_REQUESTED_TOPIC, '0x' + f'{order_id:064x}', '0x' + '00' * 32],
+                'data': '0x', 'blockNumber': '0x10', 'blockHash': '0x' + 'bb' * 32, 'logIndex': '0x0',
+                'transactionIndex': '0x0', 'transactionHash': tx_hash, 'removed': False}]}
+
+
+class InMemoryProvider(BaseProvider):
+    """Answers the JSON-RPC calls of a transaction from memory and counts them per method"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = {}
+        self.ids = itertools.count()
+        self.methods = {
+            'eth_chainId': lambda params: '0xa4b1',
+            'eth_getTransactionCount': lambda params: '0x0',
+            'eth_estimateGas': lambda params: '0x30d40',
+            'eth_maxPriorityFeePerGas': lambda params: '0x0',
+            'eth_getBlockByNumber': lambda params: BLOCK,
+            'eth_sendRawTransaction': lambda params: '0x' + keccak(hexstr=params[0]).hex(),
+            'eth_getTransactionReceipt': lambda params: make_receipt(params[0], 42),
+        }
+
+    def make_request(self, method, params):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        return {'jsonrpc': '2.0', 'id': next(self.ids), 'result': self.methods[method](params)}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+
+class BeforeOstium(Ostium):
+    """Ostium with the per-transaction work of the previous release"""
+
+    def _get_account(self):
+        self._check_private_key()
+        return self.web3.eth.account.from_key(self.private_key)
+
+    def _tx_params(self, account):
+        return {'from': account.address}
+
+    def _encode_call(self, fn_name, args):
+        function = getattr(self.ostium_trading_contract.functions, fn_name)(*args)
+        return function.build_transaction({'gas': 0})['data']
+
+    def get_order_id(self, receipt):
+        price_requested_signature = self.web3.keccak(
+            text="PriceRequested(uint256,bytes32,uint256)").hex()
+        for log in receipt.logs:
+            if len(log['topics']) > 0 and log['topics'][0].hex() == price_requested_signature:
+                return int(log['topics'][1].hex(), 16)
+        return None
+
+
+def make_client(cls):
+    provider = InMemoryProvider()
+    return cls(Web3(provider), ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY, use_delegation=True, manage_nonces=True), provider
+
+
+def run_transactions(ostium, n):
+    for i in range(n):
+        result = ostium.close_trade(i % 10, 0, 100.0, trader_address=TRADER)
+        assert result['order_id'] == 42
+
+
+def bench(label, cls, n):
+    ostium, provider = make_client(cls)
+    run_transactions(ostium, 5)  # warm up: ABI parsing, nonce sync
+    provider.calls.clear()
+    start = time.perf_counter()
+    run_transactions(ostium, n)
+    elapsed = time.perf_counter() - start
+    per_tx = ', '.join(f"{method} {count / n:g}" for method, count in sorted(provider.calls.items()))
+    print(f"{label:<8} {elapsed / n * 1000:>7,.2f} ms/tx   RPC calls per tx: {sum(provider.calls.values()) / n:g}")
+    print(f"         {per_tx}")
+    return elapsed
+
+
+def main(n):
+    before = bench("before", BeforeOstium, n)
+    after = bench("after", Ostium, n)
+    print(f"speedup: {before / after:.2f}x\n")
+
+    ostium, provider = make_client(Ostium)
+    run_transactions(ostium, 5)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_transactions(ostium, n)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,39 @@
+"""
+Price.get_latest_prices() throughput: one session per call vs. the shared, pooled session.
+
+    python benchmarks/bench_price_session.py [n_calls]
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import make_price_feeds, start_server, timed  # noqa: E402
+from ostium_python_sdk.price import Price  # noqa: E402
+
+
+async def main(n_calls):
+    feeds = make_price_feeds()
+    runner, base_url = await start_server(
+        {('GET', '/PricePublish/latest-prices'): lambda request: feeds})
+
+    try:
+        async def fresh_session_per_call():
+            # Previous behaviour: new connector + session for every lookup
+            price = Price(base_url=base_url)
+            await price.get_latest_prices()
+            await price.close()
+
+        shared = Price(base_url=base_url)
+
+        await timed("before: new session per call", n_calls, fresh_session_per_call)
+        await timed("after: shared keep-alive session", n_calls, shared.get_latest_prices)
+        await shared.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,38 @@
+"""
+N parallel SubgraphClient.get_pair_details() calls against a local GraphQL stand-in with
+a fixed per-request latency: serialized (max_concurrency=1, the old global lock) vs. pooled.
+
+    python benchmarks/bench_subgraph_concurrency.py [n_queries] [latency_ms]
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import make_subgraph_pair, start_graphql_server, timed_parallel  # noqa: E402
+from ostium_python_sdk.subgraph import SubgraphClient  # noqa: E402
+
+
+async def main(n_queries, latency):
+    runner, url = await start_graphql_server(
+        lambda body: {'pair': make_subgraph_pair(int(body['variables']['pair_id']))},
+        latency=latency)
+
+    try:
+        for max_concurrency in (1, 4, 16, 64):
+            client = SubgraphClient(url=url, max_concurrency=max_concurrency)
+            ids = iter(range(n_queries))
+            label = "before: serialized (global lock)" if max_concurrency == 1 \
+                else f"after: max_concurrency={max_concurrency}"
+            await timed_parallel(label, n_queries, lambda: client.get_pair_details(next(ids)))
+            await client.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main(n, latency_ms / 1000))
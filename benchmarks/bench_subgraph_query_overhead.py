@@ -0,0 +1,63 @@
+"""
+Client-side per-call overhead of SubgraphClient.get_pair_details() with a stubbed transport
+(no network): re-parsing + re-validating the query on every call vs. the module-level,
+pre-parsed document validated once.
+
+    python benchmarks/bench_subgraph_query_overhead.py [n_calls]
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gql import Client, gql  # noqa: E402
+from gql.transport import AsyncTransport  # noqa: E402
+from graphql import ExecutionResult, print_ast  # noqa: E402
+
+from common import make_subgraph_pair, timed  # noqa: E402
+from ostium_python_sdk.schema import get_subgraph_schema  # noqa: E402
+from ostium_python_sdk.subgraph import PAIR_DETAILS_QUERY, SubgraphClient  # noqa: E402
+
+
+class StubTransport(AsyncTransport):
+    def __init__(self):
+        self.result = ExecutionResult(data={'pair': make_subgraph_pair(0)})
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def execute(self, document, variable_values=None, operation_name=None):
+        return self.result
+
+    def subscribe(self, document, variable_values=None, operation_name=None):
+        raise NotImplementedError
+
+
+async def main(n_calls):
+    query_text = print_ast(PAIR_DETAILS_QUERY)
+
+    # Previous behaviour: gql("""...""") inside the method, validated by the client on every call
+    old_client = Client(transport=StubTransport(), schema=get_subgraph_schema())
+    old_session = await old_client.connect_async()
+
+    async def parse_and_validate_per_call():
+        await old_session.execute(gql(query_text), variable_values={"pair_id": "0"})
+
+    subgraph = SubgraphClient(url="http://stub")
+    subgraph._bind_loop()
+    subgraph._client = Client(transport=StubTransport())
+
+    await timed("before: gql() + validate per call", n_calls, parse_and_validate_per_call)
+    await timed("after: pre-parsed, validated once", n_calls, lambda: subgraph.get_pair_details(0))
+
+    await old_client.close_async()
+    await subgraph.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
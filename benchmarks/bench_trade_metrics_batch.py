@@ -0,0 +1,81 @@
+"""
+Valuing many open trades: formulae_wrapper.get_trade_metrics() (Decimal, one trade at a time)
+vs. the NumPy batch engine in formulae_batch (requires numpy).
+
+    python benchmarks/bench_trade_metrics_batch.py [sizes, default 1000,100000,1000000]
+
+The scalar path is timed on the first 1k trades and extrapolated for larger sizes.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+from common import make_open_trade, make_price_feeds, make_subgraph_pair  # noqa: E402
+from ostium_python_sdk.formulae_batch import get_trade_metrics_batch, trade_metrics_batch  # noqa: E402
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics  # noqa: E402
+
+N_PAIRS = 20
+SCALAR_SAMPLE = 1000
+
+
+def make_trades(n, seed=1):
+    rng = random.Random(seed)
+    pairs = [make_subgraph_pair(i) for i in range(N_PAIRS)]
+    return [make_open_trade(
+        pairs[i % N_PAIRS], index=i,
+        collateral=str(rng.randint(10, 100000) * 10**6),
+        leverage=str(rng.randint(110, 10000)),
+        openPrice=str(rng.randint(80, 120) * 10**18 + rng.randint(0, 10**18)),
+        isBuy=rng.random() < 0.5,
+        funding=str(rng.randint(-10**10, 10**10))) for i in range(n)]
+
+
+def make_columns(n, seed=1):
+    rng = np.random.default_rng(seed)
+    leverage = rng.uniform(1.1, 100, n)
+    return dict(
+        open_price=rng.uniform(80, 120, n), collateral=rng.uniform(10, 100000, n),
+        leverage=leverage, highest_leverage=leverage, is_buy=rng.random(n) < 0.5,
+        trade_funding=rng.uniform(-1e-8, 1e-8, n), trade_rollover=0.0,
+        acc_funding_long=1.2e-8, acc_funding_short=-0.8e-8, acc_rollover=0.0,
+        bid=np.full(n, 99.99), ask=np.full(n, 100.01), max_leverage=100.0)
+
+
+def report(label, n, elapsed):
+    print(f"{label:<52} {elapsed * 1000:>11,.1f} ms  ({n / elapsed:>13,.0f} trades/s)")
+
+
+def main(sizes):
+    prices = {(p['from'], p['to']): p for p in make_price_feeds(N_PAIRS)}
+    max_leverage = {i: 100.0 for i in range(N_PAIRS)}
+
+    sample = make_trades(SCALAR_SAMPLE)
+    start = time.perf_counter()
+    for t in sample:
+        get_trade_metrics(t, prices[(t['pair']['from'], t['pair']['to'])], 12000, max_leverage[int(t['pair']['id'])], 25)
+    scalar_per_trade = (time.perf_counter() - start) / SCALAR_SAMPLE
+
+    for n in sizes:
+        print(f"--- {n:,} trades")
+        report("before: get_trade_metrics() per trade" + (" (extrapolated)" if n > SCALAR_SAMPLE else ""),
+               n, scalar_per_trade * n)
+        if n <= 100000:
+            trades = make_trades(n)
+            start = time.perf_counter()
+            get_trade_metrics_batch(trades, prices, 12000, max_leverage, 25)
+            report("after: get_trade_metrics_batch() from trade dicts", n, time.perf_counter() - start)
+        columns = make_columns(n)
+        start = time.perf_counter()
+        trade_metrics_batch(liq_margin_threshold_p=25, **columns)
+        report("after: trade_metrics_batch() on columns", n, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    sizes = [int(s) for s in sys.argv[1].split(',')] if len(sys.argv) > 1 else [1000, 100000, 1000000]
+    main(sizes)
@@ -0,0 +1,154 @@
+"""
+Helpers shared by the benchmark scripts: local stand-in servers and a tiny timer.
+
+Benchmarks never touch the real Ostium services - every script spins up an
+aiohttp server on 127.0.0.1 that answers with canned payloads.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aiohttp import web
+
+
+def make_price_feeds(n_pairs=60):
+    """Build a latest-prices payload shaped like the metadata-backend response"""
+    feeds = []
+    for i in range(n_pairs):
+        mid = 100.0 + i
+        feeds.append({
+            'feed_id': '0x' + format(i, '064x'),
+            'bid': mid - 0.01,
+            'mid': mid,
+            'ask': mid + 0.01,
+            'isMarketOpen': True,
+            'isDayTradingClosed': False,
+            'secondsToToggleIsDayTradingClosed': -1,
+            'from': f"A{i}",
+            'to': 'USD',
+            'timestampSeconds': int(time.time()),
+        })
+    return feeds
+
+
+def make_subgraph_pair(pair_id=0, from_asset=None, to_asset='USD'):
+    """A pair entity with every field SubgraphClient.get_pair_details() selects"""
+    return {
+        'id': str(pair_id), 'from': from_asset or f"A{pair_id}", 'to': to_asset,
+        'overnightMaxLeverage': '0', 'longOI': '1500000000000000000', 'shortOI': '1000000000000000000',
+        'maxOI': '1000000000000', 'makerFeeP': '100', 'takerFeeP': '300', 'makerMaxLeverage': '1000',
+        'curFundingLong': '1000', 'curFundingShort': '-1000', 'curRollover': '0', 'totalOpenTrades': '2',
+        'totalOpenLimitOrders': '0', 'accRollover': '0', 'lastRolloverBlock': '100',
+        'rolloverFeePerBlock': '0', 'accFundingLong': '12722273808', 'accFundingShort': '0',
+        'lastFundingBlock': '200', 'maxFundingFeePerBlock': '47564687975', 'lastFundingRate': '129795925',
+        'hillInflectionPoint': '160000000000000000', 'hillPosScale': '118', 'hillNegScale': '91',
+        'springFactor': '86000000000000', 'sFactorUpScaleP': '11000', 'sFactorDownScaleP': '9000',
+        'lastTradePrice': '100000000000000000000', 'maxLeverage': '10000',
+        'group': {'id': '0', 'name': 'crypto', 'minLeverage': '200', 'maxLeverage': '0',
+                  'maxCollateralP': '1000', 'longCollateral': '0', 'shortCollateral': '0'},
+        'fee': {'minLevPos': '1500000000'},
+    }
+
+
+def make_open_trade(pair, index=0, trader='0x0000000000000000000000000000000000000001', **overrides):
+    """An open trade shaped like SubgraphClient.get_open_trades() output"""
+    trade = {
+        'tradeID': str(index), 'collateral': '1000000000', 'leverage': '1000', 'highestLeverage': '1000',
+        'openPrice': '95000000000000000000', 'stopLossPrice': '0', 'takeProfitPrice': '0', 'isOpen': True,
+        'timestamp': '1700000000', 'isBuy': True, 'notional': '10000000000',
+        'tradeNotional': '105263157894736842', 'funding': '0', 'rollover': '0', 'trader': trader,
+        'index': str(index), 'pair': pair,
+    }
+    trade.update(overrides)
+    return trade
+
+
+async def start_graphql_server(handler, latency=0.0):
+    """
+    Start a local GraphQL stand-in: `handler(body)` receives the decoded request body
+    ({'query', 'variables', ...}) and returns the `data` dict. Returns (runner, url).
+    """
+    async def graphql(request):
+        body = await request.json()
+        return {'data': handler(body)}
+
+    runner, base_url = await start_server({('POST', '/'): graphql}, latency=latency)
+    return runner, base_url + "/"
+
+
+async def start_server(routes, latency=0.0):
+    """
+    Start a local aiohttp server. `routes` maps (method, path) to a handler
+    returning a JSON-serializable body. Returns (runner, base_url).
+    """
+    app = web.Application()
+    for (method, path), handler in routes.items():
+        async def view(request, _handler=handler):
+            if latency:
+                await asyncio.sleep(latency)
+            body = _handler(request)
+            if asyncio.iscoroutine(body):
+                body = await body
+            return web.json_response(body)
+        app.router.add_route(method, path, view)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def start_rpc_server(methods, latency=0.0):
+    """
+    Start a local JSON-RPC node stand-in in a background thread, so that blocking (Web3) and
+    async (AsyncWeb3) clients can both use it from the event loop thread. `methods` maps an RPC
+    method name to a callable taking the params list and returning the result. Batch requests
+    are supported. Returns (server, url), stop with server.shutdown().
+    """
+    def call(request):
+        return {'jsonrpc': '2.0', 'id': request.get('id'),
+                'result': methods[request['method']](request.get('params', []))}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            if latency:
+                time.sleep(latency)
+            result = [call(request) for request in body] if isinstance(body, list) else call(body)
+            data = json.dumps(result).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+async def timed_parallel(label, n, coro_factory):
+    """Run n coroutines from `coro_factory()` concurrently and print wall time"""
+    start = time.perf_counter()
+    await asyncio.gather(*[coro_factory() for _ in range(n)])
+    elapsed = time.perf_counter() - start
+    print(f"{label:<45} {elapsed * 1000:>10,.1f} ms for {n} calls ({n / elapsed:,.0f} calls/s)")
+    return elapsed
+
+
+async def timed(label, n, coro_factory):
+    """Await `coro_factory()` n times (sequentially) and print calls/second"""
+    start = time.perf_counter()
+    for _ in range(n):
+        await coro_factory()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<45} {n / elapsed:>10,.0f} calls/s  ({elapsed * 1000 / n:.3f} ms/call)")
+    return elapsed
@@ -2,6 +2,10 @@ from .usdc_abi import usdc_abi
 from .trading_abi import trading_abi
 from .trading_storage_abi import trading_storage_abi
 from .faucet_testnet_abi import faucet_abi
+from .multicall3_abi import multicall3_abi
+from .pairs_info_abi import pairs_info_abi
+from .pairs_storage_abi import pairs_storage_abi
 
 __all__ = ['usdc_abi', 'trading_abi',
-           'trading_storage_abi', 'faucet_abi']
+           'trading_storage_abi', 'faucet_abi', 'multicall3_abi',
+           'pairs_info_abi', 'pairs_storage_abi']
@@ -0,0 +1,254 @@
+from web3 import AsyncWeb3
+
+from .constants import PRECISION_2
+from .nonce import AsyncNonceManager
+from .ostium import Ostium
+from .utils import convert_to_scaled_integer, fromErrorCodeToMessage, to_base_units
+
+
+class AsyncOstium(Ostium):
+    """
+    asyncio counterpart of Ostium, built on AsyncWeb3 (e.g. AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))).
+
+    Same methods and arguments as Ostium, but every method that talks to the node is a coroutine,
+    so contract calls, build_transaction and receipt waits never block the event loop. Write
+    methods sent concurrently (asyncio.gather) get distinct nonces from an AsyncNonceManager.
+    There is no fire_and_forget mode: wrap a write method in asyncio.create_task() instead.
+
+    Args:
+        w3: AsyncWeb3 instance connected to the Arbitrum network
+        usdc_address: Contract address for USDC token
+        ostium_trading_storage_address: Contract address for the Ostium trading storage
+        ostium_trading_address: Contract address for the Ostium trading contract
+        private_key: Private key for transaction signing
+        verbose: Whether to log detailed information
+        use_delegation: Whether to enable the delegatedAction functionality
+        manage_nonces: Allocate nonces locally per signing address
+        receipt_timeout: Seconds to wait for a transaction receipt
+        chain_id: Chain id of the network if already known, otherwise read from the node once
+    """
+
+    def __init__(self, w3: AsyncWeb3, usdc_address: str, ostium_trading_storage_address: str, ostium_trading_address: str, private_key: str, verbose=False, use_delegation=False, manage_nonces=False, receipt_timeout=120, chain_id=None) -> None:
+        super().__init__(w3, usdc_address, ostium_trading_storage_address, ostium_trading_address,
+                         private_key, verbose=verbose, use_delegation=use_delegation, manage_nonces=False,
+                         chain_id=chain_id)
+        self.nonce_manager = AsyncNonceManager(
+            self.get_pending_nonce, verbose=verbose) if manage_nonces else None
+        self.receipt_timeout = receipt_timeout
+
+    async def get_block_number(self):
+        return (await self.web3.eth.get_block('latest'))['number']
+
+    async def get_block(self, block_identifier='latest'):
+        return await self.web3.eth.get_block(block_identifier)
+
+    async def get_chain_id(self):
+        if self._chain_id is None:
+            self._chain_id = await self.web3.eth.chain_id
+        return self._chain_id
+
+    async def _tx_params(self, account):
+        return {'from': account.address, 'chainId': await self.get_chain_id()}
+
+    async def get_nonce(self, address):
+        return await self.web3.eth.get_transaction_count(address)
+
+    async def get_pending_nonce(self, address):
+        return await self.web3.eth.get_transaction_count(address, 'pending')
+
+    async def _send_transaction(self, tx, account):
+        async def send_with_nonce(nonce):
+            tx['nonce'] = nonce
+            signed_tx = self.web3.eth.account.sign_transaction(
+                tx, private_key=account.key)
+            return await self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+
+        if self.nonce_manager is None:
+            return await send_with_nonce(await self.get_nonce(account.address))
+        return await self.nonce_manager.send(account.address, send_with_nonce)
+
+    async def _wait_for_receipt(self, tx_hash, on_receipt=None):
+        receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=self.receipt_timeout)
+        self.log(f"Receipt: {receipt}")
+        return on_receipt(receipt) if on_receipt else receipt
+
+    async def _transact(self, account, contract, fn_name, args, trader_address=None, label='', on_receipt=None):
+        """
+        Build, sign and send contract.fn_name(*args) from `account` - wrapped in delegatedAction
+        when delegation is enabled and a trader address is given - then wait for the receipt
+        """
+        if self.use_delegation and trader_address:
+            self.log(
+                f"Using delegatedAction to {label} on behalf of {trader_address}")
+            inner_encoded_data = contract.encode_abi(fn_name, args=args)
+            function = self.ostium_trading_contract.functions.delegatedAction(
+                trader_address, inner_encoded_data)
+        else:
+            function = getattr(contract.functions, fn_name)(*args)
+
+        tx = await function.build_transaction(await self._tx_params(account))
+        tx_hash = await self._send_transaction(tx, account)
+        self.log(f"{label} TX Hash: {tx_hash.hex()}")
+        return await self._wait_for_receipt(tx_hash, on_receipt)
+
+    def _raise_parsed(self, e, process):
+        reason_string, suggestion = fromErrorCodeToMessage(
+            e, verbose=self.verbose)
+        print(
+            f"An error ({str(e)}) occurred during the {process} process - parsed as {reason_string}")
+        raise Exception(
+            f'{reason_string}\n\n{suggestion}' if suggestion != None else reason_string)
+
+    async def perform_trade(self, trade_params, at_price):
+        self.log(f"Performing trade with params: {trade_params}")
+        account = self._get_account()
+        amount = to_base_units(trade_params['collateral'], decimals=6)
+        await self._approve(account, amount, self.use_delegation,
+                            trade_params.get('trader_address'))
+
+        try:
+            args = self._open_trade_args(trade_params, at_price, account)
+            return await self._transact(
+                account, self.ostium_trading_contract, 'openTrade', args,
+                trade_params.get('trader_address'), 'trade', self._receipt_with_order_id)
+        except Exception as e:
+            self._raise_parsed(e, 'trading')
+
+    async def cancel_limit_order(self, pair_id, trade_index, trader_address=None):
+        account = self._get_account()
+        try:
+            return await self._transact(
+                account, self.ostium_trading_contract, 'cancelOpenLimitOrder',
+                [int(pair_id), int(trade_index)], trader_address, 'cancel limit order')
+        except Exception as e:
+            self._raise_parsed(e, 'cancel limit order')
+
+    async def close_trade(self, pair_id, trade_index, market_price, close_percentage=100, trader_address=None):
+        self.log(f"Closing trade for pair {pair_id}, index {trade_index}")
+        account = self._get_account()
+        args = [int(pair_id), int(trade_index), int(to_base_units(close_percentage, decimals=2)),
+                convert_to_scaled_integer(market_price), int(self.slippage_percentage * PRECISION_2)]
+        return await self._transact(
+            account, self.ostium_trading_contract, 'closeTradeMarket', args,
+            trader_address, 'close trade', self._receipt_with_order_id)
+
+    async def close_market_timeout(self, order_id, retry=False, trader_address=None):
+        self.log(f"Closing market timeout for order {order_id}, retry={retry}")
+        account = self._get_account()
+        try:
+            receipt = await self._transact(
+                account, self.ostium_trading_contract, 'closeTradeMarketTimeout',
+                [int(order_id), bool(retry)], trader_address, 'close market timeout')
+            return {
+                'receipt': receipt,
+                'order_id': order_id,
+                'retry': retry
+            }
+        except Exception as e:
+            self._raise_parsed(e, 'close market timeout')
+
+    async def open_market_timeout(self, order_id, trader_address=None):
+        self.log(f"Opening market timeout for order {order_id}")
+        account = self._get_account()
+        try:
+            receipt = await self._transact(
+                account, self.ostium_trading_contract, 'openTradeMarketTimeout',
+                [int(order_id)], trader_address, 'open market timeout')
+            return {
+                'receipt': receipt,
+                'order_id': order_id
+            }
+        except Exception as e:
+            self._raise_parsed(e, 'open market timeout')
+
+    async def remove_collateral(self, pair_id, trade_index, remove_amount):
+        self.log(
+            f"Remove collateral for trade for pair {pair_id}, index {trade_index}: {remove_amount} USDC")
+        account = self._get_account()
+        amount = to_base_units(remove_amount, decimals=6)
+        return await self._transact(
+            account, self.ostium_trading_contract, 'removeCollateral',
+            [int(pair_id), int(trade_index), int(amount)], label='remove collateral')
+
+    async def add_collateral(self, pairID, index, collateral, trader_address=None):
+        account = self._get_account()
+        try:
+            amount = to_base_units(collateral, decimals=6)
+            await self._approve(account, amount, self.use_delegation, trader_address)
+            return await self._transact(
+                account, self.ostium_trading_contract, 'topUpCollateral',
+                [int(pairID), int(index), amount], trader_address, 'add collateral')
+        except Exception as e:
+            self._raise_parsed(e, 'add collateral')
+
+    async def update_tp(self, pair_id, trade_index, tp_price, trader_address=None):
+        self.log(
+            f"Updating TP for pair {pair_id}, index {trade_index} to {tp_price}")
+        account = self._get_account()
+        try:
+            return await self._transact(
+                account, self.ostium_trading_contract, 'updateTp',
+                [int(pair_id), int(trade_index), to_base_units(tp_price, decimals=18)],
+                trader_address, 'update TP')
+        except Exception as e:
+            self._raise_parsed(e, 'update tp')
+
+    async def update_sl(self, pairID, index, sl, trader_address=None):
+        account = self._get_account()
+        try:
+            return await self._transact(
+                account, self.ostium_trading_contract, 'updateSl',
+                [int(pairID), int(index), to_base_units(sl, decimals=18)],
+                trader_address, 'update SL')
+        except Exception as e:
+            self._raise_parsed(e, 'update sl')
+
+    async def _approve(self, account, collateral, use_delegation, trader_address=None):
+        trader_address = trader_address if trader_address and use_delegation else account.address
+        allowance = await self.usdc_contract.functions.allowance(
+            trader_address, self.ostium_trading_storage_address).call()
+
+        if allowance < collateral:
+            if not use_delegation:
+                await self._transact(
+                    account, self.usdc_contract, 'approve',
+                    [self.ostium_trading_storage_address, self.web3.to_wei(1000000, 'mwei')],
+                    label='approval')
+            else:
+                raise Exception(
+                    f"Sufficient allowance for {trader_address} not present. Please approve the trading contract to spend USDC.")
+
+    async def withdraw(self, amount, receiving_address):
+        account = self._get_account()
+        try:
+            if not self.web3.is_address(receiving_address):
+                raise ValueError("Invalid Arbitrum address format")
+            return await self._transact(
+                account, self.usdc_contract, 'transfer',
+                [receiving_address, to_base_units(amount, decimals=6)], label='transfer')
+        except Exception as e:
+            self._raise_parsed(e, 'transfer')
+
+    async def update_limit_order(self, pair_id, index, pvt_key, price=None, tp=None, sl=None):
+        try:
+            account = self.web3.eth.account.from_key(pvt_key)
+            existing_order = await self.ostium_trading_storage_contract.functions.getOpenLimitOrder(
+                account.address,
+                int(pair_id),
+                int(index)
+            ).call()
+
+            self.log(f"existing_order {existing_order}")
+            # Use existing values if new values are not provided
+            price_value = convert_to_scaled_integer(
+                price) if price is not None else existing_order[1]  # openPrice
+            tp_value = convert_to_scaled_integer(
+                tp) if tp is not None else existing_order[2]    # tp
+            sl_value = convert_to_scaled_integer(
+                sl) if sl is not None else existing_order[3]    # sl
+
+            return await self._transact(
+                account, self.ostium_trading_contract, 'updateOpenLimitOrder',
+                [int(pair_id), int(index), price_value, tp_value, sl_value], label='update limit order')
+        except Exception as e:
+            self._raise_parsed(e, 'update limit order')
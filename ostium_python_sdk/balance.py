@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 import time
@@ -56,3 +57,44 @@ class Balance:
     def get_ether_balance(self, address):
         ret = Web3.from_wei(self.web3.eth.get_balance(address), 'ether')
         return ret
+
+
+class AsyncBalance(Balance):
+    """Balance over an AsyncWeb3 instance, the methods reading the chain are coroutines"""
+
+    async def get_balance(self, address, refresh=False):
+        if address not in self.balances:
+            self.balances[address] = {'ether': None,
+                                      'usdc': None, 'last_refresh': None}
+
+        balance_info = self.balances[address]
+        if balance_info['last_refresh'] is None:
+            too_old = True
+        else:
+            too_old = time.time() - \
+                balance_info['last_refresh'] > REFRESH_BALANCE_SECONDS_INTERVAL
+
+        if (refresh or too_old or balance_info['ether'] is None or balance_info['usdc'] is None):
+            await self.read_balances(address)
+
+        return self.balances[address]['ether'], self.balances[address]['usdc']
+
+    async def read_balances(self, address):
+        start_time = time.time()
+        ether, usdc = await asyncio.gather(
+            self.get_ether_balance(address), self.get_usdc_balance(address))
+        self.balances[address] = {
+            'ether': Decimal(ether),
+            'usdc': Decimal(usdc),
+            'last_refresh': start_time
+        }
+
+    async def get_usdc_balance(self, address):
+        balance = await self.usdc_contract.functions.balanceOf(address).call()
+        balance = Web3.to_wei(balance, 'szabo')
+        balance = Web3.from_wei(balance, 'ether')
+        return balance
+
+    async def get_ether_balance(self, address):
+        ret = Web3.from_wei(await self.web3.eth.get_balance(address), 'ether')
+        return ret
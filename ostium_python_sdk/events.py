@@ -0,0 +1,247 @@
+import asyncio
+import re
+from typing import NamedTuple
+
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+
+from .abi.trading_abi import trading_abi
+from .multicall import named_output
+from .utils import build_event_topics
+
+# Blocks per eth_getLogs request to start with, and the bounds the adaptive size stays within
+DEFAULT_CHUNK_SIZE = 2000
+MAX_CHUNK_SIZE = 100000
+
+# Logs per response the chunk size is tuned for, a chunk returning fewer than half of it grows
+DEFAULT_TARGET_LOGS = 5000
+
+# Fragments of the errors nodes return when a range has too many logs / takes too long
+RANGE_ERRORS = ('too many', 'more than', 'limit exceeded', 'response size', 'block range',
+                'range is too large', 'range too large', 'query timeout', 'timed out')
+
+# "... this block range should work: [0x1f, 0x2a]" (Alchemy, Infura, ...)
+SUGGESTED_RANGE = re.compile(r'\[\s*(0x[0-9a-fA-F]+)\s*,\s*(0x[0-9a-fA-F]+)\s*\]')
+
+DYNAMIC_TYPES = ('string', 'bytes', 'tuple')
+
+
+class TradingEvent(NamedTuple):
+    """A decoded Trading contract event log"""
+    name: str
+    args: dict
+    block_number: int
+    log_index: int
+    transaction_hash: str
+    address: str
+
+
+class _EventDecoder:
+    """Types and names of one event, worked out once from its ABI"""
+
+    def __init__(self, event_abi):
+        self.name = event_abi['name']
+        inputs = [dict(item, name=item['name'] or f"arg{position}")
+                  for position, item in enumerate(event_abi['inputs'])]
+        self.indexed = [(item, collapse_if_tuple(item)) for item in inputs if item['indexed']]
+        self.data = [item for item in inputs if not item['indexed']]
+        self.data_types = [collapse_if_tuple(item) for item in self.data]
+        self.names = [item['name'] for item in inputs]
+
+    def decode(self, codec, log):
+        values = {}
+        for (item, abi_type), topic in zip(self.indexed, log['topics'][1:]):
+            # indexed strings, bytes, arrays and structs are only stored as their keccak hash
+            if abi_type.startswith(DYNAMIC_TYPES) or abi_type.endswith(']'):
+                values[item['name']] = bytes(topic)
+            else:
+                values[item['name']] = named_output(item, codec.decode([abi_type], topic)[0])
+        if self.data:
+            data = codec.decode(self.data_types, bytes(log['data']))
+            for item, value in zip(self.data, data):
+                values[item['name']] = named_output(item, value)
+        return {name: values[name] for name in self.names}
+
+
+class TradingEventIndexer:
+    """
+    Backfills and decodes the events of the Trading contract (MarketOpenOrderInitiated,
+    MarketCloseOrderInitiated, OpenLimitPlaced, TpUpdated, SlUpdated, TopUpCollateralExecuted, ...)
+    straight from eth_getLogs, without the subgraph.
+
+    A block range is read in chunks of `chunk_size` blocks, one eth_getLogs per chunk filtered on
+    the contract address and the topics of the wanted events. The chunk size adapts: a "too many
+    results" / response size / timeout error halves it (or uses the range the node suggests)
+    and the chunk is retried. A chunk returning fewer than `target_logs / 2` logs doubles it, up
+    to `max_chunk_size`. Event topics and decoding types are computed once, when the indexer is
+    created.
+
+    Events are yielded chunk by chunk as TradingEvent records, in block / log order, so a long
+    history can be replayed with memory bounded by a chunk:
+
+        for event in indexer.events(from_block=250000000):
+            ...
+
+    Args:
+        w3: Web3 instance connected to the Arbitrum network
+        ostium_trading_address: Contract address for the Ostium trading contract
+        events: Names of the events to index, every event of the Trading ABI if None
+        chunk_size: Blocks per eth_getLogs request to start with
+        max_chunk_size: Upper bound of the adaptive chunk size
+        target_logs: Number of logs per response the chunk size is tuned for
+        verbose: Whether to log detailed information
+    """
+
+    def __init__(self, w3: Web3, ostium_trading_address: str, events=None, chunk_size=DEFAULT_CHUNK_SIZE, max_chunk_size=MAX_CHUNK_SIZE, target_logs=DEFAULT_TARGET_LOGS, verbose=False) -> None:
+        if chunk_size < 1 or max_chunk_size < chunk_size:
+            raise ValueError("chunk_size must be at least 1 and at most max_chunk_size")
+        self.web3 = w3
+        self.verbose = verbose
+        self.address = ostium_trading_address
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_logs = target_logs
+
+        # {event name: topic0} and {topic0: decoder}
+        event_abis = {entry['name']: entry for entry in trading_abi if entry.get('type') == 'event'}
+        self.event_topics = build_event_topics(trading_abi)
+        self.decoders = {self.event_topics[name]: _EventDecoder(event_abi)
+                         for name, event_abi in event_abis.items()}
+        self.event_names = events
+        self.topics = self.topics_for(events)
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def topics_for(self, events=None):
+        """topic0 filter (hex strings) for the event names `events`, the indexer events if None"""
+        events = self.event_names if events is None else events
+        if events is None:
+            return [Web3.to_hex(topic) for topic in self.event_topics.values()]
+        unknown = [name for name in events if name not in self.event_topics]
+        if unknown:
+            raise ValueError(f"Unknown Trading events: {', '.join(unknown)}")
+        return [Web3.to_hex(self.event_topics[name]) for name in events]
+
+    def decode(self, log):
+        """TradingEvent of a raw log, None if the log is not a Trading event"""
+        decoder = self.decoders.get(bytes(log['topics'][0])) if log['topics'] else None
+        if decoder is None:
+            return None
+        return TradingEvent(
+            decoder.name, decoder.decode(self.web3.codec, log), log['blockNumber'], log['logIndex'],
+            Web3.to_hex(log['transactionHash']), log['address'])
+
+    def _filter(self, start, end, topics):
+        return {'address': self.address, 'fromBlock': start, 'toBlock': end, 'topics': [topics]}
+
+    def _range_end(self, start, to_block):
+        return min(to_block, start + self.chunk_size - 1)
+
+    def _shrink(self, error, start, end):
+        """Lowers the chunk size after `error` for [start, end], re-raises errors unrelated to the range size"""
+        message = str(error).lower()
+        if not any(fragment in message for fragment in RANGE_ERRORS):
+            raise error
+        if end <= start:
+            raise error
+        suggested = SUGGESTED_RANGE.search(message)
+        if suggested and int(suggested.group(1), 16) == start and start <= int(suggested.group(2), 16) < end:
+            self.chunk_size = int(suggested.group(2), 16) - start + 1
+        else:
+            self.chunk_size = max(1, (end - start + 1) // 2)
+        self.log(f"eth_getLogs [{start}, {end}] too large, retrying with {self.chunk_size} blocks")
+
+    def _adapt(self, logs_count):
+        if logs_count > self.target_logs:
+            self.chunk_size = max(1, self.chunk_size // 2)
+        elif logs_count < self.target_logs // 2:
+            self.chunk_size = min(self.max_chunk_size, self.chunk_size * 2)
+
+    def _decode_chunk(self, logs):
+        events = []
+        for log in logs:
+            event = self.decode(log)
+            if event is not None:
+                events.append(event)
+        events.sort(key=lambda event: (event.block_number, event.log_index))
+        return events
+
+    def _fetch(self, start, to_block, topics):
+        while True:
+            end = self._range_end(start, to_block)
+            try:
+                logs = self.web3.eth.get_logs(self._filter(start, end, topics))
+            except Exception as e:
+                self._shrink(e, start, end)
+                continue
+            self._adapt(len(logs))
+            return start, end, logs
+
+    def chunks(self, from_block, to_block=None, events=None):
+        """
+        (start, end, events) of each chunk read, every block of [from_block, to_block] in exactly
+        one chunk - empty chunks included, so a caller can checkpoint `end` and resume from end + 1.
+
+        Args:
+            from_block: First block to read
+            to_block: Last block to read (inclusive), the latest block if None
+            events: Event names to read, the indexer events if None
+        """
+        topics = self.topics if events is None else self.topics_for(events)
+        if to_block is None:
+            to_block = self.web3.eth.block_number
+        start = from_block
+        while start <= to_block:
+            start, end, logs = self._fetch(start, to_block, topics)
+            self.log(f"eth_getLogs [{start}, {end}]: {len(logs)} logs")
+            yield start, end, self._decode_chunk(logs)
+            start = end + 1
+
+    def events(self, from_block, to_block=None, events=None):
+        """TradingEvent records of [from_block, to_block], see chunks()"""
+        for _, _, chunk in self.chunks(from_block, to_block, events):
+            yield from chunk
+
+
+class AsyncTradingEventIndexer(TradingEventIndexer):
+    """
+    TradingEventIndexer over an AsyncWeb3 instance, chunks() / events() are async generators.
+    The next chunk is requested while the current one is being consumed, so at most one
+    decoded chunk and one raw chunk are held in memory:
+
+        async for event in indexer.events(from_block=250000000):
+            ...
+    """
+
+    async def _fetch(self, start, to_block, topics):
+        while True:
+            end = self._range_end(start, to_block)
+            try:
+                logs = await self.web3.eth.get_logs(self._filter(start, end, topics))
+            except Exception as e:
+                self._shrink(e, start, end)
+                continue
+            self._adapt(len(logs))
+            return start, end, logs
+
+    async def chunks(self, from_block, to_block=None, events=None):
+        topics = self.topics if events is None else self.topics_for(events)
+        if to_block is None:
+            to_block = await self.web3.eth.block_number
+        fetch = asyncio.ensure_future(self._fetch(from_block, to_block, topics)) if from_block <= to_block else None
+        try:
+            while fetch is not None:
+                start, end, logs = await fetch
+                self.log(f"eth_getLogs [{start}, {end}]: {len(logs)} logs")
+                fetch = asyncio.ensure_future(self._fetch(end + 1, to_block, topics)) if end < to_block else None
+                yield start, end, self._decode_chunk(logs)
+        finally:
+            if fetch is not None:
+                fetch.cancel()
+
+    async def events(self, from_block, to_block=None, events=None):
+        async for _, _, chunk in self.chunks(from_block, to_block, events):
+            for event in chunk:
+                yield event
@@ -2,6 +2,7 @@ from decimal import Decimal, getcontext, ROUND_DOWN
 from .constants import MAX_PROFIT_P, MIN_LOSS_P, PRECISION_2, PRECISION_6, PRECISION_18
 from typing import Dict
 from .scscript.funding import getPendingAccFundingFees, getTargetFundingRate
+from .scscript import fixed_point
 
 quantization_6 = Decimal('0.000001')
 quantization_18 = Decimal('0.000000000000000001')
@@ -265,3 +266,83 @@ def GetFundingRate(
         'latestFundingRate': latest_funding_rate,
         'targetFundingRate': target_funding_rate
     }
+
+
+def ProjectFundingRate(
+    accPerOiLong: str,
+    accPerOiShort: str,
+    lastFundingRate: str,
+    maxFundingFeePerBlock: str,
+    lastUpdateBlock: str,
+    blocks,
+    oiLong: str,
+    oiShort: str,
+    oiCap: str,
+    hillInflectionPoint: str,
+    hillPosScale: str,
+    hillNegScale: str,
+    springFactor: str,
+    sFactorUpScaleP: str,
+    sFactorDownScaleP: str,
+    oiScenario=None
+):
+    """
+    GetFundingRate() for many future blocks in one call: the accumulated funding (long / short),
+    the funding rate and the target funding rate at each of `blocks`, in the order given.
+
+    Funding relaxes towards the target rate in closed form (see getPendingAccFundingFees), so every
+    block is evaluated directly instead of stepping block by block. `oiScenario` optionally lists
+    open interest changes as (block, oiLong, oiShort), same units as oiLong / oiShort: funding is
+    settled at each change, like the contracts do on every trade, and continues with the new OI.
+    Without a scenario the current OI is assumed to stay constant.
+
+    Uses the integer engine (scscript.fixed_point), so results equal the contract math exactly.
+    Returns a dict of lists (Decimal, 1e18 precision removed) keyed by 'blocks', 'accFundingLong',
+    'accFundingShort', 'fundingRate' and 'targetFundingRate'.
+    """
+    params = dict(
+        OiCap=int(oiCap),
+        maxFundingFeePerBlock=int(maxFundingFeePerBlock),
+        hillInflectionPoint=int(hillInflectionPoint),
+        hillPosScale=int(hillPosScale),
+        hillNegScale=int(hillNegScale),
+        springFactor=int(springFactor),
+        sFactorUpScale=int(sFactorUpScaleP),
+        sFactorDownScaleP=int(sFactorDownScaleP),
+    )
+    blocks = [int(block) for block in blocks]
+    changes = sorted((int(block), int(long_oi), int(short_oi))
+                     for block, long_oi, short_oi in (oiScenario or []))
+
+    # settled state: block, accFundingLong, accFundingShort, fundingRate, OI long, OI short
+    state_block = int(lastUpdateBlock)
+    value_long, value_short = int(accPerOiLong), int(accPerOiShort)
+    funding_rate = int(lastFundingRate)
+    long_oi, short_oi = int(oiLong), int(oiShort)
+    next_change = 0
+
+    results = {}
+    for block in sorted(set(blocks)):
+        if block < int(lastUpdateBlock):
+            raise ValueError(
+                f"Cannot project funding at block {block}, before the last funding update ({lastUpdateBlock})")
+        while next_change < len(changes) and changes[next_change][0] <= block:
+            change_block, new_long_oi, new_short_oi = changes[next_change]
+            if change_block > state_block:
+                value_long, value_short, funding_rate, _ = fixed_point.getPendingAccFundingFees(
+                    change_block, state_block, value_long, value_short, long_oi, short_oi,
+                    lastFundingRate=funding_rate, **params)
+                state_block = change_block
+            long_oi, short_oi = new_long_oi, new_short_oi
+            next_change += 1
+        results[block] = fixed_point.getPendingAccFundingFees(
+            block, state_block, value_long, value_short, long_oi, short_oi,
+            lastFundingRate=funding_rate, **params)
+
+    return {
+        'blocks': blocks,
+        'accFundingLong': [Decimal(results[block][0]) / PRECISION_18 for block in blocks],
+        'accFundingShort': [Decimal(results[block][1]) / PRECISION_18 for block in blocks],
+        'fundingRate': [Decimal(results[block][2]) / PRECISION_18 for block in blocks],
+        'targetFundingRate': [Decimal(results[block][3]) / PRECISION_18 for block in blocks],
+    }
@@ -0,0 +1,168 @@
+"""
+Vectorized (NumPy) counterpart of formulae_wrapper.get_trade_metrics(), for valuing many trades at once.
+
+NumPy is an optional dependency: pip install "ostium-python-sdk[numpy]"
+
+The batch engine works in float64, where the scalar path uses Decimal. Results agree with
+get_trade_metrics() within BATCH_RTOL relative / BATCH_ATOL absolute tolerance - the atol
+covers the 6-decimal ROUND_DOWN steps of the liquidation price, which float64 may land one
+unit (1e-6) apart from Decimal on exact rounding boundaries.
+"""
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+from .constants import MAX_PROFIT_P, MIN_LOSS_P, PRECISION_2, PRECISION_18
+from .formulae import GetCurrentRolloverFee, GetFundingRate
+
+BATCH_RTOL = 1e-9
+BATCH_ATOL = 1e-6
+
+# Keys of the dict returned by trade_metrics_batch() / get_trade_metrics_batch()
+BATCH_METRICS = ('pnl', 'pnl_percent', 'rollover', 'funding', 'net_pnl', 'net_value',
+                 'liquidation_price', 'price_impact')
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "The batch engine requires numpy: pip install \"ostium-python-sdk[numpy]\"")
+
+
+def _floor_6(values):
+    # ROUND_DOWN (towards zero) to 6 decimals, like Decimal.quantize(quantization_6, ROUND_DOWN).
+    # Values sitting on a 6-decimal boundary in exact arithmetic (e.g. 0.25 * 13.09 / 100) may come
+    # out of float64 a hair below it, snap those so truncation does not drop a whole unit.
+    scaled = values * 1e6
+    nearest = np.rint(scaled)
+    scaled = np.where(np.abs(scaled - nearest) <= np.abs(scaled) * 1e-12, nearest, scaled)
+    return np.trunc(scaled) / 1e6
+
+
+def trade_metrics_batch(open_price, collateral, leverage, highest_leverage, is_buy,
+                        trade_funding, trade_rollover,
+                        acc_funding_long, acc_funding_short, acc_rollover,
+                        bid, ask, max_leverage, liq_margin_threshold_p=25, mid=None):
+    """
+    Metrics of many trades in one vectorized pass, every argument is a scalar or an array
+    broadcastable to the number of trades, in human units (not the raw on-chain integers):
+
+        open_price, bid, ask, mid      price, e.g. 107646.01 (mid is optional)
+        collateral                     USDC
+        leverage, highest_leverage     e.g. 10 for 10x
+        is_buy                         bool
+        trade_funding, trade_rollover  accumulated funding / rollover per OI when the trade opened
+        acc_funding_long/short         current accumulated funding per OI of the trade's pair
+        acc_rollover                   current accumulated rollover per OI of the trade's pair
+        max_leverage                   the pair max leverage, e.g. 100
+        liq_margin_threshold_p         as returned by subgraph.get_liq_margin_threshold_p(), e.g. 25
+
+    Returns a dict of float64 arrays keyed by BATCH_METRICS, same meaning as get_trade_metrics().
+    Like formulae.GetPriceImpact, rows with a zero `mid` close at a price of 0.
+    """
+    _require_numpy()
+    open_price = np.asarray(open_price, dtype=np.float64)
+    collateral = np.asarray(collateral, dtype=np.float64)
+    leverage = np.asarray(leverage, dtype=np.float64)
+    highest_leverage = np.asarray(highest_leverage, dtype=np.float64)
+    is_buy = np.asarray(is_buy, dtype=bool)
+
+    notional = collateral * leverage
+    rollover = (np.asarray(acc_rollover, dtype=np.float64) -
+                np.asarray(trade_rollover, dtype=np.float64)) * notional
+    current_funding = np.where(is_buy, np.asarray(acc_funding_long, dtype=np.float64),
+                               np.asarray(acc_funding_short, dtype=np.float64))
+    funding = (current_funding - np.asarray(trade_funding, dtype=np.float64)) * notional
+
+    # liquidation price (scscript.pairinfos.getTradeLiquidationPrice)
+    adjusted_threshold = _floor_6(
+        float(Decimal(liq_margin_threshold_p) / PRECISION_2) * leverage / np.asarray(max_leverage, dtype=np.float64))
+    liq_margin_value = _floor_6(collateral * adjusted_threshold)
+    target_collateral = collateral - liq_margin_value - rollover - funding
+    liq_price_distance = _floor_6(open_price * target_collateral / collateral / leverage)
+    liquidation_price = np.maximum(0.0, np.where(
+        is_buy, open_price - liq_price_distance, open_price + liq_price_distance))
+
+    # a close executes at the bid for longs and at the ask for shorts (formulae.GetPriceImpact)
+    close_price = np.where(is_buy, np.asarray(bid, dtype=np.float64),
+                           np.asarray(ask, dtype=np.float64))
+    if mid is not None:
+        # no price impact without a mid price, GetPriceImpact returns 0 as the price after impact
+        close_price = np.where(np.asarray(mid, dtype=np.float64) == 0, 0.0, close_price)
+
+    # formulae.CurrentTradeProfitP / CurrentTradeProfitRaw
+    leverage_to_use = np.maximum(leverage, highest_leverage)
+    price_diff = np.where(is_buy, close_price - open_price, open_price - close_price)
+    profit_p = np.minimum(price_diff / open_price * leverage_to_use * 100, float(MAX_PROFIT_P))
+    profit_p = profit_p * (leverage / leverage_to_use)
+    pnl = collateral * profit_p / 100
+
+    net_pnl = pnl - rollover - funding
+    pnl_percent = np.maximum(net_pnl * 100 / collateral, float(MIN_LOSS_P))
+
+    return {
+        'pnl': pnl,
+        'pnl_percent': pnl_percent,
+        'rollover': rollover,
+        'funding': funding,
+        'net_pnl': net_pnl,
+        'net_value': net_pnl + collateral,
+        'liquidation_price': liquidation_price,
+        'price_impact': close_price,
+    }
+
+
+def get_trade_metrics_batch(trades, prices, block_number, pairs_max_leverage, liq_margin_threshold_p=25):
+    """
+    Batch version of get_trade_metrics() over open trades as returned by the subgraph.
+
+    `prices` maps (from, to) to price data (e.g. PriceSnapshot.by_pair), `pairs_max_leverage`
+    maps pair id to max leverage (e.g. sdk.get_pairs_max_leverage()). The pair funding and
+    rollover state is computed once per pair, then every trade is valued in one vectorized pass.
+    Returns a dict of arrays keyed by BATCH_METRICS, in the order of `trades`.
+    """
+    _require_numpy()
+    n = len(trades)
+    columns = {name: np.empty(n, dtype=np.float64) for name in (
+        'open_price', 'collateral', 'leverage', 'highest_leverage', 'trade_funding', 'trade_rollover',
+        'acc_funding_long', 'acc_funding_short', 'acc_rollover', 'bid', 'ask', 'mid', 'max_leverage')}
+    is_buy = np.empty(n, dtype=bool)
+
+    pair_state = {}
+    for i, t in enumerate(trades):
+        pair_info = t['pair']
+        pair_id = int(pair_info['id'])
+        state = pair_state.get(pair_id)
+        if state is None:
+            funding_rate = GetFundingRate(
+                pair_info['accFundingLong'], pair_info['accFundingShort'], pair_info['lastFundingRate'],
+                pair_info['maxFundingFeePerBlock'], pair_info['lastFundingBlock'], str(block_number),
+                pair_info['longOI'], pair_info['shortOI'], pair_info['maxOI'],
+                pair_info['hillInflectionPoint'], pair_info['hillPosScale'], pair_info['hillNegScale'],
+                pair_info['springFactor'], pair_info['sFactorUpScaleP'], pair_info['sFactorDownScaleP'])
+            acc_rollover = GetCurrentRolloverFee(
+                pair_info['accRollover'], pair_info['lastRolloverBlock'],
+                pair_info['rolloverFeePerBlock'], str(block_number)) / PRECISION_18
+            price_data = prices.get((pair_info['from'], pair_info['to']))
+            if price_data is None:
+                raise ValueError(
+                    f"No price found for pair: {pair_info['from']}/{pair_info['to']}")
+            state = pair_state[pair_id] = (
+                float(funding_rate['accFundingLong']), float(funding_rate['accFundingShort']),
+                float(acc_rollover), float(price_data['bid']), float(price_data['ask']),
+                float(price_data['mid']), float(pairs_max_leverage[pair_id]))
+
+        (columns['acc_funding_long'][i], columns['acc_funding_short'][i], columns['acc_rollover'][i],
+         columns['bid'][i], columns['ask'][i], columns['mid'][i], columns['max_leverage'][i]) = state
+        columns['open_price'][i] = int(t['openPrice']) / 1e18
+        columns['collateral'][i] = int(t['collateral']) / 1e6
+        columns['leverage'][i] = int(t['leverage']) / 1e2
+        columns['highest_leverage'][i] = int(t['highestLeverage']) / 1e2
+        columns['trade_funding'][i] = int(t['funding']) / 1e18
+        columns['trade_rollover'][i] = int(t['rollover']) / 1e18
+        is_buy[i] = t['isBuy']
+
+    return trade_metrics_batch(is_buy=is_buy, liq_margin_threshold_p=liq_margin_threshold_p, **columns)
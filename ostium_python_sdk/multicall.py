@@ -0,0 +1,133 @@
+import asyncio
+
+from eth_utils.abi import get_abi_output_types
+from hexbytes import HexBytes
+from web3 import Web3
+
+from .abi.multicall3_abi import multicall3_abi
+
+# Multicall3 has the same address on Arbitrum One, Arbitrum Sepolia and most other chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+# Calls per aggregate3 eth_call, keeps a request well below node gas / response size limits
+DEFAULT_MAX_CALLS = 500
+
+
+def named_output(output_abi, value):
+    """Decoded ABI value with structs (tuples) turned into dicts keyed by component name, arrays into lists and addresses checksummed"""
+    abi_type = output_abi['type']
+    if abi_type.endswith(']'):
+        item_abi = dict(output_abi, type=abi_type[:abi_type.rindex('[')])
+        return [named_output(item_abi, item) for item in value]
+    if abi_type == 'tuple':
+        return {component['name']: named_output(component, item)
+                for component, item in zip(output_abi['components'], value)}
+    if abi_type == 'address':
+        return Web3.to_checksum_address(value)
+    return value
+
+
+class Multicall:
+    """
+    Reads many contract view functions through Multicall3 `aggregate3`, one eth_call per
+    chunk of `max_calls` calls instead of one eth_call per function.
+
+    Calls are (contract, fn_name, args) triples (e.g. (storage, 'getOpenTrade', [trader, 0, 0])),
+    encoded with contract.encode_abi(). Results are returned in the same order and decoded like
+    .call() would, with structs - and multiple named return values - as dicts. A call that reverts yields None (allowFailure),
+    it does not fail the whole batch.
+
+    Args:
+        w3: Web3 instance connected to the Arbitrum network
+        address: Multicall3 contract address
+        max_calls: Maximum number of calls aggregated into a single eth_call
+        verbose: Whether to log detailed information
+    """
+
+    def __init__(self, w3: Web3, address: str = MULTICALL3_ADDRESS, max_calls=DEFAULT_MAX_CALLS, verbose=False) -> None:
+        if max_calls < 1:
+            raise ValueError("max_calls must be at least 1")
+        self.web3 = w3
+        self.address = address
+        self.max_calls = max_calls
+        self.verbose = verbose
+        self.contract = self.web3.eth.contract(address=address, abi=multicall3_abi)
+        # {(contract address, fn_name): function ABI}
+        self._function_abis = {}
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def resolve_block_number(self, block_identifier='latest'):
+        """
+        L2 block number of `block_identifier` ('latest', 'safe', a number, ...), to pin every chunk
+        of a read to. Multicall3.getBlockNumber() is not used for this: on Arbitrum it returns
+        Solidity `block.number`, an approximation of the L1 block number.
+        """
+        if isinstance(block_identifier, int):
+            return block_identifier
+        return self.web3.eth.get_block(block_identifier)['number']
+
+    def _chunks(self, calls):
+        return [calls[start:start + self.max_calls] for start in range(0, len(calls), self.max_calls)]
+
+    def _function_abi(self, contract, fn_name):
+        key = (contract.address, fn_name)
+        function_abi = self._function_abis.get(key)
+        if function_abi is None:
+            function_abi = self._function_abis[key] = contract.get_function_by_name(fn_name).abi
+        return function_abi
+
+    def _aggregate(self, calls):
+        return self.contract.functions.aggregate3([
+            (contract.address, True, HexBytes(contract.encode_abi(fn_name, args=args)))
+            for contract, fn_name, args in calls])
+
+    def _decode(self, calls, results):
+        decoded = []
+        for (contract, fn_name, _), (success, return_data) in zip(calls, results):
+            if not success or not return_data:
+                decoded.append(None)
+                continue
+            function_abi = self._function_abi(contract, fn_name)
+            outputs = function_abi['outputs']
+            output_types = get_abi_output_types(function_abi)
+            values = self.web3.codec.decode(output_types, return_data)
+            if len(outputs) == 1:
+                decoded.append(named_output(outputs[0], values[0]))
+            elif all(output['name'] for output in outputs):
+                decoded.append({output['name']: named_output(output, value) for output, value in zip(outputs, values)})
+            else:
+                decoded.append(tuple(named_output(output, value) for output, value in zip(outputs, values)))
+        return decoded
+
+    def call(self, calls, block_identifier='latest'):
+        """Results of `calls`, in order (None for a reverted call), all read at `block_identifier`"""
+        calls = list(calls)
+        chunks = self._chunks(calls)
+        self.log(f"Multicall: {len(calls)} calls in {len(chunks)} eth_call(s) at block {block_identifier}")
+        results = []
+        for chunk in chunks:
+            results.extend(self._decode(chunk, self._aggregate(chunk).call(block_identifier=block_identifier)))
+        return results
+
+
+class AsyncMulticall(Multicall):
+    """Multicall over an AsyncWeb3 instance, call() is a coroutine and sends the chunks concurrently"""
+
+    async def resolve_block_number(self, block_identifier='latest'):
+        if isinstance(block_identifier, int):
+            return block_identifier
+        return (await self.web3.eth.get_block(block_identifier))['number']
+
+    async def call(self, calls, block_identifier='latest'):
+        calls = list(calls)
+        chunks = self._chunks(calls)
+        self.log(f"Multicall: {len(calls)} calls in {len(chunks)} eth_call(s) at block {block_identifier}")
+        responses = await asyncio.gather(*(
+            self._aggregate(chunk).call(block_identifier=block_identifier) for chunk in chunks))
+        results = []
+        for chunk, response in zip(chunks, responses):
+            results.extend(self._decode(chunk, response))
+        return results
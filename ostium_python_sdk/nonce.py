@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+# Substrings of node errors meaning the nonce we sent is already taken (mined or pending)
+NONCE_TOO_LOW_ERRORS = (
+    'nonce too low',
+    'nonce is too low',
+    'replacement transaction underpriced',
+)
+
+
+def is_nonce_too_low_error(error) -> bool:
+    message = str(error).lower()
+    return any(pattern in message for pattern in NONCE_TOO_LOW_ERRORS)
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces per signing address from a local counter.
+
+    The first allocation for an address (and the first one after a resync) reads the pending
+    transaction count from the chain via `fetch_nonce(address)`, every following one is
+    the previous nonce + 1 without any RPC call. Allocation is thread safe, so many
+    transactions can be signed and sent concurrently without waiting for receipts. The node
+    is never read while holding the lock.
+
+    Args:
+        fetch_nonce: Callable returning the next nonce of an address as known to the node
+        max_retries: How many times send() re-sends with a fresh nonce on "nonce too low"
+        verbose: Whether to log detailed information
+    """
+
+    def __init__(self, fetch_nonce, max_retries=3, verbose=False):
+        self.fetch_nonce = fetch_nonce
+        self.max_retries = max_retries
+        self.verbose = verbose
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def allocate(self, address) -> int:
+        with self._lock:
+            nonce = self._next.get(address)
+            if nonce is not None:
+                self._next[address] = nonce + 1
+                return nonce
+        # the node is read without holding the lock, allocations for synced addresses don't wait on it
+        nonce = self.fetch_nonce(address)
+        self.log(f"Synced nonce for {address}: {nonce}")
+        with self._lock:
+            # another thread may have synced meanwhile
+            nonce = self._next.get(address, nonce)
+            self._next[address] = nonce + 1
+            return nonce
+
+    def peek(self, address):
+        """Next nonce that would be allocated for `address`, None if not synced yet"""
+        with self._lock:
+            return self._next.get(address)
+
+    def release(self, address, nonce):
+        """
+        Return a nonce whose transaction never reached the node. The last allocated nonce is
+        simply reused, an earlier one would leave a gap, so the address is resynced instead.
+        """
+        with self._lock:
+            if self._next.get(address) == nonce + 1:
+                self._next[address] = nonce
+            else:
+                self._next.pop(address, None)
+
+    def resync(self, address, min_nonce=0):
+        """Re-read the nonce of `address` from the chain, never going below `min_nonce`"""
+        nonce = max(self.fetch_nonce(address), min_nonce)
+        self.log(f"Resynced nonce for {address}: {nonce}")
+        with self._lock:
+            self._next[address] = nonce
+        return nonce
+
+    def reset(self, address=None):
+        """Forget the local counter of `address` (all addresses if None)"""
+        with self._lock:
+            if address is None:
+                self._next.clear()
+            else:
+                self._next.pop(address, None)
+
+    def send(self, address, send_with_nonce):
+        """
+        Call `send_with_nonce(nonce)` (sign + send_raw_transaction) with a managed nonce.
+        On "nonce too low" the address is resynced and the transaction re-sent with a fresh
+        nonce, up to max_retries times. Any other error releases the nonce and is re-raised.
+        """
+        attempt = 0
+        while True:
+            nonce = self.allocate(address)
+            try:
+                return send_with_nonce(nonce)
+            except Exception as e:
+                if is_nonce_too_low_error(e) and attempt < self.max_retries:
+                    attempt += 1
+                    self.log(f"Nonce {nonce} of {address} too low, resyncing (attempt {attempt})")
+                    self.resync(address, min_nonce=nonce + 1)
+                    continue
+                self.release(address, nonce)
+                raise
+
+
+class AsyncNonceManager(NonceManager):
+    """
+    NonceManager for asyncio clients (AsyncOstium): `fetch_nonce` is a coroutine function and
+    allocate() / resync() / send() are awaited. Syncing from the node happens under an
+    asyncio.Lock, so concurrent first allocations of an address fetch its nonce only once.
+    """
+
+    def __init__(self, fetch_nonce, max_retries=3, verbose=False):
+        super().__init__(fetch_nonce, max_retries=max_retries, verbose=verbose)
+        self._sync_lock = asyncio.Lock()
+
+    async def allocate(self, address) -> int:
+        with self._lock:
+            nonce = self._next.get(address)
+            if nonce is not None:
+                self._next[address] = nonce + 1
+                return nonce
+        async with self._sync_lock:
+            with self._lock:
+                nonce = self._next.get(address)
+            if nonce is None:
+                nonce = await self.fetch_nonce(address)
+                self.log(f"Synced nonce for {address}: {nonce}")
+            with self._lock:
+                # another coroutine may have synced meanwhile
+                nonce = self._next.get(address, nonce)
+                self._next[address] = nonce + 1
+                return nonce
+
+    async def resync(self, address, min_nonce=0):
+        async with self._sync_lock:
+            nonce = max(await self.fetch_nonce(address), min_nonce)
+            self.log(f"Resynced nonce for {address}: {nonce}")
+            with self._lock:
+                self._next[address] = nonce
+            return nonce
+
+    async def send(self, address, send_with_nonce):
+        """Async send(): `send_with_nonce(nonce)` is a coroutine function"""
+        attempt = 0
+        while True:
+            nonce = await self.allocate(address)
+            try:
+                return await send_with_nonce(nonce)
+            except Exception as e:
+                if is_nonce_too_low_error(e) and attempt < self.max_retries:
+                    attempt += 1
+                    self.log(f"Nonce {nonce} of {address} too low, resyncing (attempt {attempt})")
+                    await self.resync(address, min_nonce=nonce + 1)
+                    continue
+                self.release(address, nonce)
+                raise
@@ -8,8 +8,14 @@ from web3 import Web3
 from .abi.usdc_abi import usdc_abi
 from .abi.trading_abi import trading_abi
 from .abi.trading_storage_abi import trading_storage_abi
-from .utils import convert_to_scaled_integer, fromErrorCodeToMessage, get_tp_sl_prices, to_base_units
+from .nonce import NonceManager
+from .receipts import ReceiptPoller
+from .utils import build_event_topics, convert_to_scaled_integer, fromErrorCodeToMessage, get_tp_sl_prices, to_base_units
 from eth_account.account import Account
+from eth_utils import keccak
+
+# Emitted by the price oracle during openTrade / closeTradeMarket, not part of the Trading ABI
+PRICE_REQUESTED_EVENT = "PriceRequested(uint256,bytes32,uint256)"
 
 
 class OpenOrderType(Enum):
@@ -34,6 +40,11 @@ class Ostium:
         private_key: Private key for transaction signing
         verbose: Whether to log detailed information
         use_delegation: Whether to enable the delegatedAction functionality
+        fire_and_forget: Make write methods return a TransactionHandle (tx hash + future) right
+            after sending, instead of blocking until the receipt is mined
+        manage_nonces: Allocate nonces locally per signing address (NonceManager) instead of
+            reading the transaction count from the node before every transaction
+        chain_id: Chain id of the network if already known, otherwise read from the node once
 
     Delegation Usage:
         1. Initialize the SDK with the delegate's private key
@@ -44,7 +55,7 @@ class Ostium:
         5. The trader address must have approved enough USDC allowance for the trading contract
     """
 
-    def __init__(self, w3: Web3, usdc_address: str, ostium_trading_storage_address: str, ostium_trading_address: str, private_key: str, verbose=False, use_delegation=False) -> None:
+    def __init__(self, w3: Web3, usdc_address: str, ostium_trading_storage_address: str, ostium_trading_address: str, private_key: str, verbose=False, use_delegation=False, manage_nonces=False, fire_and_forget=False, chain_id=None) -> None:
         self.web3 = w3
         self.verbose = verbose
         self.private_key = private_key
@@ -52,6 +63,16 @@ class Ostium:
         self.ostium_trading_storage_address = ostium_trading_storage_address
         self.ostium_trading_address = ostium_trading_address
         self.use_delegation = use_delegation
+        self.nonce_manager = NonceManager(
+            self.get_pending_nonce, verbose=verbose) if manage_nonces else None
+        self.fire_and_forget = fire_and_forget
+        self._receipt_poller = None
+        # derived / fetched once per instance
+        self._account = None
+        self._account_key = None
+        self._chain_id = chain_id
+        self.event_topics = build_event_topics(trading_abi, trading_storage_abi, usdc_abi)
+        self.event_topics['PriceRequested'] = keccak(text=PRICE_REQUESTED_EVENT)
         # Create contract instances
         self.usdc_contract = self.web3.eth.contract(
             address=self.usdc_address, abi=usdc_abi)
@@ -80,21 +101,144 @@ class Ostium:
         return public_address
 
     def _get_account(self) -> Account:
+        """Get account from stored private key, derived once (again only if the key changes)"""
         self._check_private_key()
-        """Get account from stored private key"""
-        return self.web3.eth.account.from_key(self.private_key)
+        if self._account is None or self._account_key != self.private_key:
+            self._account = self.web3.eth.account.from_key(self.private_key)
+            self._account_key = self.private_key
+        return self._account
+
+    def get_chain_id(self):
+        if self._chain_id is None:
+            self._chain_id = self.web3.eth.chain_id
+        return self._chain_id
+
+    def _tx_params(self, account):
+        # a known chainId saves build_transaction() an eth_chainId call
+        return {'from': account.address, 'chainId': self.get_chain_id()}
+
+    def _encode_call(self, fn_name, args):
+        """Calldata of trading contract call fn_name(*args) (for delegatedAction), computed locally"""
+        return self.ostium_trading_contract.encode_abi(fn_name, args=args)
 
     def get_block_number(self):
         return self.web3.eth.get_block('latest')['number']
 
+    def get_block(self, block_identifier='latest'):
+        return self.web3.eth.get_block(block_identifier)
+
     def get_nonce(self, address):
         return self.web3.eth.get_transaction_count(address)
 
+    def get_pending_nonce(self, address):
+        # counts transactions still in the mempool too
+        return self.web3.eth.get_transaction_count(address, 'pending')
+
+    def _send_transaction(self, tx, account):
+        """Set the nonce, sign `tx` with `account` and send it, returns the transaction hash"""
+        def send_with_nonce(nonce):
+            tx['nonce'] = nonce
+            signed_tx = self.web3.eth.account.sign_transaction(
+                tx, private_key=account.key)
+            return self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+
+        if self.nonce_manager is None:
+            return send_with_nonce(self.get_nonce(account.address))
+        return self.nonce_manager.send(account.address, send_with_nonce)
+
+    def _wait_for_receipt(self, tx_hash, on_receipt=None):
+        """
+        Wait for the receipt of a sent transaction and return on_receipt(receipt) (the receipt
+        itself by default). In fire-and-forget mode return a TransactionHandle at once instead,
+        resolved by the background receipt poller.
+        """
+        if self.fire_and_forget:
+            return self.receipt_poller.track(tx_hash, on_receipt)
+        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        self.log(f"Receipt: {receipt}")
+        return on_receipt(receipt) if on_receipt else receipt
+
+    @property
+    def receipt_poller(self) -> ReceiptPoller:
+        if self._receipt_poller is None:
+            self._receipt_poller = ReceiptPoller(self.web3, verbose=self.verbose)
+        return self._receipt_poller
+
+    def get_order_id(self, receipt):
+        """orderId of the PriceRequested event in a receipt, None if there is none"""
+        price_requested_topic = self.event_topics['PriceRequested']
+        for log in receipt.logs:
+            # orderId is the indexed parameter (second topic)
+            if len(log['topics']) > 0 and log['topics'][0] == price_requested_topic:
+                order_id = int(log['topics'][1].hex(), 16)
+                self.log(f"Found orderId from PriceRequested: {order_id}")
+                return order_id
+        return None
+
+    def _receipt_with_order_id(self, receipt):
+        return {
+            'receipt': receipt,
+            'order_id': self.get_order_id(receipt)
+        }
+
     def _check_private_key(self):
         if not self.private_key:
             raise ValueError(
                 "Private key is required for Ostium platform write-operations")
 
+    def _open_trade_args(self, trade_params, at_price, account):
+        """(trade, builder_fee, order_type, slippage) arguments of openTrade for perform_trade()"""
+        tp_price, sl_price = get_tp_sl_prices(trade_params)
+
+        trade = {
+            'collateral': convert_to_scaled_integer(trade_params['collateral'], precision=5, scale=6),
+            'openPrice': convert_to_scaled_integer(at_price),
+            'tp': convert_to_scaled_integer(tp_price),
+            'sl': convert_to_scaled_integer(sl_price),
+            'trader': account.address,
+            'leverage': to_base_units(trade_params['leverage'], decimals=2),
+            'pairIndex': int(trade_params['asset_type']),
+            'index': 0,
+            'buy': trade_params['direction']
+        }
+
+        order_type = OpenOrderType.MARKET.value
+
+        if 'order_type' in trade_params:
+            if trade_params['order_type'] == 'LIMIT':
+                order_type = OpenOrderType.LIMIT.value
+            elif trade_params['order_type'] == 'STOP':
+                order_type = OpenOrderType.STOP.value
+            elif trade_params['order_type'] == 'MARKET':
+                pass
+            else:
+                raise Exception('Invalid order type')
+
+        slippage = int(self.slippage_percentage * PRECISION_2)
+        
+        # Create BuilderFee struct with default values (zero address and zero fee)
+        # Can be customized if builder fees are needed in the future
+        builder_fee = {
+            'builder': '0x0000000000000000000000000000000000000000',  # Zero address
+            'builderFee': 0  # Zero fee
+        }
+        
+        # Check if custom builder fee is provided in trade_params
+        if 'builder_address' in trade_params and 'builder_fee' in trade_params:
+
+            if not self.web3.is_address(trade_params['builder_address']):
+                raise Exception('Invalid builder address format')
+            
+            if trade_params['builder_fee'] > 0.5:
+                raise Exception('Builder fee too high: Max 0.5 (0.5%)')
+            
+            builder_fee = {
+                'builder': trade_params['builder_address'],
+                'builderFee': convert_to_scaled_integer(trade_params['builder_fee'], precision=4, scale=6)
+            }
+
+        return trade, builder_fee, order_type, slippage
+
     def perform_trade(self, trade_params, at_price):
         self.log(f"Performing trade with params: {trade_params}")
         account = self._get_account()
@@ -104,54 +248,8 @@ class Ostium:
 
         try:
             self.log(f"Final trade parameters being sent: {trade_params}")
-            tp_price, sl_price = get_tp_sl_prices(trade_params)
-
-            trade = {
-                'collateral': convert_to_scaled_integer(trade_params['collateral'], precision=5, scale=6),
-                'openPrice': convert_to_scaled_integer(at_price),
-                'tp': convert_to_scaled_integer(tp_price),
-                'sl': convert_to_scaled_integer(sl_price),
-                'trader': account.address,
-                'leverage': to_base_units(trade_params['leverage'], decimals=2),
-                'pairIndex': int(trade_params['asset_type']),
-                'index': 0,
-                'buy': trade_params['direction']
-            }
-
-            order_type = OpenOrderType.MARKET.value
-
-            if 'order_type' in trade_params:
-                if trade_params['order_type'] == 'LIMIT':
-                    order_type = OpenOrderType.LIMIT.value
-                elif trade_params['order_type'] == 'STOP':
-                    order_type = OpenOrderType.STOP.value
-                elif trade_params['order_type'] == 'MARKET':
-                    pass
-                else:
-                    raise Exception('Invalid order type')
-
-            slippage = int(self.slippage_percentage * PRECISION_2)
-            
-            # Create BuilderFee struct with default values (zero address and zero fee)
-            # Can be customized if builder fees are needed in the future
-            builder_fee = {
-                'builder': '0x0000000000000000000000000000000000000000',  # Zero address
-                'builderFee': 0  # Zero fee
-            }
-            
-            # Check if custom builder fee is provided in trade_params
-            if 'builder_address' in trade_params and 'builder_fee' in trade_params:
-
-                if not self.web3.is_address(trade_params['builder_address']):
-                    raise Exception('Invalid builder address format')
-                
-                if trade_params['builder_fee'] > 0.5:
-                    raise Exception('Builder fee too high: Max 0.5 (0.5%)')
-                
-                builder_fee = {
-                    'builder': trade_params['builder_address'],
-                    'builderFee': convert_to_scaled_integer(trade_params['builder_fee'], precision=4, scale=6)
-                }
+            trade, builder_fee, order_type, slippage = self._open_trade_args(
+                trade_params, at_price, account)
 
             if self.use_delegation and 'trader_address' in trade_params:
                 # Use delegatedAction when delegation is enabled
@@ -159,54 +257,22 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to trade on behalf of {trader_address}")
 
-                # The correct way to encode the function call in Web3.py
-                # Create the function object for openTrade with BuilderFee parameter
-                open_trade_func = self.ostium_trading_contract.functions.openTrade(
-                    trade, builder_fee, order_type, slippage
-                )
-
                 # Get the encoded data for the openTrade function call
-                inner_encoded_data = open_trade_func.build_transaction({'gas': 0})[
-                    'data']
+                inner_encoded_data = self._encode_call('openTrade', [trade, builder_fee, order_type, slippage])
 
                 # Create the outer delegatedAction transaction
                 trade_tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 # Standard direct function call (no delegation) with BuilderFee parameter
                 trade_tx = self.ostium_trading_contract.functions.openTrade(
                     trade, builder_fee, order_type, slippage
-                ).build_transaction({'from': account.address})
-
-            trade_tx['nonce'] = self.get_nonce(account.address)
+                ).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                trade_tx, private_key=self.private_key)
-            trade_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
-            trade_receipt = self.web3.eth.wait_for_transaction_receipt(
-                trade_tx_hash)
-            # self.log(f"Order Receipt: {trade_receipt}")
-
-            # Extract orderId from logs
-            order_id = None
-            for log in trade_receipt.logs:
-                # Define PriceRequested event signature
-                price_requested_signature = self.web3.keccak(
-                    text="PriceRequested(uint256,bytes32,uint256)").hex()
-
-                # Look at the event topic to identify the event type
-                if len(log['topics']) > 0 and log['topics'][0].hex() == price_requested_signature:
-                    # orderId is the indexed parameter (second topic)
-                    order_id = int(log['topics'][1].hex(), 16)
-                    self.log(f"Found orderId from PriceRequested: {order_id}")
-                    break
-
-            return {
-                'receipt': trade_receipt,
-                'order_id': order_id
-            }
+            trade_tx_hash = self._send_transaction(trade_tx, account)
+            self.log(f"Trade TX Hash: {trade_tx_hash.hex()}")
+            return self._wait_for_receipt(trade_tx_hash, self._receipt_with_order_id)
 
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -224,36 +290,21 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to cancel limit order on behalf of {trader_address}")
 
-                # The correct way to encode the function call in Web3.py
-                # Create the function object for closeTradeMarket
-                cancel_limit_func = self.ostium_trading_contract.functions.cancelOpenLimitOrder(
-                    int(pair_id), int(trade_index)
-                )
-
                 # Get the encoded data for the closeTradeMarket function call
-                inner_encoded_data = cancel_limit_func.build_transaction({'gas': 0})[
-                    'data']
+                inner_encoded_data = self._encode_call('cancelOpenLimitOrder', [int(pair_id), int(trade_index)])
 
                 # Create the outer delegatedAction transaction
                 trade_tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 trade_tx = self.ostium_trading_contract.functions.cancelOpenLimitOrder(
-                    int(pair_id), int(trade_index)).build_transaction({'from': account.address})
-
-            trade_tx['nonce'] = self.get_nonce(account.address)
+                    int(pair_id), int(trade_index)).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                trade_tx, private_key=self.private_key)
-            trade_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            trade_tx_hash = self._send_transaction(trade_tx, account)
             self.log(f"Cancel Limit Order TX Hash: {trade_tx_hash.hex()}")
 
-            trade_receipt = self.web3.eth.wait_for_transaction_receipt(
-                trade_tx_hash)
-            self.log(f"Cancel Limit Order Receipt: {trade_receipt}")
-            return trade_receipt
+            return self._wait_for_receipt(trade_tx_hash)
 
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -292,58 +343,25 @@ class Ostium:
             self.log(
                 f"Using delegatedAction to close trade on behalf of {trader_address}")
 
-            # The correct way to encode the function call in Web3.py
-            # Create the function object for closeTradeMarket with new parameters
-            close_trade_func = self.ostium_trading_contract.functions.closeTradeMarket(
-                int(pair_id), int(trade_index), int(close_percentage), 
-                market_price_scaled, slippage
-            )
-
             # Get the encoded data for the closeTradeMarket function call
-            inner_encoded_data = close_trade_func.build_transaction({'gas': 0})[
-                'data']
+            inner_encoded_data = self._encode_call('closeTradeMarket', [
+                int(pair_id), int(trade_index), int(close_percentage), market_price_scaled, slippage])
 
             # Create the outer delegatedAction transaction
             trade_tx = self.ostium_trading_contract.functions.delegatedAction(
                 trader_address, inner_encoded_data
-            ).build_transaction({'from': account.address})
+            ).build_transaction(self._tx_params(account))
         else:
             # Standard direct function call (no delegation) with new parameters
             trade_tx = self.ostium_trading_contract.functions.closeTradeMarket(
                 int(pair_id), int(trade_index), int(close_percentage),
                 market_price_scaled, slippage
-            ).build_transaction({'from': account.address})
+            ).build_transaction(self._tx_params(account))
 
-        trade_tx['nonce'] = self.get_nonce(account.address)
-
-        signed_tx = self.web3.eth.account.sign_transaction(
-            trade_tx, private_key=self.private_key)
-        trade_tx_hash = self.web3.eth.send_raw_transaction(
-            signed_tx.raw_transaction)
+        trade_tx_hash = self._send_transaction(trade_tx, account)
         self.log(f"Trade TX Hash: {trade_tx_hash.hex()}")
 
-        trade_receipt = self.web3.eth.wait_for_transaction_receipt(
-            trade_tx_hash)
-        # self.log(f"Trade Receipt: {trade_receipt}")
-
-        # Extract orderId from logs
-        order_id = None
-        for log in trade_receipt.logs:
-            # Define PriceRequested event signature
-            price_requested_signature = self.web3.keccak(
-                text="PriceRequested(uint256,bytes32,uint256)").hex()
-
-            # Look at the event topic to identify the event type
-            if len(log['topics']) > 0 and log['topics'][0].hex() == price_requested_signature:
-                # orderId is the indexed parameter (second topic)
-                order_id = int(log['topics'][1].hex(), 16)
-                self.log(f"Found orderId from PriceRequested: {order_id}")
-                break
-
-        return {
-            'receipt': trade_receipt,
-            'order_id': order_id
-        }
+        return self._wait_for_receipt(trade_tx_hash, self._receipt_with_order_id)
 
     def close_market_timeout(self, order_id, retry=False, trader_address=None):
         """
@@ -365,36 +383,28 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to close market timeout on behalf of {trader_address}")
                 
-                close_market_timeout_func = self.ostium_trading_contract.functions.closeTradeMarketTimeout(
-                    int(order_id), bool(retry)
-                )
-                
-                inner_encoded_data = close_market_timeout_func.build_transaction({'gas': 0})['data']
+                inner_encoded_data = self._encode_call('closeTradeMarketTimeout', [int(order_id), bool(retry)])
                 
                 tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 tx = self.ostium_trading_contract.functions.closeTradeMarketTimeout(
                     int(order_id), bool(retry)
-                ).build_transaction({'from': account.address})
-            
-            tx['nonce'] = self.get_nonce(account.address)
+                ).build_transaction(self._tx_params(account))
             
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, private_key=self.private_key)
-            tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            tx_hash = self._send_transaction(tx, account)
             self.log(f"Close Market Timeout TX Hash: {tx_hash.hex()}")
             
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-            self.log(f"Close Market Timeout successful for order {order_id}")
-            
-            return {
-                'receipt': receipt,
-                'order_id': order_id,
-                'retry': retry
-            }
+            def on_receipt(receipt):
+                self.log(f"Close Market Timeout successful for order {order_id}")
+                return {
+                    'receipt': receipt,
+                    'order_id': order_id,
+                    'retry': retry
+                }
+
+            return self._wait_for_receipt(tx_hash, on_receipt)
             
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -423,35 +433,27 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to open market timeout on behalf of {trader_address}")
                 
-                open_timeout_func = self.ostium_trading_contract.functions.openTradeMarketTimeout(
-                    int(order_id)
-                )
-                
-                inner_encoded_data = open_timeout_func.build_transaction({'gas': 0})['data']
+                inner_encoded_data = self._encode_call('openTradeMarketTimeout', [int(order_id)])
                 
                 tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 tx = self.ostium_trading_contract.functions.openTradeMarketTimeout(
                     int(order_id)
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             
-            tx['nonce'] = self.get_nonce(account.address)
-            
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, private_key=self.private_key)
-            tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            tx_hash = self._send_transaction(tx, account)
             self.log(f"Open Market Timeout TX Hash: {tx_hash.hex()}")
             
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-            self.log(f"Open Market Timeout successful for order {order_id}")
-            
-            return {
-                'receipt': receipt,
-                'order_id': order_id
-            }
+            def on_receipt(receipt):
+                self.log(f"Open Market Timeout successful for order {order_id}")
+                return {
+                    'receipt': receipt,
+                    'order_id': order_id
+                }
+
+            return self._wait_for_receipt(tx_hash, on_receipt)
             
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -469,19 +471,11 @@ class Ostium:
         amount = to_base_units(remove_amount, decimals=6)
 
         trade_tx = self.ostium_trading_contract.functions.removeCollateral(
-            int(pair_id), int(trade_index), int(amount)).build_transaction({'from': account.address})
-        trade_tx['nonce'] = self.get_nonce(account.address)
-
-        signed_tx = self.web3.eth.account.sign_transaction(
-            trade_tx, private_key=self.private_key)
-        trade_tx_hash = self.web3.eth.send_raw_transaction(
-            signed_tx.raw_transaction)
+            int(pair_id), int(trade_index), int(amount)).build_transaction(self._tx_params(account))
+        trade_tx_hash = self._send_transaction(trade_tx, account)
         self.log(f"Remove Collateral TX Hash: {trade_tx_hash.hex()}")
 
-        remove_receipt = self.web3.eth.wait_for_transaction_receipt(
-            trade_tx_hash)
-        self.log(f"Remove Collateral Receipt: {remove_receipt}")
-        return remove_receipt
+        return self._wait_for_receipt(trade_tx_hash)
 
     def add_collateral(self, pairID, index, collateral, trader_address=None):
         """
@@ -506,38 +500,23 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to add collateral on behalf of {trader_address}")
 
-                # The correct way to encode the function call in Web3.py
-                # Create the function object for topUpCollateral
-                top_up_func = self.ostium_trading_contract.functions.topUpCollateral(
-                    int(pairID), int(index), amount
-                )
-
                 # Get the encoded data for the topUpCollateral function call
-                inner_encoded_data = top_up_func.build_transaction({'gas': 0})[
-                    'data']
+                inner_encoded_data = self._encode_call('topUpCollateral', [int(pairID), int(index), amount])
 
                 # Create the outer delegatedAction transaction
                 add_collateral_tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 # Standard direct function call (no delegation)
                 add_collateral_tx = self.ostium_trading_contract.functions.topUpCollateral(
                     int(pairID), int(index), amount
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
 
-            add_collateral_tx['nonce'] = self.get_nonce(account.address)
-
-            signed_tx = self.web3.eth.account.sign_transaction(
-                add_collateral_tx, private_key=self.private_key)
-            add_collateral_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            add_collateral_tx_hash = self._send_transaction(add_collateral_tx, account)
             self.log(f"Add Collateral TX Hash: {add_collateral_tx_hash.hex()}")
 
-            add_collateral_receipt = self.web3.eth.wait_for_transaction_receipt(
-                add_collateral_tx_hash)
-            self.log(f"Add Collateral Receipt: {add_collateral_receipt}")
-            return add_collateral_receipt
+            return self._wait_for_receipt(add_collateral_tx_hash)
 
         except Exception as e:
             print("An error occurred during the add collateral process:")
@@ -567,37 +546,23 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to update TP on behalf of {trader_address}")
 
-                # The correct way to encode the function call in Web3.py
-                # Create the function object for updateTp
-                update_tp_func = self.ostium_trading_contract.functions.updateTp(
-                    int(pair_id), int(trade_index), tp_value
-                )
-
                 # Get the encoded data for the updateTp function call
-                inner_encoded_data = update_tp_func.build_transaction({'gas': 0})[
-                    'data']
+                inner_encoded_data = self._encode_call('updateTp', [int(pair_id), int(trade_index), tp_value])
 
                 # Create the outer delegatedAction transaction
                 update_tp_tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 # Standard direct function call (no delegation)
                 update_tp_tx = self.ostium_trading_contract.functions.updateTp(
                     int(pair_id), int(trade_index), tp_value
-                ).build_transaction({'from': account.address})
-
-            update_tp_tx['nonce'] = self.get_nonce(account.address)
+                ).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                update_tp_tx, private_key=self.private_key)
-            update_tp_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            update_tp_tx_hash = self._send_transaction(update_tp_tx, account)
             self.log(f"Update TP TX Hash: {update_tp_tx_hash.hex()}")
 
-            update_tp_receipt = self.web3.eth.wait_for_transaction_receipt(
-                update_tp_tx_hash)
-            return update_tp_receipt
+            return self._wait_for_receipt(update_tp_tx_hash)
 
         except Exception as e:
             print("An error occurred during the update tp process:")
@@ -625,37 +590,23 @@ class Ostium:
                 self.log(
                     f"Using delegatedAction to update SL on behalf of {trader_address}")
 
-                # The correct way to encode the function call in Web3.py
-                # Create the function object for updateSl
-                update_sl_func = self.ostium_trading_contract.functions.updateSl(
-                    int(pairID), int(index), sl_value
-                )
-
                 # Get the encoded data for the updateSl function call
-                inner_encoded_data = update_sl_func.build_transaction({'gas': 0})[
-                    'data']
+                inner_encoded_data = self._encode_call('updateSl', [int(pairID), int(index), sl_value])
 
                 # Create the outer delegatedAction transaction
                 update_sl_tx = self.ostium_trading_contract.functions.delegatedAction(
                     trader_address, inner_encoded_data
-                ).build_transaction({'from': account.address})
+                ).build_transaction(self._tx_params(account))
             else:
                 # Standard direct function call (no delegation)
                 update_sl_tx = self.ostium_trading_contract.functions.updateSl(
                     int(pairID), int(index), sl_value
-                ).build_transaction({'from': account.address})
-
-            update_sl_tx['nonce'] = self.get_nonce(account.address)
+                ).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                update_sl_tx, private_key=self.private_key)
-            update_sl_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            update_sl_tx_hash = self._send_transaction(update_sl_tx, account)
             self.log(f"Update SL TX Hash: {update_sl_tx_hash.hex()}")
 
-            update_sl_receipt = self.web3.eth.wait_for_transaction_receipt(
-                update_sl_tx_hash)
-            return update_sl_receipt
+            return self._wait_for_receipt(update_sl_tx_hash)
 
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -675,14 +626,9 @@ class Ostium:
                 approve_tx = self.usdc_contract.functions.approve(
                     self.ostium_trading_storage_address,
                     self.web3.to_wei(1000000, 'mwei')
-                ).build_transaction({'from': account.address})
-
-                approve_tx['nonce'] = self.get_nonce(account.address)
+                ).build_transaction(self._tx_params(account))
 
-                signed_tx = self.web3.eth.account.sign_transaction(
-                    approve_tx, private_key=self.private_key)
-                approve_tx_hash = self.web3.eth.send_raw_transaction(
-                    signed_tx.raw_transaction)
+                approve_tx_hash = self._send_transaction(approve_tx, account)
                 self.log(f"Approval TX Hash: {approve_tx_hash.hex()}")
 
                 approve_receipt = self.web3.eth.wait_for_transaction_receipt(
@@ -704,20 +650,12 @@ class Ostium:
             transfer_tx = self.usdc_contract.functions.transfer(
                 receiving_address,
                 amount_in_base_units
-            ).build_transaction({'from': account.address})
-
-            transfer_tx['nonce'] = self.get_nonce(account.address)
+            ).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                transfer_tx, private_key=self.private_key)
-            transfer_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            transfer_tx_hash = self._send_transaction(transfer_tx, account)
             self.log(f"Transfer TX Hash: {transfer_tx_hash.hex()}")
 
-            transfer_receipt = self.web3.eth.wait_for_transaction_receipt(
-                transfer_tx_hash)
-            self.log(f"Transfer Receipt: {transfer_receipt}")
-            return transfer_receipt
+            return self._wait_for_receipt(transfer_tx_hash)
 
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -752,20 +690,12 @@ class Ostium:
                 price_value,
                 tp_value,
                 sl_value
-            ).build_transaction({'from': account.address})
-
-            trade_tx['nonce'] = self.get_nonce(account.address)
+            ).build_transaction(self._tx_params(account))
 
-            signed_tx = self.web3.eth.account.sign_transaction(
-                trade_tx, private_key=account.key)
-            trade_tx_hash = self.web3.eth.send_raw_transaction(
-                signed_tx.raw_transaction)
+            trade_tx_hash = self._send_transaction(trade_tx, account)
             self.log(f"Update Limit Order TX Hash: {trade_tx_hash.hex()}")
 
-            trade_receipt = self.web3.eth.wait_for_transaction_receipt(
-                trade_tx_hash)
-            self.log(f"Update Limit Order Receipt: {trade_receipt}")
-            return trade_receipt
+            return self._wait_for_receipt(trade_tx_hash)
 
         except Exception as e:
             reason_string, suggestion = fromErrorCodeToMessage(
@@ -0,0 +1,119 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Pair fields that only change through governance (leverage caps, fees, funding curve parameters)
+STATIC_PAIR_FIELDS = frozenset([
+    'id', 'from', 'to', 'feed', 'maxLeverage', 'overnightMaxLeverage', 'makerMaxLeverage',
+    'makerFeeP', 'takerFeeP', 'maxOI', 'rolloverFeePerBlock', 'maxFundingFeePerBlock',
+    'hillInflectionPoint', 'hillPosScale', 'hillNegScale', 'springFactor',
+    'sFactorUpScaleP', 'sFactorDownScaleP', 'group', 'fee'
+])
+
+# Fields of the pair's group kept in the static copy, longCollateral / shortCollateral move with every trade
+STATIC_GROUP_FIELDS = frozenset(['id', 'name', 'minLeverage', 'maxLeverage', 'maxCollateralP'])
+
+
+def static_fields(pair: dict) -> dict:
+    """Copy of a pair entity restricted to STATIC_PAIR_FIELDS (and STATIC_GROUP_FIELDS of its group)"""
+    static = {k: v for k, v in pair.items() if k in STATIC_PAIR_FIELDS}
+    if isinstance(static.get('group'), dict):
+        static['group'] = {k: v for k, v in static['group'].items() if k in STATIC_GROUP_FIELDS}
+    return static
+
+
+class PairDetailsCache:
+    """
+    Bounded LRU cache of subgraph pair entities (as returned by get_pair_details()).
+
+    An entry serves two kinds of lookups:
+        - static lookups (static_only=True) only read STATIC_PAIR_FIELDS and accept
+          entries up to `static_ttl` seconds old
+        - full lookups also read dynamic fields (OI, accFunding*, lastFundingBlock, ...)
+          and accept entries up to `dynamic_ttl` seconds old (default 0 - never cached),
+          and, when `max_block_lag` is set, fetched no more than `max_block_lag` blocks
+          before the latest block reported through observe_block()
+
+    At most `maxsize` pairs are kept, the least recently used one is evicted first.
+    """
+
+    def __init__(self, maxsize: int = 512, static_ttl: float = 3600, dynamic_ttl: float = 0,
+                 max_block_lag: Optional[int] = None):
+        self.maxsize = maxsize
+        self.static_ttl = static_ttl
+        self.dynamic_ttl = dynamic_ttl
+        self.max_block_lag = max_block_lag
+        self.latest_block = None
+        self.hits = 0
+        self.misses = 0
+        self.static_hits = 0
+        self.dynamic_hits = 0
+        self.evictions = 0
+        # pair_id -> (pair, fetched_at (monotonic), latest_block when fetched)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'static_hits': self.static_hits,
+            'dynamic_hits': self.dynamic_hits,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+        }
+
+    def observe_block(self, block_number):
+        """Report the latest chain block, used for max_block_lag invalidation"""
+        block_number = int(block_number)
+        if self.latest_block is None or block_number > self.latest_block:
+            self.latest_block = block_number
+
+    def get(self, pair_id, static_only=False) -> Optional[dict]:
+        """Returns a copy of the cached pair (static fields only if static_only) or None"""
+        key = int(pair_id)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(entry, static_only):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if static_only:
+                self.static_hits += 1
+                return static_fields(entry[0])
+            self.dynamic_hits += 1
+            return dict(entry[0])
+        self.misses += 1
+        return None
+
+    def _is_fresh(self, entry, static_only) -> bool:
+        pair, fetched_at, block = entry
+        age = time.monotonic() - fetched_at
+        if static_only:
+            return age <= self.static_ttl
+        if age > self.dynamic_ttl:
+            return False
+        if self.max_block_lag is not None and self.latest_block is not None:
+            return block is not None and self.latest_block - block <= self.max_block_lag
+        return True
+
+    def put(self, pair):
+        key = int(pair['id'])
+        self._entries[key] = (dict(pair), time.monotonic(), self.latest_block)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, pair_id=None):
+        """Drop one pair, or every pair if pair_id is None"""
+        if pair_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(int(pair_id), None)
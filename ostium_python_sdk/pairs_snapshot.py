@@ -0,0 +1,173 @@
+from web3 import Web3
+
+from .abi.pairs_info_abi import pairs_info_abi
+from .abi.pairs_storage_abi import pairs_storage_abi
+from .abi.trading_storage_abi import trading_storage_abi
+from .multicall import DEFAULT_MAX_CALLS, MULTICALL3_ADDRESS, AsyncMulticall, Multicall
+
+
+def _bytes32_to_str(value):
+    return value.rstrip(b'\0').decode(errors='replace')
+
+
+class PairSnapshotLoader:
+    """
+    Loads the funding, rollover, fee, open interest and leverage state of all pairs from the
+    PairsInfo / PairsStorage / TradingStorage contracts, every value read at the same block.
+
+    The block is resolved to an L2 block number first, then two Multicall3 rounds pinned to it
+    run: the first reads pairsCount and groupsCount, the second reads per pair pairs, pairFundingFees, pairRolloverFees,
+    getHillFunctionParams, getFrSpringFactor, pairOpeningFees, pairMinLevPos and
+    getPairOpeningInterestInfo, plus getAllPairsMaxLeverage, every group and liqMarginThresholdP.
+
+    Pairs come in the subgraph pair shape (string integers, nested `group` / `fee`), so they can
+    be used wherever a subgraph pair is, e.g. as trade['pair'] for get_trade_metrics(). Fields
+    only the subgraph derives (curFundingLong, lastTradePrice, totalOpenTrades, ...) are absent.
+
+    Args:
+        w3: Web3 instance connected to the Arbitrum network
+        pairs_info_address: Contract address for the Ostium pairs info
+        pairs_storage_address: Contract address for the Ostium pairs storage
+        ostium_trading_storage_address: Contract address for the Ostium trading storage (open interest)
+        multicall_address: Multicall3 contract address
+        max_calls: Maximum number of calls aggregated into a single eth_call
+        verbose: Whether to log detailed information
+    """
+
+    multicall_class = Multicall
+
+    def __init__(self, w3: Web3, pairs_info_address: str, pairs_storage_address: str, ostium_trading_storage_address: str, multicall_address: str = MULTICALL3_ADDRESS, max_calls=DEFAULT_MAX_CALLS, verbose=False) -> None:
+        self.web3 = w3
+        self.verbose = verbose
+        self.pairs_info_contract = self.web3.eth.contract(
+            address=pairs_info_address, abi=pairs_info_abi)
+        self.pairs_storage_contract = self.web3.eth.contract(
+            address=pairs_storage_address, abi=pairs_storage_abi)
+        self.ostium_trading_storage_contract = self.web3.eth.contract(
+            address=ostium_trading_storage_address, abi=trading_storage_abi)
+        self.multicall = self.multicall_class(
+            w3, multicall_address, max_calls=max_calls, verbose=verbose)
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def _count_calls(self):
+        storage = self.pairs_storage_contract
+        return [(storage, 'pairsCount', []), (storage, 'groupsCount', [])]
+
+    @staticmethod
+    def _check_counts(counts):
+        if any(count is None for count in counts):
+            raise ValueError("Could not read PairsStorage through Multicall3")
+        return counts
+
+    def _snapshot_calls(self, pair_ids, groups_count):
+        info = self.pairs_info_contract
+        storage = self.pairs_storage_contract
+        trading_storage = self.ostium_trading_storage_contract
+        calls = [(info, 'liqMarginThresholdP', []), (storage, 'getAllPairsMaxLeverage', [])]
+        calls += [(storage, 'groups', [group_index]) for group_index in range(groups_count)]
+        for pair_id in pair_ids:
+            calls += [(storage, 'pairs', [pair_id]), (info, 'pairFundingFees', [pair_id]),
+                      (info, 'pairRolloverFees', [pair_id]), (info, 'getHillFunctionParams', [pair_id]),
+                      (info, 'getFrSpringFactor', [pair_id]), (info, 'pairOpeningFees', [pair_id]),
+                      (storage, 'pairMinLevPos', [pair_id]),
+                      (trading_storage, 'getPairOpeningInterestInfo', [pair_id])]
+        return calls
+
+    @staticmethod
+    def _build_pair(pair_id, results, max_leverages, groups):
+        pair, funding, rollover, hill, spring_factor, opening_fees, min_lev_pos, open_interest = results
+        hill_inflection_point, hill_pos_scale, hill_neg_scale = hill
+        long_oi, short_oi, max_oi = open_interest
+        group = groups[pair['groupIndex']]
+        max_leverage = max_leverages[pair_id] if pair_id < len(max_leverages) else pair['maxLeverage']
+        return {
+            'id': str(pair_id),
+            'from': _bytes32_to_str(pair['from']),
+            'to': _bytes32_to_str(pair['to']),
+            'feed': '0x' + pair['feed'].hex(),
+            'overnightMaxLeverage': str(pair['overnightMaxLeverage']),
+            'longOI': str(long_oi),
+            'shortOI': str(short_oi),
+            'maxOI': str(max_oi),
+            'makerFeeP': str(opening_fees['makerFeeP']),
+            'takerFeeP': str(opening_fees['takerFeeP']),
+            'makerMaxLeverage': str(opening_fees['makerMaxLeverage']),
+            'accRollover': str(rollover['accPerOi']),
+            'lastRolloverBlock': str(rollover['lastUpdateBlock']),
+            'rolloverFeePerBlock': str(rollover['rolloverFeePerBlock']),
+            'accFundingLong': str(funding['accPerOiLong']),
+            'accFundingShort': str(funding['accPerOiShort']),
+            'lastFundingBlock': str(funding['lastUpdateBlock']),
+            'maxFundingFeePerBlock': str(funding['maxFundingFeePerBlock']),
+            'lastFundingRate': str(funding['lastFundingRate']),
+            'hillInflectionPoint': str(hill_inflection_point),
+            'hillPosScale': str(hill_pos_scale),
+            'hillNegScale': str(hill_neg_scale),
+            'springFactor': str(spring_factor),
+            'sFactorUpScaleP': str(funding['sFactorUpScaleP']),
+            'sFactorDownScaleP': str(funding['sFactorDownScaleP']),
+            'maxLeverage': str(max_leverage),
+            'group': {
+                'id': str(pair['groupIndex']),
+                'name': _bytes32_to_str(group['name']),
+                'minLeverage': str(group['minLeverage']),
+                'maxLeverage': str(group['maxLeverage']),
+                'maxCollateralP': str(group['maxCollateralP']),
+            },
+            'fee': {'minLevPos': str(min_lev_pos)},
+        }
+
+    def _collect(self, block_number, pair_ids, groups_count, results):
+        liq_margin_threshold_p, max_leverages = results[0], results[1] or []
+        groups = results[2:2 + groups_count]
+        per_pair = results[2 + groups_count:]
+        pairs = {}
+        for position, pair_id in enumerate(pair_ids):
+            pair_results = per_pair[position * 8:(position + 1) * 8]
+            if any(result is None for result in pair_results):
+                raise ValueError(f"Could not read pair {pair_id} at block {block_number}")
+            pairs[pair_id] = self._build_pair(pair_id, pair_results, max_leverages, groups)
+        self.log(f"Loaded {len(pairs)} pairs at block {block_number}")
+        return {
+            'block_number': block_number,
+            'liq_margin_threshold_p': str(liq_margin_threshold_p),
+            'pairs': pairs,
+        }
+
+    def get_pairs_count(self, block_identifier='latest'):
+        return self.pairs_storage_contract.functions.pairsCount().call(block_identifier=block_identifier)
+
+    def load(self, pair_ids=None, block_identifier='latest'):
+        """
+        Snapshot of `pair_ids` (all listed pairs if None) at `block_identifier`, block_number
+        being the L2 block number the node resolved it to.
+
+        Returns:
+            dict: {'block_number', 'liq_margin_threshold_p', 'pairs': {pair_id: pair}}
+        """
+        block_number = self.multicall.resolve_block_number(block_identifier)
+        pairs_count, groups_count = self._check_counts(
+            self.multicall.call(self._count_calls(), block_identifier=block_number))
+        pair_ids = range(pairs_count) if pair_ids is None else [int(pair_id) for pair_id in pair_ids]
+        results = self.multicall.call(self._snapshot_calls(pair_ids, groups_count), block_identifier=block_number)
+        return self._collect(block_number, pair_ids, groups_count, results)
+
+
+class AsyncPairSnapshotLoader(PairSnapshotLoader):
+    """PairSnapshotLoader over an AsyncWeb3 instance, load() / get_pairs_count() are coroutines"""
+
+    multicall_class = AsyncMulticall
+
+    async def get_pairs_count(self, block_identifier='latest'):
+        return await self.pairs_storage_contract.functions.pairsCount().call(block_identifier=block_identifier)
+
+    async def load(self, pair_ids=None, block_identifier='latest'):
+        block_number = await self.multicall.resolve_block_number(block_identifier)
+        pairs_count, groups_count = self._check_counts(
+            await self.multicall.call(self._count_calls(), block_identifier=block_number))
+        pair_ids = range(pairs_count) if pair_ids is None else [int(pair_id) for pair_id in pair_ids]
+        results = await self.multicall.call(self._snapshot_calls(pair_ids, groups_count), block_identifier=block_number)
+        return self._collect(block_number, pair_ids, groups_count, results)
@@ -0,0 +1,131 @@
+from web3 import Web3
+
+from .abi.trading_storage_abi import trading_storage_abi
+from .multicall import DEFAULT_MAX_CALLS, MULTICALL3_ADDRESS, AsyncMulticall, Multicall
+
+
+class PositionReader:
+    """
+    Reads open trades and limit orders straight from the TradingStorage contract, without the
+    subgraph (which lags the chain and may be down).
+
+    Everything is read with Multicall3 in two rounds, every chunk pinned to the L2 block number
+    the node resolves for `block_identifier` before the first round:
+        1. maxTradesPerPair, plus openTradesCount / openLimitOrdersCount of every (trader, pair)
+        2. getOpenTrade + getOpenTradeInfo / getOpenLimitOrder of every slot of the non-empty pairs
+    Each round is chunked into aggregate3 calls of at most `max_calls` calls, so a book of
+    hundreds of positions over all pairs loads in a handful of eth_calls.
+
+    Trades are the TradingStorage Trade struct merged with its TradeInfo (collateral, openPrice,
+    tp, sl, trader, leverage, pairIndex, index, buy, tradeId, oiNotional, initialLeverage, ...),
+    limit orders the OpenLimitOrder struct, all as raw on-chain integers.
+
+    Args:
+        w3: Web3 instance connected to the Arbitrum network
+        ostium_trading_storage_address: Contract address for the Ostium trading storage
+        multicall_address: Multicall3 contract address
+        max_calls: Maximum number of calls aggregated into a single eth_call
+        verbose: Whether to log detailed information
+    """
+
+    multicall_class = Multicall
+
+    def __init__(self, w3: Web3, ostium_trading_storage_address: str, multicall_address: str = MULTICALL3_ADDRESS, max_calls=DEFAULT_MAX_CALLS, verbose=False) -> None:
+        self.web3 = w3
+        self.verbose = verbose
+        self.ostium_trading_storage_address = ostium_trading_storage_address
+        self.ostium_trading_storage_contract = self.web3.eth.contract(
+            address=ostium_trading_storage_address, abi=trading_storage_abi)
+        self.multicall = self.multicall_class(
+            w3, multicall_address, max_calls=max_calls, verbose=verbose)
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def _count_calls(self, traders, pair_ids):
+        storage = self.ostium_trading_storage_contract
+        calls = [(storage, 'maxTradesPerPair', [])]
+        for trader in traders:
+            for pair_id in pair_ids:
+                calls.append((storage, 'openTradesCount', [trader, pair_id]))
+                calls.append((storage, 'openLimitOrdersCount', [trader, pair_id]))
+        return calls
+
+    def _slot_calls(self, traders, pair_ids, counts):
+        """Round 2 calls for the (trader, pair) slots round 1 found non-empty"""
+        max_trades = counts[0]
+        if max_trades is None:
+            raise ValueError(
+                f"Could not read TradingStorage {self.ostium_trading_storage_address} through Multicall3 {self.multicall.address}")
+
+        storage = self.ostium_trading_storage_contract
+        calls, kinds = [], []
+        position_counts = iter(counts[1:])
+        for trader in traders:
+            for pair_id in pair_ids:
+                trades_count, limit_orders_count = next(position_counts) or 0, next(position_counts) or 0
+                for index in range(max_trades if trades_count else 0):
+                    calls.append((storage, 'getOpenTrade', [trader, pair_id, index]))
+                    calls.append((storage, 'getOpenTradeInfo', [trader, pair_id, index]))
+                    kinds += ['trade', 'trade_info']
+                for index in range(max_trades if limit_orders_count else 0):
+                    # reverts for an empty slot, which the multicall reports as None
+                    calls.append((storage, 'getOpenLimitOrder', [trader, pair_id, index]))
+                    kinds.append('limit_order')
+        return calls, kinds
+
+    @staticmethod
+    def _collect(block_number, kinds, results):
+        trades, limit_orders = [], []
+        for kind, result in zip(kinds, results):
+            if kind == 'trade':
+                trade = result
+            elif kind == 'trade_info':
+                if trade and trade['leverage'] > 0:
+                    trades.append({**trade, **(result or {})})
+            elif result and result['leverage'] > 0:
+                limit_orders.append(result)
+        return {'block_number': block_number, 'trades': trades, 'limit_orders': limit_orders}
+
+    def get_positions(self, traders, pair_ids, block_identifier='latest'):
+        """
+        Open trades and limit orders of one trader address (or a list of them) over `pair_ids`.
+
+        Args:
+            traders: Trader address or list of addresses
+            pair_ids: Pairs to scan
+            block_identifier: Block to read at, 'latest' by default
+
+        Returns:
+            dict: {'block_number', 'trades', 'limit_orders'}, block_number being the block
+            every value was read at
+        """
+        traders = [traders] if isinstance(traders, str) else list(traders)
+        pair_ids = [int(pair_id) for pair_id in pair_ids]
+        block_number = self.multicall.resolve_block_number(block_identifier)
+        counts = self.multicall.call(self._count_calls(traders, pair_ids), block_identifier=block_number)
+        calls, kinds = self._slot_calls(traders, pair_ids, counts)
+        results = self.multicall.call(calls, block_identifier=block_number) if calls else []
+        positions = self._collect(block_number, kinds, results)
+        self.log(
+            f"Read {len(positions['trades'])} trades and {len(positions['limit_orders'])} limit orders at block {block_number}")
+        return positions
+
+
+class AsyncPositionReader(PositionReader):
+    """PositionReader over an AsyncWeb3 instance, get_positions() is a coroutine"""
+
+    multicall_class = AsyncMulticall
+
+    async def get_positions(self, traders, pair_ids, block_identifier='latest'):
+        traders = [traders] if isinstance(traders, str) else list(traders)
+        pair_ids = [int(pair_id) for pair_id in pair_ids]
+        block_number = await self.multicall.resolve_block_number(block_identifier)
+        counts = await self.multicall.call(self._count_calls(traders, pair_ids), block_identifier=block_number)
+        calls, kinds = self._slot_calls(traders, pair_ids, counts)
+        results = await self.multicall.call(calls, block_identifier=block_number) if calls else []
+        positions = self._collect(block_number, kinds, results)
+        self.log(
+            f"Read {len(positions['trades'])} trades and {len(positions['limit_orders'])} limit orders at block {block_number}")
+        return positions
@@ -1,90 +1,299 @@
 import aiohttp
+import asyncio
 import ssl
-from typing import Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .price_stream import PriceFeed, PriceSubscription
+
+DEFAULT_PRICE_BASE_URL = "https://metadata-backend.ostium.io"
+
+
+class PriceSnapshot:
+    """
+    One download of /PricePublish/latest-prices.
+
+    `timestamp` is the local wall-clock time (seconds) at which the payload was received,
+    use `age` to decide whether it is fresh enough for your purpose.
+
+    The price list is indexed once, by (from, to) and by feed_id, so lookups are O(1).
+    """
+
+    def __init__(self, prices: List[dict], timestamp: float = None, monotonic: float = None):
+        self.prices = prices
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._monotonic = time.monotonic() if monotonic is None else monotonic
+
+        self.by_pair: Dict[Tuple[str, str], dict] = {}
+        self.by_feed_id: Dict[str, dict] = {}
+        for price_data in prices:
+            # first entry wins, same as a linear scan would
+            self.by_pair.setdefault(
+                (price_data.get('from'), price_data.get('to')), price_data)
+            feed_id = price_data.get('feed_id')
+            if feed_id is not None:
+                self.by_feed_id.setdefault(feed_id.lower(), price_data)
+
+    def get(self, from_asset: str, to_asset: str) -> Optional[dict]:
+        return self.by_pair.get((from_asset, to_asset))
+
+    def get_by_feed_id(self, feed_id: str) -> Optional[dict]:
+        return self.by_feed_id.get(feed_id.lower())
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since this snapshot was received"""
+        return time.monotonic() - self._monotonic
 
 
 class Price:
-    def __init__(self, verbose=False):
+    """
+    Client for the Ostium metadata-backend price service.
+
+    A single aiohttp session (and its keep-alive connection pool) is created lazily
+    on first use and reused by every subsequent call, so repeated price lookups do not
+    pay DNS, TCP and TLS handshakes each time. Release it with `await price.close()`,
+    or use the instance as an async context manager:
+
+        async with Price() as price:
+            mid, is_open, _ = await price.get_price("BTC", "USD")
+
+    Downloads are cached as a `PriceSnapshot` for `max_age` seconds (default 0 - no reuse
+    once a download completed). Concurrent callers that need a new snapshot share a single
+    in-flight request instead of each starting their own.
+    """
+
+    def __init__(self, verbose=False, base_url: str = None, timeout: float = 30,
+                 limit: int = 100, limit_per_host: int = 30, keepalive_timeout: float = 30,
+                 max_age: float = 0):
         self.verbose = verbose
-        self.base_url = "https://metadata-backend.ostium.io"
+        self.base_url = base_url or DEFAULT_PRICE_BASE_URL
+        self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._session_loop = None
+        self._closing = set()
+        self._permissive_ssl = False
+        self.max_age = max_age
+        self._snapshot: Optional[PriceSnapshot] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._feed: Optional[PriceFeed] = None
 
     def log(self, message):
         if self.verbose:
             print(message)
 
-    async def get_latest_prices(self):
-        """
-        Fetches the latest prices from the Ostium metadata-backend service.
-        Returns a dictionary of price data.
-        """
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _create_ssl_context(self):
+        if self._permissive_ssl:
+            # Completely unverified SSL context, used after a certificate failure
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        else:
+            # SSL context that doesn't verify certificates
+            ssl_context = ssl.create_default_context()
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
-        
-        # Create connector with SSL context and additional options for better compatibility
-        connector = aiohttp.TCPConnector(
-            ssl=ssl_context,
-            use_dns_cache=True,
-            ttl_dns_cache=300,
-            limit=100,
-            limit_per_host=30
-        )
-        
-        timeout = aiohttp.ClientTimeout(total=30)
-        
-        try:
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                async with session.get(f"{self.base_url}/PricePublish/latest-prices") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        raise Exception(
-                            f"Failed to fetch prices: {response.status}")
-        except aiohttp.ClientConnectorCertificateError as e:
-            # If SSL certificate verification fails, try with a more permissive approach
-            self.log(f"SSL certificate verification failed, trying alternative approach: {e}")
-            
-            # Create a completely unverified SSL context
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
+        return ssl_context
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and (self._session.closed or self._session_loop is not loop):
+            # A session cannot be shared across event loops (e.g. consecutive asyncio.run() calls)
+            self._release_session()
+
+        if self._session is None:
             connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
+                ssl=self._create_ssl_context(),
                 use_dns_cache=True,
                 ttl_dns_cache=300,
-                limit=100,
-                limit_per_host=30
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
             )
-            
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                async with session.get(f"{self.base_url}/PricePublish/latest-prices") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        raise Exception(
-                            f"Failed to fetch prices: {response.status}")
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._session_loop = loop
+        return self._session
+
+    def _release_session(self):
+        """
+        Drop a session bound to another event loop. It is closed on its own loop if that loop is
+        still running (in another thread), otherwise its connector is detached and closed from
+        the running loop.
+        """
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        connector = session.connector
+        session.detach()
+        task = asyncio.ensure_future(self._close_connector(connector))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_connector(self, connector):
+        try:
+            await connector.close()
+        except Exception as e:
+            self.log(f"Closing the connector of a previous event loop failed: {e}")
+
+    @property
+    def feed(self) -> PriceFeed:
+        """The shared poll loop behind stream(), tune it via feed.min_interval / feed.max_interval"""
+        if self._feed is None:
+            self._feed = PriceFeed(self)
+        return self._feed
+
+    def stream(self, pairs: Optional[Iterable[Tuple[str, str]]] = None) -> PriceSubscription:
+        """
+        Subscribe to price changes, e.g:
+
+            async for tick in sdk.price.stream(pairs=[("BTC", "USD"), ("ETH", "USD")]):
+                for (from_asset, to_asset), price_data in tick.items():
+                    ...
+
+        All subscriptions share one upstream poll loop. Each tick only holds the pairs that changed.
+        """
+        return PriceSubscription(self.feed, pairs)
+
+    async def close(self):
+        """Close the shared session and its connection pool"""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._session is not None and self._session_loop is running_loop:
+            session, self._session, self._session_loop = self._session, None, None
+            await session.close()
+        else:
+            self._release_session()
+
+    async def _fetch_latest_prices(self):
+        session = self._get_session()
+        async with session.get(f"{self.base_url}/PricePublish/latest-prices") as response:
+            if response.status == 200:
+                return await response.json()
+            else:
+                raise Exception(
+                    f"Failed to fetch prices: {response.status}")
+
+    @property
+    def snapshot(self) -> Optional[PriceSnapshot]:
+        """The most recently downloaded snapshot, None if nothing was fetched yet"""
+        return self._snapshot
+
+    @property
+    def snapshot_timestamp(self) -> Optional[float]:
+        """Wall-clock time (seconds) of the most recently downloaded snapshot"""
+        return self._snapshot.timestamp if self._snapshot is not None else None
+
+    async def get_snapshot(self, max_age: float = None) -> PriceSnapshot:
+        """
+        Returns a price snapshot no older than `max_age` seconds (defaults to `self.max_age`).
+        When a download is needed and one is already in flight, waits for that one instead.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        snapshot = self._snapshot
+        if snapshot is not None and max_age > 0 and snapshot.age <= max_age:
+            return snapshot
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._download_snapshot())
+            self._inflight = task
+            task.add_done_callback(self._clear_inflight)
+        else:
+            self.log("get_snapshot: joining in-flight price request")
+        # shield so a cancelled caller does not cancel the download other callers wait on
+        return await asyncio.shield(task)
+
+    def _clear_inflight(self, task):
+        if self._inflight is task:
+            self._inflight = None
+        if not task.cancelled():
+            task.exception()  # mark retrieved, callers get it through the shield
+
+    async def _download_snapshot(self) -> PriceSnapshot:
+        prices = await self._download_latest_prices()
+        snapshot = PriceSnapshot(prices)
+        self._snapshot = snapshot
+        return snapshot
+
+    async def get_latest_prices(self, max_age: float = None):
+        """
+        Fetches the latest prices from the Ostium metadata-backend service.
+        Returns a list of price data dictionaries (shared with the cached snapshot - do not mutate).
+        """
+        snapshot = await self.get_snapshot(max_age)
+        return snapshot.prices
+
+    async def _download_latest_prices(self):
+        try:
+            try:
+                return await self._fetch_latest_prices()
+            except aiohttp.ClientConnectorCertificateError as e:
+                if self._permissive_ssl:
+                    raise
+                # If SSL certificate verification fails, try with a more permissive approach
+                self.log(
+                    f"SSL certificate verification failed, trying alternative approach: {e}")
+                await self.close()
+                self._permissive_ssl = True
+                return await self._fetch_latest_prices()
         except Exception as e:
             raise Exception(f"Error fetching prices: {str(e)}")
 
     # Returns a json, e.g: {'feed_id': '0x00039d9e45394f473ab1f050a1b963e6b05351e52d71e507509ada0c95ed75b8', 'bid': 107646.01338169997, 'mid': 107646.03680130735, 'ask': 107646.06022091472, 'isMarketOpen': True, 'isDayTradingClosed': False, 'secondsToToggleIsDayTradingClosed': -1, 'from': 'BTC', 'to': 'USD', 'timestampSeconds': 1748460056}
-    async def get_latest_price_json(self, from_asset: str, to_asset: str):
-        prices = await self.get_latest_prices()
-        for price_data in prices:
-            if (price_data.get('from') == from_asset and
-                    price_data.get('to') == to_asset):
-                self.log(f"get_latest_price_json: {price_data}")
-                return price_data
-        raise ValueError(f"No price found for pair: {from_asset}/{to_asset}")
+    async def get_latest_price_json(self, from_asset: str, to_asset: str, max_age: float = None):
+        snapshot = await self.get_snapshot(max_age)
+        price_data = snapshot.get(from_asset, to_asset)
+        if price_data is None:
+            raise ValueError(
+                f"No price found for pair: {from_asset}/{to_asset}")
+        self.log(f"get_latest_price_json: {price_data}")
+        return price_data
+
+    # Same json as get_latest_price_json(), looked up by the pair's feed id
+    async def get_latest_price_json_by_feed_id(self, feed_id: str, max_age: float = None):
+        snapshot = await self.get_snapshot(max_age)
+        price_data = snapshot.get_by_feed_id(feed_id)
+        if price_data is None:
+            raise ValueError(f"No price found for feed: {feed_id}")
+        return price_data
 
     # Returns a mid price and isMarketOpen tuple, e.g: (97243.36503172085, True)
-    async def get_price(self, from_currency, to_currency) -> Tuple[float, bool, bool]:
+    async def get_price(self, from_currency, to_currency, max_age: float = None) -> Tuple[float, bool, bool]:
         self.log(f"Getting price for {from_currency}/{to_currency}")
-        prices = await self.get_latest_prices()
-        for price_data in prices:
-            if (price_data.get('from') == from_currency and
-                    price_data.get('to') == to_currency):
-                return float(price_data.get('mid', 0)), price_data.get('isMarketOpen', False), price_data.get('isDayTradingClosed', False)
-        raise ValueError(
-            f"No price found for pair: {from_currency}/{to_currency}")
+        snapshot = await self.get_snapshot(max_age)
+        price_data = snapshot.get(from_currency, to_currency)
+        if price_data is None:
+            raise ValueError(
+                f"No price found for pair: {from_currency}/{to_currency}")
+        return _price_tuple(price_data)
+
+    # Returns {(from, to): (mid, isMarketOpen, isDayTradingClosed)} for many pairs out of a single
+    # snapshot, e.g: await price.get_prices([("BTC", "USD"), ("ETH", "USD")]). Unknown pairs are omitted.
+    async def get_prices(self, pairs: Iterable[Tuple[str, str]], max_age: float = None) -> Dict[Tuple[str, str], Tuple[float, bool, bool]]:
+        snapshot = await self.get_snapshot(max_age)
+        ret = {}
+        for from_currency, to_currency in pairs:
+            price_data = snapshot.get(from_currency, to_currency)
+            if price_data is not None:
+                ret[(from_currency, to_currency)] = _price_tuple(price_data)
+        return ret
+
+
+def _price_tuple(price_data) -> Tuple[float, bool, bool]:
+    return float(price_data.get('mid', 0)), price_data.get('isMarketOpen', False), price_data.get('isDayTradingClosed', False)
@@ -0,0 +1,177 @@
+import asyncio
+import weakref
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Fields compared between polls to decide whether a pair's price changed
+PRICE_CHANGE_FIELDS = ('bid', 'mid', 'ask', 'isMarketOpen', 'isDayTradingClosed')
+
+
+class PriceSubscription:
+    """
+    Async iterator over price changes, created by `Price.stream()`.
+
+    Every tick is a dict {(from, to): price_data} holding only the pairs that changed since
+    the previous tick (the first tick holds the current price of every subscribed pair).
+
+    Updates a consumer has not picked up yet are conflated per pair - a slow consumer gets
+    the latest price of each changed pair on its next iteration instead of a growing backlog,
+    so memory is bounded by the number of pairs. `conflated` counts the overwritten updates.
+    """
+
+    def __init__(self, feed: 'PriceFeed', pairs: Optional[Iterable[Tuple[str, str]]] = None):
+        self._feed = feed
+        self.pairs: Optional[Set[Tuple[str, str]]] = set(
+            pairs) if pairs is not None else None
+        self.conflated = 0
+        self._pending: Dict[Tuple[str, str], dict] = {}
+        self._event = None
+        self._subscribed = False
+        self._closed = False
+
+    def wants(self, key: Tuple[str, str]) -> bool:
+        return self.pairs is None or key in self.pairs
+
+    def _publish(self, changes: Dict[Tuple[str, str], dict]):
+        for key, price_data in changes.items():
+            if self.wants(key):
+                if key in self._pending:
+                    self.conflated += 1
+                self._pending[key] = price_data
+        if self._pending and self._event is not None:
+            self._event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[Tuple[str, str], dict]:
+        if not self._subscribed and not self._closed:
+            self._event = asyncio.Event()
+            self._subscribed = True
+            self._feed.subscribe(self)
+
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            self._event.clear()
+            await self._event.wait()
+
+        tick, self._pending = self._pending, {}
+        return tick
+
+    def close(self):
+        """Stop receiving ticks, the upstream poll stops once no subscription is left"""
+        if self._closed:
+            return
+        self._closed = True
+        self._pending = {}
+        if self._subscribed:
+            self._feed.unsubscribe(self)
+        if self._event is not None:
+            self._event.set()
+
+    async def aclose(self):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # a consumer that breaks out of `async for` without closing still releases the feed
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class PriceFeed:
+    """
+    One upstream poll loop over `Price.get_snapshot()` fanned out to many `PriceSubscription`s.
+
+    The metadata-backend only offers a request/response endpoint, so polling is adaptive:
+    after a poll that saw changes the next one is scheduled `min_interval` seconds later,
+    every poll without changes multiplies the interval by `backoff` up to `max_interval`.
+    The loop runs only while at least one subscription is open.
+    """
+
+    def __init__(self, price, min_interval: float = 0.5, max_interval: float = 5.0, backoff: float = 1.5):
+        self.price = price
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.polls = 0
+        # weak, so a subscription abandoned without close() is collected and releases the loop
+        self._subscribers: Set[PriceSubscription] = weakref.WeakSet()
+        self._last: Dict[Tuple[str, str], tuple] = {}
+        self._state: Dict[Tuple[str, str], dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, subscription: PriceSubscription):
+        self._subscribers.add(subscription)
+        # new subscribers start from the latest known prices
+        current = {key: price_data for key, price_data in self._state.items()
+                   if subscription.wants(key)}
+        if current:
+            subscription._publish(current)
+
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self.interval = self.min_interval
+            self._task = loop.create_task(self._run())
+
+    def unsubscribe(self, subscription: PriceSubscription):
+        self._subscribers.discard(subscription)
+        if not self._subscribers and self._task is not None:
+            if not self._task.get_loop().is_closed():
+                self._task.cancel()
+            self._task = None
+
+    def _diff(self, snapshot) -> Dict[Tuple[str, str], dict]:
+        changes = {}
+        for key, price_data in snapshot.by_pair.items():
+            signature = tuple(price_data.get(field)
+                              for field in PRICE_CHANGE_FIELDS)
+            if self._last.get(key) != signature:
+                self._last[key] = signature
+                self._state[key] = price_data
+                changes[key] = price_data
+        return changes
+
+    def _broadcast(self, changes):
+        # kept out of _run() so its frame never holds a strong reference to a subscription
+        for subscription in list(self._subscribers):
+            subscription._publish(changes)
+
+    async def _run(self):
+        while self._subscribers:
+            try:
+                snapshot = await self.price.get_snapshot(max_age=0)
+                self.polls += 1
+                changes = self._diff(snapshot)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.price.log(f"PriceFeed: poll failed, backing off: {e}")
+                changes = None
+
+            if changes:
+                self._broadcast(changes)
+                self.interval = self.min_interval
+            elif changes is None:
+                self.interval = self.max_interval
+            else:
+                self.interval = min(self.max_interval,
+                                    self.interval * self.backoff)
+
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+
+class ReadContext:
+    """
+    One block number pinned for a group of dependent reads, so pair state, open trades,
+    funding extrapolation and the block number used by the formulae all refer to the same
+    block. Create it with `await sdk.read_context()` and pass it as `context=` to the SDK
+    metrics methods:
+
+        context = await sdk.read_context()
+        a = await sdk.get_open_trade_metrics(0, 0, context=context)
+        b = await sdk.get_open_trade_metrics(1, 0, context=context)   # no refetch
+        context.sources   # data age per source
+
+    Every read made through the context is done once (subgraph queries with `block: {number: N}`,
+    one price snapshot) and shared by all the calls using the context, so marks computed from
+    it are consistent with each other.
+
+    `sources` records, per source ('rpc', 'subgraph', 'price', ...), the block number and / or
+    timestamp of its data, how many blocks it is behind the chain head and how old it was
+    (seconds) when the context was created.
+
+    Args:
+        block_number: The pinned block
+        block_timestamp: Timestamp (seconds) of the pinned block
+        chain_head: Latest chain block number when the context was created
+    """
+
+    def __init__(self, block_number: int, block_timestamp: int = None, chain_head: int = None) -> None:
+        self.block_number = int(block_number)
+        self.block_timestamp = block_timestamp
+        self.chain_head = chain_head if chain_head is not None else self.block_number
+        self.created_at = time.time()
+        self.sources = {}
+        self._reads = {}
+
+    def __repr__(self):
+        return f"ReadContext(block_number={self.block_number}, sources={sorted(self.sources)})"
+
+    def record(self, source, block_number=None, timestamp=None):
+        """Record the block and / or timestamp the data of `source` is from"""
+        self.sources[source] = {
+            'block_number': block_number,
+            'timestamp': timestamp,
+            'blocks_behind_head': self.chain_head - block_number if block_number is not None else None,
+            'age_seconds': self.created_at - timestamp if timestamp is not None else None,
+        }
+
+    @property
+    def age_seconds(self):
+        """Age of the pinned block (seconds) when the context was created, None if its timestamp is unknown"""
+        return self.created_at - self.block_timestamp if self.block_timestamp is not None else None
+
+    async def get(self, key, fetch):
+        """
+        Result of the coroutine `fetch()` for `key`, fetched at most once per context: concurrent
+        and later callers with the same key share the first result. A failed read is not kept.
+        """
+        task = self._reads.get(key)
+        if task is None:
+            task = self._reads[key] = asyncio.ensure_future(fetch())
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._reads.get(key) is task:
+                del self._reads[key]
+            raise
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+from eth_utils import is_address, to_checksum_address, to_int
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+
+# Fields of a raw (JSON-RPC) receipt / log converted the way Eth.get_transaction_receipt() does,
+# other fields (e.g. Arbitrum's gasUsedForL1) are kept as returned by the node
+RECEIPT_INTEGERS = ('blockNumber', 'transactionIndex', 'cumulativeGasUsed', 'status', 'gasUsed',
+                    'effectiveGasPrice', 'type', 'blobGasPrice', 'blobGasUsed', 'logIndex')
+RECEIPT_BYTES = ('blockHash', 'transactionHash', 'logsBloom', 'topics', 'data')
+RECEIPT_ADDRESSES = ('contractAddress', 'from', 'to', 'address')
+
+
+def format_receipt(raw):
+    """AttributeDict receipt of a raw eth_getTransactionReceipt result"""
+    receipt = {}
+    for key, value in raw.items():
+        if value is None:
+            receipt[key] = value
+        elif key == 'logs':
+            receipt[key] = [format_receipt(log) for log in value]
+        elif key == 'topics':
+            receipt[key] = [HexBytes(topic) for topic in value]
+        elif key in RECEIPT_INTEGERS:
+            receipt[key] = to_int(hexstr=value) if isinstance(value, str) else value
+        elif key in RECEIPT_BYTES:
+            receipt[key] = HexBytes(value)
+        elif key in RECEIPT_ADDRESSES and is_address(value):
+            receipt[key] = to_checksum_address(value)
+        else:
+            receipt[key] = value
+    return AttributeDict.recursive(receipt)
+
+
+class TransactionHandle:
+    """
+    A sent transaction whose receipt is still pending.
+
+    `tx_hash` is known right after send_raw_transaction, `future` (a concurrent.futures.Future)
+    resolves to the method result - the receipt, or {'receipt', 'order_id'} for trades - once
+    the receipt is mined. Block with handle.result(timeout) or `await handle` from asyncio.
+    """
+
+    def __init__(self, tx_hash, on_receipt=None):
+        self.tx_hash = tx_hash
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self._on_receipt = on_receipt
+
+    def __repr__(self):
+        state = 'done' if self.future.done() else 'pending'
+        return f"TransactionHandle({self.tx_hash.hex()}, {state})"
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def _resolve(self, receipt):
+        try:
+            value = self._on_receipt(receipt) if self._on_receipt else receipt
+        except Exception as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(value)
+
+
+class ReceiptPoller:
+    """
+    Resolves TransactionHandles from a single background thread.
+
+    Every `poll_interval` seconds the receipts of all pending transactions are requested in
+    JSON-RPC batches of `batch_size` eth_getTransactionReceipt calls. A handle whose receipt
+    is not mined within `timeout` seconds fails with web3's TimeExhausted, like
+    wait_for_transaction_receipt(). The thread starts with the first tracked transaction,
+    with background=False no thread is started and the caller drives poll_once() instead.
+
+    Args:
+        w3: Web3 instance whose provider supports batch requests
+        poll_interval: Seconds between two polling rounds
+        batch_size: Maximum number of receipt requests per batch
+        timeout: Seconds to wait for a receipt before failing its handle
+        background: Whether to poll from a background thread
+        verbose: Whether to log detailed information
+    """
+
+    def __init__(self, w3, poll_interval=0.25, batch_size=100, timeout=120, background=True, verbose=False):
+        self.web3 = w3
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.background = background
+        self.verbose = verbose
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+        self.batches = 0
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def track(self, tx_hash, on_receipt=None) -> TransactionHandle:
+        """Register a sent transaction, returns its handle"""
+        handle = TransactionHandle(tx_hash, on_receipt)
+        with self._lock:
+            self._pending.setdefault(tx_hash, []).append(handle)
+            if self.background and (self._thread is None or not self._thread.is_alive()):
+                self._stopped = False
+                self._thread = threading.Thread(
+                    target=self._run, name='ostium-receipt-poller', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return handle
+
+    def stop(self):
+        """Stop the polling thread, pending handles stay unresolved"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped:
+            if not len(self):
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            try:
+                self.poll_once()
+            except Exception as e:
+                # transient RPC failure, the handles stay pending until their timeout
+                self.log(f"Receipt polling failed: {e}")
+                self._expire(time.monotonic())
+            time.sleep(self.poll_interval)
+
+    def poll_once(self):
+        """One polling round over all pending transactions, returns the number of handles resolved"""
+        with self._lock:
+            tx_hashes = list(self._pending)
+        resolved = 0
+        for start in range(0, len(tx_hashes), self.batch_size):
+            chunk = tx_hashes[start:start + self.batch_size]
+            responses = self.web3.provider.make_batch_request(
+                [('eth_getTransactionReceipt', [tx_hash]) for tx_hash in chunk])
+            self.batches += 1
+            if not isinstance(responses, list):
+                raise Exception(f"Batch request failed: {responses.get('error', responses)}")
+            responses = sorted(responses, key=lambda response: response.get('id', 0))
+            for tx_hash, response in zip(chunk, responses):
+                if response.get('error'):
+                    self.log(f"Receipt request for {tx_hash.hex()} failed: {response['error']}")
+                    continue
+                if not response.get('result'):
+                    continue
+                receipt = format_receipt(response['result'])
+                with self._lock:
+                    handles = self._pending.pop(tx_hash, [])
+                for handle in handles:
+                    handle._resolve(receipt)
+                resolved += len(handles)
+        self._expire(time.monotonic())
+        return resolved
+
+    def _expire(self, now):
+        with self._lock:
+            expired = [tx_hash for tx_hash, handles in self._pending.items()
+                       if now - handles[0].submitted_at > self.timeout]
+            expired_handles = [(tx_hash, self._pending.pop(tx_hash)) for tx_hash in expired]
+        for tx_hash, handles in expired_handles:
+            for handle in handles:
+                handle.future.set_exception(TimeExhausted(
+                    f"Transaction {tx_hash.hex()} is not in the chain after {self.timeout} seconds"))
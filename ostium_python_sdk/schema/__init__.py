@@ -0,0 +1,4 @@
+from .subgraph_schema import SUBGRAPH_SCHEMA_VERSION, subgraph_schema_sdl, get_subgraph_schema
+
+__all__ = ['SUBGRAPH_SCHEMA_VERSION',
+           'subgraph_schema_sdl', 'get_subgraph_schema']
@@ -0,0 +1,1307 @@
+# Bundled copy of the Ostium subgraph schema, used by SubgraphClient to validate queries
+# locally instead of sending an introspection query on startup.
+# It covers the entities and fields the SDK queries (graph-node style filters/orderBy).
+# Bump SUBGRAPH_SCHEMA_VERSION whenever this schema changes.
+from functools import lru_cache
+
+from graphql import GraphQLSchema, build_schema
+
+SUBGRAPH_SCHEMA_VERSION = "2025-10-15"
+
+subgraph_schema_sdl = """
+scalar BigDecimal
+scalar BigInt
+scalar Bytes
+scalar Int8
+scalar Timestamp
+
+enum OrderDirection {
+  asc
+  desc
+}
+
+enum _SubgraphErrorPolicy_ {
+  allow
+  deny
+}
+
+input Block_height {
+  hash: Bytes
+  number: Int
+  number_gte: Int
+}
+
+input BlockChangedFilter {
+  number_gte: Int!
+}
+
+type _Block_ {
+  hash: Bytes
+  number: Int!
+  timestamp: Int
+  parentHash: Bytes
+}
+
+type _Meta_ {
+  block: _Block_!
+  deployment: String!
+  hasIndexingErrors: Boolean!
+}
+
+type Pair {
+  id: ID!
+  from: String!
+  to: String!
+  feed: Bytes!
+  overnightMaxLeverage: BigInt!
+  longOI: BigInt!
+  shortOI: BigInt!
+  maxOI: BigInt!
+  makerFeeP: BigInt!
+  takerFeeP: BigInt!
+  makerMaxLeverage: BigInt!
+  curFundingLong: BigInt!
+  curFundingShort: BigInt!
+  curRollover: BigInt!
+  totalOpenTrades: BigInt!
+  totalOpenLimitOrders: BigInt!
+  accRollover: BigInt!
+  lastRolloverBlock: BigInt!
+  rolloverFeePerBlock: BigInt!
+  accFundingLong: BigInt!
+  accFundingShort: BigInt!
+  lastFundingBlock: BigInt!
+  maxFundingFeePerBlock: BigInt!
+  lastFundingRate: BigInt!
+  hillInflectionPoint: BigInt!
+  hillPosScale: BigInt!
+  hillNegScale: BigInt!
+  springFactor: BigInt!
+  sFactorUpScaleP: BigInt!
+  sFactorDownScaleP: BigInt!
+  lastTradePrice: BigInt!
+  minLeverage: BigInt!
+  maxLeverage: BigInt!
+  spreadP: BigInt!
+  group: Group!
+  fee: Fee!
+}
+
+enum Pair_orderBy {
+  id
+  from
+  to
+  feed
+  overnightMaxLeverage
+  longOI
+  shortOI
+  maxOI
+  makerFeeP
+  takerFeeP
+  makerMaxLeverage
+  curFundingLong
+  curFundingShort
+  curRollover
+  totalOpenTrades
+  totalOpenLimitOrders
+  accRollover
+  lastRolloverBlock
+  rolloverFeePerBlock
+  accFundingLong
+  accFundingShort
+  lastFundingBlock
+  maxFundingFeePerBlock
+  lastFundingRate
+  hillInflectionPoint
+  hillPosScale
+  hillNegScale
+  springFactor
+  sFactorUpScaleP
+  sFactorDownScaleP
+  lastTradePrice
+  minLeverage
+  maxLeverage
+  spreadP
+  group
+  fee
+}
+
+input Pair_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  from: String
+  from_not: String
+  from_gt: String
+  from_lt: String
+  from_gte: String
+  from_lte: String
+  from_in: [String!]
+  from_not_in: [String!]
+  from_contains: String
+  from_not_contains: String
+  from_starts_with: String
+  from_ends_with: String
+  to: String
+  to_not: String
+  to_gt: String
+  to_lt: String
+  to_gte: String
+  to_lte: String
+  to_in: [String!]
+  to_not_in: [String!]
+  to_contains: String
+  to_not_contains: String
+  to_starts_with: String
+  to_ends_with: String
+  feed: Bytes
+  feed_not: Bytes
+  feed_gt: Bytes
+  feed_lt: Bytes
+  feed_gte: Bytes
+  feed_lte: Bytes
+  feed_in: [Bytes!]
+  feed_not_in: [Bytes!]
+  overnightMaxLeverage: BigInt
+  overnightMaxLeverage_not: BigInt
+  overnightMaxLeverage_gt: BigInt
+  overnightMaxLeverage_lt: BigInt
+  overnightMaxLeverage_gte: BigInt
+  overnightMaxLeverage_lte: BigInt
+  overnightMaxLeverage_in: [BigInt!]
+  overnightMaxLeverage_not_in: [BigInt!]
+  longOI: BigInt
+  longOI_not: BigInt
+  longOI_gt: BigInt
+  longOI_lt: BigInt
+  longOI_gte: BigInt
+  longOI_lte: BigInt
+  longOI_in: [BigInt!]
+  longOI_not_in: [BigInt!]
+  shortOI: BigInt
+  shortOI_not: BigInt
+  shortOI_gt: BigInt
+  shortOI_lt: BigInt
+  shortOI_gte: BigInt
+  shortOI_lte: BigInt
+  shortOI_in: [BigInt!]
+  shortOI_not_in: [BigInt!]
+  maxOI: BigInt
+  maxOI_not: BigInt
+  maxOI_gt: BigInt
+  maxOI_lt: BigInt
+  maxOI_gte: BigInt
+  maxOI_lte: BigInt
+  maxOI_in: [BigInt!]
+  maxOI_not_in: [BigInt!]
+  makerFeeP: BigInt
+  makerFeeP_not: BigInt
+  makerFeeP_gt: BigInt
+  makerFeeP_lt: BigInt
+  makerFeeP_gte: BigInt
+  makerFeeP_lte: BigInt
+  makerFeeP_in: [BigInt!]
+  makerFeeP_not_in: [BigInt!]
+  takerFeeP: BigInt
+  takerFeeP_not: BigInt
+  takerFeeP_gt: BigInt
+  takerFeeP_lt: BigInt
+  takerFeeP_gte: BigInt
+  takerFeeP_lte: BigInt
+  takerFeeP_in: [BigInt!]
+  takerFeeP_not_in: [BigInt!]
+  makerMaxLeverage: BigInt
+  makerMaxLeverage_not: BigInt
+  makerMaxLeverage_gt: BigInt
+  makerMaxLeverage_lt: BigInt
+  makerMaxLeverage_gte: BigInt
+  makerMaxLeverage_lte: BigInt
+  makerMaxLeverage_in: [BigInt!]
+  makerMaxLeverage_not_in: [BigInt!]
+  curFundingLong: BigInt
+  curFundingLong_not: BigInt
+  curFundingLong_gt: BigInt
+  curFundingLong_lt: BigInt
+  curFundingLong_gte: BigInt
+  curFundingLong_lte: BigInt
+  curFundingLong_in: [BigInt!]
+  curFundingLong_not_in: [BigInt!]
+  curFundingShort: BigInt
+  curFundingShort_not: BigInt
+  curFundingShort_gt: BigInt
+  curFundingShort_lt: BigInt
+  curFundingShort_gte: BigInt
+  curFundingShort_lte: BigInt
+  curFundingShort_in: [BigInt!]
+  curFundingShort_not_in: [BigInt!]
+  curRollover: BigInt
+  curRollover_not: BigInt
+  curRollover_gt: BigInt
+  curRollover_lt: BigInt
+  curRollover_gte: BigInt
+  curRollover_lte: BigInt
+  curRollover_in: [BigInt!]
+  curRollover_not_in: [BigInt!]
+  totalOpenTrades: BigInt
+  totalOpenTrades_not: BigInt
+  totalOpenTrades_gt: BigInt
+  totalOpenTrades_lt: BigInt
+  totalOpenTrades_gte: BigInt
+  totalOpenTrades_lte: BigInt
+  totalOpenTrades_in: [BigInt!]
+  totalOpenTrades_not_in: [BigInt!]
+  totalOpenLimitOrders: BigInt
+  totalOpenLimitOrders_not: BigInt
+  totalOpenLimitOrders_gt: BigInt
+  totalOpenLimitOrders_lt: BigInt
+  totalOpenLimitOrders_gte: BigInt
+  totalOpenLimitOrders_lte: BigInt
+  totalOpenLimitOrders_in: [BigInt!]
+  totalOpenLimitOrders_not_in: [BigInt!]
+  accRollover: BigInt
+  accRollover_not: BigInt
+  accRollover_gt: BigInt
+  accRollover_lt: BigInt
+  accRollover_gte: BigInt
+  accRollover_lte: BigInt
+  accRollover_in: [BigInt!]
+  accRollover_not_in: [BigInt!]
+  lastRolloverBlock: BigInt
+  lastRolloverBlock_not: BigInt
+  lastRolloverBlock_gt: BigInt
+  lastRolloverBlock_lt: BigInt
+  lastRolloverBlock_gte: BigInt
+  lastRolloverBlock_lte: BigInt
+  lastRolloverBlock_in: [BigInt!]
+  lastRolloverBlock_not_in: [BigInt!]
+  rolloverFeePerBlock: BigInt
+  rolloverFeePerBlock_not: BigInt
+  rolloverFeePerBlock_gt: BigInt
+  rolloverFeePerBlock_lt: BigInt
+  rolloverFeePerBlock_gte: BigInt
+  rolloverFeePerBlock_lte: BigInt
+  rolloverFeePerBlock_in: [BigInt!]
+  rolloverFeePerBlock_not_in: [BigInt!]
+  accFundingLong: BigInt
+  accFundingLong_not: BigInt
+  accFundingLong_gt: BigInt
+  accFundingLong_lt: BigInt
+  accFundingLong_gte: BigInt
+  accFundingLong_lte: BigInt
+  accFundingLong_in: [BigInt!]
+  accFundingLong_not_in: [BigInt!]
+  accFundingShort: BigInt
+  accFundingShort_not: BigInt
+  accFundingShort_gt: BigInt
+  accFundingShort_lt: BigInt
+  accFundingShort_gte: BigInt
+  accFundingShort_lte: BigInt
+  accFundingShort_in: [BigInt!]
+  accFundingShort_not_in: [BigInt!]
+  lastFundingBlock: BigInt
+  lastFundingBlock_not: BigInt
+  lastFundingBlock_gt: BigInt
+  lastFundingBlock_lt: BigInt
+  lastFundingBlock_gte: BigInt
+  lastFundingBlock_lte: BigInt
+  lastFundingBlock_in: [BigInt!]
+  lastFundingBlock_not_in: [BigInt!]
+  maxFundingFeePerBlock: BigInt
+  maxFundingFeePerBlock_not: BigInt
+  maxFundingFeePerBlock_gt: BigInt
+  maxFundingFeePerBlock_lt: BigInt
+  maxFundingFeePerBlock_gte: BigInt
+  maxFundingFeePerBlock_lte: BigInt
+  maxFundingFeePerBlock_in: [BigInt!]
+  maxFundingFeePerBlock_not_in: [BigInt!]
+  lastFundingRate: BigInt
+  lastFundingRate_not: BigInt
+  lastFundingRate_gt: BigInt
+  lastFundingRate_lt: BigInt
+  lastFundingRate_gte: BigInt
+  lastFundingRate_lte: BigInt
+  lastFundingRate_in: [BigInt!]
+  lastFundingRate_not_in: [BigInt!]
+  hillInflectionPoint: BigInt
+  hillInflectionPoint_not: BigInt
+  hillInflectionPoint_gt: BigInt
+  hillInflectionPoint_lt: BigInt
+  hillInflectionPoint_gte: BigInt
+  hillInflectionPoint_lte: BigInt
+  hillInflectionPoint_in: [BigInt!]
+  hillInflectionPoint_not_in: [BigInt!]
+  hillPosScale: BigInt
+  hillPosScale_not: BigInt
+  hillPosScale_gt: BigInt
+  hillPosScale_lt: BigInt
+  hillPosScale_gte: BigInt
+  hillPosScale_lte: BigInt
+  hillPosScale_in: [BigInt!]
+  hillPosScale_not_in: [BigInt!]
+  hillNegScale: BigInt
+  hillNegScale_not: BigInt
+  hillNegScale_gt: BigInt
+  hillNegScale_lt: BigInt
+  hillNegScale_gte: BigInt
+  hillNegScale_lte: BigInt
+  hillNegScale_in: [BigInt!]
+  hillNegScale_not_in: [BigInt!]
+  springFactor: BigInt
+  springFactor_not: BigInt
+  springFactor_gt: BigInt
+  springFactor_lt: BigInt
+  springFactor_gte: BigInt
+  springFactor_lte: BigInt
+  springFactor_in: [BigInt!]
+  springFactor_not_in: [BigInt!]
+  sFactorUpScaleP: BigInt
+  sFactorUpScaleP_not: BigInt
+  sFactorUpScaleP_gt: BigInt
+  sFactorUpScaleP_lt: BigInt
+  sFactorUpScaleP_gte: BigInt
+  sFactorUpScaleP_lte: BigInt
+  sFactorUpScaleP_in: [BigInt!]
+  sFactorUpScaleP_not_in: [BigInt!]
+  sFactorDownScaleP: BigInt
+  sFactorDownScaleP_not: BigInt
+  sFactorDownScaleP_gt: BigInt
+  sFactorDownScaleP_lt: BigInt
+  sFactorDownScaleP_gte: BigInt
+  sFactorDownScaleP_lte: BigInt
+  sFactorDownScaleP_in: [BigInt!]
+  sFactorDownScaleP_not_in: [BigInt!]
+  lastTradePrice: BigInt
+  lastTradePrice_not: BigInt
+  lastTradePrice_gt: BigInt
+  lastTradePrice_lt: BigInt
+  lastTradePrice_gte: BigInt
+  lastTradePrice_lte: BigInt
+  lastTradePrice_in: [BigInt!]
+  lastTradePrice_not_in: [BigInt!]
+  minLeverage: BigInt
+  minLeverage_not: BigInt
+  minLeverage_gt: BigInt
+  minLeverage_lt: BigInt
+  minLeverage_gte: BigInt
+  minLeverage_lte: BigInt
+  minLeverage_in: [BigInt!]
+  minLeverage_not_in: [BigInt!]
+  maxLeverage: BigInt
+  maxLeverage_not: BigInt
+  maxLeverage_gt: BigInt
+  maxLeverage_lt: BigInt
+  maxLeverage_gte: BigInt
+  maxLeverage_lte: BigInt
+  maxLeverage_in: [BigInt!]
+  maxLeverage_not_in: [BigInt!]
+  spreadP: BigInt
+  spreadP_not: BigInt
+  spreadP_gt: BigInt
+  spreadP_lt: BigInt
+  spreadP_gte: BigInt
+  spreadP_lte: BigInt
+  spreadP_in: [BigInt!]
+  spreadP_not_in: [BigInt!]
+  group: String
+  group_not: String
+  group_gt: String
+  group_lt: String
+  group_gte: String
+  group_lte: String
+  group_in: [String!]
+  group_not_in: [String!]
+  group_: Group_filter
+  fee: String
+  fee_not: String
+  fee_gt: String
+  fee_lt: String
+  fee_gte: String
+  fee_lte: String
+  fee_in: [String!]
+  fee_not_in: [String!]
+  fee_: Fee_filter
+  _change_block: BlockChangedFilter
+  and: [Pair_filter]
+  or: [Pair_filter]
+}
+
+type Group {
+  id: ID!
+  name: String!
+  minLeverage: BigInt!
+  maxLeverage: BigInt!
+  maxCollateralP: BigInt!
+  longCollateral: BigInt!
+  shortCollateral: BigInt!
+}
+
+enum Group_orderBy {
+  id
+  name
+  minLeverage
+  maxLeverage
+  maxCollateralP
+  longCollateral
+  shortCollateral
+}
+
+input Group_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  name: String
+  name_not: String
+  name_gt: String
+  name_lt: String
+  name_gte: String
+  name_lte: String
+  name_in: [String!]
+  name_not_in: [String!]
+  name_contains: String
+  name_not_contains: String
+  name_starts_with: String
+  name_ends_with: String
+  minLeverage: BigInt
+  minLeverage_not: BigInt
+  minLeverage_gt: BigInt
+  minLeverage_lt: BigInt
+  minLeverage_gte: BigInt
+  minLeverage_lte: BigInt
+  minLeverage_in: [BigInt!]
+  minLeverage_not_in: [BigInt!]
+  maxLeverage: BigInt
+  maxLeverage_not: BigInt
+  maxLeverage_gt: BigInt
+  maxLeverage_lt: BigInt
+  maxLeverage_gte: BigInt
+  maxLeverage_lte: BigInt
+  maxLeverage_in: [BigInt!]
+  maxLeverage_not_in: [BigInt!]
+  maxCollateralP: BigInt
+  maxCollateralP_not: BigInt
+  maxCollateralP_gt: BigInt
+  maxCollateralP_lt: BigInt
+  maxCollateralP_gte: BigInt
+  maxCollateralP_lte: BigInt
+  maxCollateralP_in: [BigInt!]
+  maxCollateralP_not_in: [BigInt!]
+  longCollateral: BigInt
+  longCollateral_not: BigInt
+  longCollateral_gt: BigInt
+  longCollateral_lt: BigInt
+  longCollateral_gte: BigInt
+  longCollateral_lte: BigInt
+  longCollateral_in: [BigInt!]
+  longCollateral_not_in: [BigInt!]
+  shortCollateral: BigInt
+  shortCollateral_not: BigInt
+  shortCollateral_gt: BigInt
+  shortCollateral_lt: BigInt
+  shortCollateral_gte: BigInt
+  shortCollateral_lte: BigInt
+  shortCollateral_in: [BigInt!]
+  shortCollateral_not_in: [BigInt!]
+  _change_block: BlockChangedFilter
+  and: [Group_filter]
+  or: [Group_filter]
+}
+
+type Fee {
+  id: ID!
+  minLevPos: BigInt!
+}
+
+enum Fee_orderBy {
+  id
+  minLevPos
+}
+
+input Fee_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  minLevPos: BigInt
+  minLevPos_not: BigInt
+  minLevPos_gt: BigInt
+  minLevPos_lt: BigInt
+  minLevPos_gte: BigInt
+  minLevPos_lte: BigInt
+  minLevPos_in: [BigInt!]
+  minLevPos_not_in: [BigInt!]
+  _change_block: BlockChangedFilter
+  and: [Fee_filter]
+  or: [Fee_filter]
+}
+
+type MetaData {
+  id: ID!
+  liqMarginThresholdP: BigInt!
+}
+
+enum MetaData_orderBy {
+  id
+  liqMarginThresholdP
+}
+
+input MetaData_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  liqMarginThresholdP: BigInt
+  liqMarginThresholdP_not: BigInt
+  liqMarginThresholdP_gt: BigInt
+  liqMarginThresholdP_lt: BigInt
+  liqMarginThresholdP_gte: BigInt
+  liqMarginThresholdP_lte: BigInt
+  liqMarginThresholdP_in: [BigInt!]
+  liqMarginThresholdP_not_in: [BigInt!]
+  _change_block: BlockChangedFilter
+  and: [MetaData_filter]
+  or: [MetaData_filter]
+}
+
+type Trade {
+  id: ID!
+  tradeID: BigInt!
+  trader: Bytes!
+  pair: Pair!
+  index: BigInt!
+  tradeType: String!
+  openPrice: BigInt!
+  closePrice: BigInt!
+  takeProfitPrice: BigInt!
+  stopLossPrice: BigInt!
+  collateral: BigInt!
+  notional: BigInt!
+  tradeNotional: BigInt!
+  highestLeverage: BigInt!
+  leverage: BigInt!
+  isBuy: Boolean!
+  isOpen: Boolean!
+  closeInitiated: Boolean!
+  funding: BigInt!
+  rollover: BigInt!
+  timestamp: BigInt!
+}
+
+enum Trade_orderBy {
+  id
+  tradeID
+  trader
+  pair
+  index
+  tradeType
+  openPrice
+  closePrice
+  takeProfitPrice
+  stopLossPrice
+  collateral
+  notional
+  tradeNotional
+  highestLeverage
+  leverage
+  isBuy
+  isOpen
+  closeInitiated
+  funding
+  rollover
+  timestamp
+}
+
+input Trade_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  tradeID: BigInt
+  tradeID_not: BigInt
+  tradeID_gt: BigInt
+  tradeID_lt: BigInt
+  tradeID_gte: BigInt
+  tradeID_lte: BigInt
+  tradeID_in: [BigInt!]
+  tradeID_not_in: [BigInt!]
+  trader: Bytes
+  trader_not: Bytes
+  trader_gt: Bytes
+  trader_lt: Bytes
+  trader_gte: Bytes
+  trader_lte: Bytes
+  trader_in: [Bytes!]
+  trader_not_in: [Bytes!]
+  pair: String
+  pair_not: String
+  pair_gt: String
+  pair_lt: String
+  pair_gte: String
+  pair_lte: String
+  pair_in: [String!]
+  pair_not_in: [String!]
+  pair_: Pair_filter
+  index: BigInt
+  index_not: BigInt
+  index_gt: BigInt
+  index_lt: BigInt
+  index_gte: BigInt
+  index_lte: BigInt
+  index_in: [BigInt!]
+  index_not_in: [BigInt!]
+  tradeType: String
+  tradeType_not: String
+  tradeType_gt: String
+  tradeType_lt: String
+  tradeType_gte: String
+  tradeType_lte: String
+  tradeType_in: [String!]
+  tradeType_not_in: [String!]
+  tradeType_contains: String
+  tradeType_not_contains: String
+  tradeType_starts_with: String
+  tradeType_ends_with: String
+  openPrice: BigInt
+  openPrice_not: BigInt
+  openPrice_gt: BigInt
+  openPrice_lt: BigInt
+  openPrice_gte: BigInt
+  openPrice_lte: BigInt
+  openPrice_in: [BigInt!]
+  openPrice_not_in: [BigInt!]
+  closePrice: BigInt
+  closePrice_not: BigInt
+  closePrice_gt: BigInt
+  closePrice_lt: BigInt
+  closePrice_gte: BigInt
+  closePrice_lte: BigInt
+  closePrice_in: [BigInt!]
+  closePrice_not_in: [BigInt!]
+  takeProfitPrice: BigInt
+  takeProfitPrice_not: BigInt
+  takeProfitPrice_gt: BigInt
+  takeProfitPrice_lt: BigInt
+  takeProfitPrice_gte: BigInt
+  takeProfitPrice_lte: BigInt
+  takeProfitPrice_in: [BigInt!]
+  takeProfitPrice_not_in: [BigInt!]
+  stopLossPrice: BigInt
+  stopLossPrice_not: BigInt
+  stopLossPrice_gt: BigInt
+  stopLossPrice_lt: BigInt
+  stopLossPrice_gte: BigInt
+  stopLossPrice_lte: BigInt
+  stopLossPrice_in: [BigInt!]
+  stopLossPrice_not_in: [BigInt!]
+  collateral: BigInt
+  collateral_not: BigInt
+  collateral_gt: BigInt
+  collateral_lt: BigInt
+  collateral_gte: BigInt
+  collateral_lte: BigInt
+  collateral_in: [BigInt!]
+  collateral_not_in: [BigInt!]
+  notional: BigInt
+  notional_not: BigInt
+  notional_gt: BigInt
+  notional_lt: BigInt
+  notional_gte: BigInt
+  notional_lte: BigInt
+  notional_in: [BigInt!]
+  notional_not_in: [BigInt!]
+  tradeNotional: BigInt
+  tradeNotional_not: BigInt
+  tradeNotional_gt: BigInt
+  tradeNotional_lt: BigInt
+  tradeNotional_gte: BigInt
+  tradeNotional_lte: BigInt
+  tradeNotional_in: [BigInt!]
+  tradeNotional_not_in: [BigInt!]
+  highestLeverage: BigInt
+  highestLeverage_not: BigInt
+  highestLeverage_gt: BigInt
+  highestLeverage_lt: BigInt
+  highestLeverage_gte: BigInt
+  highestLeverage_lte: BigInt
+  highestLeverage_in: [BigInt!]
+  highestLeverage_not_in: [BigInt!]
+  leverage: BigInt
+  leverage_not: BigInt
+  leverage_gt: BigInt
+  leverage_lt: BigInt
+  leverage_gte: BigInt
+  leverage_lte: BigInt
+  leverage_in: [BigInt!]
+  leverage_not_in: [BigInt!]
+  isBuy: Boolean
+  isBuy_not: Boolean
+  isBuy_in: [Boolean!]
+  isBuy_not_in: [Boolean!]
+  isOpen: Boolean
+  isOpen_not: Boolean
+  isOpen_in: [Boolean!]
+  isOpen_not_in: [Boolean!]
+  closeInitiated: Boolean
+  closeInitiated_not: Boolean
+  closeInitiated_in: [Boolean!]
+  closeInitiated_not_in: [Boolean!]
+  funding: BigInt
+  funding_not: BigInt
+  funding_gt: BigInt
+  funding_lt: BigInt
+  funding_gte: BigInt
+  funding_lte: BigInt
+  funding_in: [BigInt!]
+  funding_not_in: [BigInt!]
+  rollover: BigInt
+  rollover_not: BigInt
+  rollover_gt: BigInt
+  rollover_lt: BigInt
+  rollover_gte: BigInt
+  rollover_lte: BigInt
+  rollover_in: [BigInt!]
+  rollover_not_in: [BigInt!]
+  timestamp: BigInt
+  timestamp_not: BigInt
+  timestamp_gt: BigInt
+  timestamp_lt: BigInt
+  timestamp_gte: BigInt
+  timestamp_lte: BigInt
+  timestamp_in: [BigInt!]
+  timestamp_not_in: [BigInt!]
+  _change_block: BlockChangedFilter
+  and: [Trade_filter]
+  or: [Trade_filter]
+}
+
+type Limit {
+  id: ID!
+  trader: Bytes!
+  pair: Pair!
+  collateral: BigInt!
+  leverage: BigInt!
+  isBuy: Boolean!
+  isActive: Boolean!
+  openPrice: BigInt!
+  takeProfitPrice: BigInt!
+  stopLossPrice: BigInt!
+  initiatedAt: BigInt!
+  limitType: String!
+}
+
+enum Limit_orderBy {
+  id
+  trader
+  pair
+  collateral
+  leverage
+  isBuy
+  isActive
+  openPrice
+  takeProfitPrice
+  stopLossPrice
+  initiatedAt
+  limitType
+}
+
+input Limit_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  trader: Bytes
+  trader_not: Bytes
+  trader_gt: Bytes
+  trader_lt: Bytes
+  trader_gte: Bytes
+  trader_lte: Bytes
+  trader_in: [Bytes!]
+  trader_not_in: [Bytes!]
+  pair: String
+  pair_not: String
+  pair_gt: String
+  pair_lt: String
+  pair_gte: String
+  pair_lte: String
+  pair_in: [String!]
+  pair_not_in: [String!]
+  pair_: Pair_filter
+  collateral: BigInt
+  collateral_not: BigInt
+  collateral_gt: BigInt
+  collateral_lt: BigInt
+  collateral_gte: BigInt
+  collateral_lte: BigInt
+  collateral_in: [BigInt!]
+  collateral_not_in: [BigInt!]
+  leverage: BigInt
+  leverage_not: BigInt
+  leverage_gt: BigInt
+  leverage_lt: BigInt
+  leverage_gte: BigInt
+  leverage_lte: BigInt
+  leverage_in: [BigInt!]
+  leverage_not_in: [BigInt!]
+  isBuy: Boolean
+  isBuy_not: Boolean
+  isBuy_in: [Boolean!]
+  isBuy_not_in: [Boolean!]
+  isActive: Boolean
+  isActive_not: Boolean
+  isActive_in: [Boolean!]
+  isActive_not_in: [Boolean!]
+  openPrice: BigInt
+  openPrice_not: BigInt
+  openPrice_gt: BigInt
+  openPrice_lt: BigInt
+  openPrice_gte: BigInt
+  openPrice_lte: BigInt
+  openPrice_in: [BigInt!]
+  openPrice_not_in: [BigInt!]
+  takeProfitPrice: BigInt
+  takeProfitPrice_not: BigInt
+  takeProfitPrice_gt: BigInt
+  takeProfitPrice_lt: BigInt
+  takeProfitPrice_gte: BigInt
+  takeProfitPrice_lte: BigInt
+  takeProfitPrice_in: [BigInt!]
+  takeProfitPrice_not_in: [BigInt!]
+  stopLossPrice: BigInt
+  stopLossPrice_not: BigInt
+  stopLossPrice_gt: BigInt
+  stopLossPrice_lt: BigInt
+  stopLossPrice_gte: BigInt
+  stopLossPrice_lte: BigInt
+  stopLossPrice_in: [BigInt!]
+  stopLossPrice_not_in: [BigInt!]
+  initiatedAt: BigInt
+  initiatedAt_not: BigInt
+  initiatedAt_gt: BigInt
+  initiatedAt_lt: BigInt
+  initiatedAt_gte: BigInt
+  initiatedAt_lte: BigInt
+  initiatedAt_in: [BigInt!]
+  initiatedAt_not_in: [BigInt!]
+  limitType: String
+  limitType_not: String
+  limitType_gt: String
+  limitType_lt: String
+  limitType_gte: String
+  limitType_lte: String
+  limitType_in: [String!]
+  limitType_not_in: [String!]
+  limitType_contains: String
+  limitType_not_contains: String
+  limitType_starts_with: String
+  limitType_ends_with: String
+  _change_block: BlockChangedFilter
+  and: [Limit_filter]
+  or: [Limit_filter]
+}
+
+type Order {
+  id: ID!
+  trader: Bytes!
+  pair: Pair!
+  tradeID: BigInt
+  limitID: String
+  orderType: String!
+  orderAction: String!
+  price: BigInt!
+  priceAfterImpact: BigInt
+  priceImpactP: BigInt
+  collateral: BigInt!
+  notional: BigInt!
+  tradeNotional: BigInt!
+  profitPercent: BigInt
+  totalProfitPercent: BigInt
+  amountSentToTrader: BigInt
+  isBuy: Boolean!
+  initiatedAt: BigInt!
+  executedAt: BigInt
+  initiatedTx: Bytes!
+  executedTx: Bytes
+  initiatedBlock: BigInt!
+  executedBlock: BigInt
+  leverage: BigInt!
+  isPending: Boolean!
+  isCancelled: Boolean!
+  cancelReason: String
+  devFee: BigInt
+  vaultFee: BigInt
+  oracleFee: BigInt
+  liquidationFee: BigInt
+  fundingFee: BigInt
+  rolloverFee: BigInt
+  closePercent: BigInt
+}
+
+enum Order_orderBy {
+  id
+  trader
+  pair
+  tradeID
+  limitID
+  orderType
+  orderAction
+  price
+  priceAfterImpact
+  priceImpactP
+  collateral
+  notional
+  tradeNotional
+  profitPercent
+  totalProfitPercent
+  amountSentToTrader
+  isBuy
+  initiatedAt
+  executedAt
+  initiatedTx
+  executedTx
+  initiatedBlock
+  executedBlock
+  leverage
+  isPending
+  isCancelled
+  cancelReason
+  devFee
+  vaultFee
+  oracleFee
+  liquidationFee
+  fundingFee
+  rolloverFee
+  closePercent
+}
+
+input Order_filter {
+  id: ID
+  id_not: ID
+  id_gt: ID
+  id_lt: ID
+  id_gte: ID
+  id_lte: ID
+  id_in: [ID!]
+  id_not_in: [ID!]
+  trader: Bytes
+  trader_not: Bytes
+  trader_gt: Bytes
+  trader_lt: Bytes
+  trader_gte: Bytes
+  trader_lte: Bytes
+  trader_in: [Bytes!]
+  trader_not_in: [Bytes!]
+  pair: String
+  pair_not: String
+  pair_gt: String
+  pair_lt: String
+  pair_gte: String
+  pair_lte: String
+  pair_in: [String!]
+  pair_not_in: [String!]
+  pair_: Pair_filter
+  tradeID: BigInt
+  tradeID_not: BigInt
+  tradeID_gt: BigInt
+  tradeID_lt: BigInt
+  tradeID_gte: BigInt
+  tradeID_lte: BigInt
+  tradeID_in: [BigInt!]
+  tradeID_not_in: [BigInt!]
+  limitID: String
+  limitID_not: String
+  limitID_gt: String
+  limitID_lt: String
+  limitID_gte: String
+  limitID_lte: String
+  limitID_in: [String!]
+  limitID_not_in: [String!]
+  limitID_contains: String
+  limitID_not_contains: String
+  limitID_starts_with: String
+  limitID_ends_with: String
+  orderType: String
+  orderType_not: String
+  orderType_gt: String
+  orderType_lt: String
+  orderType_gte: String
+  orderType_lte: String
+  orderType_in: [String!]
+  orderType_not_in: [String!]
+  orderType_contains: String
+  orderType_not_contains: String
+  orderType_starts_with: String
+  orderType_ends_with: String
+  orderAction: String
+  orderAction_not: String
+  orderAction_gt: String
+  orderAction_lt: String
+  orderAction_gte: String
+  orderAction_lte: String
+  orderAction_in: [String!]
+  orderAction_not_in: [String!]
+  orderAction_contains: String
+  orderAction_not_contains: String
+  orderAction_starts_with: String
+  orderAction_ends_with: String
+  price: BigInt
+  price_not: BigInt
+  price_gt: BigInt
+  price_lt: BigInt
+  price_gte: BigInt
+  price_lte: BigInt
+  price_in: [BigInt!]
+  price_not_in: [BigInt!]
+  priceAfterImpact: BigInt
+  priceAfterImpact_not: BigInt
+  priceAfterImpact_gt: BigInt
+  priceAfterImpact_lt: BigInt
+  priceAfterImpact_gte: BigInt
+  priceAfterImpact_lte: BigInt
+  priceAfterImpact_in: [BigInt!]
+  priceAfterImpact_not_in: [BigInt!]
+  priceImpactP: BigInt
+  priceImpactP_not: BigInt
+  priceImpactP_gt: BigInt
+  priceImpactP_lt: BigInt
+  priceImpactP_gte: BigInt
+  priceImpactP_lte: BigInt
+  priceImpactP_in: [BigInt!]
+  priceImpactP_not_in: [BigInt!]
+  collateral: BigInt
+  collateral_not: BigInt
+  collateral_gt: BigInt
+  collateral_lt: BigInt
+  collateral_gte: BigInt
+  collateral_lte: BigInt
+  collateral_in: [BigInt!]
+  collateral_not_in: [BigInt!]
+  notional: BigInt
+  notional_not: BigInt
+  notional_gt: BigInt
+  notional_lt: BigInt
+  notional_gte: BigInt
+  notional_lte: BigInt
+  notional_in: [BigInt!]
+  notional_not_in: [BigInt!]
+  tradeNotional: BigInt
+  tradeNotional_not: BigInt
+  tradeNotional_gt: BigInt
+  tradeNotional_lt: BigInt
+  tradeNotional_gte: BigInt
+  tradeNotional_lte: BigInt
+  tradeNotional_in: [BigInt!]
+  tradeNotional_not_in: [BigInt!]
+  profitPercent: BigInt
+  profitPercent_not: BigInt
+  profitPercent_gt: BigInt
+  profitPercent_lt: BigInt
+  profitPercent_gte: BigInt
+  profitPercent_lte: BigInt
+  profitPercent_in: [BigInt!]
+  profitPercent_not_in: [BigInt!]
+  totalProfitPercent: BigInt
+  totalProfitPercent_not: BigInt
+  totalProfitPercent_gt: BigInt
+  totalProfitPercent_lt: BigInt
+  totalProfitPercent_gte: BigInt
+  totalProfitPercent_lte: BigInt
+  totalProfitPercent_in: [BigInt!]
+  totalProfitPercent_not_in: [BigInt!]
+  amountSentToTrader: BigInt
+  amountSentToTrader_not: BigInt
+  amountSentToTrader_gt: BigInt
+  amountSentToTrader_lt: BigInt
+  amountSentToTrader_gte: BigInt
+  amountSentToTrader_lte: BigInt
+  amountSentToTrader_in: [BigInt!]
+  amountSentToTrader_not_in: [BigInt!]
+  isBuy: Boolean
+  isBuy_not: Boolean
+  isBuy_in: [Boolean!]
+  isBuy_not_in: [Boolean!]
+  initiatedAt: BigInt
+  initiatedAt_not: BigInt
+  initiatedAt_gt: BigInt
+  initiatedAt_lt: BigInt
+  initiatedAt_gte: BigInt
+  initiatedAt_lte: BigInt
+  initiatedAt_in: [BigInt!]
+  initiatedAt_not_in: [BigInt!]
+  executedAt: BigInt
+  executedAt_not: BigInt
+  executedAt_gt: BigInt
+  executedAt_lt: BigInt
+  executedAt_gte: BigInt
+  executedAt_lte: BigInt
+  executedAt_in: [BigInt!]
+  executedAt_not_in: [BigInt!]
+  initiatedTx: Bytes
+  initiatedTx_not: Bytes
+  initiatedTx_gt: Bytes
+  initiatedTx_lt: Bytes
+  initiatedTx_gte: Bytes
+  initiatedTx_lte: Bytes
+  initiatedTx_in: [Bytes!]
+  initiatedTx_not_in: [Bytes!]
+  executedTx: Bytes
+  executedTx_not: Bytes
+  executedTx_gt: Bytes
+  executedTx_lt: Bytes
+  executedTx_gte: Bytes
+  executedTx_lte: Bytes
+  executedTx_in: [Bytes!]
+  executedTx_not_in: [Bytes!]
+  initiatedBlock: BigInt
+  initiatedBlock_not: BigInt
+  initiatedBlock_gt: BigInt
+  initiatedBlock_lt: BigInt
+  initiatedBlock_gte: BigInt
+  initiatedBlock_lte: BigInt
+  initiatedBlock_in: [BigInt!]
+  initiatedBlock_not_in: [BigInt!]
+  executedBlock: BigInt
+  executedBlock_not: BigInt
+  executedBlock_gt: BigInt
+  executedBlock_lt: BigInt
+  executedBlock_gte: BigInt
+  executedBlock_lte: BigInt
+  executedBlock_in: [BigInt!]
+  executedBlock_not_in: [BigInt!]
+  leverage: BigInt
+  leverage_not: BigInt
+  leverage_gt: BigInt
+  leverage_lt: BigInt
+  leverage_gte: BigInt
+  leverage_lte: BigInt
+  leverage_in: [BigInt!]
+  leverage_not_in: [BigInt!]
+  isPending: Boolean
+  isPending_not: Boolean
+  isPending_in: [Boolean!]
+  isPending_not_in: [Boolean!]
+  isCancelled: Boolean
+  isCancelled_not: Boolean
+  isCancelled_in: [Boolean!]
+  isCancelled_not_in: [Boolean!]
+  cancelReason: String
+  cancelReason_not: String
+  cancelReason_gt: String
+  cancelReason_lt: String
+  cancelReason_gte: String
+  cancelReason_lte: String
+  cancelReason_in: [String!]
+  cancelReason_not_in: [String!]
+  cancelReason_contains: String
+  cancelReason_not_contains: String
+  cancelReason_starts_with: String
+  cancelReason_ends_with: String
+  devFee: BigInt
+  devFee_not: BigInt
+  devFee_gt: BigInt
+  devFee_lt: BigInt
+  devFee_gte: BigInt
+  devFee_lte: BigInt
+  devFee_in: [BigInt!]
+  devFee_not_in: [BigInt!]
+  vaultFee: BigInt
+  vaultFee_not: BigInt
+  vaultFee_gt: BigInt
+  vaultFee_lt: BigInt
+  vaultFee_gte: BigInt
+  vaultFee_lte: BigInt
+  vaultFee_in: [BigInt!]
+  vaultFee_not_in: [BigInt!]
+  oracleFee: BigInt
+  oracleFee_not: BigInt
+  oracleFee_gt: BigInt
+  oracleFee_lt: BigInt
+  oracleFee_gte: BigInt
+  oracleFee_lte: BigInt
+  oracleFee_in: [BigInt!]
+  oracleFee_not_in: [BigInt!]
+  liquidationFee: BigInt
+  liquidationFee_not: BigInt
+  liquidationFee_gt: BigInt
+  liquidationFee_lt: BigInt
+  liquidationFee_gte: BigInt
+  liquidationFee_lte: BigInt
+  liquidationFee_in: [BigInt!]
+  liquidationFee_not_in: [BigInt!]
+  fundingFee: BigInt
+  fundingFee_not: BigInt
+  fundingFee_gt: BigInt
+  fundingFee_lt: BigInt
+  fundingFee_gte: BigInt
+  fundingFee_lte: BigInt
+  fundingFee_in: [BigInt!]
+  fundingFee_not_in: [BigInt!]
+  rolloverFee: BigInt
+  rolloverFee_not: BigInt
+  rolloverFee_gt: BigInt
+  rolloverFee_lt: BigInt
+  rolloverFee_gte: BigInt
+  rolloverFee_lte: BigInt
+  rolloverFee_in: [BigInt!]
+  rolloverFee_not_in: [BigInt!]
+  closePercent: BigInt
+  closePercent_not: BigInt
+  closePercent_gt: BigInt
+  closePercent_lt: BigInt
+  closePercent_gte: BigInt
+  closePercent_lte: BigInt
+  closePercent_in: [BigInt!]
+  closePercent_not_in: [BigInt!]
+  _change_block: BlockChangedFilter
+  and: [Order_filter]
+  or: [Order_filter]
+}
+
+type Query {
+  pair(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Pair
+  pairs(skip: Int = 0, first: Int = 100, orderBy: Pair_orderBy, orderDirection: OrderDirection, where: Pair_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Pair!]!
+  group(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Group
+  groups(skip: Int = 0, first: Int = 100, orderBy: Group_orderBy, orderDirection: OrderDirection, where: Group_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Group!]!
+  fee(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Fee
+  fees(skip: Int = 0, first: Int = 100, orderBy: Fee_orderBy, orderDirection: OrderDirection, where: Fee_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Fee!]!
+  metaData(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): MetaData
+  metaDatas(skip: Int = 0, first: Int = 100, orderBy: MetaData_orderBy, orderDirection: OrderDirection, where: MetaData_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [MetaData!]!
+  trade(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Trade
+  trades(skip: Int = 0, first: Int = 100, orderBy: Trade_orderBy, orderDirection: OrderDirection, where: Trade_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Trade!]!
+  limit(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Limit
+  limits(skip: Int = 0, first: Int = 100, orderBy: Limit_orderBy, orderDirection: OrderDirection, where: Limit_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Limit!]!
+  order(id: ID!, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): Order
+  orders(skip: Int = 0, first: Int = 100, orderBy: Order_orderBy, orderDirection: OrderDirection, where: Order_filter, block: Block_height, subgraphError: _SubgraphErrorPolicy_! = deny): [Order!]!
+  _meta(block: Block_height): _Meta_
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def get_subgraph_schema() -> GraphQLSchema:
+    """The bundled schema, built once per process"""
+    return build_schema(subgraph_schema_sdl)
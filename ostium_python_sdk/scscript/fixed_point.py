@@ -0,0 +1,185 @@
+"""
+Integer fixed-point versions of the contract-mirroring functions in funding.py and pairinfos.py.
+
+Every argument and result is a plain Python int holding the raw on-chain value, i.e. the number
+the Decimal versions divide by its precision first (the same inputs their __main__ harness takes):
+
+    prices, funding rates/values, hill inflection point, spring factor ... 1e18
+    collateral, OI, fees, trade size, oi delta, normalizedOiDelta ....... 1e6
+    leverage, hill scales, sFactor scales, liqMarginThresholdP .......... 1e2
+
+Each quantize(..., ROUND_DOWN) of the Decimal code is an integer division truncating towards
+zero, like Solidity's. Results are bit for bit equal to the Decimal versions evaluated the way the
+contracts are, with getcontext().prec = 128 and ROUND_DOWN - without depending on the global
+decimal context.
+"""
+
+from functools import lru_cache
+
+SCALE_2 = 10**2
+SCALE_3 = 10**3
+SCALE_6 = 10**6
+SCALE_18 = 10**18
+
+# exponentialApproximation() constants, scaled
+_EXP_SMALL_LIMIT = 7932312589092019  # 0.7932312589092019, 16 decimals
+_EXP_SMALL_LIMIT_SCALE = 10**16
+_EXP_MAX = 6906  # 6.906, 3 decimals
+_EXP_K = (1648721, 1284025, 1133148, 1064494, 1031743,
+          1015748, 1007843, 1003915, 1001955, 1000977)  # 1e6
+
+# sFactor = sFactorScaleP (1e2) * springFactor (1e18) / 100 carries up to 22 decimals
+_SFACTOR_SCALE = 10**22
+
+
+def _div(a: int, b: int) -> int:
+    """Integer division truncating towards zero (Solidity / ROUND_DOWN), unlike Python's //"""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def getTargetFundingRate(normalizedOiDelta: int, hillInflectionPoint: int, maxFundingFeePerBlock: int,
+                         hillPosScale: int, hillNegScale: int) -> int:
+    # x = a * normalizedOiDelta, a = 1.84
+    x = _div(184 * normalizedOiDelta, 100)
+    x2 = x * x * SCALE_6
+    # hill = x^2 / (K + x^2), K = 0.16
+    hill = _div(x2 * SCALE_18, 16 * 10**16 + x2)
+
+    if normalizedOiDelta >= 0:
+        targetFr = _div(hillPosScale * hill, SCALE_2) + hillInflectionPoint
+    else:
+        targetFr = _div(-hillNegScale * hill, SCALE_2) + hillInflectionPoint
+
+    targetFr = max(-SCALE_18, min(SCALE_18, targetFr))
+    return _div(maxFundingFeePerBlock * targetFr, SCALE_18)
+
+
+def exponentialApproximation(value: int, scale: int = SCALE_18) -> int:
+    """e^value for `value` scaled by `scale` (a power of ten >= 1e9), result scaled by 1e18"""
+    abs_value = abs(value)
+    if abs_value * _EXP_SMALL_LIMIT_SCALE < _EXP_SMALL_LIMIT * scale:
+        # Pade approximant ((x + 3)^2 + 3) / ((x - 3)^2 + 3)
+        square_scale = scale * scale // SCALE_18
+        numeratorTmp = value + 3 * scale
+        numerator = numeratorTmp * numeratorTmp // square_scale + 3 * SCALE_18
+        denominatorTmp = value - 3 * scale
+        denominator = denominatorTmp * denominatorTmp // square_scale + 3 * SCALE_18
+        return numerator * SCALE_18 // denominator
+    elif abs_value * SCALE_3 <= _EXP_MAX * scale:
+        # only the integer part and the first len(_EXP_K) bits of the fraction matter
+        integer_part, decimal_part = divmod(abs_value, scale)
+        return _exponential_table(integer_part, (decimal_part << len(_EXP_K)) // scale)
+    else:
+        return 0
+
+
+@lru_cache(maxsize=None)
+def _exponential_table(integer_part: int, bits: int) -> int:
+    # e^-|x| = 1 / (2^int(|x|) * prod(e^(2^-i) for the set bits of frac(|x|))), at most 7 * 1024 entries
+    product = SCALE_6
+    for i, k in enumerate(_EXP_K):
+        if bits >> (len(_EXP_K) - 1 - i) & 1:
+            product = product * k // SCALE_6
+    product = (product // SCALE_3) << integer_part  # 1e3
+    return SCALE_6 // product * 10**15
+
+
+def getPendingAccFundingFees(
+        blockNumber: int,
+        lastUpdateBlock: int,
+        valueLong: int,
+        valueShort: int,
+        openInterestUsdcLong: int,
+        openInterestUsdcShort: int,
+        OiCap: int,
+        maxFundingFeePerBlock: int,
+        lastFundingRate: int,
+        hillInflectionPoint: int,
+        hillPosScale: int,
+        hillNegScale: int,
+        springFactor: int,
+        sFactorUpScale: int,
+        sFactorDownScaleP: int,
+):
+    """Returns (accFundingLong, accFundingShort, latestFundingRate, targetFundingRate), all 1e18"""
+    numBlocks = blockNumber - lastUpdateBlock
+    openInterestMax = max(openInterestUsdcLong, openInterestUsdcShort)
+    normalizedOiDelta = _div((openInterestUsdcLong - openInterestUsdcShort) * SCALE_6,
+                             max(OiCap, openInterestMax))
+
+    targetFr = getTargetFundingRate(normalizedOiDelta, hillInflectionPoint,
+                                    maxFundingFeePerBlock, hillPosScale, hillNegScale)
+
+    # regime selection, sFactor scaled by 1e22
+    if lastFundingRate * targetFr >= 0:  # Same sign
+        if abs(targetFr) > abs(lastFundingRate):
+            sFactor = springFactor * 10**4
+        else:
+            sFactor = sFactorDownScaleP * springFactor
+    else:
+        sFactor = sFactorUpScale * springFactor
+
+    expComp = exponentialApproximation(-sFactor * numBlocks, _SFACTOR_SCALE)
+    accFundingRate = targetFr * numBlocks + \
+        _div((SCALE_18 - expComp) * (lastFundingRate - targetFr) * 10**4, sFactor)
+
+    fr = targetFr + _div((lastFundingRate - targetFr) * expComp, SCALE_18)
+
+    if accFundingRate > 0:
+        if openInterestUsdcLong > 0:
+            valueLong += accFundingRate
+            valueShort -= _div(accFundingRate * openInterestUsdcLong,
+                               openInterestUsdcShort) if openInterestUsdcShort > 0 else 0
+    else:
+        if openInterestUsdcShort > 0:
+            valueShort -= accFundingRate
+            valueLong += _div(accFundingRate * openInterestUsdcShort,
+                              openInterestUsdcLong) if openInterestUsdcLong > 0 else 0
+
+    return valueLong, valueShort, fr, targetFr
+
+
+def getTradeLiquidationPrice(
+    liqMarginThresholdP: int,
+    openPrice: int,
+    long: bool,
+    collateral: int,
+    leverage: int,
+    rolloverFee: int,
+    fundingFee: int,
+    maxLeverage: int
+) -> int:
+    """Liquidation price (1e18)"""
+    rawAdjustedThreshold = _div(liqMarginThresholdP * leverage * SCALE_6, SCALE_2 * maxLeverage)
+    liqMarginValue = _div(collateral * rawAdjustedThreshold, SCALE_6)
+    targetCollateralAfterFees = collateral - liqMarginValue - rolloverFee - fundingFee
+    liqPriceDistance = _div(openPrice * targetCollateralAfterFees * SCALE_2,
+                            collateral * leverage * 10**12)
+    liqPrice = openPrice - liqPriceDistance * 10**12 if long else openPrice + liqPriceDistance * 10**12
+    return max(0, liqPrice)
+
+
+def getOpeningFee(
+    tradeSize: int,
+    leverage: int,
+    oiDelta: int,
+    makerMaxLeverage: int,
+    makerFeeP: int,
+    takerFeeP: int
+) -> int:
+    """Opening fee (1e6)"""
+    makerAmount = 0
+    takerAmount = 0
+
+    # Base Fee
+    if (oiDelta * tradeSize < 0 and leverage <= makerMaxLeverage):
+        if (oiDelta * (oiDelta + tradeSize) >= 0):
+            makerAmount = abs(tradeSize)
+        else:
+            makerAmount = abs(oiDelta)
+            takerAmount = abs(oiDelta + tradeSize)
+    else:
+        takerAmount = abs(tradeSize)
+
+    return (makerFeeP * makerAmount // SCALE_6 + takerFeeP * takerAmount // SCALE_6) // SCALE_2
@@ -1,6 +1,7 @@
 import sys
 from eth_abi import encode
 from decimal import *
+from functools import lru_cache
 import math
 
 PRECISION_2 = Decimal(1e2)
@@ -64,7 +65,7 @@ def getPendingAccFundingFees(
     else:
         sFactor = sFactorUpScale * springFactor / 100
 
-    expComp = exponentialApproximation(-sFactor * numBlocks)
+    expComp = exponentialApproximationCached(-sFactor * numBlocks)
     accFundingRate = (targetFr * numBlocks).quantize(quantization_18, rounding=ROUND_DOWN) + ((Decimal(1) - expComp) * (lastFundingRate - targetFr) / sFactor).quantize(quantization_18, rounding=ROUND_DOWN)
 
     fr = targetFr + ((lastFundingRate - targetFr) * expComp).quantize(quantization_18, rounding=ROUND_DOWN)
@@ -90,11 +91,17 @@ def exponentialApproximation(value):
 
     return (numerator / denominator).quantize(quantization_18, rounding=ROUND_DOWN);
   elif abs(value) <= Decimal('6.906'):
+    return _exponentialPiecewise(abs(value))
+  else:
+    return Decimal(0)
+
+
+def _exponentialPiecewise(absValue):
     k = [Decimal('1.648721'), Decimal('1.284025'), Decimal('1.133148'), Decimal('1.064494'), Decimal('1.031743'), Decimal('1.015748'), Decimal('1.007843'), Decimal('1.003915'), Decimal('1.001955'), Decimal('1.000977')]
     product = Decimal('1.0')
 
-    integer_part = math.floor(abs(value))
-    decimal_part = abs(value) - integer_part
+    integer_part = math.floor(absValue)
+    decimal_part = absValue - integer_part
     
     for i in range(len(k)):
         decimal_part *= 2
@@ -107,8 +114,46 @@ def exponentialApproximation(value):
     product = product.quantize(quantization_3, rounding=ROUND_DOWN) * Decimal(2)**(integer_part)
 
     return (Decimal(1) / product.quantize(quantization_18, rounding=ROUND_DOWN)).quantize(quantization_3, rounding=ROUND_DOWN)
-  else:
-    return Decimal(0)
+
+
+EXP_SMALL_LIMIT = Decimal('0.7932312589092019')
+EXP_MAX = Decimal('6.906')
+EXP_TABLE_BITS = 10  # exponentialApproximation() reads at most len(k) bits of the fraction
+
+
+@lru_cache(maxsize=16384)
+def _exponentialApproximationEntry(value, prec, rounding):
+    return exponentialApproximation(value)
+
+
+@lru_cache(maxsize=None)
+def _exponentialPiecewiseEntry(absValue, prec, rounding):
+    return _exponentialPiecewise(absValue)
+
+
+def exponentialApproximationCached(value):
+    """
+    Same result as exponentialApproximation(), memoized per decimal context.
+
+    Between 0.79 and 6.906 the result only depends on the integer part of |value| and the first
+    EXP_TABLE_BITS bits of its fraction, so those inputs share one table entry per (integer part, bits),
+    7 * 1024 entries at most. Smaller inputs are memoized by value.
+    """
+    context = getcontext()
+    absValue = abs(value)
+    if absValue < EXP_SMALL_LIMIT:
+        return _exponentialApproximationEntry(value, context.prec, context.rounding)
+    elif absValue <= EXP_MAX:
+        integer_part = math.floor(absValue)
+        decimal_part = absValue - integer_part
+        if len(decimal_part.as_tuple().digits) + 4 > context.prec:
+            # shifting the fraction would round, keep the bit by bit loop
+            return _exponentialPiecewise(absValue)
+        bits = int(decimal_part * (1 << EXP_TABLE_BITS))
+        key = integer_part + Decimal(bits) / (1 << EXP_TABLE_BITS)
+        return _exponentialPiecewiseEntry(key, context.prec, context.rounding)
+    else:
+        return Decimal(0)
 
 if __name__ == "__main__":
     getcontext().prec = 128
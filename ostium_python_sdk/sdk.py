@@ -1,8 +1,10 @@
 from dotenv import load_dotenv
+import asyncio
 import os
+import time
 from decimal import Decimal, ROUND_DOWN
 
-from ostium_python_sdk.formulae import GetFundingRate
+from ostium_python_sdk.formulae import GetFundingRate, ProjectFundingRate
 from ostium_python_sdk.scscript.funding import getTargetFundingRate
 from ostium_python_sdk.utils import calculate_fee_per_hours, format_with_precision
 
@@ -10,17 +12,60 @@ from .formulae_wrapper import get_trade_metrics
 from .constants import CHAIN_ID_ARBITRUM_MAINNET, CHAIN_ID_ARBITRUM_TESTNET, PRECISION_2, PRECISION_6, PRECISION_12, PRECISION_18, PRECISION_9
 
 from ostium_python_sdk.faucet import Faucet
-from .balance import Balance
+from .async_ostium import AsyncOstium
+from .balance import AsyncBalance, Balance
+from .pairs_snapshot import AsyncPairSnapshotLoader
+from .positions import AsyncPositionReader
+from .events import AsyncTradingEventIndexer
+from .read_context import ReadContext
+from .store import HistoryStore
 from .price import Price
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from .ostium import Ostium
 from .config import NetworkConfig
 from typing import Union
 from .subgraph import SubgraphClient
 
+# Keys of get_formatted_pairs_details(columnar=True)
+PAIRS_DETAILS_COLUMNS = (
+    'id', 'from', 'to', 'group', 'longOI', 'shortOI', 'maxOI', 'makerFeeP', 'takerFeeP',
+    'minLeverage', 'maxLeverage', 'makerMaxLeverage', 'groupMaxCollateralP', 'minLevPos',
+    'lastFundingRate', 'curFundingLong', 'curFundingShort', 'lastFundingBlock',
+    'overnightMaxLeverage'
+)
+PAIRS_DETAILS_PRICE_COLUMNS = ('price', 'isMarketOpen', 'isDayTradingClosed')
+
+# Arbitrum blocks per hour, the (10 / 3) blocks per second used by the funding / rollover rate helpers
+BLOCKS_PER_HOUR = 12000
+
+
+async def _timed(timings, stage, awaitable):
+    """Await `awaitable`, recording its latency (seconds) as timings[stage]"""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def _empty_portfolio_totals():
+    return {'positions': 0, 'collateral': 0.0, 'pnl': 0.0, 'net_pnl': 0.0, 'funding': 0.0,
+            'rollover': 0.0, 'net_value': 0.0, 'margin_at_risk': 0.0}
+
+
+def _add_to_portfolio_totals(totals, position, risk_buffer_p):
+    metrics = position['metrics']
+    totals['positions'] += 1
+    totals['collateral'] += position['collateral']
+    for key in ('pnl', 'net_pnl', 'funding', 'rollover', 'net_value'):
+        totals[key] += metrics[key]
+    mid = float(metrics['mid'])
+    if mid > 0 and abs(mid - metrics['liquidation_price']) / mid * 100 <= risk_buffer_p:
+        totals['margin_at_risk'] += position['collateral']
+
 
 class OstiumSDK:
-    def __init__(self, network: Union[str, NetworkConfig], private_key: str = None, rpc_url: str = None, verbose=False, use_delegation=False):
+    def __init__(self, network: Union[str, NetworkConfig], private_key: str = None, rpc_url: str = None, verbose=False, use_delegation=False, manage_nonces=False, fire_and_forget=False, history_path: str = None):
         self.verbose = verbose
         load_dotenv()
         self.private_key = private_key or os.getenv('PRIVATE_KEY')
@@ -33,8 +78,10 @@ class OstiumSDK:
             raise ValueError(
                 f"No RPC_URL provided for {network_name}. Please provide via constructor or RPC_URL environment variable")
 
-        # Initialize Web3
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        # Initialize Web3. The chain id never changes, so the provider answers web3's own eth_chainId
+        # lookups (transaction validation before every eth_estimateGas / eth_call) from its cache
+        self.w3 = Web3(Web3.HTTPProvider(
+            self.rpc_url, cache_allowed_requests=True, cacheable_requests={'eth_chainId'}))
 
         # Get network configuration
         if isinstance(network, NetworkConfig):
@@ -72,7 +119,25 @@ class OstiumSDK:
             self.network_config.contracts["trading"],
             private_key=self.private_key,
             verbose=self.verbose,
-            use_delegation=self.use_delegation
+            use_delegation=self.use_delegation,
+            manage_nonces=manage_nonces,
+            fire_and_forget=fire_and_forget,
+            chain_id=actual_chain_id
+        )
+
+        # Async counterparts over AsyncWeb3, used by the async SDK methods so RPC calls do not block the event loop
+        self.async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(
+            self.rpc_url, cache_allowed_requests=True, cacheable_requests={'eth_chainId'}))
+        self.async_ostium = AsyncOstium(
+            self.async_w3,
+            self.network_config.contracts["usdc"],
+            self.network_config.contracts["tradingStorage"],
+            self.network_config.contracts["trading"],
+            private_key=self.private_key,
+            verbose=self.verbose,
+            use_delegation=self.use_delegation,
+            manage_nonces=manage_nonces,
+            chain_id=actual_chain_id
         )
 
         # Initialize subgraph client
@@ -81,7 +146,26 @@ class OstiumSDK:
 
         self.balance = Balance(
             self.w3, self.network_config.contracts["usdc"], verbose=self.verbose)
+        self.async_balance = AsyncBalance(
+            self.async_w3, self.network_config.contracts["usdc"], verbose=self.verbose)
         self.price = Price(verbose=self.verbose)
+        # On-chain (Multicall3) reader of open trades / limit orders, independent of the subgraph
+        self.positions = AsyncPositionReader(
+            self.async_w3, self.network_config.contracts["tradingStorage"], verbose=self.verbose)
+        # Trading contract event logs backfilled with chunked eth_getLogs
+        self.trading_events = AsyncTradingEventIndexer(
+            self.async_w3, self.network_config.contracts["trading"], verbose=self.verbose)
+        # Block-pinned pair state read from PairsInfo / PairsStorage, when the network config has their addresses
+        contracts = self.network_config.contracts
+        if "pairsInfo" in contracts and "pairsStorage" in contracts:
+            self.pair_snapshots = AsyncPairSnapshotLoader(
+                self.async_w3, contracts["pairsInfo"], contracts["pairsStorage"], contracts["tradingStorage"],
+                verbose=self.verbose)
+        else:
+            self.pair_snapshots = None
+
+        # Optional local SQLite copy of the order / trade history, see sync_history()
+        self.history = HistoryStore(history_path, verbose=self.verbose) if history_path else None
 
         if self.network_config.is_testnet:
             self.faucet = Faucet(self.w3, self.private_key,
@@ -93,24 +177,225 @@ class OstiumSDK:
         if self.verbose:
             print(message)
 
-    async def get_open_trades(self, trader_address=None):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Release the pooled HTTP connections held by the SDK"""
+        await self.price.close()
+        await self.subgraph.close()
+        if self.async_ostium is not None:
+            await self.async_ostium.web3.provider.disconnect()
+        if self.history is not None:
+            self.history.close()
+
+    async def get_block_number(self):
+        """Latest block number, read through AsyncWeb3 without blocking the event loop"""
+        return await self.async_ostium.get_block_number()
+
+    async def get_block(self, block_identifier='latest'):
+        """Block header (number, timestamp, ...), read through AsyncWeb3 without blocking the event loop"""
+        return await self.async_ostium.get_block(block_identifier)
+
+    async def read_context(self, block_number=None):
+        """
+        Pin one block for a group of reads (see ReadContext). By default that is the latest block
+        both the RPC node and the subgraph have, so subgraph queries at that block can be served.
+        The data age of the RPC node and the subgraph is recorded in context.sources.
+
+        Args:
+            block_number: Block to pin instead of the latest common one
+        """
+        head, indexed = await asyncio.gather(self.get_block('latest'), self.subgraph.get_indexed_block())
+        if block_number is None:
+            block_number = min(head['number'], indexed['number'])
+        block = head if block_number == head['number'] else await self.get_block(block_number)
+
+        context = ReadContext(block_number, block['timestamp'], chain_head=head['number'])
+        context.record('rpc', head['number'], head['timestamp'])
+        context.record('subgraph', indexed['number'], indexed['timestamp'])
+        self.subgraph.observe_block(head['number'])
+        self.log(f"Read context pinned at block {block_number}, data age: {context.sources}")
+        return context
+
+    async def _read_block_number(self, context=None):
+        if context is None:
+            return await self.get_block_number()
+        return context.block_number
+
+    async def _read_price_snapshot(self, context=None):
+        if context is None:
+            return await self.price.get_snapshot()
+
+        async def fetch():
+            snapshot = await self.price.get_snapshot()
+            context.record('price', timestamp=snapshot.timestamp)
+            return snapshot
+        return await context.get('price', fetch)
+
+    async def _read_liq_margin_threshold_p(self, context=None):
+        if context is None:
+            return await self.subgraph.get_liq_margin_threshold_p()
+        return await context.get('liq_margin_threshold_p', lambda: self.subgraph.get_liq_margin_threshold_p(
+            block_number=context.block_number))
+
+    async def _read_pairs_snapshot(self, context):
+        """On-chain state of every pair at the context block, None without pairsInfo / pairsStorage addresses"""
+        if self.pair_snapshots is None:
+            return None
+
+        async def fetch():
+            snapshot = await self.pair_snapshots.load(block_identifier=context.block_number)
+            context.record('contracts', snapshot['block_number'])
+            return snapshot
+        return await context.get('pairs_snapshot', fetch)
+
+    @staticmethod
+    def _with_onchain_pair(trade, pairs_snapshot):
+        """`trade` with its pair state replaced by the contract values of `pairs_snapshot`, if any"""
+        if pairs_snapshot is None:
+            return trade
+        pair = pairs_snapshot['pairs'].get(int(trade['pair']['id']))
+        return trade if pair is None else {**trade, 'pair': {**trade['pair'], **pair}}
+
+    async def get_open_trades(self, trader_address=None, context=None):
         if trader_address is None:
             trader_public_address = self.ostium.get_public_address()
         else:
             trader_public_address = trader_address
 
         self.log(f"Trader public address: {trader_public_address}")
-        open_trades = await self.subgraph.get_open_trades(trader_public_address)
+        if context is None:
+            open_trades = await self.subgraph.get_open_trades(trader_public_address)
+        else:
+            open_trades = await context.get(
+                ('open_trades', trader_public_address.lower()),
+                lambda: self.subgraph.get_open_trades(trader_public_address, block_number=context.block_number))
         return open_trades, trader_public_address
 
+    async def get_open_positions_onchain(self, trader_address=None, pair_ids=None, context: ReadContext = None):
+        """
+        Open trades and limit orders of a trader read from TradingStorage at one block (see
+        PositionReader), instead of from the subgraph.
+
+        Args:
+            trader_address: Trader address, defaults to the address of the SDK private key
+            pair_ids: Pairs to scan, defaults to every listed pair: PairsStorage.pairsCount() when
+                the network config has a pairsStorage address, the subgraph pairs otherwise
+            context: Read at the block pinned by this ReadContext (see read_context()) instead of the latest
+
+        Returns:
+            dict: {'block_number', 'trades', 'limit_orders'}, raw on-chain values
+        """
+        trader_address = trader_address or self.ostium.get_public_address()
+        block_identifier = context.block_number if context is not None else 'latest'
+        if pair_ids is None and self.pair_snapshots is not None:
+            pair_ids = range(await self.pair_snapshots.get_pairs_count(block_identifier))
+        elif pair_ids is None:
+            pair_ids = [int(pair['id']) for pair in await self.subgraph.get_pairs()]
+        return await self.positions.get_positions(trader_address, pair_ids, block_identifier)
+
+    async def iter_trading_events(self, from_block, to_block=None, events=None):
+        """
+        Decoded Trading contract events of a block range, read from the chain with adaptively
+        chunked eth_getLogs (see TradingEventIndexer) instead of from the subgraph history.
+
+            async for event in sdk.iter_trading_events(250000000, events=['TpUpdated', 'SlUpdated']):
+                print(event.name, event.block_number, event.args['trader'])
+
+        Args:
+            from_block: First block to read
+            to_block: Last block to read (inclusive), the latest block if None
+            events: Event names to read (e.g. 'MarketOpenOrderInitiated'), every Trading event if None
+
+        Yields:
+            TradingEvent: (name, args, block_number, log_index, transaction_hash, address), in chain order
+        """
+        async for event in self.trading_events.events(from_block, to_block, events):
+            yield event
+
+    async def sync_history(self, to_block=None):
+        """
+        Bring the local history store (OstiumSDK(..., history_path='ostium.db')) up to date: the
+        orders executed since the last sync and their trades, read from the subgraph. Query it
+        afterwards with sdk.history.get_orders() / get_trades() / get_recent_history() / ...,
+        without network calls.
+
+        Args:
+            to_block: Block to sync up to, the subgraph indexed head if None
+
+        Returns:
+            dict: {'from_block', 'to_block', 'orders', 'trades'}
+        """
+        if self.history is None:
+            raise ValueError(
+                "No history store configured. Pass history_path= to OstiumSDK to keep a local copy of the history")
+        return await self.history.sync(self.subgraph, to_block=to_block)
+
+    async def get_pairs_snapshot(self, pair_ids=None, block_identifier='latest', context: ReadContext = None):
+        """
+        Funding, rollover, fee, open interest and leverage state of pairs read from the contracts
+        at a single block (see PairSnapshotLoader), instead of from the lagging subgraph.
+
+        Requires the pairsInfo and pairsStorage addresses in the network config, e.g.
+        NetworkConfig(graph_url, {**NetworkConfig.mainnet().contracts, "pairsInfo": ..., "pairsStorage": ...}, False)
+
+        Args:
+            pair_ids: Pairs to load, all listed pairs if None
+            block_identifier: Block to read at, 'latest' by default
+            context: Read at the block pinned by this ReadContext (see read_context()) instead, the
+                snapshot of all pairs is shared with the other reads using the context
+
+        Returns:
+            dict: {'block_number', 'liq_margin_threshold_p', 'pairs': {pair_id: pair}}, pairs in the
+            subgraph pair shape, usable as trade['pair'] for get_trade_metrics()
+        """
+        if self.pair_snapshots is None:
+            raise ValueError(
+                "No pairsInfo / pairsStorage contract address in the network config. Add them to NetworkConfig.contracts to read pairs on-chain")
+        if context is None:
+            return await self.pair_snapshots.load(pair_ids, block_identifier)
+        snapshot = await self._read_pairs_snapshot(context)
+        if pair_ids is None:
+            return snapshot
+        return {**snapshot, 'pairs': {int(pair_id): snapshot['pairs'][int(pair_id)] for pair_id in pair_ids}}
+
     # if SDK instantiated with a private key, this function will return a given open trade metrics,
     # such as: funding fee, roll over fee, Unrealized Pnl, Profit Percent, etc.
     #
     # Will thorw in case SDK instantiated with no private key
-    async def get_open_trade_metrics(self, pair_id, trade_index, trader_address=None):
-        open_trades, trader_public_address = await self.get_open_trades(trader_address)
-
-        liq_margin_threshold_p = await self.subgraph.get_liq_margin_threshold_p()
+    #
+    # The open trades, liquidation threshold, prices, block number and pair max leverage are
+    # fetched concurrently. Pass a dict as `timings` to get the latency (seconds) of each stage:
+    # open_trades, liq_margin_threshold_p, price, block_number, pair_max_leverage, compute and total.
+    #
+    # With a `context` (see read_context()) the trade and pair state are read at the pinned block,
+    # funding is extrapolated to that block, and the reads are shared with other calls using it.
+    # When the network config has pairsInfo / pairsStorage addresses, the pair state (funding,
+    # rollover, OI, leverage) comes from the contracts at that block instead of the subgraph.
+    async def get_open_trade_metrics(self, pair_id, trade_index, trader_address=None, timings: dict = None, context: ReadContext = None):
+        timings = {} if timings is None else timings
+        start = time.perf_counter()
+
+        open_trades_result, liq_margin_threshold_p, snapshot, block_number, pair_max_leverage = await asyncio.gather(
+            _timed(timings, 'open_trades', self.get_open_trades(trader_address, context=context)),
+            _timed(timings, 'liq_margin_threshold_p',
+                   self._read_liq_margin_threshold_p(context)),
+            _timed(timings, 'price', self._read_price_snapshot(context)),
+            # a native AsyncWeb3 read (or the pinned block of the context)
+            _timed(timings, 'block_number', self._read_block_number(context)),
+            _timed(timings, 'pair_max_leverage',
+                   self.get_pair_max_leverage(pair_id, context=context)),
+        )
+        open_trades, trader_public_address = open_trades_result
+        if context is None:
+            self.subgraph.observe_block(block_number)
+            pairs_snapshot = None
+        else:
+            pairs_snapshot = await self._read_pairs_snapshot(context)
         self.log(
             f"SDK: get_open_trade_metrics: {liq_margin_threshold_p}, will use it for liquidation price calculation - call to get_trade_metrics()")
 
@@ -121,7 +406,7 @@ class OstiumSDK:
 
         for t in open_trades:
             if int(t['pair']['id']) == int(pair_id) and int(t['index']) == int(trade_index):
-                trade_details = t
+                trade_details = self._with_onchain_pair(t, pairs_snapshot)
                 break
 
         if trade_details is None:
@@ -129,21 +414,121 @@ class OstiumSDK:
                 f"Trade not found for {trader_public_address} pair {pair_id} and index {trade_index}")
 
         self.log(f"\nTrade details: {trade_details}")
-        # get the price for this trade's asset/feed
-        price_data = await self.price.get_latest_price_json(trade_details['pair']['from'], trade_details['pair']['to'])
+        # the price for this trade's asset/feed
+        price_data = snapshot.get(
+            trade_details['pair']['from'], trade_details['pair']['to'])
+        if price_data is None:
+            raise ValueError(
+                f"No price found for pair: {trade_details['pair']['from']}/{trade_details['pair']['to']}")
         self.log(
             f"\nPrice data: {price_data} (contains bid, mid, ask prices among other things)")
-        # get the block number
-        block_number = self.ostium.get_block_number()
         self.log(f"\nBlock number: {block_number}")
 
-        pair_max_leverage = await self.get_pair_max_leverage(trade_details['pair']['id'])
+        compute_start = time.perf_counter()
+        metrics = get_trade_metrics(trade_details, price_data, block_number,
+                                    pair_max_leverage, liq_margin_threshold_p, verbose=self.verbose)
+        timings['compute'] = time.perf_counter() - compute_start
+        timings['total'] = time.perf_counter() - start
+        self.log(f"get_open_trade_metrics latency breakdown (s): {timings}")
+        return metrics
 
-        return get_trade_metrics(trade_details, price_data, block_number, pair_max_leverage, liq_margin_threshold_p, verbose=self.verbose)
+    # Metrics of every open trade of one or many traders (default: the SDK's own address), e.g:
+    #
+    #   portfolio = await sdk.get_all_open_trade_metrics(["0xabc...", "0xdef..."])
+    #   portfolio['totals']['net_pnl'], portfolio['by_trader']["0xabc..."]['funding']
+    #
+    # The open trades (one paged query for all traders), liquidation threshold, prices, block number
+    # and the max leverage of the traded pairs are each fetched once, then get_trade_metrics() runs
+    # for every trade. Returns:
+    #   - positions: one dict per trade: trader, pair_id, index, from, to, is_buy, collateral and
+    #     metrics (as returned by get_trade_metrics(), None if no price is available for the pair)
+    #   - totals / by_trader: aggregates over the priced positions: positions, collateral, pnl,
+    #     net_pnl, funding, rollover, net_value and margin_at_risk - the collateral of positions
+    #     whose mid price is within `risk_buffer_p` percent of their liquidation price
+    #   - block_number, price_timestamp: the block and price snapshot the metrics were computed at
+    #   - data_age: with a `context` (see read_context()), its per-source data age (context.sources)
+    async def get_all_open_trade_metrics(self, trader_addresses=None, risk_buffer_p=10, context: ReadContext = None):
+        if trader_addresses is None:
+            trader_addresses = [self.ostium.get_public_address()]
+        elif isinstance(trader_addresses, str):
+            trader_addresses = [trader_addresses]
+        # the subgraph keys traders by lowercase address, an address listed twice is valued once
+        trader_addresses = list(dict.fromkeys(trader.lower() for trader in trader_addresses))
+
+        if context is None:
+            open_trades_read = self.subgraph.get_open_trades_for_traders(trader_addresses)
+        else:
+            open_trades_read = context.get(
+                ('open_trades_for_traders', tuple(sorted(trader_addresses))),
+                lambda: self.subgraph.get_open_trades_for_traders(trader_addresses, block_number=context.block_number))
+        open_trades, liq_margin_threshold_p, snapshot, block_number = await asyncio.gather(
+            open_trades_read,
+            self._read_liq_margin_threshold_p(context),
+            self._read_price_snapshot(context),
+            self._read_block_number(context),
+        )
+        if context is None:
+            self.subgraph.observe_block(block_number)
+
+        pair_ids = sorted({int(t['pair']['id'])
+                          for trades in open_trades.values() for t in trades})
+        pairs_max_leverage = await self.get_pairs_max_leverage(pair_ids, context=context)
+        pairs_snapshot = await self._read_pairs_snapshot(context) if context is not None else None
+
+        positions = []
+        by_trader = {}
+        for trader in trader_addresses:
+            trader_totals = by_trader[trader] = _empty_portfolio_totals()
+            for t in open_trades.get(trader, []):
+                t = self._with_onchain_pair(t, pairs_snapshot)
+                pair_id = int(t['pair']['id'])
+                price_data = snapshot.get(t['pair']['from'], t['pair']['to'])
+                metrics = None
+                if price_data is None:
+                    self.log(
+                        f"get_all_open_trade_metrics: no price for {t['pair']['from']}/{t['pair']['to']}, skipping metrics")
+                else:
+                    metrics = get_trade_metrics(t, price_data, block_number, pairs_max_leverage[pair_id],
+                                                liq_margin_threshold_p, verbose=self.verbose)
+                position = {
+                    'trader': trader,
+                    'pair_id': pair_id,
+                    'index': int(t['index']),
+                    'from': t['pair']['from'],
+                    'to': t['pair']['to'],
+                    'is_buy': t['isBuy'],
+                    'collateral': float(Decimal(t['collateral']) / PRECISION_6),
+                    'metrics': metrics,
+                }
+                positions.append(position)
+                if metrics is not None:
+                    _add_to_portfolio_totals(
+                        trader_totals, position, risk_buffer_p)
+
+        totals = _empty_portfolio_totals()
+        for trader_totals in by_trader.values():
+            for key, value in trader_totals.items():
+                totals[key] += value
+
+        return {
+            'positions': positions,
+            'totals': totals,
+            'by_trader': by_trader,
+            'block_number': block_number,
+            'price_timestamp': snapshot.timestamp,
+            'data_age': dict(context.sources) if context is not None else None,
+        }
 
     async def get_target_funding_rate(self, pair_id):
         pair_details = await self.subgraph.get_pair_details(pair_id)
+        return self._target_funding_rate(pair_details)
+
+    # Same as get_target_funding_rate() for many pairs, using a single subgraph query - returns {pair_id: rate}
+    async def get_target_funding_rates(self, pair_ids):
+        pairs_details = await self.subgraph.get_pairs_details(pair_ids)
+        return {pair_id: self._target_funding_rate(pair_details) for pair_id, pair_details in pairs_details.items()}
 
+    def _target_funding_rate(self, pair_details):
         hillInflectionPoint = Decimal(
             pair_details['hillInflectionPoint']) / PRECISION_18
 
@@ -176,16 +561,37 @@ class OstiumSDK:
 
     # max leverage for overnight trades (Stocks) - 100 means 100x, None if not set
     async def get_pair_overnight_max_leverage(self, pair_id):
-        obj = await self.subgraph.get_pair_details(pair_id)
+        obj = await self.subgraph.get_pair_details(pair_id, static_only=True)
 
         maxLeverage = int(obj['overnightMaxLeverage'])/PRECISION_2 if int(
             obj['overnightMaxLeverage']) != 0 else None
         return maxLeverage
 
     # either by group of pair or by pair id (e.g: maxLeverage 100 means 100x)
-    async def get_pair_max_leverage(self, pair_id):
-        obj = await self.subgraph.get_pair_details(pair_id)
+    # With a `context` (see read_context()) the leverage caps are read at the pinned block: from the
+    # contracts when the network config has pairsInfo / pairsStorage addresses, else from the subgraph
+    async def get_pair_max_leverage(self, pair_id, context: ReadContext = None):
+        if context is None:
+            obj = await self.subgraph.get_pair_details(pair_id, static_only=True)
+            return self._pair_max_leverage(obj)
+        return (await self.get_pairs_max_leverage([pair_id], context=context))[int(pair_id)]
+
+    # Same as get_pair_max_leverage() for many pairs, using a single subgraph query - returns {pair_id: max_leverage}
+    async def get_pairs_max_leverage(self, pair_ids, context: ReadContext = None):
+        if context is None:
+            pairs_details = await self.subgraph.get_pairs_details(pair_ids, static_only=True)
+        else:
+            pairs_snapshot = await self._read_pairs_snapshot(context)
+            if pairs_snapshot is not None:
+                pairs_details = {int(pair_id): pairs_snapshot['pairs'][int(pair_id)] for pair_id in pair_ids}
+            else:
+                pair_ids = tuple(sorted({int(pair_id) for pair_id in pair_ids}))
+                pairs_details = await context.get(('pairs_details', pair_ids), lambda: self.subgraph.get_pairs_details(
+                    pair_ids, static_only=True, block_number=context.block_number))
+        return {pair_id: self._pair_max_leverage(obj) for pair_id, obj in pairs_details.items()}
 
+    @staticmethod
+    def _pair_max_leverage(obj):
         maxLeverage = int(obj['maxLeverage']) / PRECISION_2 if int(
             obj['group']['maxLeverage']) == 0 else int(obj['group']['maxLeverage']) / PRECISION_2
         return maxLeverage
@@ -196,6 +602,15 @@ class OstiumSDK:
 
     async def get_rollover_rate_for_pair_id(self, pair_id, period_hours=24):
         pair_details = await self.subgraph.get_pair_details(pair_id)
+        return self._rollover_rate(pair_details, period_hours)
+
+    # Same as get_rollover_rate_for_pair_id() for many pairs, using a single subgraph query - returns {pair_id: rollover}
+    async def get_rollover_rates_for_pair_ids(self, pair_ids, period_hours=24):
+        pairs_details = await self.subgraph.get_pairs_details(pair_ids)
+        return {pair_id: self._rollover_rate(pair_details, period_hours) for pair_id, pair_details in pairs_details.items()}
+
+    @staticmethod
+    def _rollover_rate(pair_details, period_hours):
         rollover_fee_per_block = Decimal(
             pair_details['rolloverFeePerBlock']) / Decimal('1e18')
         rollover = calculate_fee_per_hours(
@@ -205,11 +620,67 @@ class OstiumSDK:
     async def get_funding_rate_for_pair_id(self, pair_id, period_hours=24):
         pair_details = await self.subgraph.get_pair_details(pair_id)
         # get the block number
-        block_number = self.ostium.get_block_number()
+        block_number = await self.get_block_number()
+        self.subgraph.observe_block(block_number)
 
-        # Get current price
-        last_trade_price = pair_details['lastTradePrice']
+        return self._funding_rate(pair_details, block_number, period_hours)
+
+    # Same as get_funding_rate_for_pair_id() for many pairs, using a single subgraph query and block number -
+    # returns {pair_id: (accFundingLong, accFundingShort, fundingRate, targetFundingRate)}
+    async def get_funding_rates_for_pair_ids(self, pair_ids, period_hours=24):
+        pairs_details = await self.subgraph.get_pairs_details(pair_ids)
+        # get the block number
+        block_number = await self.get_block_number()
+        self.subgraph.observe_block(block_number)
+
+        return {pair_id: self._funding_rate(pair_details, block_number, period_hours)
+                for pair_id, pair_details in pairs_details.items()}
+
+    # Funding curve of a pair over the next hours, e.g. every hour for a week:
+    #
+    #   curve = await sdk.get_funding_rate_projection(pair_id, hours=range(1, 24 * 7 + 1))
+    #   curve['accFundingLong'][-1], curve['fundingRate'][0]
+    #
+    # `oi_scenario` lists expected open interest changes as (hours from now, long OI, short OI) in USD,
+    # otherwise the current OI is assumed constant. Returns the dict of ProjectFundingRate() (accumulated
+    # funding long / short, funding rate and target funding rate per block) plus 'hours'.
+    async def get_funding_rate_projection(self, pair_id, hours, oi_scenario=None):
+        pair_details, block_number = await asyncio.gather(
+            self.subgraph.get_pair_details(pair_id),
+            self.get_block_number())
+        self.subgraph.observe_block(block_number)
+
+        hours = list(hours)
+        blocks = [block_number + int(h * BLOCKS_PER_HOUR) for h in hours]
+        scenario = [(block_number + int(h * BLOCKS_PER_HOUR), int(Decimal(str(long_oi)) * PRECISION_6),
+                     int(Decimal(str(short_oi)) * PRECISION_6)) for h, long_oi, short_oi in (oi_scenario or [])]
+
+        long_oi, short_oi = self._pair_oi_usd(pair_details)
+        ret = ProjectFundingRate(
+            pair_details['accFundingLong'],
+            pair_details['accFundingShort'],
+            pair_details['lastFundingRate'],
+            pair_details['maxFundingFeePerBlock'],
+            pair_details['lastFundingBlock'],
+            blocks,
+            long_oi,
+            short_oi,
+            pair_details['maxOI'],
+            pair_details['hillInflectionPoint'],
+            pair_details['hillPosScale'],
+            pair_details['hillNegScale'],
+            pair_details['springFactor'],
+            pair_details['sFactorUpScaleP'],
+            pair_details['sFactorDownScaleP'],
+            oiScenario=scenario
+        )
+        ret['hours'] = hours
+        return ret
 
+    @staticmethod
+    def _pair_oi_usd(pair_details):
+        # OI in USD (6 decimals), as the funding formula expects
+        last_trade_price = pair_details['lastTradePrice']
         long_oi = int(
             (Decimal(pair_details['longOI']) *
              Decimal(last_trade_price) / PRECISION_18 / PRECISION_12)
@@ -218,6 +689,10 @@ class OstiumSDK:
             (Decimal(pair_details['shortOI']) *
              Decimal(last_trade_price) / PRECISION_18 / PRECISION_12)
         )
+        return long_oi, short_oi
+
+    def _funding_rate(self, pair_details, block_number, period_hours):
+        long_oi, short_oi = self._pair_oi_usd(pair_details)
 
         ret = GetFundingRate(
             pair_details['accFundingLong'],
@@ -252,8 +727,29 @@ class OstiumSDK:
 
         return accFundingLong, accFundingShort, fundingRate, targetFundingRate
 
-    async def get_formatted_pairs_details(self, including_current_price_and_market_status=True) -> list:
-        pairs = await self.subgraph.get_pairs()
+    async def get_formatted_pairs_details(self, including_current_price_and_market_status=True, columnar=False):
+        """
+        Returns all pairs with their details (sorted by pair id).
+
+        When including_current_price_and_market_status is set, one price snapshot is fetched
+        (concurrently with the subgraph pairs query) and joined to the pairs in memory.
+
+        With columnar=True, returns a dict of equally long lists keyed by field name
+        (e.g. result['price'][i] belongs to result['id'][i]) holding plain floats/ints/bools
+        instead of Decimals - cheaper to build and to feed into dashboards. Missing values
+        (no overnight max leverage, no price for the pair) are None.
+        """
+        if including_current_price_and_market_status:
+            pairs, price_snapshot = await asyncio.gather(
+                self.subgraph.get_pairs(), self.price.get_snapshot())
+        else:
+            pairs, price_snapshot = await self.subgraph.get_pairs(), None
+
+        pairs = sorted(pairs, key=lambda x: int(x['id']))
+
+        if columnar:
+            return self._pairs_details_columns(pairs, price_snapshot)
+
         formatted_pairs = []
 
         for pair in pairs:
@@ -267,7 +763,7 @@ class OstiumSDK:
                 'maxOI': Decimal(pair['maxOI']) / PRECISION_6,
                 'makerFeeP': Decimal(pair['makerFeeP']) / PRECISION_6,
                 'takerFeeP': Decimal(pair['takerFeeP']) / PRECISION_6,
-                'minLeverage': int(pair['minLeverage']) / PRECISION_2 if int(
+                'minLeverage': int(pair.get('minLeverage', 0)) / PRECISION_2 if int(
                     pair['group']['minLeverage']) == 0 else Decimal(pair['group']['minLeverage']) / PRECISION_2,
                 'maxLeverage': int(pair['maxLeverage']) / PRECISION_2 if int(
                     pair['group']['maxLeverage']) == 0 else Decimal(pair['group']['maxLeverage']) / PRECISION_2,
@@ -284,23 +780,70 @@ class OstiumSDK:
                 formatted_pair['overnightMaxLeverage'] = Decimal(
                     pair['overnightMaxLeverage']) / PRECISION_2
 
-            if including_current_price_and_market_status:
-                # Get current price and market status
-                try:
-                    price, is_market_open, is_day_trading_closed = await self.price.get_price(
-                        pair['from'],
-                        pair['to']
-                    )
-                    if price is not None:
-                        formatted_pair['price'] = price
-                    if is_market_open is not None:
-                        formatted_pair['isMarketOpen'] = is_market_open
-                    if is_day_trading_closed is not None:
-                        formatted_pair['isDayTradingClosed'] = is_day_trading_closed
-                except ValueError:
-                    pass
+            if price_snapshot is not None:
+                # Join the current price and market status from the snapshot
+                price_data = price_snapshot.get(pair['from'], pair['to'])
+                if price_data is not None:
+                    formatted_pair['price'] = float(price_data.get('mid', 0))
+                    formatted_pair['isMarketOpen'] = price_data.get(
+                        'isMarketOpen', False)
+                    formatted_pair['isDayTradingClosed'] = price_data.get(
+                        'isDayTradingClosed', False)
 
             formatted_pairs.append(formatted_pair)
 
-        formatted_pairs.sort(key=lambda x: x['id'])
         return formatted_pairs
+
+    @staticmethod
+    def _pairs_details_columns(pairs, price_snapshot=None) -> dict:
+        columns = {key: [] for key in PAIRS_DETAILS_COLUMNS}
+        if price_snapshot is not None:
+            columns.update({key: [] for key in PAIRS_DETAILS_PRICE_COLUMNS})
+
+        for pair in pairs:
+            group = pair['group']
+            group_min_leverage = int(group['minLeverage'])
+            group_max_leverage = int(group['maxLeverage'])
+            overnight_max_leverage = int(pair['overnightMaxLeverage'])
+
+            columns['id'].append(int(pair['id']))
+            columns['from'].append(pair['from'])
+            columns['to'].append(pair['to'])
+            columns['group'].append(group['name'])
+            columns['longOI'].append(int(pair['longOI']) / 1e18)
+            columns['shortOI'].append(int(pair['shortOI']) / 1e18)
+            columns['maxOI'].append(int(pair['maxOI']) / 1e6)
+            columns['makerFeeP'].append(int(pair['makerFeeP']) / 1e6)
+            columns['takerFeeP'].append(int(pair['takerFeeP']) / 1e6)
+            columns['minLeverage'].append(
+                (group_min_leverage or int(pair.get('minLeverage', 0))) / 1e2)
+            columns['maxLeverage'].append(
+                (group_max_leverage or int(pair['maxLeverage'])) / 1e2)
+            columns['makerMaxLeverage'].append(
+                int(pair['makerMaxLeverage']) / 1e2)
+            columns['groupMaxCollateralP'].append(
+                int(group['maxCollateralP']) / 1e2)
+            columns['minLevPos'].append(int(pair['fee']['minLevPos']) / 1e6)
+            columns['lastFundingRate'].append(
+                int(pair['lastFundingRate']) / 1e9)
+            columns['curFundingLong'].append(int(pair['curFundingLong']) / 1e9)
+            columns['curFundingShort'].append(
+                int(pair['curFundingShort']) / 1e9)
+            columns['lastFundingBlock'].append(int(pair['lastFundingBlock']))
+            columns['overnightMaxLeverage'].append(
+                overnight_max_leverage / 1e2 if overnight_max_leverage != 0 else None)
+
+            if price_snapshot is not None:
+                price_data = price_snapshot.get(pair['from'], pair['to'])
+                if price_data is None:
+                    columns['price'].append(None)
+                    columns['isMarketOpen'].append(None)
+                    columns['isDayTradingClosed'].append(None)
+                else:
+                    columns['price'].append(float(price_data.get('mid', 0)))
+                    columns['isMarketOpen'].append(
+                        price_data.get('isMarketOpen', False))
+                    columns['isDayTradingClosed'].append(
+                        price_data.get('isDayTradingClosed', False))
+
+        return columns
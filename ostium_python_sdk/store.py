@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import json
+import sqlite3
+
+# Bump when the tables change, a store with another version is rebuilt (and resynced) when opened
+STORE_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS orders (
+    id TEXT PRIMARY KEY,
+    trader TEXT NOT NULL,
+    pair_id INTEGER NOT NULL,
+    trade_id TEXT,
+    order_type TEXT,
+    order_action TEXT,
+    is_cancelled INTEGER NOT NULL,
+    executed_block INTEGER NOT NULL,
+    executed_at INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_trader_pair ON orders (trader, pair_id, executed_block);
+CREATE INDEX IF NOT EXISTS orders_block ON orders (executed_block);
+CREATE INDEX IF NOT EXISTS orders_trade_id ON orders (trade_id);
+CREATE TABLE IF NOT EXISTS trades (
+    id TEXT PRIMARY KEY,
+    trade_id TEXT NOT NULL,
+    trader TEXT NOT NULL,
+    pair_id INTEGER NOT NULL,
+    is_open INTEGER NOT NULL,
+    timestamp INTEGER,
+    synced_block INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_trader_pair ON trades (trader, pair_id, is_open);
+CREATE INDEX IF NOT EXISTS trades_trade_id ON trades (trade_id);
+CREATE TABLE IF NOT EXISTS pair_snapshots (
+    pair_id INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (pair_id, block_number)
+);
+"""
+
+
+def _dump(value):
+    return json.dumps(value, default=str, separators=(',', ':'))
+
+
+class HistoryStore:
+    """
+    Local SQLite copy of the subgraph order / trade history and of pair snapshots, so analytics
+    jobs query it locally instead of downloading the same history on every run.
+
+        store = HistoryStore('ostium.db')
+        await store.sync(sdk.subgraph)          # only what was executed since the last sync
+        store.get_trades(trader, pair_id=3, is_open=False)   # closed trades of trader on pair 3
+
+    sync() reads the orders executed in blocks [cursor, subgraph head], paged by order id, plus the
+    trades those orders belong to (open / close / update state as of the head). Every page is
+    written in one transaction together with the cursor (from block, head, last order id), so an
+    interrupted sync resumes after the last stored page. Orders are indexed on (trader, pair,
+    executed block), block and tradeID, trades on (trader, pair, isOpen) and tradeID; rows keep the
+    full subgraph record, returned as is by the getters.
+
+    Trades only change in the store when one of their orders is synced, e.g. a TP / SL update,
+    which has no order, shows up with the next order of the trade.
+
+    Args:
+        path: SQLite database file, ':memory:' for a throwaway store
+        start_block: First block of the first sync
+        verbose: Whether to log detailed information
+    """
+
+    def __init__(self, path: str = ':memory:', start_block: int = 0, verbose=False) -> None:
+        self.path = path
+        self.start_block = start_block
+        self.verbose = verbose
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        if path != ':memory:':
+            # readers do not block the sync and a page commit is one WAL append
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            version = self._get_meta('schema_version')
+            if version is not None and int(version) != STORE_SCHEMA_VERSION:
+                self.log(f"Store schema {version} is outdated, rebuilding it")
+                self.connection.executescript(
+                    "DROP TABLE orders; DROP TABLE trades; DROP TABLE pair_snapshots; DELETE FROM meta;")
+                self.connection.executescript(SCHEMA)
+            self._set_meta('schema_version', STORE_SCHEMA_VERSION)
+
+    def _get_meta(self, key):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_meta(self, key, value):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, None if value is None else str(value)))
+
+    # Sync cursor
+
+    def get_cursor(self):
+        """
+        {'from_block', 'to_block', 'last_id'}: the next sync reads from `from_block`. While a sync
+        is in progress (or was interrupted) `to_block` is the head it syncs to and `last_id` the id
+        of the last stored order, otherwise `to_block` is None.
+        """
+        from_block = self._get_meta('cursor_from_block')
+        to_block = self._get_meta('cursor_to_block')
+        return {'from_block': int(from_block) if from_block is not None else self.start_block,
+                'to_block': int(to_block) if to_block is not None else None,
+                'last_id': self._get_meta('cursor_last_id') or ""}
+
+    def _set_cursor(self, from_block, to_block, last_id):
+        self._set_meta('cursor_from_block', from_block)
+        self._set_meta('cursor_to_block', to_block)
+        self._set_meta('cursor_last_id', last_id)
+
+    def reset_cursor(self, from_block=None):
+        """Restart syncing from `from_block` (start_block if None), stored rows are kept and updated"""
+        with self.connection:
+            self._set_cursor(self.start_block if from_block is None else from_block, None, "")
+
+    # Writes
+
+    def _put_orders(self, orders):
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO orders (id, trader, pair_id, trade_id, order_type, order_action, is_cancelled,"
+            " executed_block, executed_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(order['id'], order['trader'].lower(), int(order['pair']['id']), order.get('tradeID'),
+              order.get('orderType'), order.get('orderAction'), int(bool(order.get('isCancelled'))),
+              int(order['executedBlock']), int(order['executedAt']) if order.get('executedAt') is not None else None,
+              _dump(order)) for order in orders])
+
+    def _put_trades(self, trades, block_number):
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO trades (id, trade_id, trader, pair_id, is_open, timestamp, synced_block, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(trade['id'], str(trade['tradeID']), trade['trader'].lower(), int(trade['pair']['id']),
+              int(bool(trade['isOpen'])), int(trade['timestamp']) if trade.get('timestamp') is not None else None,
+              block_number, _dump(trade)) for trade in trades])
+
+    def save_pair_snapshot(self, snapshot):
+        """
+        Store the pairs of a snapshot: sdk.get_pairs_snapshot() / PairSnapshotLoader.load() output,
+        or {'block_number', 'pairs': [subgraph pair, ...]}
+        """
+        pairs = snapshot['pairs']
+        pairs = pairs.values() if isinstance(pairs, dict) else pairs
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO pair_snapshots (pair_id, block_number, data) VALUES (?, ?, ?)",
+                [(int(pair['id']), int(snapshot['block_number']), _dump(pair)) for pair in pairs])
+
+    async def sync(self, subgraph, to_block=None, page_size=1000):
+        """
+        Store the orders executed since the last sync, and their trades.
+
+        Args:
+            subgraph: SubgraphClient to read from
+            to_block: Block to sync up to, the subgraph indexed head if None
+            page_size: Orders per query
+
+        Returns:
+            dict: {'from_block', 'to_block', 'orders', 'trades'}, the range synced and the number
+            of orders / trades written
+        """
+        cursor = self.get_cursor()
+        if cursor['to_block'] is None:
+            head = to_block if to_block is not None else (await subgraph.get_indexed_block())['number']
+            if head < cursor['from_block']:
+                return {'from_block': cursor['from_block'], 'to_block': head, 'orders': 0, 'trades': 0}
+            cursor['to_block'] = head
+            with self.connection:
+                self._set_cursor(cursor['from_block'], head, "")
+        else:
+            self.log(f"Resuming sync of blocks [{cursor['from_block']}, {cursor['to_block']}] after order {cursor['last_id']!r}")
+
+        from_block, head, last_id = cursor['from_block'], cursor['to_block'], cursor['last_id']
+        orders_count = trades_count = 0
+        while True:
+            orders = await subgraph.get_orders_executed_between(
+                from_block, head, last_id=last_id, page_size=page_size, block_number=head)
+            trade_ids = {order['tradeID'] for order in orders if order.get('tradeID') is not None}
+            trades = await subgraph.get_trades_by_trade_ids(trade_ids, page_size=page_size, block_number=head)
+            if orders:
+                last_id = orders[-1]['id']
+            done = len(orders) < page_size
+            with self.connection:
+                self._put_orders(orders)
+                self._put_trades(trades, head)
+                if done:
+                    self._set_cursor(head + 1, None, "")
+                else:
+                    self._set_cursor(from_block, head, last_id)
+            orders_count += len(orders)
+            trades_count += len(trades)
+            self.log(f"Synced {len(orders)} orders / {len(trades)} trades of blocks [{from_block}, {head}]")
+            if done:
+                return {'from_block': from_block, 'to_block': head, 'orders': orders_count, 'trades': trades_count}
+
+    def compact(self, keep_pair_snapshots=1, cancelled_orders_before=None):
+        """
+        Shrink the store: keep the `keep_pair_snapshots` latest snapshots of every pair, optionally
+        drop the cancelled orders executed before block `cancelled_orders_before`, then rewrite the
+        file (VACUUM) and refresh the query planner statistics.
+
+        Returns:
+            dict: {'pair_snapshots', 'orders'}, the number of rows deleted
+        """
+        with self.connection:
+            snapshots = self.connection.execute(
+                "DELETE FROM pair_snapshots WHERE rowid IN (SELECT rowid FROM (SELECT rowid, ROW_NUMBER() OVER ("
+                " PARTITION BY pair_id ORDER BY block_number DESC) AS position FROM pair_snapshots) WHERE position > ?)",
+                (keep_pair_snapshots,)).rowcount
+            orders = 0
+            if cancelled_orders_before is not None:
+                orders = self.connection.execute(
+                    "DELETE FROM orders WHERE is_cancelled = 1 AND executed_block < ?",
+                    (cancelled_orders_before,)).rowcount
+        self.connection.execute("VACUUM")
+        self.connection.execute("ANALYZE")
+        self.log(f"Compacted store: {snapshots} pair snapshots and {orders} orders removed")
+        return {'pair_snapshots': snapshots, 'orders': orders}
+
+    # Queries
+
+    @staticmethod
+    def _where(conditions):
+        clauses = [clause for clause, value in conditions if value is not None]
+        values = [value for _, value in conditions if value is not None]
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), values
+
+    def get_order_by_id(self, order_id):
+        """Stored order with the given id (same shape as SubgraphClient.get_order_by_id()), None if absent"""
+        row = self.connection.execute("SELECT data FROM orders WHERE id = ?", (str(order_id),)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_orders(self, trader=None, pair_id=None, from_block=None, to_block=None, trade_id=None, order_action=None, limit=None):
+        """Stored orders matching every given filter, oldest executed first"""
+        where, values = self._where([
+            ("trader = ?", trader.lower() if trader is not None else None),
+            ("pair_id = ?", int(pair_id) if pair_id is not None else None),
+            ("executed_block >= ?", from_block), ("executed_block <= ?", to_block),
+            ("trade_id = ?", str(trade_id) if trade_id is not None else None),
+            ("order_action = ?", order_action)])
+        query = f"SELECT data FROM orders{where} ORDER BY executed_block, executed_at, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+        return [json.loads(row['data']) for row in self.connection.execute(query, values)]
+
+    def get_recent_history(self, trader, last_n_orders=10):
+        """The last `last_n_orders` executed orders of a trader, oldest first, like SubgraphClient.get_recent_history()"""
+        rows = self.connection.execute(
+            "SELECT data FROM orders WHERE trader = ? ORDER BY executed_block DESC, executed_at DESC, id DESC LIMIT ?",
+            (trader.lower(), last_n_orders)).fetchall()
+        return [json.loads(row['data']) for row in reversed(rows)]
+
+    def get_trade_by_id(self, trade_id):
+        """Stored trade with the given id (same shape as SubgraphClient.get_trade_by_id()), None if absent"""
+        row = self.connection.execute("SELECT data FROM trades WHERE id = ?", (str(trade_id),)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_trades(self, trader=None, pair_id=None, is_open=None):
+        """Stored trades matching every given filter, e.g. is_open=False for closed trades"""
+        where, values = self._where([
+            ("trader = ?", trader.lower() if trader is not None else None),
+            ("pair_id = ?", int(pair_id) if pair_id is not None else None),
+            ("is_open = ?", int(is_open) if is_open is not None else None)])
+        return [json.loads(row['data']) for row in self.connection.execute(
+            f"SELECT data FROM trades{where} ORDER BY timestamp, id", values)]
+
+    def get_pair_snapshot(self, pair_id, block_number=None):
+        """
+        Latest stored snapshot of a pair at or before `block_number` (the latest one if None):
+        {'block_number', 'pair'}, None if there is none
+        """
+        where, values = self._where([("pair_id = ?", int(pair_id)), ("block_number <= ?", block_number)])
+        row = self.connection.execute(
+            f"SELECT block_number, data FROM pair_snapshots{where} ORDER BY block_number DESC LIMIT 1",
+            values).fetchone()
+        return {'block_number': row['block_number'], 'pair': json.loads(row['data'])} if row else None
+
+    def stats(self):
+        """Row counts and the sync cursor"""
+        counts = {table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in ('orders', 'trades', 'pair_snapshots')}
+        return {**counts, 'cursor': self.get_cursor()}
+
+
+async def _sync(args):
+    from .config import NetworkConfig
+    from .subgraph import SubgraphClient
+
+    config = NetworkConfig.testnet() if args.testnet else NetworkConfig.mainnet()
+    subgraph = SubgraphClient(url=config.graph_url, verbose=args.verbose)
+    try:
+        with HistoryStore(args.path, start_block=args.start_block, verbose=args.verbose) as store:
+            print(await store.sync(subgraph, to_block=args.to_block, page_size=args.page_size))
+    finally:
+        await subgraph.close()
+
+
+def main(argv=None):
+    """python -m ostium_python_sdk.store {sync,compact,stats} PATH"""
+    parser = argparse.ArgumentParser(prog='python -m ostium_python_sdk.store',
+                                     description='Local store of the Ostium order / trade history')
+    parser.add_argument('--verbose', action='store_true')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sync = commands.add_parser('sync', help='store the orders and trades executed since the last sync')
+    sync.add_argument('path')
+    sync.add_argument('--testnet', action='store_true')
+    sync.add_argument('--start-block', type=int, default=0)
+    sync.add_argument('--to-block', type=int)
+    sync.add_argument('--page-size', type=int, default=1000)
+
+    compact = commands.add_parser('compact', help='drop old pair snapshots and rewrite the database file')
+    compact.add_argument('path')
+    compact.add_argument('--keep-pair-snapshots', type=int, default=1)
+    compact.add_argument('--cancelled-orders-before', type=int)
+
+    stats = commands.add_parser('stats', help='row counts and sync cursor')
+    stats.add_argument('path')
+
+    args = parser.parse_args(argv)
+    if args.command == 'sync':
+        asyncio.run(_sync(args))
+        return
+    with HistoryStore(args.path, verbose=args.verbose) as store:
+        if args.command == 'compact':
+            print(store.compact(args.keep_pair_snapshots, args.cancelled_orders_before))
+        else:
+            print(store.stats())
+
+
+if __name__ == '__main__':
+    main()
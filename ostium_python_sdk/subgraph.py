@@ -1,184 +1,838 @@
 from gql import gql
 from gql import Client
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportClosed
+from graphql import validate
 from decimal import Decimal
+import aiohttp
 import asyncio
+import weakref
+
+from .pair_cache import PairDetailsCache, static_fields
+from .schema import SUBGRAPH_SCHEMA_VERSION, get_subgraph_schema
+
+
+# Documents already validated against the bundled schema, keyed by id(document)
+_validated_documents = weakref.WeakValueDictionary()
+
+
+def _validate_document(document):
+    """Validate a query document against the bundled schema, once per document object"""
+    if _validated_documents.get(id(document)) is document:
+        return
+    errors = validate(get_subgraph_schema(), document)
+    if errors:
+        raise errors[0]
+    _validated_documents[id(document)] = document
+
+
+# Query documents are parsed once at import time and reused by every call
+PAIRS_QUERY = gql(
+    """
+    query getPairs {
+        pairs(first: 1000) {
+          id
+          from
+          to    
+          feed
+          overnightMaxLeverage                
+          longOI
+          shortOI
+          maxOI
+          makerFeeP
+          takerFeeP
+          makerMaxLeverage    
+          curFundingLong  
+          curFundingShort
+          curRollover
+          totalOpenTrades
+          totalOpenLimitOrders
+          accRollover
+          lastRolloverBlock
+          rolloverFeePerBlock
+          accFundingLong
+          accFundingShort
+          lastFundingBlock
+          maxFundingFeePerBlock
+          lastFundingRate              
+          hillInflectionPoint
+          hillPosScale
+          hillNegScale
+          springFactor
+          sFactorUpScaleP
+          sFactorDownScaleP
+          lastTradePrice
+          maxLeverage              
+          group {
+            id
+            name
+            minLeverage
+            maxLeverage
+            maxCollateralP
+            longCollateral
+            shortCollateral
+          }
+          fee {
+            minLevPos                
+          }
+        }
+      }
+    """
+)
+
+PAIR_DETAILS_QUERY = gql(
+    """
+    query getPairDetails($pair_id: ID!, $block: Block_height){
+      pair(id: $pair_id, block: $block) {
+        id
+        from
+        to    
+        overnightMaxLeverage                
+        longOI
+        shortOI
+        maxOI
+        makerFeeP
+        takerFeeP
+        makerMaxLeverage    
+        curFundingLong  
+        curFundingShort
+        curRollover
+        totalOpenTrades
+        totalOpenLimitOrders
+        accRollover
+        lastRolloverBlock
+        rolloverFeePerBlock
+        accFundingLong
+        accFundingShort
+        lastFundingBlock
+        maxFundingFeePerBlock
+        lastFundingRate              
+        hillInflectionPoint
+        hillPosScale
+        hillNegScale
+        springFactor
+        sFactorUpScaleP
+        sFactorDownScaleP
+        lastTradePrice
+        maxLeverage              
+        group {
+          id
+          name
+          minLeverage
+          maxLeverage
+          maxCollateralP
+          longCollateral
+          shortCollateral
+        }
+        fee {
+          minLevPos                
+        }
+    }
+    }
+    """
+)
+
+PAIRS_DETAILS_QUERY = gql(
+    """
+    query getPairsDetails($pair_ids: [ID!]!, $block: Block_height){
+      pairs(where: { id_in: $pair_ids }, first: 1000, block: $block) {
+        id
+        from
+        to    
+        overnightMaxLeverage                
+        longOI
+        shortOI
+        maxOI
+        makerFeeP
+        takerFeeP
+        makerMaxLeverage    
+        curFundingLong  
+        curFundingShort
+        curRollover
+        totalOpenTrades
+        totalOpenLimitOrders
+        accRollover
+        lastRolloverBlock
+        rolloverFeePerBlock
+        accFundingLong
+        accFundingShort
+        lastFundingBlock
+        maxFundingFeePerBlock
+        lastFundingRate              
+        hillInflectionPoint
+        hillPosScale
+        hillNegScale
+        springFactor
+        sFactorUpScaleP
+        sFactorDownScaleP
+        lastTradePrice
+        maxLeverage              
+        group {
+          id
+          name
+          minLeverage
+          maxLeverage
+          maxCollateralP
+          longCollateral
+          shortCollateral
+        }
+        fee {
+          minLevPos                
+        }
+    }
+    }
+    """
+)
+
+LIQ_MARGIN_THRESHOLD_P_QUERY = gql(
+    """
+    query metaDatas($block: Block_height) {
+      metaDatas(block: $block) {
+        liqMarginThresholdP
+      }
+    }
+    """
+)
+
+# Latest block the subgraph has indexed
+META_QUERY = gql(
+    """
+    query meta {
+      _meta {
+        block {
+          number
+          timestamp
+        }
+        hasIndexingErrors
+      }
+    }
+    """
+)
+
+OPEN_TRADES_QUERY = gql(
+    """
+        query trades($trader: Bytes!, $block: Block_height) {
+      trades(
+        where: { isOpen: true, trader: $trader }
+        block: $block
+      ) {
+        tradeID
+        collateral
+        leverage
+        highestLeverage
+        openPrice
+        stopLossPrice
+        takeProfitPrice
+        isOpen
+        timestamp
+        isBuy
+        notional
+        tradeNotional
+        funding
+        rollover
+        trader
+        index
+        pair {
+          id
+          feed
+          from
+          to
+          accRollover
+          lastRolloverBlock
+          rolloverFeePerBlock
+          accFundingLong
+          spreadP
+          accFundingShort
+          longOI
+          shortOI
+          maxOI
+          maxLeverage
+          hillInflectionPoint
+          hillPosScale
+          hillNegScale
+          springFactor
+          sFactorUpScaleP
+          sFactorDownScaleP
+          lastFundingBlock
+          maxFundingFeePerBlock
+          lastFundingRate
+          maxLeverage
+        }
+      }
+    }
+    """
+)
+
+OPEN_TRADES_BY_TRADERS_QUERY = gql(
+    """
+        query tradesByTraders($traders: [Bytes!]!, $last_id: ID!, $page_size: Int!, $block: Block_height) {
+      trades(
+        where: { isOpen: true, trader_in: $traders, id_gt: $last_id }
+        block: $block
+        first: $page_size
+        orderBy: id
+        orderDirection: asc
+      ) {
+        id
+        tradeID
+        collateral
+        leverage
+        highestLeverage
+        openPrice
+        stopLossPrice
+        takeProfitPrice
+        isOpen
+        timestamp
+        isBuy
+        notional
+        tradeNotional
+        funding
+        rollover
+        trader
+        index
+        pair {
+          id
+          feed
+          from
+          to
+          accRollover
+          lastRolloverBlock
+          rolloverFeePerBlock
+          accFundingLong
+          spreadP
+          accFundingShort
+          longOI
+          shortOI
+          maxOI
+          maxLeverage
+          hillInflectionPoint
+          hillPosScale
+          hillNegScale
+          springFactor
+          sFactorUpScaleP
+          sFactorDownScaleP
+          lastFundingBlock
+          maxFundingFeePerBlock
+          lastFundingRate
+          maxLeverage
+        }
+      }
+    }
+    """
+)
+
+ORDERS_QUERY = gql(
+    """
+    query orders($trader: Bytes!) {
+      limits(
+        where: { trader: $trader, isActive: true }
+        orderBy: initiatedAt
+        orderDirection: asc
+      ) {
+        collateral
+        leverage
+        isBuy
+        isActive
+        id
+        openPrice
+        takeProfitPrice
+        stopLossPrice
+        trader
+        initiatedAt
+        limitType
+        pair {
+          id
+          feed
+          from
+          to
+          accRollover
+          lastRolloverBlock
+          rolloverFeePerBlock
+          accFundingLong
+          spreadP
+          accFundingShort
+          longOI
+          shortOI
+          lastFundingBlock
+          maxFundingFeePerBlock
+          lastFundingRate
+        }
+      }
+    }
+    """
+)
+
+RECENT_HISTORY_QUERY = gql(
+    """
+    query ListOrdersHistory($trader: Bytes, $last_n_orders: Int) {
+      orders(
+        where: { trader: $trader, isPending: false}
+        first: $last_n_orders
+        orderBy: executedAt
+        orderDirection: desc
+      ) {
+        id
+        isBuy
+        trader
+        notional
+        tradeNotional
+        collateral
+        leverage
+        orderType
+        orderAction
+        price
+        initiatedAt
+        executedAt
+        executedTx
+        isCancelled
+        cancelReason
+        profitPercent
+        totalProfitPercent
+        isPending
+        amountSentToTrader
+        rolloverFee
+        fundingFee
+        pair {
+          id
+          from
+          to
+          feed
+          longOI
+          shortOI
+          group {
+              name
+          }
+        }
+      }
+    }
+    """
+)
+
+ORDER_BY_ID_QUERY = gql(
+    """
+    query GetOrder($order_id: ID!) {
+      orders(where: {id: $order_id}) {
+        id
+        trader
+        pair {
+          id
+          from
+          to
+          feed
+        }
+        tradeID
+        limitID
+        orderType
+        orderAction
+        price
+        priceAfterImpact
+        priceImpactP
+        collateral
+        notional
+        tradeNotional
+        profitPercent
+        totalProfitPercent
+        amountSentToTrader
+        isBuy
+        initiatedAt
+        executedAt
+        initiatedTx
+        executedTx
+        initiatedBlock
+        executedBlock
+        leverage
+        isPending
+        isCancelled
+        cancelReason
+        devFee
+        vaultFee
+        oracleFee
+        liquidationFee
+        fundingFee
+        rolloverFee
+        closePercent
+      }
+    }
+    """
+)
+
+TRADE_BY_ID_QUERY = gql(
+    """
+    query GetTrade($trade_id: ID!) {
+      trades(where: {id: $trade_id}) {
+        id
+        trader
+        pair {
+          id
+          from
+          to
+          feed
+        }
+        index
+        tradeID
+        tradeType
+        openPrice
+        closePrice
+        takeProfitPrice
+        stopLossPrice
+        collateral
+        notional
+        tradeNotional
+        highestLeverage
+        leverage
+        isBuy
+        isOpen
+        closeInitiated
+        funding
+        rollover
+        timestamp
+      }
+    }
+    """
+)
+
+
+ORDERS_EXECUTED_BETWEEN_QUERY = gql(
+    """
+    query ordersExecutedBetween($from_block: BigInt!, $to_block: BigInt!, $last_id: ID!, $page_size: Int!, $block: Block_height) {
+      orders(
+        where: { isPending: false, executedBlock_gte: $from_block, executedBlock_lte: $to_block, id_gt: $last_id }
+        block: $block
+        first: $page_size
+        orderBy: id
+        orderDirection: asc
+      ) {
+        id
+        trader
+        pair {
+          id
+          from
+          to
+          feed
+        }
+        tradeID
+        limitID
+        orderType
+        orderAction
+        price
+        priceAfterImpact
+        priceImpactP
+        collateral
+        notional
+        tradeNotional
+        profitPercent
+        totalProfitPercent
+        amountSentToTrader
+        isBuy
+        initiatedAt
+        executedAt
+        initiatedTx
+        executedTx
+        initiatedBlock
+        executedBlock
+        leverage
+        isPending
+        isCancelled
+        cancelReason
+        devFee
+        vaultFee
+        oracleFee
+        liquidationFee
+        fundingFee
+        rolloverFee
+        closePercent
+      }
+    }
+    """
+)
+
+TRADES_BY_TRADE_IDS_QUERY = gql(
+    """
+    query tradesByTradeIds($trade_ids: [BigInt!]!, $last_id: ID!, $page_size: Int!, $block: Block_height) {
+      trades(
+        where: { tradeID_in: $trade_ids, id_gt: $last_id }
+        block: $block
+        first: $page_size
+        orderBy: id
+        orderDirection: asc
+      ) {
+        id
+        trader
+        pair {
+          id
+          from
+          to
+          feed
+        }
+        index
+        tradeID
+        tradeType
+        openPrice
+        closePrice
+        takeProfitPrice
+        stopLossPrice
+        collateral
+        notional
+        tradeNotional
+        highestLeverage
+        leverage
+        isBuy
+        isOpen
+        closeInitiated
+        funding
+        rollover
+        timestamp
+      }
+    }
+    """
+)
 
 
 class SubgraphClient:
-    def __init__(self, url: str = None, verbose=False) -> None:
+    """
+    Async client for the Ostium subgraph.
+
+    Queries run concurrently over one pooled aiohttp session (created on first use, per
+    event loop), at most `max_concurrency` at a time. Each query fails with a timeout
+    error after `timeout` seconds (None disables the timeout).
+    Release the session with `await subgraph.close()`.
+
+    Queries are validated locally against the bundled schema (see `ostium_python_sdk.schema`),
+    so no introspection query is sent on startup. Pass `fetch_schema_from_transport=True`, or
+    call `refresh_schema()`, to validate against the live schema instead, and
+    `validate_queries=False` to skip local validation altogether.
+
+    Pair details are kept in `pair_cache` (a `PairDetailsCache`): lookups with
+    `static_only=True` (leverage caps, fees, funding curve parameters) are served from it for
+    `pair_cache_static_ttl` seconds, full lookups only when `pair_cache_dynamic_ttl` > 0.
+    """
+
+    def __init__(self, url: str = None, verbose=False, max_concurrency: int = 16, timeout: float = 30,
+                 fetch_schema_from_transport: bool = False, validate_queries: bool = True,
+                 pair_cache_size: int = 512, pair_cache_static_ttl: float = 3600,
+                 pair_cache_dynamic_ttl: float = 0, pair_cache_max_block_lag: int = None) -> None:
         self.verbose = verbose
         self.url = url
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.fetch_schema_from_transport = fetch_schema_from_transport
+        self.validate_queries = validate_queries
         self._client = None
-        self._lock = asyncio.Lock()
+        self._session = None
+        self._loop = None
+        self._closing = set()
+        self._connect_lock = None
+        self._semaphore = None
+        self.pair_cache = PairDetailsCache(maxsize=pair_cache_size, static_ttl=pair_cache_static_ttl,
+                                           dynamic_ttl=pair_cache_dynamic_ttl,
+                                           max_block_lag=pair_cache_max_block_lag)
 
     def log(self, message):
         if self.verbose:
             print(message)
 
+    def _bind_loop(self):
+        """(Re)create loop-bound primitives when used from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._release_client()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _release_client(self):
+        """
+        Drop the client connected on another event loop. It is closed on that loop if it is still
+        running (in another thread), otherwise its aiohttp session is detached and the connector
+        closed from the running loop.
+        """
+        client, self._client = self._client, None
+        session, self._session = self._session, None
+        if client is None or session is None:
+            return
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.close_async(), self._loop)
+            return
+        http_session, client.transport.session = client.transport.session, None
+        if http_session is None or http_session.closed:
+            return
+        connector = http_session.connector
+        http_session.detach()
+        task = asyncio.ensure_future(self._close_connector(connector))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_connector(self, connector):
+        try:
+            await connector.close()
+        except Exception as e:
+            self.log(f"Closing the connector of a previous event loop failed: {e}")
+
     async def _get_client(self):
         """Get or create a GQL client with proper connection handling"""
         if self._client is None:
-            transport = AIOHTTPTransport(url=self.url)
+            transport = AIOHTTPTransport(
+                url=self.url,
+                client_session_args={
+                    'connector': aiohttp.TCPConnector(
+                        limit=self.max_concurrency,
+                        keepalive_timeout=30
+                    )
+                }
+            )
             self._client = Client(
                 transport=transport,
-                fetch_schema_from_transport=True,
-                execute_timeout=None
+                # validation against the bundled schema is done (and cached) by _execute_query
+                fetch_schema_from_transport=self.fetch_schema_from_transport,
+                execute_timeout=self.timeout
             )
         return self._client
 
+    @property
+    def schema_version(self):
+        """Version of the schema queries are validated against: the bundled version, 'transport' or None"""
+        if self.fetch_schema_from_transport:
+            return 'transport'
+        return SUBGRAPH_SCHEMA_VERSION if self.validate_queries else None
+
+    async def refresh_schema(self):
+        """Fetch the live schema from the subgraph (introspection) and validate against it from now on"""
+        self.fetch_schema_from_transport = True
+        session = await self._get_session()
+        await session.fetch_schema()
+        self.log("Subgraph schema refreshed from transport")
+
+    async def _get_session(self):
+        """Get the shared, connected session (connects once, even with concurrent callers)"""
+        self._bind_loop()
+        if self._session is None:
+            async with self._connect_lock:
+                if self._session is None:
+                    client = await self._get_client()
+                    self._session = await client.connect_async()
+        return self._session
+
+    async def close(self):
+        """Close the pooled transport"""
+        if self._loop is not asyncio.get_running_loop():
+            self._release_client()
+            self._loop = None
+            return
+        client, self._client = self._client, None
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and client is not None:
+            await client.close_async()
+
     async def _execute_query(self, query, variable_values=None):
         """Execute a query with proper connection handling"""
-        async with self._lock:
-            client = await self._get_client()
+        if self.validate_queries and not self.fetch_schema_from_transport:
+            _validate_document(query)
+        session = await self._get_session()
+        async with self._semaphore:
             try:
-                result = await client.execute_async(query, variable_values=variable_values)
-                return result
-            except Exception as e:
-                # If there's a connection issue, try to recreate the client
-                if "Transport is already connected" in str(e) or "already connected" in str(e):
-                    self.log("Connection issue detected, recreating client...")
+                return await session.execute(query, variable_values=variable_values)
+            except TransportClosed:
+                # The transport was closed underneath us, reconnect once and retry
+                self.log("Connection issue detected, recreating client...")
+                if self._session is session:
                     self._client = None
-                    client = await self._get_client()
-                    result = await client.execute_async(query, variable_values=variable_values)
-                    return result
-                else:
-                    raise e
+                    self._session = None
+                session = await self._get_session()
+                return await session.execute(query, variable_values=variable_values)
+
+    def observe_block(self, block_number):
+        """Report the latest chain block to the pair cache (see PairDetailsCache.max_block_lag)"""
+        self.pair_cache.observe_block(block_number)
 
     async def get_pairs(self):
         self.log("Fetching available pairs")
-        query = gql(
-            """
-          query getPairs {
-              pairs(first: 1000) {
-                id
-                from
-                to    
-                feed
-                overnightMaxLeverage                
-                longOI
-                shortOI
-                maxOI
-                makerFeeP
-                takerFeeP
-                makerMaxLeverage    
-                curFundingLong  
-                curFundingShort
-                curRollover
-                totalOpenTrades
-                totalOpenLimitOrders
-                accRollover
-                lastRolloverBlock
-                rolloverFeePerBlock
-                accFundingLong
-                accFundingShort
-                lastFundingBlock
-                maxFundingFeePerBlock
-                lastFundingRate              
-                hillInflectionPoint
-                hillPosScale
-                hillNegScale
-                springFactor
-                sFactorUpScaleP
-                sFactorDownScaleP
-                lastTradePrice
-                maxLeverage              
-                group {
-                  id
-                  name
-                  minLeverage
-                  maxLeverage
-                  maxCollateralP
-                  longCollateral
-                  shortCollateral
-                }
-                fee {
-                  minLevPos                
-                }
-              }
-            }
-      """
-        )
-
-        # Execute the query using the new method
-        result = await self._execute_query(query)
+        result = await self._execute_query(PAIRS_QUERY)
+        for pair in result['pairs']:
+            self.pair_cache.put(pair)
         return result['pairs']
 
-    async def get_pair_details(self, pair_id):
-        query = gql(
-            """
-          query getPairDetails($pair_id: ID!){
-            pair(id: $pair_id) {
-              id
-              from
-              to    
-              overnightMaxLeverage                
-              longOI
-              shortOI
-              maxOI
-              makerFeeP
-              takerFeeP
-              makerMaxLeverage    
-              curFundingLong  
-              curFundingShort
-              curRollover
-              totalOpenTrades
-              totalOpenLimitOrders
-              accRollover
-              lastRolloverBlock
-              rolloverFeePerBlock
-              accFundingLong
-              accFundingShort
-              lastFundingBlock
-              maxFundingFeePerBlock
-              lastFundingRate              
-              hillInflectionPoint
-              hillPosScale
-              hillNegScale
-              springFactor
-              sFactorUpScaleP
-              sFactorDownScaleP
-              lastTradePrice
-              maxLeverage              
-              group {
-                id
-                name
-                minLeverage
-                maxLeverage
-                maxCollateralP
-                longCollateral
-                shortCollateral
-              }
-              fee {
-                minLevPos                
-              }
-          }
-          }
-          """
-        )
-        result = await self._execute_query(query, variable_values={"pair_id": str(pair_id)})
+    async def get_pair_details(self, pair_id, static_only=False, block_number=None):
+        """
+        Get the details of a pair. With static_only=True only the static fields
+        (see pair_cache.STATIC_PAIR_FIELDS) are returned, possibly from the pair cache.
+        With `block_number` the pair is read at that block, bypassing the pair cache.
+        """
+        if block_number is None:
+            cached = self.pair_cache.get(pair_id, static_only=static_only)
+            if cached is not None:
+                return cached
+
+        result = await self._execute_query(
+            PAIR_DETAILS_QUERY, variable_values=self._at_block({"pair_id": str(pair_id)}, block_number))
 
         # Convert Decimal fields to float or str
-        if result and 'pair' in result:
+        if result and result.get('pair'):
             pair = result['pair']
             for key, value in pair.items():
                 if isinstance(value, Decimal):
                     pair[key] = float(value)  # or str(value) if you prefer
-            return pair
+            if block_number is None:
+                self.pair_cache.put(pair)
+            return static_fields(pair) if static_only else pair
         else:
             raise ValueError(f"No pair details found for pair ID: {pair_id}")
 
-    async def get_liq_margin_threshold_p(self):
-        query = gql(
-            """
-          query metaDatas {
-            metaDatas {              
-              liqMarginThresholdP
-            }
-          }
-          """
-        )
-        result = await self._execute_query(query)
+    async def get_pairs_details(self, pair_ids, static_only=False, block_number=None):
+        """
+        Get the details of many pairs in a single query, same fields as get_pair_details().
+        Returns a dict keyed by int pair id. Only pairs missing from the pair cache are queried,
+        with `block_number` all pairs are read at that block, bypassing the pair cache.
+        """
+        pair_ids = [str(pair_id) for pair_id in pair_ids]
+        if len(pair_ids) == 0:
+            return {}
+
+        pairs = {}
+        to_fetch = []
+        for pair_id in pair_ids:
+            cached = self.pair_cache.get(pair_id, static_only=static_only) if block_number is None else None
+            if cached is not None:
+                pairs[int(pair_id)] = cached
+            else:
+                to_fetch.append(pair_id)
+
+        if to_fetch:
+            result = await self._execute_query(
+                PAIRS_DETAILS_QUERY, variable_values=self._at_block({"pair_ids": to_fetch}, block_number))
+            for pair in result['pairs']:
+                for key, value in pair.items():
+                    if isinstance(value, Decimal):
+                        pair[key] = float(value)
+                if block_number is None:
+                    self.pair_cache.put(pair)
+                pairs[int(pair['id'])] = static_fields(pair) if static_only else pair
+
+        missing = [pair_id for pair_id in pair_ids if int(pair_id) not in pairs]
+        if missing:
+            raise ValueError(f"No pair details found for pair IDs: {missing}")
+        return pairs
+
+    @staticmethod
+    def _at_block(variable_values, block_number):
+        """Add the `block: {number: N}` argument of the queries that support it, latest block if None"""
+        if block_number is not None:
+            variable_values["block"] = {"number": int(block_number)}
+        return variable_values
+
+    async def get_indexed_block(self):
+        """
+        Latest block indexed by the subgraph: {'number', 'timestamp', 'has_indexing_errors'}.
+        Queries pinned to a later block fail, so pin reads at or below this one.
+        """
+        result = await self._execute_query(META_QUERY)
+        meta = result['_meta']
+        return {'number': meta['block']['number'], 'timestamp': meta['block']['timestamp'],
+                'has_indexing_errors': meta['hasIndexingErrors']}
+
+    async def get_liq_margin_threshold_p(self, block_number=None):
+        result = await self._execute_query(
+            LIQ_MARGIN_THRESHOLD_P_QUERY, variable_values=self._at_block({}, block_number))
 
         liq_margin_threshold_p = result['metaDatas'][0]['liqMarginThresholdP']
 
@@ -188,209 +842,47 @@ class SubgraphClient:
 
         return liq_margin_threshold_p
 
-    async def get_open_trades(self, address):
+    async def get_open_trades(self, address, block_number=None):
         # self.log(f"Fetching open trades for address: {address}")
-        query = gql(
-            """
-          query trades($trader: Bytes!) {
-        trades(        
-          where: { isOpen: true, trader: $trader }
-        ) {
-          tradeID
-          collateral
-          leverage
-          highestLeverage
-          openPrice
-          stopLossPrice
-          takeProfitPrice
-          isOpen
-          timestamp
-          isBuy
-          notional
-          tradeNotional
-          funding
-          rollover
-          trader
-          index
-          pair {
-            id
-            feed
-            from
-            to
-            accRollover
-            lastRolloverBlock
-            rolloverFeePerBlock
-            accFundingLong
-            spreadP
-            accFundingShort
-            longOI
-            shortOI
-            maxOI
-            maxLeverage
-            hillInflectionPoint
-            hillPosScale
-            hillNegScale
-            springFactor
-            sFactorUpScaleP
-            sFactorDownScaleP
-            lastFundingBlock
-            maxFundingFeePerBlock
-            lastFundingRate
-            maxLeverage
-          }
-        }
-      }
-          """
-        )
-        result = await self._execute_query(query, variable_values={"trader": address})
+        result = await self._execute_query(
+            OPEN_TRADES_QUERY, variable_values=self._at_block({"trader": address}, block_number))
         return result['trades']
 
+    async def get_open_trades_for_traders(self, traders, page_size=1000, block_number=None):
+        """
+        Open trades of many traders with `trader_in` queries, paged by trade id.
+        Returns a dict keyed by lowercase trader address (traders without open trades map to []).
+        With `block_number` every page is read at that block.
+        """
+        traders = [trader.lower() for trader in traders]
+        trades = {trader: [] for trader in traders}
+        if len(traders) == 0:
+            return trades
+
+        last_id = ""
+        while True:
+            result = await self._execute_query(OPEN_TRADES_BY_TRADERS_QUERY, variable_values=self._at_block({
+                "traders": traders, "last_id": last_id, "page_size": page_size}, block_number))
+            page = result['trades']
+            for trade in page:
+                trades.setdefault(trade['trader'].lower(), []).append(trade)
+            if len(page) < page_size:
+                return trades
+            last_id = page[-1]['id']
+
     async def get_orders(self, trader):
-        query = gql(
-            """
-          query orders($trader: Bytes!) {
-            limits(
-              where: { trader: $trader, isActive: true }
-              orderBy: initiatedAt
-              orderDirection: asc
-            ) {
-              collateral
-              leverage
-              isBuy
-              isActive
-              id
-              openPrice
-              takeProfitPrice
-              stopLossPrice
-              trader
-              initiatedAt
-              limitType
-              pair {
-                id
-                feed
-                from
-                to
-                accRollover
-                lastRolloverBlock
-                rolloverFeePerBlock
-                accFundingLong
-                spreadP
-                accFundingShort
-                longOI
-                shortOI
-                lastFundingBlock
-                maxFundingFeePerBlock
-                lastFundingRate
-              }
-            }
-          }
-          """
-        )
-        result = await self._execute_query(query, variable_values={"trader": trader})
+        result = await self._execute_query(ORDERS_QUERY, variable_values={"trader": trader})
         return result['limits']
 
     async def get_recent_history(self, trader, last_n_orders=10):
-        query = gql(
-            """
-        query ListOrdersHistory($trader: Bytes, $last_n_orders: Int) {
-          orders(
-            where: { trader: $trader, isPending: false}
-            first: $last_n_orders
-            orderBy: executedAt
-            orderDirection: desc
-          ) {
-            id
-            isBuy
-            trader
-            notional
-            tradeNotional
-            collateral
-            leverage
-            orderType
-            orderAction
-            price
-            initiatedAt
-            executedAt
-            executedTx
-            isCancelled
-            cancelReason
-            profitPercent
-            totalProfitPercent
-            isPending
-            amountSentToTrader
-            rolloverFee
-            fundingFee
-            pair {
-              id
-              from
-              to
-              feed
-              longOI
-              shortOI
-              group {
-                  name
-              }
-            }
-          }
-        }
-        """
-        )
-        result = await self._execute_query(query, variable_values={"trader": trader, "last_n_orders": last_n_orders})
+        result = await self._execute_query(RECENT_HISTORY_QUERY, variable_values={"trader": trader, "last_n_orders": last_n_orders})
         return list(reversed(result['orders']))  # Reverse the final list
 
     async def get_order_by_id(self, order_id):
         """
         Get an order by its ID
         """
-        query = gql(
-            """
-            query GetOrder($order_id: ID!) {
-              orders(where: {id: $order_id}) {
-                id
-                trader
-                pair {
-                  id
-                  from
-                  to
-                  feed
-                }
-                tradeID
-                limitID
-                orderType
-                orderAction
-                price
-                priceAfterImpact
-                priceImpactP
-                collateral
-                notional
-                tradeNotional
-                profitPercent
-                totalProfitPercent
-                amountSentToTrader
-                isBuy
-                initiatedAt
-                executedAt
-                initiatedTx
-                executedTx
-                initiatedBlock
-                executedBlock
-                leverage
-                isPending
-                isCancelled
-                cancelReason
-                devFee
-                vaultFee
-                oracleFee
-                liquidationFee
-                fundingFee
-                rolloverFee
-                closePercent
-              }
-            }
-            """
-        )
-
-        result = await self._execute_query(query, variable_values={"order_id": str(order_id)})
+        result = await self._execute_query(ORDER_BY_ID_QUERY, variable_values={"order_id": str(order_id)})
 
         if result and 'orders' in result and len(result['orders']) > 0:
             return result['orders'][0]
@@ -400,43 +892,38 @@ class SubgraphClient:
         """
         Get a trade by its ID
         """
-        query = gql(
-            """
-            query GetTrade($trade_id: ID!) {
-              trades(where: {id: $trade_id}) {
-                id
-                trader
-                pair {
-                  id
-                  from
-                  to
-                  feed
-                }
-                index
-                tradeID
-                tradeType
-                openPrice
-                closePrice
-                takeProfitPrice
-                stopLossPrice
-                collateral
-                notional
-                tradeNotional
-                highestLeverage
-                leverage
-                isBuy
-                isOpen
-                closeInitiated
-                funding
-                rollover
-                timestamp
-              }
-            }
-            """
-        )
-
-        result = await self._execute_query(query, variable_values={"trade_id": str(trade_id)})
+        result = await self._execute_query(TRADE_BY_ID_QUERY, variable_values={"trade_id": str(trade_id)})
 
         if result and 'trades' in result and len(result['trades']) > 0:
             return result['trades'][0]
         return None
+
+    async def get_orders_executed_between(self, from_block, to_block, last_id="", page_size=1000, block_number=None):
+        """
+        One page of the orders executed (or cancelled) in blocks [from_block, to_block], all traders,
+        ordered by id: the orders with an id greater than `last_id`, at most `page_size` of them.
+        Same fields as get_order_by_id(). Page with last_id = the id of the last order of the page.
+        """
+        result = await self._execute_query(ORDERS_EXECUTED_BETWEEN_QUERY, variable_values=self._at_block({
+            "from_block": str(from_block), "to_block": str(to_block), "last_id": last_id,
+            "page_size": page_size}, block_number))
+        return result['orders']
+
+    async def get_trades_by_trade_ids(self, trade_ids, page_size=1000, block_number=None):
+        """
+        Trades with the given tradeIDs, same fields as get_trade_by_id(), paged by id
+        """
+        trade_ids = sorted({str(trade_id) for trade_id in trade_ids})
+        trades = []
+        if len(trade_ids) == 0:
+            return trades
+
+        last_id = ""
+        while True:
+            result = await self._execute_query(TRADES_BY_TRADE_IDS_QUERY, variable_values=self._at_block({
+                "trade_ids": trade_ids, "last_id": last_id, "page_size": page_size}, block_number))
+            page = result['trades']
+            trades.extend(page)
+            if len(page) < page_size:
+                return trades
+            last_id = page[-1]['id']
@@ -2,6 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from web3 import Web3
 from ast import literal_eval
+from eth_utils import event_abi_to_log_topic
 
 from .constants import MAX_PROFIT_P, MAX_STOP_LOSS_P
 
@@ -219,3 +220,9 @@ def convert_decimals(obj):
     return obj
 
 # timestamp is a string in seconds as returned from graph
+
+
+def build_event_topics(*abis):
+    """{event name: topic0 (keccak of the event signature, bytes)} for the events of the given ABIs"""
+    return {entry['name']: event_abi_to_log_topic(entry)
+            for abi in abis for entry in abi if entry.get('type') == 'event'}
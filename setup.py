@@ -27,6 +27,7 @@ setup(
     install_requires=read_requirements('requirements.txt'),
     extras_require={
         "dev": read_requirements('requirements-dev.txt'),
+        "numpy": ["numpy>=1.22"],
     },
     package_data={
         '': ['requirements.txt', 'requirements-dev.txt']
@@ -1,8 +1,21 @@
+import asyncio
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
+import pytest_asyncio
+from aiohttp import web
 from dotenv import load_dotenv
+from eth_utils import keccak
+from eth_utils.abi import get_abi_output_types
+from web3 import Web3
 from ostium_python_sdk import OstiumSDK
+from ostium_python_sdk.abi.multicall3_abi import multicall3_abi
 from ostium_python_sdk.config import NetworkConfig
+from ostium_python_sdk.multicall import MULTICALL3_ADDRESS
+from ostium_python_sdk.price import Price
 
 # Public RPC endpoints for Arbitrum Sepolia
 PUBLIC_RPC_URLS = {
@@ -37,3 +50,429 @@ def mock_sdk():
     """Initialize SDK with mock configuration for unit tests"""
     config = NetworkConfig.testnet()
     return OstiumSDK(config)
+
+
+def make_price_feeds(n_pairs=3):
+    """Latest-prices payload shaped like the metadata-backend response"""
+    return [{
+        'feed_id': '0x' + format(i, '064x'),
+        'bid': 100.0 + i - 0.01,
+        'mid': 100.0 + i,
+        'ask': 100.0 + i + 0.01,
+        'isMarketOpen': True,
+        'isDayTradingClosed': False,
+        'secondsToToggleIsDayTradingClosed': -1,
+        'from': ['BTC', 'ETH', 'EUR'][i] if i < 3 else f"A{i}",
+        'to': 'USD',
+        'timestampSeconds': 1748460056,
+    } for i in range(n_pairs)]
+
+
+@pytest_asyncio.fixture
+async def price_server():
+    """Local stand-in for the metadata-backend price service"""
+    state = {'requests': 0, 'feeds': make_price_feeds(), 'latency': 0.0}
+
+    async def latest_prices(request):
+        state['requests'] += 1
+        if state['latency']:
+            await asyncio.sleep(state['latency'])
+        return web.json_response(state['feeds'])
+
+    app = web.Application()
+    app.router.add_get('/PricePublish/latest-prices', latest_prices)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state['base_url'] = f"http://127.0.0.1:{port}"
+    yield state
+    await runner.cleanup()
+
+
+def make_subgraph_pair(pair_id=0, from_asset='BTC', to_asset='USD', **overrides):
+    """A pair entity as returned by SubgraphClient.get_pairs() / get_pair_details()"""
+    pair = {
+        'id': str(pair_id),
+        'from': from_asset,
+        'to': to_asset,
+        'feed': '0x' + format(pair_id, '064x'),
+        'overnightMaxLeverage': '0',
+        'longOI': '1500000000000000000',
+        'shortOI': '1000000000000000000',
+        'maxOI': '1000000000000',
+        'makerFeeP': '100',
+        'takerFeeP': '300',
+        'makerMaxLeverage': '1000',
+        'curFundingLong': '1000',
+        'curFundingShort': '-1000',
+        'curRollover': '0',
+        'totalOpenTrades': '2',
+        'totalOpenLimitOrders': '0',
+        'accRollover': '0',
+        'lastRolloverBlock': '100',
+        'rolloverFeePerBlock': '0',
+        'accFundingLong': '12722273808',
+        'accFundingShort': '0',
+        'lastFundingBlock': '200',
+        'maxFundingFeePerBlock': '47564687975',
+        'lastFundingRate': '129795925',
+        'hillInflectionPoint': '160000000000000000',
+        'hillPosScale': '118',
+        'hillNegScale': '91',
+        'springFactor': '86000000000000',
+        'sFactorUpScaleP': '11000',
+        'sFactorDownScaleP': '9000',
+        'lastTradePrice': '100000000000000000000',
+        'maxLeverage': '10000',
+        'spreadP': '0',
+        'group': {
+            'id': '0',
+            'name': 'crypto',
+            'minLeverage': '200',
+            'maxLeverage': '0',
+            'maxCollateralP': '1000',
+            'longCollateral': '0',
+            'shortCollateral': '0',
+        },
+        'fee': {'minLevPos': '1500000000'},
+    }
+    pair.update(overrides)
+    return pair
+
+
+def make_open_trade(pair, index=0, trader='0x0000000000000000000000000000000000000001', **overrides):
+    """An open trade as returned by SubgraphClient.get_open_trades(), `pair` as built by make_subgraph_pair()"""
+    trade = {
+        'tradeID': str(index),
+        'collateral': '1000000000',
+        'leverage': '1000',
+        'highestLeverage': '1000',
+        'openPrice': '95000000000000000000',
+        'stopLossPrice': '0',
+        'takeProfitPrice': '0',
+        'isOpen': True,
+        'timestamp': '1700000000',
+        'isBuy': True,
+        'notional': '10000000000',
+        'tradeNotional': '105263157894736842',
+        'funding': '0',
+        'rollover': '0',
+        'trader': trader,
+        'index': str(index),
+        'pair': pair,
+    }
+    trade.update(overrides)
+    return trade
+
+
+class FakeSubgraph:
+    """In-memory stand-in for SubgraphClient, counts calls per method"""
+
+    def __init__(self, pairs=None, open_trades=None, liq_margin_threshold_p='25'):
+        self.pairs = pairs if pairs is not None else [
+            make_subgraph_pair(0, 'BTC', 'USD'), make_subgraph_pair(1, 'ETH', 'USD')]
+        self.open_trades = open_trades or {}
+        self.liq_margin_threshold_p = liq_margin_threshold_p
+        self.latency = 0.0
+        self.calls = {}
+        self.indexed_block = {'number': 11990, 'timestamp': 1699999997, 'has_indexing_errors': False}
+        # block_number argument of every pinnable query, None when read at the latest block
+        self.read_blocks = []
+
+    async def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def get_pairs(self):
+        await self._count('get_pairs')
+        return [dict(p) for p in self.pairs]
+
+    async def get_pair_details(self, pair_id, static_only=False, block_number=None):
+        await self._count('get_pair_details')
+        self.read_blocks.append(block_number)
+        for p in self.pairs:
+            if int(p['id']) == int(pair_id):
+                return dict(p)
+        raise ValueError(f"No pair details found for pair ID: {pair_id}")
+
+    async def get_pairs_details(self, pair_ids, static_only=False, block_number=None):
+        await self._count('get_pairs_details')
+        self.read_blocks.append(block_number)
+        by_id = {int(p['id']): dict(p) for p in self.pairs}
+        return {int(pair_id): by_id[int(pair_id)] for pair_id in pair_ids}
+
+    async def get_indexed_block(self):
+        await self._count('get_indexed_block')
+        return dict(self.indexed_block)
+
+    async def get_liq_margin_threshold_p(self, block_number=None):
+        await self._count('get_liq_margin_threshold_p')
+        self.read_blocks.append(block_number)
+        return self.liq_margin_threshold_p
+
+    async def get_open_trades(self, address, block_number=None):
+        await self._count('get_open_trades')
+        self.read_blocks.append(block_number)
+        return list(self.open_trades.get(address, []))
+
+    async def get_open_trades_for_traders(self, traders, block_number=None):
+        await self._count('get_open_trades_for_traders')
+        self.read_blocks.append(block_number)
+        return {trader.lower(): list(self.open_trades.get(trader, [])) for trader in traders}
+
+    def observe_block(self, block_number):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeOstium:
+    def __init__(self, block_number=12000, address='0x0000000000000000000000000000000000000001'):
+        self.block_number = block_number
+        self.address = address
+        self.latency = 0.0
+        self.calls = {}
+
+    def get_block(self, block_identifier='latest'):
+        self.calls['get_block'] = self.calls.get('get_block', 0) + 1
+        number = self.block_number if block_identifier == 'latest' else block_identifier
+        # one block every 0.25s, block 12000 at t=1700000000
+        return {'number': number, 'timestamp': 1700000000 + (number - 12000) // 4}
+
+    def get_public_address(self):
+        return self.address
+
+
+class FakeAsyncOstium:
+    """AsyncOstium reads over a FakeOstium, sharing its block number, latency and call counts"""
+
+    def __init__(self, ostium):
+        self.ostium = ostium
+
+    async def get_block_number(self):
+        calls = self.ostium.calls
+        calls['get_block_number'] = calls.get('get_block_number', 0) + 1
+        if self.ostium.latency:
+            await asyncio.sleep(self.ostium.latency)
+        return self.ostium.block_number
+
+    async def get_block(self, block_identifier='latest'):
+        return self.ostium.get_block(block_identifier)
+
+
+@pytest.fixture
+def offline_sdk():
+    """OstiumSDK wired to in-memory fakes - no RPC, subgraph or price service needed"""
+    sdk = OstiumSDK.__new__(OstiumSDK)
+    sdk.verbose = False
+    sdk.subgraph = FakeSubgraph()
+    sdk.ostium = FakeOstium()
+    sdk.async_ostium = FakeAsyncOstium(sdk.ostium)
+    sdk.pair_snapshots = None
+    sdk.history = None
+    sdk.price = Price()
+    return sdk
+
+
+@pytest_asyncio.fixture
+async def subgraph_server():
+    """
+    Local stand-in GraphQL endpoint. Set state['handler'] to a callable taking the decoded
+    request body ({'query', 'variables', ...}) and returning the `data` dict.
+    Tracks the number of requests and the peak number of concurrent requests.
+    """
+    state = {'requests': 0, 'in_flight': 0, 'max_in_flight': 0, 'latency': 0.0,
+             'bodies': [], 'handler': lambda body: {}}
+
+    async def graphql(request):
+        body = await request.json()
+        state['requests'] += 1
+        state['bodies'].append(body)
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        try:
+            if state['latency']:
+                await asyncio.sleep(state['latency'])
+            return web.json_response({'data': state['handler'](body)})
+        finally:
+            state['in_flight'] -= 1
+
+    app = web.Application()
+    app.router.add_post('/', graphql)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state['url'] = f"http://127.0.0.1:{port}/"
+    yield state
+    await runner.cleanup()
+
+
+@pytest.fixture
+def rpc_node():
+    """
+    Local stand-in JSON-RPC node, served from a thread so both Web3 and AsyncWeb3 can use it.
+    Set state['methods'][name] to a callable taking the params list and returning the result,
+    an exception becomes a JSON-RPC error. Batch requests are supported. Tracks the number of
+    HTTP requests, batches and calls per method.
+    """
+    state = {'methods': {}, 'requests': 0, 'batches': 0, 'calls': {}, 'latency': 0.0,
+             'in_flight': 0, 'max_in_flight': 0}
+    lock = threading.Lock()
+
+    def call(request):
+        method = request['method']
+        with lock:
+            state['calls'][method] = state['calls'].get(method, 0) + 1
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        try:
+            response['result'] = state['methods'][method](request.get('params', []))
+        except Exception as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+        return response
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            with lock:
+                state['requests'] += 1
+                state['batches'] += isinstance(body, list)
+                state['in_flight'] += 1
+                state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            try:
+                if state['latency']:
+                    time.sleep(state['latency'])
+                result = [call(request) for request in body] if isinstance(body, list) else call(body)
+            finally:
+                with lock:
+                    state['in_flight'] -= 1
+            data = json.dumps(result).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    state['url'] = f"http://127.0.0.1:{server.server_port}/"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+# Signing key / address used against the stand-in node
+ADDRESS = '0x0000000000000000000000000000000000000001'
+PRIVATE_KEY = '0x' + '11' * 32
+PRICE_REQUESTED_TOPIC = '0x' + keccak(text="PriceRequested(uint256,bytes32,uint256)").hex()
+
+
+def make_receipt(tx_hash, order_id=None):
+    """A raw (JSON-RPC) receipt, with a PriceRequested log when order_id is given"""
+    logs = []
+    if order_id is not None:
+        logs.append({
+            'address': ADDRESS, 'topics': [PRICE_REQUESTED_TOPIC, '0x' + f'{order_id:064x}', '0x' + '00' * 32],
+            'data': '0x', 'blockNumber': '0x10', 'blockHash': '0x' + 'bb' * 32, 'logIndex': '0x0',
+            'transactionIndex': '0x0', 'transactionHash': tx_hash, 'removed': False})
+    return {'transactionHash': tx_hash, 'status': '0x1', 'blockNumber': '0x10', 'blockHash': '0x' + 'bb' * 32,
+            'transactionIndex': '0x0', 'from': ADDRESS, 'to': ADDRESS, 'gasUsed': '0x5208',
+            'cumulativeGasUsed': '0x5208', 'effectiveGasPrice': '0x1', 'contractAddress': None,
+            'logsBloom': '0x' + '00' * 256, 'type': '0x0', 'logs': logs}
+
+
+def serve_receipts(rpc_node, mined):
+    """eth_getTransactionReceipt answers from `mined` ({tx hash: order id}), null while pending"""
+    def get_receipt(params):
+        tx_hash = params[0]
+        return make_receipt(tx_hash, mined[tx_hash]) if tx_hash in mined else None
+    rpc_node['methods']['eth_getTransactionReceipt'] = get_receipt
+
+
+def make_block(block_number, timestamp=1):
+    """A raw (JSON-RPC) block header"""
+    return {
+        'number': hex(block_number), 'hash': '0x' + 'bb' * 32, 'parentHash': '0x' + 'aa' * 32,
+        'baseFeePerGas': '0x989680', 'timestamp': hex(timestamp), 'gasLimit': '0x1c9c380', 'gasUsed': '0x0',
+        'transactions': [], 'miner': ADDRESS, 'difficulty': '0x0', 'extraData': '0x',
+        'logsBloom': '0x' + '00' * 256, 'nonce': '0x' + '00' * 8, 'sha3Uncles': '0x' + '00' * 32, 'size': '0x0',
+        'stateRoot': '0x' + '00' * 32, 'receiptsRoot': '0x' + '00' * 32, 'transactionsRoot': '0x' + '00' * 32,
+        'uncles': [], 'mixHash': '0x' + '00' * 32}
+
+
+def serve_transactions(rpc_node, mined, block_number=16):
+    """
+    Let the stand-in node accept transactions: chain id, nonce, gas and fee lookups, and
+    eth_sendRawTransaction. Returns the list of sent transaction hashes, a transaction is
+    mined once `mined[hash]` is set (see serve_receipts()).
+    """
+    methods = rpc_node['methods']
+    methods['eth_chainId'] = lambda params: '0xa4b1'
+    methods['eth_getTransactionCount'] = lambda params: '0x0'
+    methods['eth_estimateGas'] = lambda params: '0x30d40'
+    methods['eth_gasPrice'] = lambda params: '0x989680'
+    methods['eth_maxPriorityFeePerGas'] = lambda params: '0x0'
+    methods['eth_blockNumber'] = lambda params: hex(block_number)
+    methods['eth_getBlockByNumber'] = lambda params: make_block(block_number)
+    sent = []
+
+    def send_raw_transaction(params):
+        sent.append('0x' + keccak(hexstr=params[0]).hex())
+        return sent[-1]
+    methods['eth_sendRawTransaction'] = send_raw_transaction
+    serve_receipts(rpc_node, mined)
+    return sent
+
+
+def serve_contracts(rpc_node, contracts, block_number=16, l1_block_number=21000000):
+    """
+    Let the stand-in node answer eth_call for fake contracts and for Multicall3 (aggregate3,
+    getBlockNumber). `contracts` maps an address to (abi, {function name: callable(*args)}),
+    a callable returns the output value(s) - structs as tuples - and raising makes the call
+    revert. The block of every eth_call is recorded in rpc_node['call_blocks'].
+
+    The chain head (eth_blockNumber / eth_getBlockByNumber) is `block_number`. Like on Arbitrum,
+    Multicall3.getBlockNumber() (Solidity block.number) returns another number, `l1_block_number`.
+    """
+    w3 = Web3()
+    targets = {address.lower(): (w3.eth.contract(abi=abi), functions)
+               for address, (abi, functions) in contracts.items()}
+
+    def aggregate3(calls):
+        results = []
+        for call in calls:
+            try:
+                results.append((True, execute(call['target'], call['callData'])))
+            except Exception:
+                if not call['allowFailure']:
+                    raise
+                results.append((False, b''))
+        return results
+
+    targets[MULTICALL3_ADDRESS.lower()] = (
+        w3.eth.contract(abi=multicall3_abi), {'aggregate3': aggregate3, 'getBlockNumber': lambda: l1_block_number})
+
+    def execute(to, data):
+        contract, functions = targets[to.lower()]
+        function, args = contract.decode_function_input(data)
+        result = functions[function.fn_name](*args.values())
+        output_types = get_abi_output_types(function.abi)
+        return w3.codec.encode(output_types, [result] if len(output_types) == 1 else result)
+
+    def eth_call(params):
+        rpc_node.setdefault('call_blocks', []).append(params[1])
+        return '0x' + execute(params[0]['to'], params[0]['data']).hex()
+    rpc_node['methods']['eth_chainId'] = lambda params: '0xa4b1'
+    rpc_node['methods']['eth_blockNumber'] = lambda params: hex(block_number)
+    rpc_node['methods']['eth_getBlockByNumber'] = lambda params: make_block(block_number)
+    rpc_node['methods']['eth_call'] = eth_call
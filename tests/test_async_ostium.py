@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+import rlp
+from eth_utils import keccak
+from web3 import AsyncWeb3
+
+from ostium_python_sdk.async_ostium import AsyncOstium
+from ostium_python_sdk.balance import AsyncBalance
+from tests.conftest import ADDRESS, PRIVATE_KEY, serve_transactions
+
+
+def async_ostium(rpc_node, **kwargs):
+    """AsyncOstium against the stand-in node, every sent transaction is mined at once with order id 1000 + nonce"""
+    mined = {}
+    sent = serve_transactions(rpc_node, mined)
+    nonces = []
+
+    def send_and_mine(params):
+        raw = bytes.fromhex(params[0][2:])
+        tx_hash = '0x' + keccak(raw).hex()
+        # type 2 transaction: 0x02 || rlp([chainId, nonce, ...])
+        nonce = int.from_bytes(rlp.decode(raw[1:])[1], 'big')
+        nonces.append(nonce)
+        mined[tx_hash] = 1000 + nonce
+        sent.append(tx_hash)
+        return tx_hash
+    rpc_node['methods']['eth_sendRawTransaction'] = send_and_mine
+
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_node['url']))
+    return AsyncOstium(w3, ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY, **kwargs), sent, nonces
+
+
+@pytest.mark.asyncio
+async def test_concurrent_close_trades(rpc_node):
+    ostium, sent, nonces = async_ostium(rpc_node, manage_nonces=True)
+    try:
+        results = await asyncio.gather(*(ostium.close_trade(pair_id, 0, 100.0) for pair_id in range(5)))
+    finally:
+        await ostium.web3.provider.disconnect()
+
+    assert sorted(nonces) == [0, 1, 2, 3, 4]
+    assert sorted(r['order_id'] for r in results) == [1000, 1001, 1002, 1003, 1004]
+    assert results[0]['receipt'].status == 1
+    assert rpc_node['calls']['eth_getTransactionCount'] == 1
+
+
+@pytest.mark.asyncio
+async def test_delegated_trade_wraps_the_call(rpc_node):
+    ostium, sent, nonces = async_ostium(rpc_node, use_delegation=True)
+    estimates = []
+    rpc_node['methods']['eth_estimateGas'] = lambda params: estimates.append(params[0]) or '0x30d40'
+    trader = AsyncWeb3.to_checksum_address('0x00000000000000000000000000000000000000aa')
+    try:
+        await ostium.update_tp(3, 1, 120.5, trader_address=trader)
+    finally:
+        await ostium.web3.provider.disconnect()
+
+    contract = ostium.ostium_trading_contract
+    inner = contract.encode_abi('updateTp', args=[3, 1, 120500000000000000000])
+    assert estimates[0]['data'] == contract.encode_abi('delegatedAction', args=[trader, inner])
+
+
+@pytest.mark.asyncio
+async def test_block_number_and_balances(rpc_node):
+    ostium, sent, nonces = async_ostium(rpc_node)
+    rpc_node['methods']['eth_getBalance'] = lambda params: hex(2 * 10**18)
+    rpc_node['methods']['eth_call'] = lambda params: '0x' + f'{5 * 10**6:064x}'
+    balance = AsyncBalance(ostium.web3, ADDRESS)
+    try:
+        assert await ostium.get_block_number() == 16
+        ether, usdc = await balance.get_balance(ADDRESS)
+    finally:
+        await ostium.web3.provider.disconnect()
+    assert (ether, usdc) == (2, 5)
+
+
+@pytest.mark.asyncio
+async def test_sdk_block_number_does_not_block_the_loop(offline_sdk, rpc_node):
+    ostium, sent, nonces = async_ostium(rpc_node)
+    offline_sdk.async_ostium = ostium
+    rpc_node['latency'] = 0.2
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    try:
+        rates = await offline_sdk.get_funding_rate_for_pair_id(0)
+    finally:
+        task.cancel()
+        await offline_sdk.close()
+
+    assert rates is not None
+    # the RPC call went through AsyncWeb3, the sync client was never used
+    assert 'get_block_number' not in offline_sdk.ostium.calls
+    assert rpc_node['calls']['eth_getBlockByNumber'] == 1
+    assert len(ticks) > 5
@@ -0,0 +1,52 @@
+import random
+from decimal import Decimal, ROUND_DOWN, localcontext
+
+import pytest
+
+from ostium_python_sdk.scscript import funding
+from ostium_python_sdk.scscript.funding import exponentialApproximation, exponentialApproximationCached
+
+
+def _values(n, seed):
+    rng = random.Random(seed)
+    values = [Decimal(0), Decimal('0.7932312589092019'), Decimal('-0.7932312589092018'), Decimal('6.906'),
+              Decimal('-6.906'), Decimal('-6.9060000001'), Decimal(-1), Decimal('-2.5'), Decimal('-0.50')]
+    for _ in range(n):
+        # sFactor * numBlocks: up to 22 decimals
+        values.append(-Decimal(rng.randint(1, 10**16)) * rng.randint(1, 10**6) / Decimal(10**22))
+        values.append(Decimal(rng.randint(-7 * 10**9, 7 * 10**9)) / Decimal(10**9))
+        values.append(Decimal(rng.randint(-7 * 1024, 7 * 1024)) / 1024)
+    # more fractional digits than the context can shift exactly
+    values.append(-Decimal('3.1415926535897932384626433832795028841971'))
+    return values
+
+
+@pytest.mark.parametrize("context", [dict(), dict(prec=128, rounding=ROUND_DOWN)])
+def test_cached_matches_reference(context):
+    with localcontext(**context):
+        for value in _values(1000, seed=len(context)):
+            # same value and same representation
+            assert str(exponentialApproximationCached(value)) == str(exponentialApproximation(value)), value
+            # again, from the cache
+            assert str(exponentialApproximationCached(value)) == str(exponentialApproximation(value)), value
+
+
+def test_table_entries_are_shared():
+    funding._exponentialPiecewiseEntry.cache_clear()
+    for numerator in range(1024):
+        exponentialApproximationCached(-(3 + Decimal(numerator) / 1024 + Decimal('0.0000001')))
+        exponentialApproximationCached(-(3 + Decimal(numerator) / 1024 + Decimal('0.0000002')))
+    info = funding._exponentialPiecewiseEntry.cache_info()
+    assert (info.hits, info.misses) == (1024, 1024)
+
+
+def test_pending_acc_funding_fees_unchanged(monkeypatch):
+    args = dict(blockNumber=Decimal(150000), lastUpdateBlock=Decimal(200), valueLong=Decimal('0.000000012722273808'),
+                valueShort=Decimal(0), openInterestUsdcLong=Decimal(150000), openInterestUsdcShort=Decimal(100000),
+                OiCap=Decimal(1000000), maxFundingFeePerBlock=Decimal('0.000000047564687975'),
+                lastFundingRate=Decimal('0.000000000129795925'), hillInflectionPoint=Decimal('0.16'),
+                hillPosScale=Decimal('1.18'), hillNegScale=Decimal('0.91'), springFactor=Decimal('0.000086'),
+                sFactorUpScale=Decimal(110), sFactorDownScaleP=Decimal(90))
+    cached = funding.getPendingAccFundingFees(**args)
+    monkeypatch.setattr(funding, 'exponentialApproximationCached', exponentialApproximation)
+    assert funding.getPendingAccFundingFees(**args) == cached
@@ -0,0 +1,137 @@
+"""
+Differential tests: scscript.fixed_point (ints) against the Decimal versions in scscript.funding /
+scscript.pairinfos, evaluated with the contract harness context (prec 128, ROUND_DOWN).
+"""
+import random
+from decimal import Decimal, ROUND_DOWN, localcontext
+
+import pytest
+
+from ostium_python_sdk.scscript import fixed_point, funding, pairinfos
+
+P2 = Decimal(10**2)
+P6 = Decimal(10**6)
+P18 = Decimal(10**18)
+N_CASES = 2000
+
+
+def contract_context():
+    return localcontext(prec=128, rounding=ROUND_DOWN)
+
+
+def as_int(value, precision):
+    scaled = Decimal(value) * precision
+    assert scaled == scaled.to_integral_value(), "reference result has more decimals than its precision"
+    return int(scaled)
+
+
+def test_div_truncates_towards_zero():
+    assert [fixed_point._div(a, b) for a, b in [(7, 2), (-7, 2), (7, -2), (-7, -2), (0, 5)]] == [3, -3, -3, 3, 0]
+
+
+def test_exponential_approximation_matches_decimal():
+    rng = random.Random(1)
+    values = [0, 1, -1, 10**18, -10**18, 793231258909201899, -793231258909201900, 6906 * 10**15,
+              -6906 * 10**15, -6906 * 10**15 - 1, -50 * 10**18]
+    values += [rng.randint(-8 * 10**18, 8 * 10**18) for _ in range(N_CASES)]
+    values += [-rng.randint(0, 10**6) * 10**14 for _ in range(200)]  # few fractional bits
+    with contract_context():
+        for value in values:
+            expected = funding.exponentialApproximation(Decimal(value) / P18)
+            assert fixed_point.exponentialApproximation(value) == as_int(expected, P18), value
+
+
+def test_exponential_approximation_other_scale():
+    with contract_context():
+        for value in (-3 * 10**21, -12345678901234567890123, -6 * 10**22):
+            expected = funding.exponentialApproximation(Decimal(value) / Decimal(10**22))
+            assert fixed_point.exponentialApproximation(value, 10**22) == as_int(expected, P18)
+
+
+def test_target_funding_rate_matches_decimal():
+    rng = random.Random(2)
+    with contract_context():
+        for _ in range(N_CASES):
+            args = (rng.randint(-10**6, 10**6), rng.randint(-10**18, 10**18), rng.randint(0, 10**12),
+                    rng.randint(0, 500), rng.randint(0, 500))
+            expected = funding.getTargetFundingRate(
+                Decimal(args[0]) / P6, Decimal(args[1]) / P18, Decimal(args[2]) / P18,
+                Decimal(args[3]) / P2, Decimal(args[4]) / P2)
+            assert fixed_point.getTargetFundingRate(*args) == as_int(expected, P18), args
+
+
+def _random_funding_args(rng):
+    oi_scale = rng.choice([10**6, 10**12, 10**18])
+    long_oi = rng.choice([0, rng.randint(1, 10**7) * oi_scale // 10**3])
+    short_oi = rng.choice([0, rng.randint(1, 10**7) * oi_scale // 10**3])
+    if long_oi == short_oi == 0:
+        long_oi = 1
+    last_update_block = rng.randint(0, 10**8)
+    return dict(
+        blockNumber=last_update_block + rng.choice([0, 1, rng.randint(0, 1000), rng.randint(0, 10**7)]),
+        lastUpdateBlock=last_update_block,
+        valueLong=rng.randint(-10**14, 10**14),
+        valueShort=rng.randint(-10**14, 10**14),
+        openInterestUsdcLong=long_oi,
+        openInterestUsdcShort=short_oi,
+        OiCap=rng.randint(1, 10**7) * oi_scale // 10**3,
+        maxFundingFeePerBlock=rng.randint(0, 10**11),
+        lastFundingRate=rng.randint(-10**11, 10**11),
+        hillInflectionPoint=rng.randint(-2 * 10**17, 2 * 10**17),
+        hillPosScale=rng.randint(1, 300),
+        hillNegScale=rng.randint(1, 300),
+        springFactor=rng.randint(1, 10**15),
+        sFactorUpScale=rng.randint(1, 20000),
+        sFactorDownScaleP=rng.randint(1, 20000),
+    )
+
+
+def test_pending_acc_funding_fees_matches_decimal():
+    rng = random.Random(3)
+    precisions = dict(valueLong=P18, valueShort=P18, openInterestUsdcLong=P6, openInterestUsdcShort=P6,
+                      OiCap=P6, maxFundingFeePerBlock=P18, lastFundingRate=P18, hillInflectionPoint=P18,
+                      hillPosScale=P2, hillNegScale=P2, springFactor=P18, sFactorUpScale=P2,
+                      sFactorDownScaleP=P2)
+    with contract_context():
+        for _ in range(N_CASES):
+            args = _random_funding_args(rng)
+            decimal_args = {name: Decimal(value) / precisions[name] if name in precisions else Decimal(value)
+                            for name, value in args.items()}
+            expected = funding.getPendingAccFundingFees(**decimal_args)
+            assert fixed_point.getPendingAccFundingFees(**args) == tuple(as_int(v, P18) for v in expected), args
+
+
+def test_trade_liquidation_price_matches_decimal():
+    rng = random.Random(4)
+    with contract_context():
+        for _ in range(N_CASES):
+            args = (rng.randint(0, 10000), rng.randint(1, 10**24), rng.random() < 0.5,
+                    rng.randint(1, 10**12), rng.randint(100, 100000), rng.randint(-10**9, 10**9),
+                    rng.randint(-10**9, 10**9), rng.randint(100, 100000))
+            expected = pairinfos.getTradeLiquidationPrice(
+                Decimal(args[0]) / P2, Decimal(args[1]) / P18, args[2], Decimal(args[3]) / P6,
+                Decimal(args[4]) / P2, Decimal(args[5]) / P6, Decimal(args[6]) / P6, Decimal(args[7]) / P2)
+            assert fixed_point.getTradeLiquidationPrice(*args) == as_int(expected, P18), args
+
+
+def test_opening_fee_matches_decimal():
+    rng = random.Random(5)
+    with contract_context():
+        for _ in range(N_CASES):
+            args = (rng.randint(-10**13, 10**13), rng.randint(100, 100000), rng.randint(-10**13, 10**13),
+                    rng.randint(100, 100000), rng.randint(0, 10**6), rng.randint(0, 10**6))
+            expected = pairinfos.getOpeningFee(
+                Decimal(args[0]) / P6, Decimal(args[1]) / P2, Decimal(args[2]) / P6,
+                Decimal(args[3]) / P2, Decimal(args[4]) / P6, Decimal(args[5]) / P6)
+            assert fixed_point.getOpeningFee(*args) == as_int(expected, P6), args
+
+
+@pytest.mark.parametrize("normalized_oi_delta", [-10**6, -1, 0, 1, 500000, 10**6])
+def test_target_funding_rate_needs_no_decimal_context(normalized_oi_delta):
+    # the int engine gives the contract result whatever the global decimal context is
+    with contract_context():
+        expected = funding.getTargetFundingRate(Decimal(normalized_oi_delta) / P6, Decimal('0.16'),
+                                                Decimal('0.000000047564687975'), Decimal('1.18'), Decimal('0.91'))
+        expected = as_int(expected, P18)
+    with localcontext(prec=10):
+        assert fixed_point.getTargetFundingRate(normalized_oi_delta, 16 * 10**16, 47564687975, 118, 91) == expected
@@ -0,0 +1,75 @@
+import pytest
+from decimal import Decimal
+from tests.conftest import make_subgraph_pair
+
+
+@pytest.mark.asyncio
+async def test_single_price_download_for_all_pairs(offline_sdk, price_server):
+    offline_sdk.subgraph.pairs = [
+        make_subgraph_pair(2, 'EUR', 'USD', overnightMaxLeverage='5000'),
+        make_subgraph_pair(0, 'BTC', 'USD'),
+        make_subgraph_pair(1, 'ETH', 'USD'),
+        make_subgraph_pair(3, 'XXX', 'USD'),
+    ]
+    offline_sdk.price.base_url = price_server['base_url']
+
+    pairs = await offline_sdk.get_formatted_pairs_details()
+    await offline_sdk.price.close()
+
+    assert price_server['requests'] == 1
+    assert [p['id'] for p in pairs] == [0, 1, 2, 3]
+    assert pairs[0]['price'] == 100.0 and pairs[0]['isMarketOpen'] is True
+    assert pairs[2]['price'] == 102.0
+    assert pairs[2]['overnightMaxLeverage'] == Decimal(50)
+    assert 'overnightMaxLeverage' not in pairs[0]
+    assert 'price' not in pairs[3]
+    assert pairs[0]['maxLeverage'] == Decimal(100)
+    assert pairs[0]['longOI'] == Decimal('1.5')
+
+
+@pytest.mark.asyncio
+async def test_without_prices_skips_price_service(offline_sdk, price_server):
+    offline_sdk.price.base_url = price_server['base_url']
+
+    pairs = await offline_sdk.get_formatted_pairs_details(including_current_price_and_market_status=False)
+
+    assert price_server['requests'] == 0
+    assert all('price' not in p for p in pairs)
+
+
+@pytest.mark.asyncio
+async def test_columnar_matches_row_format(offline_sdk, price_server):
+    offline_sdk.subgraph.pairs = [
+        make_subgraph_pair(1, 'ETH', 'USD', overnightMaxLeverage='5000'),
+        make_subgraph_pair(0, 'BTC', 'USD'),
+        make_subgraph_pair(3, 'XXX', 'USD'),
+    ]
+    offline_sdk.price.base_url = price_server['base_url']
+
+    rows = await offline_sdk.get_formatted_pairs_details()
+    columns = await offline_sdk.get_formatted_pairs_details(columnar=True)
+    await offline_sdk.price.close()
+
+    assert columns['id'] == [0, 1, 3]
+    assert columns['price'] == [100.0, 101.0, None]
+    assert columns['overnightMaxLeverage'] == [None, 50.0, None]
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            expected = pytest.approx(float(value)) if isinstance(value, Decimal) else value
+            assert columns[key][i] == expected, key
+    assert all(not isinstance(v, Decimal) for values in columns.values() for v in values)
+
+
+@pytest.mark.asyncio
+async def test_zero_group_min_leverage(offline_sdk):
+    # pairs have no minLeverage of their own in the subgraph, only their group does
+    pair = make_subgraph_pair(0, 'BTC', 'USD')
+    pair['group'] = dict(pair['group'], minLeverage='0')
+    offline_sdk.subgraph.pairs = [pair]
+
+    rows = await offline_sdk.get_formatted_pairs_details(including_current_price_and_market_status=False)
+    columns = await offline_sdk.get_formatted_pairs_details(
+        including_current_price_and_market_status=False, columnar=True)
+
+    assert rows[0]['minLeverage'] == 0
+    assert columns['minLeverage'] == [0.0]
@@ -0,0 +1,80 @@
+import random
+import pytest
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics
+from tests.conftest import make_open_trade, make_price_feeds, make_subgraph_pair
+
+np = pytest.importorskip("numpy")
+from ostium_python_sdk.formulae_batch import (BATCH_ATOL, BATCH_METRICS, BATCH_RTOL,  # noqa: E402
+                                              get_trade_metrics_batch, trade_metrics_batch)
+
+
+def _random_trades(n, seed=7):
+    rng = random.Random(seed)
+    pairs = [
+        make_subgraph_pair(0, 'BTC', 'USD', rolloverFeePerBlock='3000000000'),
+        make_subgraph_pair(1, 'ETH', 'USD', longOI='500000000000000000', lastFundingRate='-129795925'),
+        make_subgraph_pair(2, 'EUR', 'USD', accRollover='4000000000000000', accFundingShort='-9000000000'),
+    ]
+    trades = []
+    for i in range(n):
+        leverage = rng.randint(110, 10000)
+        trades.append(make_open_trade(
+            rng.choice(pairs), index=i,
+            collateral=str(rng.randint(1, 100000) * 10**6 + rng.randint(0, 999999)),
+            leverage=str(leverage),
+            highestLeverage=str(max(leverage, rng.choice([0, leverage + rng.randint(0, 500)]))),
+            openPrice=str(rng.randint(80, 120) * 10**18 + rng.randint(0, 10**18)),
+            isBuy=rng.random() < 0.5,
+            funding=str(rng.randint(-10**10, 10**10)),
+            rollover=str(rng.randint(0, 10**9)),
+        ))
+    return trades
+
+
+def test_batch_matches_scalar_path():
+    trades = _random_trades(1000)
+    prices = {(p['from'], p['to']): p for p in make_price_feeds()}
+    max_leverage = {0: 100.0, 1: 50.0, 2: 200.0}
+
+    batch = get_trade_metrics_batch(trades, prices, 12000, max_leverage, '25')
+
+    for i, trade in enumerate(trades):
+        pair = trade['pair']
+        expected = get_trade_metrics(trade, prices[(pair['from'], pair['to'])], 12000,
+                                     max_leverage[int(pair['id'])], '25')
+        for name in BATCH_METRICS:
+            assert batch[name][i] == pytest.approx(expected[name], rel=BATCH_RTOL, abs=BATCH_ATOL), (i, name)
+
+
+def test_batch_broadcasts_scalars_and_caps_profit():
+    result = trade_metrics_batch(
+        open_price=[100.0, 100.0], collateral=1000.0, leverage=[10.0, 10.0], highest_leverage=0.0,
+        is_buy=[True, False], trade_funding=0.0, trade_rollover=0.0, acc_funding_long=0.0,
+        acc_funding_short=0.0, acc_rollover=0.0, bid=250.0, ask=250.0, max_leverage=100.0)
+
+    # long capped at +900%, short floored at -100%
+    assert result['pnl'].tolist() == [9000.0, -15000.0]
+    assert result['pnl_percent'].tolist() == [900.0, -100.0]
+    assert result['net_value'].tolist() == [10000.0, -14000.0]
+
+
+def test_batch_zero_mid_matches_scalar_path():
+    trades = _random_trades(50)
+    prices = {(p['from'], p['to']): p for p in make_price_feeds()}
+    prices[('ETH', 'USD')] = dict(prices[('ETH', 'USD')], mid=0)
+    max_leverage = {0: 100.0, 1: 50.0, 2: 200.0}
+
+    batch = get_trade_metrics_batch(trades, prices, 12000, max_leverage, '25')
+
+    for i, trade in enumerate(trades):
+        pair = trade['pair']
+        expected = get_trade_metrics(trade, prices[(pair['from'], pair['to'])], 12000,
+                                     max_leverage[int(pair['id'])], '25')
+        for name in BATCH_METRICS:
+            assert batch[name][i] == pytest.approx(expected[name], rel=BATCH_RTOL, abs=BATCH_ATOL), (i, name)
+    assert 0.0 in batch['price_impact']
+
+
+def test_batch_requires_prices_for_every_pair():
+    with pytest.raises(ValueError, match="No price found"):
+        get_trade_metrics_batch(_random_trades(1), {}, 12000, {0: 100.0, 1: 100.0, 2: 100.0})
@@ -0,0 +1,88 @@
+from decimal import Decimal, ROUND_DOWN, localcontext
+
+import pytest
+
+from ostium_python_sdk.formulae import GetFundingRate, ProjectFundingRate
+from tests.conftest import make_subgraph_pair
+
+PAIR = make_subgraph_pair(0)
+OI_LONG, OI_SHORT = '150000000000', '100000000000'
+
+
+def _funding_args(pair=PAIR, oi_long=OI_LONG, oi_short=OI_SHORT):
+    return (pair['accFundingLong'], pair['accFundingShort'], pair['lastFundingRate'], pair['maxFundingFeePerBlock'],
+            pair['lastFundingBlock'], oi_long, oi_short, pair['maxOI'], pair['hillInflectionPoint'],
+            pair['hillPosScale'], pair['hillNegScale'], pair['springFactor'], pair['sFactorUpScaleP'],
+            pair['sFactorDownScaleP'])
+
+
+def _project(blocks, oi_scenario=None, **kwargs):
+    args = _funding_args(**kwargs)
+    return ProjectFundingRate(*args[:5], blocks, *args[5:], oiScenario=oi_scenario)
+
+
+def _get_funding_rate(block, acc_long, acc_short, last_rate, last_block, oi_long, oi_short):
+    args = list(_funding_args(oi_long=oi_long, oi_short=oi_short))
+    args[0:5] = [acc_long, acc_short, last_rate, PAIR['maxFundingFeePerBlock'], last_block]
+    return GetFundingRate(*args[:5], str(block), *args[5:])
+
+
+def _raw(value):
+    return str(int(value * Decimal(10**18)))
+
+
+def test_projection_matches_get_funding_rate_at_every_block():
+    blocks = [200, 201, 1200, 12200, 200 + 12000 * 24, 200 + 12000 * 24 * 7, 5000]
+    curve = _project(blocks)
+
+    assert curve['blocks'] == blocks
+    with localcontext(prec=128, rounding=ROUND_DOWN):
+        for i, block in enumerate(blocks):
+            expected = _get_funding_rate(block, PAIR['accFundingLong'], PAIR['accFundingShort'],
+                                         PAIR['lastFundingRate'], PAIR['lastFundingBlock'], OI_LONG, OI_SHORT)
+            assert curve['accFundingLong'][i] == expected['accFundingLong']
+            assert curve['accFundingShort'][i] == expected['accFundingShort']
+            assert curve['fundingRate'][i] == expected['latestFundingRate']
+            assert curve['targetFundingRate'][i] == expected['targetFundingRate']
+
+
+def test_oi_scenario_settles_funding_at_each_change():
+    # shorts take over at block 1200, then OI balances out at block 5200
+    scenario = [(5200, '100000000000', '100000000000'), (1200, '100000000000', '300000000000')]
+    curve = _project([1000, 3000, 9000], oi_scenario=scenario)
+
+    with localcontext(prec=128, rounding=ROUND_DOWN):
+        at_1000 = _get_funding_rate(1000, PAIR['accFundingLong'], PAIR['accFundingShort'], PAIR['lastFundingRate'],
+                                    PAIR['lastFundingBlock'], OI_LONG, OI_SHORT)
+        at_1200 = _get_funding_rate(1200, PAIR['accFundingLong'], PAIR['accFundingShort'], PAIR['lastFundingRate'],
+                                    PAIR['lastFundingBlock'], OI_LONG, OI_SHORT)
+        settled_1200 = [_raw(at_1200['accFundingLong']), _raw(at_1200['accFundingShort']),
+                        _raw(at_1200['latestFundingRate']), '1200']
+        at_3000 = _get_funding_rate(3000, *settled_1200, '100000000000', '300000000000')
+        at_5200 = _get_funding_rate(5200, *settled_1200, '100000000000', '300000000000')
+        settled_5200 = [_raw(at_5200['accFundingLong']), _raw(at_5200['accFundingShort']),
+                        _raw(at_5200['latestFundingRate']), '5200']
+        at_9000 = _get_funding_rate(9000, *settled_5200, '100000000000', '100000000000')
+
+    for i, expected in enumerate([at_1000, at_3000, at_9000]):
+        assert curve['accFundingLong'][i] == expected['accFundingLong']
+        assert curve['accFundingShort'][i] == expected['accFundingShort']
+        assert curve['fundingRate'][i] == expected['latestFundingRate']
+    # shorts pay once they dominate
+    assert curve['targetFundingRate'][1] < 0 < curve['targetFundingRate'][0]
+
+
+def test_projection_rejects_blocks_before_last_update():
+    with pytest.raises(ValueError):
+        _project([100])
+
+
+@pytest.mark.asyncio
+async def test_sdk_projection_in_hours(offline_sdk):
+    curve = await offline_sdk.get_funding_rate_projection(0, hours=[1, 24], oi_scenario=[(12, 0, 0)])
+
+    assert curve['hours'] == [1, 24]
+    assert curve['blocks'] == [12000 + 12000, 12000 + 24 * 12000]
+    long_oi, short_oi = offline_sdk._pair_oi_usd(PAIR)
+    assert curve == dict(_project(curve['blocks'], oi_scenario=[(12000 + 12 * 12000, 0, 0)],
+                                  oi_long=str(long_oi), oi_short=str(short_oi)), hours=[1, 24])
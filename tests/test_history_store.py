@@ -0,0 +1,156 @@
+import pytest
+
+from ostium_python_sdk.store import HistoryStore, main
+from ostium_python_sdk.subgraph import SubgraphClient
+
+TRADER = '0x00000000000000000000000000000000000000aa'
+OTHER = '0x00000000000000000000000000000000000000bb'
+
+
+def make_order(order_id, block, trader=TRADER, pair_id=0, trade_id=None, action='Open', cancelled=False):
+    return {'id': str(order_id), 'trader': trader, 'pair': {'id': str(pair_id), 'from': 'BTC', 'to': 'USD'},
+            'tradeID': None if trade_id is None else str(trade_id), 'orderType': 'Market', 'orderAction': action,
+            'executedBlock': str(block), 'executedAt': str(1700000000 + block), 'isCancelled': cancelled,
+            'isPending': False}
+
+
+def make_trade(trade_id, trader=TRADER, pair_id=0, is_open=True):
+    return {'id': f'trade-{trade_id}', 'tradeID': str(trade_id), 'trader': trader, 'pair': {'id': str(pair_id)},
+            'isOpen': is_open, 'timestamp': str(1700000000 + trade_id)}
+
+
+class HistorySubgraph:
+    """Subgraph history over in-memory orders / trades, fails the call number `fail_at` once"""
+
+    def __init__(self, orders, trades, head):
+        self.orders = orders
+        self.trades = trades
+        self.head = head
+        self.queries = []
+        self.fail_at = None
+
+    async def get_indexed_block(self):
+        return {'number': self.head, 'timestamp': 0, 'has_indexing_errors': False}
+
+    async def get_orders_executed_between(self, from_block, to_block, last_id="", page_size=1000, block_number=None):
+        self.queries.append((from_block, to_block, last_id, block_number))
+        if self.fail_at == len(self.queries):
+            self.fail_at = None
+            raise TimeoutError('subgraph timeout')
+        matched = sorted((o for o in self.orders if from_block <= int(o['executedBlock']) <= to_block
+                          and o['id'] > last_id), key=lambda o: o['id'])
+        return matched[:page_size]
+
+    async def get_trades_by_trade_ids(self, trade_ids, page_size=1000, block_number=None):
+        return [dict(self.trades[trade_id]) for trade_id in sorted(trade_ids) if trade_id in self.trades]
+
+
+ORDERS = [make_order(10, 100, trade_id=1), make_order(11, 105, pair_id=1, trade_id=2),
+          make_order(12, 110, trader=OTHER, trade_id=3), make_order(13, 120, action='Cancel', cancelled=True),
+          make_order(14, 130, trade_id=1, action='Close')]
+TRADES = {'1': make_trade(1, is_open=False), '2': make_trade(2, pair_id=1), '3': make_trade(3, trader=OTHER)}
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_and_local_queries():
+    subgraph = HistorySubgraph(ORDERS[:3], {'1': make_trade(1), **{k: TRADES[k] for k in '23'}}, head=110)
+    store = HistoryStore(start_block=50)
+
+    assert await store.sync(subgraph, page_size=2) == {'from_block': 50, 'to_block': 110, 'orders': 3, 'trades': 3}
+    assert [q[2] for q in subgraph.queries] == ['', '11']
+    assert all(q[3] == 110 for q in subgraph.queries)
+    assert store.get_cursor() == {'from_block': 111, 'to_block': None, 'last_id': ''}
+    assert store.get_trades(TRADER, pair_id=0, is_open=True)[0]['id'] == 'trade-1'
+
+    # the next sync only reads the new blocks, and picks up the close of trade 1
+    subgraph.orders, subgraph.trades, subgraph.head = ORDERS, TRADES, 140
+    assert await store.sync(subgraph) == {'from_block': 111, 'to_block': 140, 'orders': 2, 'trades': 1}
+    assert subgraph.queries[-1] == (111, 140, '', 140)
+    assert await store.sync(subgraph, to_block=139) == {'from_block': 141, 'to_block': 139, 'orders': 0, 'trades': 0}
+
+    assert store.get_trades(TRADER, pair_id=0, is_open=False) == [TRADES['1']]
+    assert store.get_trades(TRADER, pair_id=0, is_open=True) == []
+    assert [o['id'] for o in store.get_orders(TRADER)] == ['10', '11', '13', '14']
+    assert [o['id'] for o in store.get_orders(TRADER, pair_id=0, from_block=101)] == ['13', '14']
+    assert [o['id'] for o in store.get_orders(trade_id=1)] == ['10', '14']
+    assert [o['id'] for o in store.get_recent_history(TRADER, last_n_orders=2)] == ['13', '14']
+    assert store.get_order_by_id(12) == ORDERS[2] and store.get_order_by_id(99) is None
+    assert store.get_trade_by_id('trade-3') == TRADES['3']
+    assert store.stats()['orders'] == 5
+
+
+@pytest.mark.asyncio
+async def test_interrupted_sync_resumes_after_last_page(tmp_path):
+    path = str(tmp_path / 'history.db')
+    subgraph = HistorySubgraph(ORDERS, TRADES, head=140)
+    subgraph.fail_at = 2
+
+    with HistoryStore(path) as store:
+        with pytest.raises(TimeoutError):
+            await store.sync(subgraph, page_size=2)
+        assert store.get_cursor() == {'from_block': 0, 'to_block': 140, 'last_id': '11'}
+        assert store.stats()['orders'] == 2
+
+    # a new process keeps going from the stored page, at the same head
+    subgraph.head = 200
+    with HistoryStore(path) as store:
+        assert await store.sync(subgraph, page_size=2) == {'from_block': 0, 'to_block': 140, 'orders': 3, 'trades': 2}
+        assert subgraph.queries[2:] == [(0, 140, '11', 140), (0, 140, '13', 140)]
+        assert store.stats()['orders'] == 5
+        assert store.get_cursor()['from_block'] == 141
+
+
+def test_pair_snapshots_and_compaction(tmp_path, capsys):
+    path = str(tmp_path / 'history.db')
+    with HistoryStore(path) as store:
+        for block in (100, 200, 300):
+            store.save_pair_snapshot({'block_number': block, 'pairs': {
+                0: {'id': '0', 'accFundingLong': str(block)}, 1: {'id': '1', 'accFundingLong': str(-block)}}})
+        store._put_orders([make_order(20, 50, cancelled=True), make_order(21, 150, cancelled=True)])
+        store.connection.commit()
+
+        assert store.get_pair_snapshot(0) == {'block_number': 300, 'pair': {'id': '0', 'accFundingLong': '300'}}
+        assert store.get_pair_snapshot(1, block_number=250)['pair']['accFundingLong'] == '-200'
+        assert store.get_pair_snapshot(1, block_number=99) is None
+        assert store.compact(keep_pair_snapshots=2) == {'pair_snapshots': 2, 'orders': 0}
+        assert store.get_pair_snapshot(0, block_number=150) is None
+
+    main(['compact', path, '--keep-pair-snapshots', '1', '--cancelled-orders-before', '100'])
+    assert "{'pair_snapshots': 2, 'orders': 1}" in capsys.readouterr().out
+    with HistoryStore(path) as store:
+        assert store.stats()['pair_snapshots'] == 2 and store.stats()['orders'] == 1
+
+
+@pytest.mark.asyncio
+async def test_sdk_sync_history(offline_sdk):
+    with pytest.raises(ValueError, match='history_path'):
+        await offline_sdk.sync_history()
+
+    offline_sdk.subgraph = HistorySubgraph(ORDERS, TRADES, head=140)
+    offline_sdk.history = HistoryStore()
+    assert (await offline_sdk.sync_history())['orders'] == 5
+    assert offline_sdk.history.get_trades(OTHER) == [TRADES['3']]
+
+
+@pytest.mark.asyncio
+async def test_subgraph_history_queries_are_paged(subgraph_server):
+    def handler(body):
+        variables = body['variables']
+        if 'orders(' in body['query']:
+            return {'orders': [make_order(30, 100)]}
+        ids = [trade_id for trade_id in variables['trade_ids'] if f'trade-{trade_id}' > variables['last_id']]
+        return {'trades': [make_trade(int(trade_id)) for trade_id in ids[:variables['page_size']]]}
+    subgraph_server['handler'] = handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        orders = await client.get_orders_executed_between(100, 200, last_id='29', page_size=10, block_number=200)
+        trades = await client.get_trades_by_trade_ids([3, 1, 2, 1], page_size=2, block_number=200)
+        assert await client.get_trades_by_trade_ids([]) == []
+    finally:
+        await client.close()
+
+    assert [o['id'] for o in orders] == ['30']
+    assert [t['tradeID'] for t in trades] == ['1', '2', '3']
+    first = subgraph_server['bodies'][0]['variables']
+    assert first == {'from_block': '100', 'to_block': '200', 'last_id': '29', 'page_size': 10, 'block': {'number': 200}}
+    assert [body['variables']['last_id'] for body in subgraph_server['bodies'][1:]] == ['', 'trade-2']
@@ -0,0 +1,146 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import rlp
+from eth_account import Account
+from web3 import Web3
+
+from ostium_python_sdk.nonce import NonceManager, is_nonce_too_low_error
+from ostium_python_sdk.ostium import Ostium
+
+ADDRESS = '0x0000000000000000000000000000000000000001'
+PRIVATE_KEY = '0x' + '11' * 32
+
+
+class Chain:
+    """Stands in for the node: counts nonce fetches and accepts each nonce once"""
+
+    def __init__(self, nonce=5):
+        self.nonce = nonce
+        self.fetches = 0
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def fetch_nonce(self, address):
+        self.fetches += 1
+        return self.nonce
+
+    def send(self, nonce):
+        with self.lock:
+            if nonce < self.nonce or nonce in self.sent:
+                raise ValueError({'code': -32000, 'message': 'nonce too low'})
+            self.sent.append(nonce)
+            return nonce
+
+
+def test_allocates_locally_after_first_sync():
+    chain = Chain()
+    manager = NonceManager(chain.fetch_nonce)
+    assert [manager.allocate(ADDRESS) for _ in range(3)] == [5, 6, 7]
+    assert manager.peek(ADDRESS) == 8
+    assert chain.fetches == 1
+
+
+def test_concurrent_allocations_are_unique():
+    chain = Chain()
+    manager = NonceManager(chain.fetch_nonce)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        nonces = list(pool.map(lambda _: manager.send(ADDRESS, chain.send), range(50)))
+    assert sorted(nonces) == list(range(5, 55))
+    # threads racing on the first allocation may each read the node, only one count is kept
+    assert 1 <= chain.fetches <= 16
+
+
+def test_node_is_not_read_under_the_lock():
+    chain = Chain()
+    manager = NonceManager(chain.fetch_nonce)
+    locked = []
+    manager.fetch_nonce = lambda address: locked.append(manager._lock.locked()) or chain.fetch_nonce(address)
+    assert manager.allocate(ADDRESS) == 5
+    assert manager.resync(ADDRESS, min_nonce=7) == 7
+    assert locked == [False, False]
+
+
+def test_resyncs_on_nonce_too_low():
+    chain = Chain()
+    manager = NonceManager(chain.fetch_nonce)
+    manager.allocate(ADDRESS)
+    manager.reset()
+    manager.allocate(ADDRESS)
+    # meanwhile another client sent 3 transactions from the same address
+    chain.nonce = 9
+    assert manager.send(ADDRESS, chain.send) == 9
+    assert manager.peek(ADDRESS) == 10
+
+
+def test_gives_up_after_max_retries():
+    def always_too_low(nonce):
+        raise ValueError('nonce too low: next nonce 100, tx nonce 1')
+
+    manager = NonceManager(Chain().fetch_nonce, max_retries=2)
+    with pytest.raises(ValueError, match='nonce too low'):
+        manager.send(ADDRESS, always_too_low)
+
+
+def test_failed_send_releases_nonce():
+    def insufficient_funds(nonce):
+        raise ValueError('insufficient funds for gas * price + value')
+
+    chain = Chain()
+    manager = NonceManager(chain.fetch_nonce)
+    with pytest.raises(ValueError, match='insufficient funds'):
+        manager.send(ADDRESS, insufficient_funds)
+    assert manager.send(ADDRESS, chain.send) == 5
+
+    # releasing an earlier nonce leaves a gap, the next allocation resyncs
+    first = manager.allocate(ADDRESS)
+    manager.allocate(ADDRESS)
+    manager.release(ADDRESS, first)
+    assert manager.peek(ADDRESS) is None
+
+
+def test_is_nonce_too_low_error():
+    assert is_nonce_too_low_error(ValueError({'code': -32000, 'message': 'Nonce too low'}))
+    assert is_nonce_too_low_error('replacement transaction underpriced')
+    assert not is_nonce_too_low_error('execution reverted')
+
+
+def _offline_ostium(monkeypatch, **kwargs):
+    w3 = Web3(Web3.HTTPProvider('http://127.0.0.1:9'))
+    ostium = Ostium(w3, ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY, **kwargs)
+    chain = Chain(nonce=3)
+    counts = {'get_transaction_count': 0}
+
+    def get_transaction_count(address, block_identifier=None):
+        counts['get_transaction_count'] += 1
+        return chain.nonce
+
+    def send_raw_transaction(raw):
+        # legacy transaction: rlp([nonce, gasPrice, gas, to, value, data, v, r, s])
+        assert Account.recover_transaction(raw) == ostium.get_public_address()
+        return chain.send(int.from_bytes(rlp.decode(raw)[0], 'big'))
+
+    monkeypatch.setattr(w3.eth, 'get_transaction_count', get_transaction_count)
+    monkeypatch.setattr(w3.eth, 'send_raw_transaction', send_raw_transaction)
+    return ostium, chain, counts
+
+
+def _tx():
+    return {'to': ADDRESS, 'value': 0, 'gas': 21000, 'gasPrice': 10**8, 'chainId': 42161, 'data': '0x'}
+
+
+def test_ostium_sends_without_nonce_round_trips(monkeypatch):
+    ostium, chain, counts = _offline_ostium(monkeypatch, manage_nonces=True)
+    account = Account.from_key(PRIVATE_KEY)
+    assert [ostium._send_transaction(_tx(), account) for _ in range(4)] == [3, 4, 5, 6]
+    assert counts['get_transaction_count'] == 1
+
+
+def test_ostium_unmanaged_nonces_read_the_node(monkeypatch):
+    # unmanaged is the default
+    ostium, chain, counts = _offline_ostium(monkeypatch)
+    account = Account.from_key(PRIVATE_KEY)
+    assert ostium.nonce_manager is None
+    assert ostium._send_transaction(_tx(), account) == 3
+    assert counts['get_transaction_count'] == 1
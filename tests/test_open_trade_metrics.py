@@ -0,0 +1,115 @@
+import time
+import pytest
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics
+from tests.conftest import make_open_trade, make_subgraph_pair
+
+TRADER = '0x0000000000000000000000000000000000000001'
+
+
+def _setup(offline_sdk, price_server):
+    offline_sdk.price.base_url = price_server['base_url']
+    offline_sdk.subgraph.open_trades = {TRADER: [
+        make_open_trade(make_subgraph_pair(0, 'BTC', 'USD'), index=0),
+        make_open_trade(make_subgraph_pair(1, 'ETH', 'USD'), index=0, isBuy=False),
+    ]}
+
+
+@pytest.mark.asyncio
+async def test_open_trade_metrics_matches_get_trade_metrics(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+    timings = {}
+
+    metrics = await offline_sdk.get_open_trade_metrics(1, 0, timings=timings)
+    await offline_sdk.price.close()
+
+    trade = offline_sdk.subgraph.open_trades[TRADER][1]
+    price_data = next(p for p in price_server['feeds'] if p['from'] == 'ETH')
+    assert metrics == get_trade_metrics(trade, price_data, 12000, 100.0, '25')
+    assert set(timings) == {'open_trades', 'liq_margin_threshold_p', 'price', 'block_number',
+                            'pair_max_leverage', 'compute', 'total'}
+
+
+@pytest.mark.asyncio
+async def test_dependencies_are_fetched_concurrently(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+    offline_sdk.subgraph.latency = 0.1
+    offline_sdk.ostium.latency = 0.1
+    price_server['latency'] = 0.1
+
+    start = time.perf_counter()
+    await offline_sdk.get_open_trade_metrics(0, 0)
+    elapsed = time.perf_counter() - start
+    await offline_sdk.price.close()
+
+    # five dependencies of 100ms each, run side by side (the block number read included)
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_trade_not_found(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+    with pytest.raises(ValueError, match="Trade not found"):
+        await offline_sdk.get_open_trade_metrics(0, 5)
+    await offline_sdk.price.close()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_metrics_fetch_each_dependency_once(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+    other = '0x00000000000000000000000000000000000000aa'
+    offline_sdk.subgraph.open_trades[other] = [
+        make_open_trade(make_subgraph_pair(0, 'BTC', 'USD'), index=3, trader=other, collateral='500000000'),
+        make_open_trade(make_subgraph_pair(2, 'XXX', 'USD'), index=0, trader=other),
+    ]
+    offline_sdk.subgraph.pairs.append(make_subgraph_pair(2, 'XXX', 'USD'))
+    offline_sdk.price.max_age = 60
+
+    portfolio = await offline_sdk.get_all_open_trade_metrics([TRADER, other])
+
+    assert offline_sdk.subgraph.calls == {'get_open_trades_for_traders': 1, 'get_liq_margin_threshold_p': 1,
+                                          'get_pairs_details': 1}
+    assert offline_sdk.ostium.calls['get_block_number'] == 1
+    assert price_server['requests'] == 1
+
+    positions = portfolio['positions']
+    assert [(p['trader'], p['pair_id'], p['index']) for p in positions] == [
+        (TRADER, 0, 0), (TRADER, 1, 0), (other, 0, 3), (other, 2, 0)]
+    # no price for XXX/USD
+    assert positions[3]['metrics'] is None
+    for position in positions[:3]:
+        assert position['metrics'] == await offline_sdk.get_open_trade_metrics(
+            position['pair_id'], position['index'], trader_address=position['trader'])
+    await offline_sdk.price.close()
+
+    totals = portfolio['totals']
+    assert totals['positions'] == 3
+    assert totals['collateral'] == 2500.0
+    assert totals['pnl'] == pytest.approx(sum(p['metrics']['pnl'] for p in positions[:3]))
+    assert totals['funding'] == pytest.approx(sum(p['metrics']['funding'] for p in positions[:3]))
+    assert portfolio['by_trader'][other]['positions'] == 1
+    assert portfolio['block_number'] == 12000
+
+    # the ETH short opened at 95 is 3.3% away from liquidation, the BTC longs about 14%
+    assert totals['margin_at_risk'] == 1000.0
+    wide = await offline_sdk.get_all_open_trade_metrics([TRADER, other], risk_buffer_p=20)
+    narrow = await offline_sdk.get_all_open_trade_metrics([TRADER, other], risk_buffer_p=1)
+    assert wide['totals']['margin_at_risk'] == 2500.0
+    assert narrow['totals']['margin_at_risk'] == 0.0
+    await offline_sdk.price.close()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_counts_a_repeated_trader_once(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+    other = '0x00000000000000000000000000000000000000ab'
+    offline_sdk.subgraph.open_trades[other] = [
+        make_open_trade(make_subgraph_pair(0, 'BTC', 'USD'), index=3, trader=other)]
+
+    portfolio = await offline_sdk.get_all_open_trade_metrics(['0x00000000000000000000000000000000000000Ab', other, TRADER])
+    single = await offline_sdk.get_all_open_trade_metrics([other, TRADER])
+    await offline_sdk.price.close()
+
+    assert [(p['trader'], p['pair_id'], p['index']) for p in portfolio['positions']] == [
+        (other, 0, 3), (TRADER, 0, 0), (TRADER, 1, 0)]
+    assert list(portfolio['by_trader']) == [other, TRADER]
+    assert portfolio['totals'] == single['totals']
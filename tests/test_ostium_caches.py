@@ -0,0 +1,75 @@
+from web3 import Web3
+
+from ostium_python_sdk.abi.trading_abi import trading_abi
+from ostium_python_sdk.ostium import Ostium
+from ostium_python_sdk.utils import build_event_topics
+from tests.conftest import ADDRESS, PRIVATE_KEY, serve_transactions
+
+
+def offline_ostium(rpc_node, provider_cache=True, **kwargs):
+    mined = {}
+    sent = serve_transactions(rpc_node, mined)
+    send_raw_transaction = rpc_node['methods']['eth_sendRawTransaction']
+
+    def send_and_mine(params):
+        tx_hash = send_raw_transaction(params)
+        mined[tx_hash] = 42
+        return tx_hash
+    rpc_node['methods']['eth_sendRawTransaction'] = send_and_mine
+    # like OstiumSDK, let the provider cache web3's own eth_chainId validation lookups
+    provider = Web3.HTTPProvider(rpc_node['url'], cache_allowed_requests=provider_cache,
+                                 cacheable_requests={'eth_chainId'})
+    return Ostium(Web3(provider), ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY, **kwargs), sent
+
+
+def test_account_and_chain_id_are_cached(rpc_node):
+    ostium, sent = offline_ostium(rpc_node)
+    account = ostium._get_account()
+
+    assert ostium.close_trade(0, 0, 100.0)['order_id'] == 42
+    chain_id_calls = rpc_node['calls']['eth_chainId']
+    results = [ostium.close_trade(pair_id, 0, 100.0) for pair_id in range(1, 3)]
+
+    assert [r['order_id'] for r in results] == [42, 42]
+    assert ostium._get_account() is account
+    # no more chain id lookups after the first transaction
+    assert rpc_node['calls']['eth_chainId'] == chain_id_calls
+    assert ostium.get_chain_id() == 42161
+
+    # a new key is derived again
+    ostium.private_key = '0x' + '22' * 32
+    assert ostium._get_account() is not account and ostium.get_public_address() != ADDRESS
+
+
+def test_known_chain_id_is_not_fetched_for_build_transaction(rpc_node):
+    ostium, sent = offline_ostium(rpc_node, provider_cache=False)
+    ostium.update_sl(1, 0, 90)
+    ostium.update_sl(1, 0, 80)
+    unknown = rpc_node['calls'].pop('eth_chainId')
+
+    ostium, sent = offline_ostium(rpc_node, provider_cache=False, chain_id=42161)
+    ostium.update_sl(1, 0, 90)
+    ostium.update_sl(1, 0, 80)
+    # what is left are web3's own validation lookups of the uncached provider
+    assert rpc_node['calls']['eth_chainId'] < unknown
+
+
+def test_delegated_calldata_is_encoded_locally(rpc_node):
+    ostium, sent = offline_ostium(rpc_node, use_delegation=True, chain_id=42161)
+    estimates = []
+    rpc_node['methods']['eth_estimateGas'] = lambda params: estimates.append(params[0]) or '0x30d40'
+    trader = Web3.to_checksum_address('0x00000000000000000000000000000000000000aa')
+    ostium.cancel_limit_order(2, 1, trader_address=trader)
+
+    # a single estimate for the outer delegatedAction transaction
+    assert rpc_node['calls']['eth_estimateGas'] == 1
+    inner = ostium.ostium_trading_contract.encode_abi('cancelOpenLimitOrder', args=[2, 1])
+    assert ostium._encode_call('cancelOpenLimitOrder', [2, 1]) == inner
+    outer = ostium.ostium_trading_contract.encode_abi('delegatedAction', args=[trader, inner])
+    assert estimates[0]['data'] == outer
+
+
+def test_build_event_topics():
+    topics = build_event_topics(trading_abi)
+    assert topics['TpUpdated'] == Web3.keccak(text='TpUpdated(uint256,address,uint16,uint8,uint192)')
+    assert len(topics) == len([entry for entry in trading_abi if entry.get('type') == 'event'])
@@ -0,0 +1,103 @@
+import pytest
+from ostium_python_sdk.pair_cache import PairDetailsCache, STATIC_GROUP_FIELDS, STATIC_PAIR_FIELDS
+from ostium_python_sdk.subgraph import SubgraphClient
+from tests.conftest import make_subgraph_pair
+
+
+def _handler(body):
+    variables = body.get('variables') or {}
+    if 'pair_id' in variables:
+        return {'pair': make_subgraph_pair(int(variables['pair_id']))}
+    return {'pairs': [make_subgraph_pair(int(pair_id)) for pair_id in variables['pair_ids']]}
+
+
+def test_static_and_dynamic_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('ostium_python_sdk.pair_cache.time.monotonic', lambda: now[0])
+    cache = PairDetailsCache(static_ttl=60, dynamic_ttl=2)
+    cache.put(make_subgraph_pair(1))
+
+    assert cache.get(1)['longOI'] == make_subgraph_pair(1)['longOI']
+    static = cache.get(1, static_only=True)
+    assert set(static) <= STATIC_PAIR_FIELDS and 'maxLeverage' in static
+
+    now[0] += 5
+    assert cache.get(1) is None
+    assert cache.get(1, static_only=True) is not None
+    now[0] += 60
+    assert cache.get(1, static_only=True) is None
+
+    assert cache.stats() == {'hits': 3, 'misses': 2, 'hit_rate': 0.6, 'static_hits': 2,
+                             'dynamic_hits': 1, 'evictions': 0, 'size': 1}
+
+
+def test_block_lag_and_lru_eviction():
+    cache = PairDetailsCache(maxsize=2, dynamic_ttl=60, max_block_lag=10)
+    cache.observe_block(100)
+    cache.put(make_subgraph_pair(0))
+    cache.put(make_subgraph_pair(1))
+    cache.observe_block(105)
+    assert cache.get(0) is not None
+    cache.observe_block(111)
+    assert cache.get(0) is None
+    # static fields are not affected by new blocks
+    assert cache.get(0, static_only=True) is not None
+
+    # 0 was used last, so 1 is evicted
+    cache.put(make_subgraph_pair(2))
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get(1, static_only=True) is None
+    assert cache.get(0, static_only=True) is not None
+
+    cache.invalidate(0)
+    assert cache.get(0, static_only=True) is None
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_subgraph_serves_static_lookups_from_cache(subgraph_server):
+    subgraph_server['handler'] = _handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        first = await client.get_pair_details(3, static_only=True)
+        again = await client.get_pair_details(3, static_only=True)
+        assert first == again and 'longOI' not in first
+        assert subgraph_server['requests'] == 1
+
+        # dynamic fields are not cached by default
+        full = await client.get_pair_details(3)
+        assert 'longOI' in full
+        assert subgraph_server['requests'] == 2
+
+        # only the missing pair is queried
+        pairs = await client.get_pairs_details([3, 4], static_only=True)
+        assert sorted(pairs) == [3, 4]
+        assert subgraph_server['bodies'][-1]['variables'] == {'pair_ids': ['4']}
+        assert subgraph_server['requests'] == 3
+        assert client.pair_cache.hit_rate > 0
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_group_collateral_is_not_served_from_static_cache(subgraph_server):
+    long_collateral = ['100']
+
+    def handler(body):
+        pair = make_subgraph_pair(int(body['variables']['pair_id']))
+        pair['group'] = dict(pair['group'], longCollateral=long_collateral[0])
+        return {'pair': pair}
+    subgraph_server['handler'] = handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        static = await client.get_pair_details(0, static_only=True)
+        assert set(static['group']) == STATIC_GROUP_FIELDS
+        assert static['group']['maxCollateralP'] == make_subgraph_pair(0)['group']['maxCollateralP']
+
+        # the dynamic fetch returns the current group collateral, not the cached one
+        long_collateral[0] = '250'
+        assert (await client.get_pair_details(0))['group']['longCollateral'] == '250'
+        assert 'longCollateral' not in (await client.get_pair_details(0, static_only=True))['group']
+    finally:
+        await client.close()
@@ -0,0 +1,75 @@
+import pytest
+from ostium_python_sdk.subgraph import SubgraphClient
+from tests.conftest import make_subgraph_pair
+
+
+def _pairs_handler(body):
+    ids = body['variables']['pair_ids']
+    return {'pairs': [make_subgraph_pair(int(pair_id)) for pair_id in ids if int(pair_id) < 5]}
+
+
+@pytest.mark.asyncio
+async def test_get_pairs_details_single_query(subgraph_server):
+    subgraph_server['handler'] = _pairs_handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        pairs = await client.get_pairs_details([3, 0, '1'])
+        assert subgraph_server['requests'] == 1
+        assert subgraph_server['bodies'][0]['variables'] == {'pair_ids': ['3', '0', '1']}
+        assert sorted(pairs) == [0, 1, 3]
+        assert pairs[3]['id'] == '3'
+
+        assert await client.get_pairs_details([]) == {}
+        assert subgraph_server['requests'] == 1
+
+        with pytest.raises(ValueError):
+            await client.get_pairs_details([1, 7])
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_sdk_methods_match_single_pair_methods(offline_sdk):
+    offline_sdk.subgraph.pairs = [
+        make_subgraph_pair(0, 'BTC', 'USD'),
+        make_subgraph_pair(1, 'ETH', 'USD', rolloverFeePerBlock='1000000000', longOI='900000000000000000',
+                           group=dict(make_subgraph_pair()['group'], maxLeverage='5000')),
+    ]
+    pair_ids = [0, 1]
+
+    max_leverage = await offline_sdk.get_pairs_max_leverage(pair_ids)
+    rollover = await offline_sdk.get_rollover_rates_for_pair_ids(pair_ids, period_hours=8)
+    funding = await offline_sdk.get_funding_rates_for_pair_ids(pair_ids, period_hours=8)
+    target = await offline_sdk.get_target_funding_rates(pair_ids)
+    assert offline_sdk.subgraph.calls == {'get_pairs_details': 4}
+    assert offline_sdk.ostium.calls['get_block_number'] == 1
+
+    for pair_id in pair_ids:
+        assert max_leverage[pair_id] == await offline_sdk.get_pair_max_leverage(pair_id)
+        assert rollover[pair_id] == await offline_sdk.get_rollover_rate_for_pair_id(pair_id, period_hours=8)
+        assert funding[pair_id] == await offline_sdk.get_funding_rate_for_pair_id(pair_id, period_hours=8)
+        assert target[pair_id] == await offline_sdk.get_target_funding_rate(pair_id)
+
+    assert max_leverage == {0: 100, 1: 50}
+
+
+@pytest.mark.asyncio
+async def test_open_trades_for_traders_pages_by_id(subgraph_server):
+    trades = [{'id': f"{i:04d}", 'trader': '0xAA' if i % 2 else '0xbb'} for i in range(5)]
+
+    def handler(body):
+        variables = body['variables']
+        assert variables['traders'] == ['0xaa', '0xbb', '0xcc']
+        page = [t for t in trades if t['id'] > variables['last_id']]
+        return {'trades': page[:variables['page_size']]}
+
+    subgraph_server['handler'] = handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        result = await client.get_open_trades_for_traders(['0xAA', '0xbb', '0xCC'], page_size=2)
+        assert subgraph_server['requests'] == 3
+        assert [t['id'] for t in result['0xaa']] == ['0001', '0003']
+        assert [t['id'] for t in result['0xbb']] == ['0000', '0002', '0004']
+        assert result['0xcc'] == []
+    finally:
+        await client.close()
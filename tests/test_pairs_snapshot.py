@@ -0,0 +1,106 @@
+import pytest
+from web3 import AsyncWeb3, Web3
+
+from ostium_python_sdk.abi.pairs_info_abi import pairs_info_abi
+from ostium_python_sdk.abi.pairs_storage_abi import pairs_storage_abi
+from ostium_python_sdk.abi.trading_storage_abi import trading_storage_abi
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics
+from ostium_python_sdk.pairs_snapshot import AsyncPairSnapshotLoader, PairSnapshotLoader
+from tests.conftest import make_open_trade, make_subgraph_pair, serve_contracts
+
+PAIRS_INFO = '0x00000000000000000000000000000000000000D1'
+PAIRS_STORAGE = '0x00000000000000000000000000000000000000D2'
+TRADING_STORAGE = '0x00000000000000000000000000000000000000D3'
+SUBGRAPH_PAIRS = [make_subgraph_pair(0, 'BTC', 'USD'),
+                  make_subgraph_pair(1, 'ETH', 'USD', accFundingLong='-5000', longOI='900000000000000000', lastFundingRate='-7')]
+
+
+def bytes32(text):
+    return text.encode().ljust(32, b'\0')
+
+
+def fake_contracts(pairs):
+    """PairsInfo / PairsStorage / TradingStorage answering with the values of subgraph `pairs`"""
+    def pair(pair_id):
+        return pairs[pair_id]
+
+    pairs_storage = {
+        'pairsCount': lambda: len(pairs),
+        'groupsCount': lambda: 1,
+        'pairs': lambda i: (bytes32(pair(i)['from']), bytes32(pair(i)['to']), bytes.fromhex(pair(i)['feed'][2:]),
+                            0, int(pair(i)['overnightMaxLeverage']), 1, int(pair(i)['group']['id']), 0, 'oracle'),
+        'groups': lambda g: (bytes32('crypto'), 0, 200, 1000),
+        'getAllPairsMaxLeverage': lambda: [int(p['maxLeverage']) for p in pairs],
+        'pairMinLevPos': lambda i: int(pair(i)['fee']['minLevPos']),
+    }
+    pairs_info = {
+        'liqMarginThresholdP': lambda: 25,
+        'pairFundingFees': lambda i: (
+            int(pair(i)['accFundingLong']), int(pair(i)['accFundingShort']), int(pair(i)['lastFundingRate']),
+            int(pair(i)['hillInflectionPoint']), int(pair(i)['maxFundingFeePerBlock']), int(pair(i)['springFactor']),
+            int(pair(i)['lastFundingBlock']), int(pair(i)['hillPosScale']), int(pair(i)['hillNegScale']),
+            int(pair(i)['sFactorUpScaleP']), int(pair(i)['sFactorDownScaleP']), 0),
+        'pairRolloverFees': lambda i: (
+            int(pair(i)['accRollover']), int(pair(i)['rolloverFeePerBlock']), 0, 0, int(pair(i)['lastRolloverBlock']), 0),
+        'getHillFunctionParams': lambda i: (
+            int(pair(i)['hillInflectionPoint']), int(pair(i)['hillPosScale']), int(pair(i)['hillNegScale'])),
+        'getFrSpringFactor': lambda i: int(pair(i)['springFactor']),
+        'pairOpeningFees': lambda i: (
+            int(pair(i)['makerFeeP']), int(pair(i)['takerFeeP']), 0, 0, int(pair(i)['makerMaxLeverage']), 0),
+    }
+    trading_storage = {
+        'getPairOpeningInterestInfo': lambda i: (int(pair(i)['longOI']), int(pair(i)['shortOI']), int(pair(i)['maxOI'])),
+    }
+    return {PAIRS_INFO: (pairs_info_abi, pairs_info), PAIRS_STORAGE: (pairs_storage_abi, pairs_storage),
+            TRADING_STORAGE: (trading_storage_abi, trading_storage)}
+
+
+def test_snapshot_is_block_pinned_and_feeds_trade_metrics(rpc_node):
+    serve_contracts(rpc_node, fake_contracts(SUBGRAPH_PAIRS), block_number=12000)
+    loader = PairSnapshotLoader(Web3(Web3.HTTPProvider(rpc_node['url'])), PAIRS_INFO, PAIRS_STORAGE, TRADING_STORAGE)
+
+    snapshot = loader.load()
+
+    assert rpc_node['calls']['eth_call'] == 2
+    # pinned to the L2 head, not to Multicall3.getBlockNumber() (the L1 block on Arbitrum)
+    assert rpc_node['call_blocks'] == [hex(12000), hex(12000)]
+    assert snapshot['block_number'] == 12000 and snapshot['liq_margin_threshold_p'] == '25'
+    assert sorted(snapshot['pairs']) == [0, 1]
+    for pair_id, subgraph_pair in enumerate(SUBGRAPH_PAIRS):
+        pair = snapshot['pairs'][pair_id]
+        # every on-chain field has the subgraph value, in the subgraph representation
+        assert {key: subgraph_pair[key] for key in pair if key != 'group'} == {
+            key: value for key, value in pair.items() if key != 'group'}
+        assert pair['group'] == {key: subgraph_pair['group'][key] for key in pair['group']}
+
+        trade = make_open_trade(subgraph_pair, funding='1000000000')
+        price = {'mid': 101.0, 'bid': 100.99, 'ask': 101.01, 'isMarketOpen': True}
+        assert get_trade_metrics({**trade, 'pair': pair}, price, snapshot['block_number'], 100.0,
+                                 snapshot['liq_margin_threshold_p']) == \
+            get_trade_metrics(trade, price, 12000, 100.0, '25')
+
+    # an explicit block is read as is, and reported back
+    rpc_node['call_blocks'].clear()
+    assert loader.load(pair_ids=[0], block_identifier=11000)['block_number'] == 11000
+    assert rpc_node['call_blocks'] == [hex(11000), hex(11000)]
+    assert rpc_node['calls']['eth_getBlockByNumber'] == 1
+
+
+@pytest.mark.asyncio
+async def test_sdk_pairs_snapshot(offline_sdk, rpc_node):
+    with pytest.raises(ValueError, match='pairsInfo'):
+        await offline_sdk.get_pairs_snapshot()
+
+    serve_contracts(rpc_node, fake_contracts(SUBGRAPH_PAIRS))
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_node['url']))
+    offline_sdk.pair_snapshots = AsyncPairSnapshotLoader(w3, PAIRS_INFO, PAIRS_STORAGE, TRADING_STORAGE, max_calls=5)
+    try:
+        snapshot = await offline_sdk.get_pairs_snapshot(pair_ids=[1])
+    finally:
+        await w3.provider.disconnect()
+
+    assert list(snapshot['pairs']) == [1]
+    assert snapshot['block_number'] == 16 and set(rpc_node['call_blocks']) == {hex(16)}
+    assert snapshot['pairs'][1]['from'] == 'ETH' and snapshot['pairs'][1]['accFundingLong'] == '-5000'
+    # 2 counts in one call, 3 + 8 calls in chunks of 5
+    assert rpc_node['calls']['eth_call'] == 1 + 3
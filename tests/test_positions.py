@@ -0,0 +1,101 @@
+import pytest
+from web3 import AsyncWeb3, Web3
+
+from ostium_python_sdk.abi.trading_storage_abi import trading_storage_abi
+from ostium_python_sdk.positions import AsyncPositionReader, PositionReader
+from tests.conftest import ADDRESS, serve_contracts
+
+STORAGE = '0x00000000000000000000000000000000000000C0'
+TRADER = Web3.to_checksum_address('0x00000000000000000000000000000000000000aa')
+ZERO_ADDRESS = '0x' + '00' * 20
+MAX_TRADES_PER_PAIR = 3
+
+
+def fake_trading_storage(trades, limit_orders):
+    """TradingStorage view functions over {(trader, pair, index): collateral} dicts"""
+    def key(trader, pair_id, index):
+        return trader.lower(), pair_id, index
+
+    def get_open_trade(trader, pair_id, index):
+        if key(trader, pair_id, index) not in trades:
+            return (0, 0, 0, 0, ZERO_ADDRESS, 0, 0, 0, False)
+        return (trades[key(trader, pair_id, index)], 100 * 10**18, 0, 0, trader, 1000, pair_id, index, True)
+
+    def get_open_trade_info(trader, pair_id, index):
+        trade_id = 1000 * pair_id + index if key(trader, pair_id, index) in trades else 0
+        return (trade_id, 10**18, 1000, 0, 0, 1700000000, False)
+
+    def get_open_limit_order(trader, pair_id, index):
+        if key(trader, pair_id, index) not in limit_orders:
+            raise ValueError('no limit order')
+        return (limit_orders[key(trader, pair_id, index)], 90 * 10**18, 0, 0, trader, 500,
+                1700000000, 1700000000, pair_id, 1, index, False)
+
+    def count(book):
+        return lambda trader, pair_id: sum(1 for t, p, _ in book if t == trader.lower() and p == pair_id)
+
+    return (trading_storage_abi, {
+        'maxTradesPerPair': lambda: MAX_TRADES_PER_PAIR,
+        'openTradesCount': count(trades),
+        'openLimitOrdersCount': count(limit_orders),
+        'getOpenTrade': get_open_trade,
+        'getOpenTradeInfo': get_open_trade_info,
+        'getOpenLimitOrder': get_open_limit_order,
+    })
+
+
+TRADES = {(TRADER.lower(), 1, 0): 100, (TRADER.lower(), 1, 2): 200, (TRADER.lower(), 5, 1): 300,
+          (ADDRESS.lower(), 1, 0): 400}
+LIMIT_ORDERS = {(TRADER.lower(), 7, 0): 50}
+
+
+def test_positions_load_in_two_pinned_round_trips(rpc_node):
+    serve_contracts(rpc_node, {STORAGE: fake_trading_storage(TRADES, LIMIT_ORDERS)}, block_number=1234)
+    reader = PositionReader(Web3(Web3.HTTPProvider(rpc_node['url'])), STORAGE)
+
+    positions = reader.get_positions(TRADER, range(20))
+
+    assert rpc_node['calls']['eth_call'] == 2
+    # both rounds are read at the L2 head, not at Multicall3.getBlockNumber() (the L1 block on Arbitrum)
+    assert rpc_node['calls']['eth_getBlockByNumber'] == 1
+    assert rpc_node['call_blocks'] == [hex(1234), hex(1234)]
+    assert positions['block_number'] == 1234
+    assert [(t['pairIndex'], t['index'], t['collateral'], t['tradeId']) for t in positions['trades']] == [
+        (1, 0, 100, 1000), (1, 2, 200, 1002), (5, 1, 300, 5001)]
+    assert positions['trades'][0]['trader'] == TRADER and positions['trades'][0]['buy'] is True
+    assert [(o['pairIndex'], o['index'], o['collateral']) for o in positions['limit_orders']] == [(7, 0, 50)]
+
+
+def test_calls_are_chunked(rpc_node):
+    serve_contracts(rpc_node, {STORAGE: fake_trading_storage(TRADES, LIMIT_ORDERS)})
+    w3 = Web3(Web3.HTTPProvider(rpc_node['url']))
+    expected = PositionReader(w3, STORAGE).get_positions([TRADER, ADDRESS], range(20))
+    rpc_node['calls'].clear()
+
+    rpc_node['call_blocks'].clear()
+    positions = PositionReader(w3, STORAGE, max_calls=10).get_positions([TRADER, ADDRESS], range(20))
+
+    # round 1: 1 + 2 traders * 20 pairs * 2 counts = 81 calls -> 9 chunks
+    # round 2: 3 pairs with trades * 3 slots * 2 calls + 1 pair with orders * 3 slots = 21 calls -> 3 chunks
+    assert rpc_node['calls']['eth_call'] == 9 + 3
+    assert set(rpc_node['call_blocks']) == {hex(16)}
+    assert positions == expected
+    assert len(positions['trades']) == 4
+
+
+@pytest.mark.asyncio
+async def test_sdk_reads_positions_onchain(offline_sdk, rpc_node):
+    serve_contracts(rpc_node, {STORAGE: fake_trading_storage(TRADES, LIMIT_ORDERS)})
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_node['url']))
+    offline_sdk.positions = AsyncPositionReader(w3, STORAGE, max_calls=10)
+    try:
+        positions = await offline_sdk.get_open_positions_onchain()
+        by_trader = await offline_sdk.get_open_positions_onchain(TRADER, pair_ids=[1, 5, 7])
+    finally:
+        await w3.provider.disconnect()
+
+    # defaults: the SDK signer over the pairs listed by the subgraph (0 and 1)
+    assert [(t['trader'], t['pairIndex'], t['collateral']) for t in positions['trades']] == [(ADDRESS, 1, 400)]
+    assert len(by_trader['trades']) == 3 and len(by_trader['limit_orders']) == 1
+    # concurrent chunks of both rounds are all pinned to the head
+    assert positions['block_number'] == 16 and set(rpc_node['call_blocks']) == {hex(16)}
@@ -0,0 +1,36 @@
+import pytest
+from ostium_python_sdk.price import Price, PriceSnapshot
+
+
+def test_snapshot_index_keeps_first_entry():
+    first = {'from': 'BTC', 'to': 'USD', 'mid': 1, 'feed_id': '0xAB'}
+    second = {'from': 'BTC', 'to': 'USD', 'mid': 2, 'feed_id': '0xab'}
+    snapshot = PriceSnapshot([first, second])
+
+    assert snapshot.get('BTC', 'USD') is first
+    assert snapshot.get_by_feed_id('0xab') is first
+    assert snapshot.get('ETH', 'USD') is None
+
+
+@pytest.mark.asyncio
+async def test_get_prices_bulk_from_one_snapshot(price_server):
+    async with Price(base_url=price_server['base_url']) as price:
+        prices = await price.get_prices([("BTC", "USD"), ("EUR", "USD"), ("XXX", "USD")])
+
+    assert price_server['requests'] == 1
+    assert prices == {
+        ("BTC", "USD"): (100.0, True, False),
+        ("EUR", "USD"): (102.0, True, False),
+    }
+
+
+@pytest.mark.asyncio
+async def test_lookup_by_feed_id(price_server):
+    feed_id = price_server['feeds'][1]['feed_id']
+    async with Price(base_url=price_server['base_url'], max_age=60) as price:
+        by_feed = await price.get_latest_price_json_by_feed_id(feed_id.upper().replace('0X', '0x'))
+        by_pair = await price.get_latest_price_json("ETH", "USD")
+
+        assert by_feed is by_pair
+        with pytest.raises(ValueError):
+            await price.get_latest_price_json_by_feed_id('0xdead')
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+from ostium_python_sdk.price import Price
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_across_calls(price_server):
+    price = Price(base_url=price_server['base_url'])
+    try:
+        await price.get_latest_prices()
+        session = price._session
+        await price.get_price("BTC", "USD")
+        await price.get_latest_price_json("ETH", "USD")
+
+        assert price._session is session
+        assert not session.closed
+        assert price_server['requests'] == 3
+    finally:
+        await price.close()
+
+    assert session.closed
+    assert price._session is None
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_session(price_server):
+    async with Price(base_url=price_server['base_url']) as price:
+        mid, is_open, is_day_trading_closed = await price.get_price("BTC", "USD")
+        session = price._session
+
+    assert mid == 100.0
+    assert is_open is True
+    assert is_day_trading_closed is False
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_session_recreated_after_close(price_server):
+    price = Price(base_url=price_server['base_url'])
+    await price.get_latest_prices()
+    await price.close()
+
+    prices = await price.get_latest_prices()
+    assert len(prices) == 3
+    await price.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_pair_raises(price_server):
+    async with Price(base_url=price_server['base_url']) as price:
+        with pytest.raises(ValueError):
+            await price.get_price("XXX", "USD")
+
+
+def _start_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    return loop, thread
+
+
+def _stop_loop(loop, thread):
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_session_of_a_running_loop_is_closed_on_that_loop(price_server):
+    price = Price(base_url=price_server['base_url'])
+    loop, thread = _start_loop()
+    try:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(price.get_latest_prices(), loop))
+        old = price._session
+
+        # used from this loop: the old session is closed by its own loop
+        await price.get_latest_prices()
+        for _ in range(100):
+            if old.closed:
+                break
+            await asyncio.sleep(0.01)
+        assert old.closed
+        assert price._session is not old and not price._session.closed
+    finally:
+        await price.close()
+        _stop_loop(loop, thread)
+
+
+@pytest.mark.asyncio
+async def test_session_of_a_closed_loop_is_detached(price_server):
+    price = Price(base_url=price_server['base_url'])
+    loop, thread = _start_loop()
+    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(price.get_latest_prices(), loop))
+    old = price._session
+    connector = old.connector
+    _stop_loop(loop, thread)
+
+    try:
+        await price.get_latest_prices()
+        assert old.closed and old.connector is None
+        await asyncio.gather(*price._closing)
+        assert connector.closed
+    finally:
+        await price.close()
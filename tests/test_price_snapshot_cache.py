@@ -0,0 +1,52 @@
+import asyncio
+import time
+import pytest
+from ostium_python_sdk.price import Price
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_request(price_server):
+    price_server['latency'] = 0.05
+    async with Price(base_url=price_server['base_url']) as price:
+        results = await asyncio.gather(*[price.get_price("BTC", "USD") for _ in range(50)])
+
+    assert price_server['requests'] == 1
+    assert all(r[0] == 100.0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reused_within_max_age(price_server):
+    async with Price(base_url=price_server['base_url'], max_age=60) as price:
+        assert price.snapshot_timestamp is None
+        await price.get_price("BTC", "USD")
+        await price.get_latest_price_json("ETH", "USD")
+        assert price_server['requests'] == 1
+
+        # an explicit, stricter max_age forces a refresh
+        await price.get_price("BTC", "USD", max_age=0)
+        assert price_server['requests'] == 2
+        assert price.snapshot_timestamp == pytest.approx(time.time(), abs=5)
+        assert price.snapshot.age < 5
+
+
+@pytest.mark.asyncio
+async def test_no_reuse_by_default(price_server):
+    async with Price(base_url=price_server['base_url']) as price:
+        await price.get_latest_prices()
+        await price.get_latest_prices()
+
+    assert price_server['requests'] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_fetch(price_server):
+    price_server['latency'] = 0.05
+    async with Price(base_url=price_server['base_url']) as price:
+        first = asyncio.ensure_future(price.get_latest_prices())
+        second = asyncio.ensure_future(price.get_latest_prices())
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        prices = await second
+        assert len(prices) == 3
+        assert price_server['requests'] == 1
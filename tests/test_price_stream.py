@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from ostium_python_sdk.price import Price
+
+
+def _fast(price):
+    price.feed.min_interval = 0.01
+    price.feed.max_interval = 0.05
+    return price
+
+
+@pytest.mark.asyncio
+async def test_first_tick_has_current_prices_then_only_changes(price_server):
+    async with _fast(Price(base_url=price_server['base_url'])) as price:
+        async with price.stream(pairs=[("BTC", "USD"), ("ETH", "USD")]) as ticks:
+            first = await ticks.__anext__()
+            assert set(first) == {("BTC", "USD"), ("ETH", "USD")}
+
+            price_server['feeds'][1] = dict(price_server['feeds'][1], mid=555.0)
+            price_server['feeds'][2] = dict(price_server['feeds'][2], mid=777.0)  # not subscribed
+            second = await asyncio.wait_for(ticks.__anext__(), 2)
+
+            assert list(second) == [("ETH", "USD")]
+            assert second[("ETH", "USD")]['mid'] == 555.0
+
+        await asyncio.sleep(0.1)
+        assert not price.feed.running
+
+
+@pytest.mark.asyncio
+async def test_fan_out_shares_one_poll_loop(price_server):
+    async with _fast(Price(base_url=price_server['base_url'])) as price:
+        subscriptions = [price.stream() for _ in range(10)]
+        ticks = await asyncio.gather(*[s.__anext__() for s in subscriptions])
+        assert all(len(t) == 3 for t in ticks)
+        assert price.feed.subscribers == 10
+
+        await asyncio.sleep(0.2)
+        # one upstream request per poll regardless of the number of consumers
+        assert price_server['requests'] == price.feed.polls
+
+        for s in subscriptions:
+            s.close()
+        assert not price.feed.running
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_conflated(price_server):
+    async with _fast(Price(base_url=price_server['base_url'])) as price:
+        async with price.stream(pairs=[("BTC", "USD")]) as ticks:
+            await ticks.__anext__()
+            for i in range(5):
+                price_server['feeds'][0] = dict(price_server['feeds'][0], mid=200.0 + i)
+                await asyncio.sleep(0.05)
+
+            tick = await ticks.__anext__()
+            assert tick[("BTC", "USD")]['mid'] == 204.0
+            assert ticks.conflated >= 1
+            assert len(ticks._pending) == 0
+
+
+@pytest.mark.asyncio
+async def test_polling_backs_off_without_changes(price_server):
+    async with _fast(Price(base_url=price_server['base_url'])) as price:
+        async with price.stream() as ticks:
+            await ticks.__anext__()
+            await asyncio.sleep(0.3)
+            assert price.feed.interval == price.feed.max_interval
+
+
+@pytest.mark.asyncio
+async def test_break_out_of_async_for_releases_feed(price_server):
+    async with _fast(Price(base_url=price_server['base_url'])) as price:
+        async for tick in price.stream():
+            assert price.feed.running
+            break
+        del tick
+
+        import gc
+        gc.collect()
+        assert price.feed.subscribers == 0
+        assert not price.feed.running
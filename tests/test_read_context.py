@@ -0,0 +1,162 @@
+import pytest
+
+from web3 import AsyncWeb3
+
+from ostium_python_sdk.formulae_wrapper import get_trade_metrics
+from ostium_python_sdk.pairs_snapshot import AsyncPairSnapshotLoader
+from ostium_python_sdk.positions import AsyncPositionReader
+from ostium_python_sdk.read_context import ReadContext
+from ostium_python_sdk.subgraph import SubgraphClient
+from tests.conftest import make_open_trade, make_subgraph_pair, serve_contracts
+from tests.test_pairs_snapshot import PAIRS_INFO, PAIRS_STORAGE, TRADING_STORAGE, fake_contracts
+from tests.test_positions import LIMIT_ORDERS, STORAGE, TRADES, TRADER as ONCHAIN_TRADER, fake_trading_storage
+
+TRADER = '0x0000000000000000000000000000000000000001'
+OTHER = '0x00000000000000000000000000000000000000aa'
+
+
+def _setup(offline_sdk, price_server):
+    offline_sdk.price.base_url = price_server['base_url']
+    offline_sdk.subgraph.open_trades = {
+        TRADER: [make_open_trade(make_subgraph_pair(0, 'BTC', 'USD'), index=0),
+                 make_open_trade(make_subgraph_pair(1, 'ETH', 'USD'), index=0, isBuy=False)],
+        OTHER: [make_open_trade(make_subgraph_pair(0, 'BTC', 'USD'), index=1, trader=OTHER)],
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_share_reads_pinned_to_one_block(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+
+    # the subgraph is 10 blocks behind the node: pin its head so it can serve the queries
+    context = await offline_sdk.read_context()
+    first = await offline_sdk.get_open_trade_metrics(0, 0, context=context)
+    second = await offline_sdk.get_open_trade_metrics(1, 0, context=context)
+    await offline_sdk.price.close()
+
+    assert context.block_number == 11990 and context.chain_head == 12000
+    assert context.block_timestamp == 1699999997
+    # open trades, threshold and the leverage caps of pairs 0 and 1
+    assert offline_sdk.subgraph.read_blocks == [11990] * 4
+    assert offline_sdk.subgraph.calls['get_open_trades'] == 1
+    assert offline_sdk.subgraph.calls['get_liq_margin_threshold_p'] == 1
+    assert price_server['requests'] == 1
+    assert 'get_block_number' not in offline_sdk.ostium.calls
+
+    # funding and rollover are extrapolated to the pinned block
+    trades = offline_sdk.subgraph.open_trades[TRADER]
+    feeds = {p['from']: p for p in price_server['feeds']}
+    assert first == get_trade_metrics(trades[0], feeds['BTC'], 11990, 100.0, '25')
+    assert second == get_trade_metrics(trades[1], feeds['ETH'], 11990, 100.0, '25')
+
+    assert context.sources['rpc']['blocks_behind_head'] == 0
+    assert context.sources['subgraph']['blocks_behind_head'] == 10
+    assert context.sources['price']['timestamp'] == offline_sdk.price.snapshot_timestamp
+
+
+@pytest.mark.asyncio
+async def test_subgraph_and_contract_reads_share_the_pinned_block(offline_sdk, price_server, rpc_node):
+    _setup(offline_sdk, price_server)
+    # the contracts disagree with the subgraph on the funding state of pair 0
+    onchain_pairs = [make_subgraph_pair(0, 'BTC', 'USD', accFundingLong='123456', lastFundingRate='-9'),
+                     make_subgraph_pair(1, 'ETH', 'USD')]
+    serve_contracts(rpc_node, {**fake_contracts(onchain_pairs), STORAGE: fake_trading_storage(TRADES, LIMIT_ORDERS)},
+                    block_number=12000)
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_node['url']))
+    offline_sdk.pair_snapshots = AsyncPairSnapshotLoader(w3, PAIRS_INFO, PAIRS_STORAGE, TRADING_STORAGE)
+    offline_sdk.positions = AsyncPositionReader(w3, STORAGE)
+    try:
+        context = await offline_sdk.read_context()
+        metrics = await offline_sdk.get_open_trade_metrics(0, 0, context=context)
+        portfolio = await offline_sdk.get_all_open_trade_metrics([TRADER], context=context)
+        snapshot = await offline_sdk.get_pairs_snapshot(context=context)
+        positions = await offline_sdk.get_open_positions_onchain(ONCHAIN_TRADER, pair_ids=[1, 5], context=context)
+    finally:
+        await offline_sdk.price.close()
+        await w3.provider.disconnect()
+
+    # every eth_call and every subgraph query is at the block the subgraph has indexed
+    assert context.block_number == 11990
+    assert set(rpc_node['call_blocks']) == {hex(11990)}
+    assert set(offline_sdk.subgraph.read_blocks) == {11990}
+    assert 'get_pair_details' not in offline_sdk.subgraph.calls
+    assert snapshot['block_number'] == positions['block_number'] == 11990
+    assert context.sources['contracts']['block_number'] == 11990
+    # one snapshot of the pair state, shared by all the calls
+    assert rpc_node['calls']['eth_call'] == 2 + 2
+
+    trade = offline_sdk.subgraph.open_trades[TRADER][0]
+    onchain_trade = {**trade, 'pair': {**trade['pair'], **snapshot['pairs'][0]}}
+    feeds = {p['from']: p for p in price_server['feeds']}
+    assert metrics == get_trade_metrics(onchain_trade, feeds['BTC'], 11990, 100.0, '25')
+    assert metrics != get_trade_metrics(trade, feeds['BTC'], 11990, 100.0, '25')
+    assert portfolio['positions'][0]['metrics'] == metrics
+
+
+@pytest.mark.asyncio
+async def test_portfolio_metrics_at_an_explicit_block(offline_sdk, price_server):
+    _setup(offline_sdk, price_server)
+
+    context = await offline_sdk.read_context(block_number=11800)
+    portfolio = await offline_sdk.get_all_open_trade_metrics([TRADER, OTHER], context=context)
+    again = await offline_sdk.get_all_open_trade_metrics([OTHER, TRADER], context=context)
+    await offline_sdk.price.close()
+
+    # the latest block for the chain head, then the header of the pinned block
+    assert offline_sdk.ostium.calls['get_block'] == 2
+    assert context.block_timestamp == 1700000000 - 50
+    assert portfolio['block_number'] == 11800
+    assert offline_sdk.subgraph.calls['get_open_trades_for_traders'] == 1
+    assert offline_sdk.subgraph.read_blocks == [11800] * 3
+    assert set(portfolio['data_age']) == {'rpc', 'subgraph', 'price'}
+    assert again['totals'] == portfolio['totals']
+
+
+@pytest.mark.asyncio
+async def test_failed_reads_are_not_kept():
+    context = ReadContext(100)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError('subgraph unavailable')
+        return 'ok'
+
+    with pytest.raises(ValueError):
+        await context.get('key', flaky)
+    assert await context.get('key', flaky) == 'ok'
+    assert await context.get('key', flaky) == 'ok'
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_subgraph_queries_take_a_block(subgraph_server):
+    def handler(body):
+        if '_meta' in body['query']:
+            return {'_meta': {'block': {'number': 123, 'timestamp': 1700000000}, 'hasIndexingErrors': False}}
+        if 'metaDatas' in body['query']:
+            return {'metaDatas': [{'liqMarginThresholdP': '25'}]}
+        if 'pairs(' in body['query']:
+            return {'pairs': [make_subgraph_pair(0)]}
+        if 'pair(' in body['query']:
+            return {'pair': make_subgraph_pair(0)}
+        return {'trades': []}
+    subgraph_server['handler'] = handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        assert await client.get_indexed_block() == {'number': 123, 'timestamp': 1700000000,
+                                                     'has_indexing_errors': False}
+        await client.get_open_trades(TRADER, block_number=120)
+        await client.get_open_trades(TRADER)
+        await client.get_open_trades_for_traders([TRADER], block_number=120)
+        await client.get_liq_margin_threshold_p(block_number=120)
+        # pinned pair reads bypass the pair cache
+        await client.get_pair_details(0, static_only=True, block_number=120)
+        await client.get_pairs_details([0], static_only=True, block_number=120)
+        assert client.pair_cache.stats()['size'] == 0
+    finally:
+        await client.close()
+
+    variables = [body.get('variables') or {} for body in subgraph_server['bodies'][1:]]
+    assert [v.get('block') for v in variables] == [{'number': 120}, None] + [{'number': 120}] * 4
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+
+from ostium_python_sdk.ostium import Ostium
+from ostium_python_sdk.receipts import ReceiptPoller
+from tests.conftest import ADDRESS, PRIVATE_KEY, serve_receipts, serve_transactions
+
+
+def tx_hash(i):
+    return Web3.to_bytes(i).rjust(32, b'\0')
+
+
+def test_one_batch_resolves_many_handles(rpc_node):
+    mined = {}
+    serve_receipts(rpc_node, mined)
+    poller = ReceiptPoller(Web3(Web3.HTTPProvider(rpc_node['url'])), batch_size=10, background=False)
+
+    handles = [poller.track(tx_hash(i)) for i in range(25)]
+    assert poller.poll_once() == 0 and rpc_node['batches'] == 3
+
+    for i in range(0, 25, 2):
+        mined[Web3.to_hex(tx_hash(i))] = None
+    assert poller.poll_once() == 13
+    assert rpc_node['batches'] == 6
+    assert [h.done() for h in handles[:3]] == [True, False, True]
+    assert handles[2].result().transactionHash == tx_hash(2)
+    assert len(poller) == 12
+
+
+def test_pending_handles_time_out(rpc_node):
+    serve_receipts(rpc_node, {})
+    poller = ReceiptPoller(Web3(Web3.HTTPProvider(rpc_node['url'])), timeout=0, background=False)
+    handle = poller.track(tx_hash(1))
+    poller.poll_once()
+    with pytest.raises(TimeExhausted):
+        handle.result(timeout=0)
+
+
+def offline_ostium(rpc_node, mined, **kwargs):
+    sent = serve_transactions(rpc_node, mined)
+    return Ostium(Web3(Web3.HTTPProvider(rpc_node['url'])), ADDRESS, ADDRESS, ADDRESS, PRIVATE_KEY, **kwargs), sent
+
+
+def test_fire_and_forget_close_trades(rpc_node):
+    mined = {}
+    ostium, sent = offline_ostium(rpc_node, mined, fire_and_forget=True, manage_nonces=True)
+    ostium.receipt_poller.poll_interval = 0.01
+
+    handles = [ostium.close_trade(pair_id, 0, 100.0) for pair_id in range(5)]
+    assert len(set(sent)) == 5
+    assert [h.tx_hash.to_0x_hex() for h in handles] == sent
+    assert not any(h.done() for h in handles)
+
+    for order_id, sent_hash in enumerate(sent):
+        mined[sent_hash] = 1000 + order_id
+    results = [h.result(timeout=5) for h in handles]
+    ostium.receipt_poller.stop()
+
+    assert [r['order_id'] for r in results] == [1000, 1001, 1002, 1003, 1004]
+    assert results[0]['receipt'].status == 1
+    # one nonce lookup for the five transactions
+    assert rpc_node['calls']['eth_getTransactionCount'] == 1
+
+
+@pytest.mark.asyncio
+async def test_handles_can_be_awaited(rpc_node):
+    mined = {}
+    ostium, sent = offline_ostium(rpc_node, mined, fire_and_forget=True)
+    ostium.receipt_poller.poll_interval = 0.01
+    handle = ostium.withdraw(1, ADDRESS)
+    mined[sent[0]] = None
+
+    receipt = await asyncio.wait_for(handle, 5)
+    ostium.receipt_poller.stop()
+    assert receipt.transactionHash.to_0x_hex() == sent[0]
+
+
+def test_blocking_mode_returns_order_id(rpc_node):
+    mined = {}
+    ostium, sent = offline_ostium(rpc_node, mined)
+    send_raw_transaction = rpc_node['methods']['eth_sendRawTransaction']
+
+    def send_and_mine(params):
+        mined[send_raw_transaction(params)] = 7
+        return sent[-1]
+    rpc_node['methods']['eth_sendRawTransaction'] = send_and_mine
+
+    result = ostium.close_trade(1, 0, 100.0)
+    assert result['order_id'] == 7
+
+
+def test_polled_receipts_match_get_transaction_receipt(rpc_node):
+    mined = {Web3.to_hex(tx_hash(1)): 7}
+    serve_receipts(rpc_node, mined)
+    w3 = Web3(Web3.HTTPProvider(rpc_node['url']))
+    poller = ReceiptPoller(w3, background=False)
+    handle = poller.track(tx_hash(1))
+    poller.poll_once()
+
+    assert handle.result(timeout=0) == w3.eth.get_transaction_receipt(tx_hash(1))
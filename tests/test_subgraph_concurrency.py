@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import pytest
+from ostium_python_sdk.subgraph import SubgraphClient
+from tests.conftest import make_subgraph_pair
+
+
+def _pair_handler(body):
+    return {'pair': make_subgraph_pair(int(body['variables']['pair_id']))}
+
+
+@pytest.mark.asyncio
+async def test_queries_run_concurrently_up_to_limit(subgraph_server):
+    subgraph_server['handler'] = _pair_handler
+    subgraph_server['latency'] = 0.05
+    client = SubgraphClient(url=subgraph_server['url'], max_concurrency=4)
+    try:
+        pairs = await asyncio.gather(*[client.get_pair_details(i) for i in range(12)])
+    finally:
+        await client.close()
+
+    assert [p['id'] for p in pairs] == [str(i) for i in range(12)]
+    assert subgraph_server['max_in_flight'] == 4
+
+
+@pytest.mark.asyncio
+async def test_query_timeout(subgraph_server):
+    subgraph_server['handler'] = _pair_handler
+    subgraph_server['latency'] = 0.5
+    client = SubgraphClient(url=subgraph_server['url'], timeout=0.05)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get_pair_details(0)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused(subgraph_server):
+    subgraph_server['handler'] = _pair_handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    await client.get_pair_details(0)
+    session = client._session
+    await client.get_pair_details(1)
+
+    assert client._session is session
+    await client.close()
+    assert client._session is None
+
+
+def _start_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    return loop, thread
+
+
+def _stop_loop(loop, thread):
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_client_of_a_running_loop_is_closed_on_that_loop(subgraph_server):
+    subgraph_server['handler'] = _pair_handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    loop, thread = _start_loop()
+    try:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.get_pair_details(0), loop))
+        old = client._client.transport.session
+
+        # used from this loop: the old client is closed by its own loop
+        await client.get_pair_details(1)
+        for _ in range(100):
+            if old.closed:
+                break
+            await asyncio.sleep(0.01)
+        assert old.closed
+        assert client._client.transport.session is not old
+    finally:
+        await client.close()
+        _stop_loop(loop, thread)
+
+
+@pytest.mark.asyncio
+async def test_client_of_a_closed_loop_is_detached(subgraph_server):
+    subgraph_server['handler'] = _pair_handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    loop, thread = _start_loop()
+    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.get_pair_details(0), loop))
+    old = client._client.transport.session
+    connector = old.connector
+    _stop_loop(loop, thread)
+
+    try:
+        await client.get_pair_details(1)
+        assert old.closed and old.connector is None
+        await asyncio.gather(*client._closing)
+        assert connector.closed
+    finally:
+        await client.close()
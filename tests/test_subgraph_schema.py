@@ -0,0 +1,96 @@
+import pytest
+from gql import gql
+from graphql import GraphQLError
+from ostium_python_sdk.schema import SUBGRAPH_SCHEMA_VERSION
+from ostium_python_sdk.subgraph import SubgraphClient
+from tests.conftest import make_subgraph_pair
+
+
+def _handler(body):
+    query = body['query']
+    if '__schema' in query:
+        raise AssertionError("introspection query sent")
+    if 'metaDatas' in query:
+        return {'metaDatas': [{'liqMarginThresholdP': '25'}]}
+    if 'pairs(' in query:
+        return {'pairs': [make_subgraph_pair(0)]}
+    if 'pair(' in query:
+        return {'pair': make_subgraph_pair(0)}
+    if 'limits(' in query:
+        return {'limits': []}
+    if 'orders(' in query:
+        return {'orders': []}
+    if 'trades(' in query:
+        return {'trades': []}
+    return {}
+
+
+@pytest.mark.asyncio
+async def test_all_queries_validate_against_bundled_schema(subgraph_server):
+    subgraph_server['handler'] = _handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    assert client.schema_version == SUBGRAPH_SCHEMA_VERSION
+    try:
+        await client.get_pairs()
+        await client.get_pair_details(0)
+        await client.get_liq_margin_threshold_p()
+        await client.get_open_trades('0x0000000000000000000000000000000000000001')
+        await client.get_orders('0x0000000000000000000000000000000000000001')
+        await client.get_recent_history('0x0000000000000000000000000000000000000001')
+        await client.get_order_by_id(1)
+        await client.get_trade_by_id('0x01_0_0')
+    finally:
+        await client.close()
+
+    assert subgraph_server['requests'] == 8
+    assert not any('__schema' in b['query'] for b in subgraph_server['bodies'])
+
+
+@pytest.mark.asyncio
+async def test_invalid_query_rejected_locally(subgraph_server):
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        with pytest.raises(GraphQLError):
+            await client._execute_query(gql("query { pairs { notAField } }"))
+    finally:
+        await client.close()
+
+    assert subgraph_server['requests'] == 0
+
+
+@pytest.mark.asyncio
+async def test_validation_can_be_disabled(subgraph_server):
+    client = SubgraphClient(url=subgraph_server['url'], validate_queries=False)
+    assert client.schema_version is None
+    try:
+        await client._execute_query(gql("query { pairs { notAField } }"))
+    finally:
+        await client.close()
+
+    assert subgraph_server['requests'] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_documents_are_parsed_and_validated_once(subgraph_server, monkeypatch):
+    from ostium_python_sdk import subgraph as subgraph_module
+
+    validated = []
+    original_validate = subgraph_module.validate
+
+    def counting_validate(schema, document):
+        validated.append(document)
+        return original_validate(schema, document)
+
+    subgraph_module._validated_documents.clear()
+    monkeypatch.setattr(subgraph_module, 'validate', counting_validate)
+    monkeypatch.setattr(subgraph_module, 'gql', lambda *args: pytest.fail("query re-parsed"))
+
+    subgraph_server['handler'] = _handler
+    client = SubgraphClient(url=subgraph_server['url'])
+    try:
+        for _ in range(3):
+            await client.get_pair_details(0)
+    finally:
+        await client.close()
+
+    assert validated == [subgraph_module.PAIR_DETAILS_QUERY]
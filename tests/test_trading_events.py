@@ -0,0 +1,141 @@
+import pytest
+from eth_abi import encode
+from eth_utils.abi import collapse_if_tuple
+from web3 import AsyncWeb3, Web3
+
+from ostium_python_sdk.abi.trading_abi import trading_abi
+from ostium_python_sdk.events import AsyncTradingEventIndexer, TradingEventIndexer
+from ostium_python_sdk.utils import build_event_topics
+
+TRADING = Web3.to_checksum_address('0x00000000000000000000000000000000000000e1')
+TRADER = Web3.to_checksum_address('0x00000000000000000000000000000000000000aa')
+TOPICS = build_event_topics(trading_abi)
+EVENT_ABIS = {entry['name']: entry for entry in trading_abi if entry.get('type') == 'event'}
+
+
+def make_log(name, block_number, log_index, *values):
+    """A raw (JSON-RPC) log of the Trading event `name` with its inputs `values`, in ABI order"""
+    inputs = EVENT_ABIS[name]['inputs']
+    topics = [Web3.to_hex(TOPICS[name])]
+    data_types, data_values = [], []
+    for item, value in zip(inputs, values):
+        if item['indexed']:
+            topics.append(Web3.to_hex(encode([item['type']], [value])))
+        else:
+            data_types.append(collapse_if_tuple(item))
+            data_values.append(value)
+    return {'address': TRADING, 'topics': topics, 'data': Web3.to_hex(encode(data_types, data_values)),
+            'blockNumber': hex(block_number), 'logIndex': hex(log_index), 'blockHash': '0x' + 'bb' * 32,
+            'transactionHash': '0x' + f'{block_number:064x}', 'transactionIndex': '0x0', 'removed': False}
+
+
+def serve_logs(rpc_node, logs, max_results, head=1000, suggest=False):
+    """eth_getLogs over `logs`, failing like hosted nodes do when a range matches more than `max_results` logs"""
+    ranges = rpc_node['log_ranges'] = []
+
+    def get_logs(params):
+        query = params[0]
+        start, end = int(query['fromBlock'], 16), int(query['toBlock'], 16)
+        wanted = set(query['topics'][0])
+        addresses = query['address'] if isinstance(query['address'], list) else [query['address']]
+        addresses = {address.lower() for address in addresses}
+        matched = [log for log in logs if start <= int(log['blockNumber'], 16) <= end
+                   and log['address'].lower() in addresses and log['topics'][0] in wanted]
+        if len(matched) > max_results:
+            message = f"query returned more than {max_results} results."
+            if suggest:
+                last = int(matched[max_results - 1]['blockNumber'], 16)
+                message += f" Try with this block range [{hex(start)}, {hex(last)}]."
+            raise ValueError(message)
+        ranges.append((start, end))
+        return matched
+
+    rpc_node['methods']['eth_getLogs'] = get_logs
+    rpc_node['methods']['eth_blockNumber'] = lambda params: hex(head)
+
+
+order = (120, 10**18, 50, (10**20, 10**18, 0, 0, TRADER, 1000, 3, 0, True))
+LOGS = [
+    make_log('MarketOpenOrderInitiated', 10, 0, 1, TRADER, 3),
+    make_log('MarketOpenTimeoutExecuted', 10, 4, 1, order),
+    make_log('TpUpdated', 200, 1, 7, TRADER, 3, 0, 2 * 10**18),
+    make_log('AutomationCloseOrderInitiated', 201, 0, 2, 7, TRADER, 3, 1),
+    make_log('SlUpdated', 202, 0, 7, TRADER, 3, 0, 10**17),
+    make_log('TopUpCollateralExecuted', 203, 0, 7, TRADER, 3, 5 * 10**6, 900),
+    make_log('OpenLimitPlaced', 204, 2, TRADER, 4, 1),
+    make_log('MarketCloseOrderInitiated', 950, 0, 3, 7, TRADER, 3),
+]
+
+
+def test_events_are_decoded_in_order_with_adaptive_chunks(rpc_node):
+    serve_logs(rpc_node, LOGS, max_results=2)
+    indexer = TradingEventIndexer(Web3(Web3.HTTPProvider(rpc_node['url'])), TRADING, chunk_size=300)
+
+    chunks = list(indexer.chunks(0))
+    events = [event for _, _, chunk in chunks for event in chunk]
+
+    # every block of [0, head] in exactly one chunk, the busy range split until it fits
+    assert chunks[0][0] == 0 and chunks[-1][1] == 1000
+    assert all(chunks[i][1] + 1 == chunks[i + 1][0] for i in range(len(chunks) - 1))
+    assert [(s, e) for s, e, _ in chunks] == rpc_node['log_ranges']
+    assert all(len(chunk) <= 2 for _, _, chunk in chunks)
+
+    assert [(e.name, e.block_number, e.log_index) for e in events] == [
+        ('MarketOpenOrderInitiated', 10, 0), ('MarketOpenTimeoutExecuted', 10, 4), ('TpUpdated', 200, 1),
+        ('AutomationCloseOrderInitiated', 201, 0), ('SlUpdated', 202, 0), ('TopUpCollateralExecuted', 203, 0),
+        ('OpenLimitPlaced', 204, 2), ('MarketCloseOrderInitiated', 950, 0)]
+    assert events[0].args == {'orderId': 1, 'trader': TRADER, 'pairIndex': 3}
+    assert events[1].args['order']['trade'] == {
+        'collateral': 10**20, 'openPrice': 10**18, 'tp': 0, 'sl': 0, 'trader': TRADER, 'leverage': 1000,
+        'pairIndex': 3, 'index': 0, 'buy': True}
+    assert events[2].args == {'tradeId': 7, 'trader': TRADER, 'pairIndex': 3, 'index': 0, 'newTp': 2 * 10**18}
+    assert events[3].args['arg4'] == 1
+    assert events[5].args['topUpAmount'] == 5 * 10**6 and events[5].args['newLeverage'] == 900
+    assert events[7].transaction_hash == '0x' + f'{950:064x}' and events[7].address == TRADING
+
+
+def test_suggested_range_and_event_filter(rpc_node):
+    serve_logs(rpc_node, LOGS, max_results=3, suggest=True)
+    indexer = TradingEventIndexer(Web3(Web3.HTTPProvider(rpc_node['url'])), TRADING, chunk_size=1000)
+
+    events = list(indexer.events(0, 999, events=['TpUpdated', 'SlUpdated', 'OpenLimitPlaced', 'MarketOpenOrderInitiated']))
+
+    assert [event.name for event in events] == ['MarketOpenOrderInitiated', 'TpUpdated', 'SlUpdated', 'OpenLimitPlaced']
+    # [0, 999] fails with 4 matching logs, the range the node suggests ends at the 3rd
+    assert rpc_node['log_ranges'][0] == (0, 202)
+    assert rpc_node['calls']['eth_getLogs'] == 1 + len(rpc_node['log_ranges'])
+
+    with pytest.raises(ValueError, match='Unknown Trading events'):
+        indexer.topics_for(['NotAnEvent'])
+
+
+def test_other_node_errors_are_raised(rpc_node):
+    def failing(params):
+        raise ValueError('execution reverted')
+    rpc_node['methods']['eth_getLogs'] = failing
+    indexer = TradingEventIndexer(Web3(Web3.HTTPProvider(rpc_node['url'])), TRADING)
+
+    with pytest.raises(Exception, match='execution reverted'):
+        list(indexer.events(0, 10))
+    assert rpc_node['calls']['eth_getLogs'] == 1
+
+
+@pytest.mark.asyncio
+async def test_sdk_streams_events(offline_sdk, rpc_node):
+    serve_logs(rpc_node, LOGS, max_results=2)
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_node['url']))
+    offline_sdk.trading_events = AsyncTradingEventIndexer(w3, TRADING, chunk_size=100)
+    try:
+        events = [event async for event in offline_sdk.iter_trading_events(0)]
+        expected = list(TradingEventIndexer(Web3(Web3.HTTPProvider(rpc_node['url'])), TRADING).events(0))
+
+        # stopping early leaves no request behind beyond the one chunk read ahead
+        requests = rpc_node['calls']['eth_getLogs']
+        async for event in offline_sdk.iter_trading_events(0, events=['TpUpdated']):
+            break
+    finally:
+        await w3.provider.disconnect()
+
+    assert events == expected and len(events) == len(LOGS)
+    assert event.name == 'TpUpdated'
+    assert rpc_node['calls']['eth_getLogs'] - requests <= 3